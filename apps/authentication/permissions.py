@@ -1,4 +1,26 @@
-from django.contrib.auth.mixins import UserPassesTestMixin
+from django.contrib.auth.mixins import AccessMixin, UserPassesTestMixin
+from django.contrib.auth.views import redirect_to_login
+from django.core.exceptions import PermissionDenied
+
+
+class AsyncLoginRequiredMixin(AccessMixin):
+    """
+    LoginRequiredMixin for async views: the user is loaded with
+    request.auser(), since evaluating request.user queries the session
+    synchronously.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        user = await request.auser()
+        if not user.is_authenticated:
+            if self.raise_exception:
+                raise PermissionDenied(self.get_permission_denied_message())
+            return redirect_to_login(
+                request.get_full_path(),
+                self.get_login_url(),
+                self.get_redirect_field_name(),
+            )
+        return await super().dispatch(request, *args, **kwargs)
 
 
 class AdminRequiredMixin(UserPassesTestMixin):
@@ -7,3 +7,10 @@ class BaseConfig(AppConfig):
     name = "apps.base"
     label = "base"
     verbose_name = _("Base")
+
+    def ready(self):
+        # Version counters behind the model-versioned cache keys
+        # pylint: disable=import-outside-toplevel
+        from apps.base.utils import model_cache
+
+        model_cache.connect_signals()
@@ -0,0 +1,53 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.base.utils import archive
+
+
+class Command(BaseCommand):
+    help = (
+        "Move closed history (weighing sessions, sanitary events, feeding "
+        "events, done or canceled tasks) dated before the horizon to the "
+        "archive schema, in bounded batches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--years",
+            type=int,
+            default=settings.ARCHIVE_AFTER_YEARS,
+            help=(
+                "Archive what is dated before January 1st, this many years ago "
+                "(default ARCHIVE_AFTER_YEARS)"
+            ),
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.ARCHIVE_BATCH_SIZE,
+            help="Records moved per transaction, with their detail rows",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only count the records that would move",
+        )
+
+    def handle(self, *args, **options):
+        # Withdrawal and ADG windows reach a year back
+        if options["years"] < 1:
+            raise CommandError("The horizon must be at least one year")
+        if options["batch_size"] < 1:
+            raise CommandError("The batch size must be positive")
+
+        before = archive.horizon(options["years"])
+        if options["dry_run"]:
+            for label, count in archive.pending(before).items():
+                self.stdout.write(f"{label}: {count} before {before}")
+            return
+
+        moved = archive.archive_before(before, options["batch_size"])
+        if not moved:
+            self.stdout.write(f"Nothing to archive before {before}")
+        for label, count in moved.items():
+            self.stdout.write(f"Archived {count} {label} rows dated before {before}")
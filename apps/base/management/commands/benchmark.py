@@ -0,0 +1,131 @@
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from apps.base.utils import benchmarks
+from apps.base.utils.mock_data import SCALES, MockDataGenerator
+from apps.cattle.models import Cattle
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure wall time, query count and peak memory of the hot paths "
+        "against a seeded herd and append the results to the benchmark "
+        "history. The seeded rows are rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scale",
+            choices=list(SCALES),
+            default="1k",
+            help="Herd size preset to seed (number of cattle)",
+        )
+        parser.add_argument(
+            "--cattle", type=int, help="Exact number of cattle, overriding --scale"
+        )
+        parser.add_argument(
+            "--years", type=int, default=3, help="Years of history to seed"
+        )
+        parser.add_argument("--seed", type=int, default=42, help="Random seed")
+        parser.add_argument(
+            "--existing",
+            action="store_true",
+            help="Measure the data already in the database instead of seeding",
+        )
+        parser.add_argument(
+            "--only",
+            action="append",
+            choices=list(benchmarks.SCENARIOS),
+            help="Run only this scenario (repeatable)",
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=5, help="Timed runs per scenario"
+        )
+        parser.add_argument(
+            "--warmup", type=int, default=1, help="Discarded runs per scenario"
+        )
+        parser.add_argument(
+            "--history",
+            default=settings.BENCHMARK_HISTORY,
+            help="JSON history file (default: BENCHMARK_HISTORY)",
+        )
+        parser.add_argument("--label", default="", help="Note stored with the run")
+        parser.add_argument(
+            "--no-save", action="store_true", help="Do not write to the history"
+        )
+        parser.add_argument(
+            "--compare",
+            action="store_true",
+            help="Compare with the previous run on the same dataset afterwards",
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=benchmarks.THRESHOLD * 100,
+            help="Regression threshold in percent for --compare (default 20)",
+        )
+
+    def handle(self, *args, **options):
+        if options["repeat"] < 1:
+            raise CommandError("--repeat must be at least 1.")
+
+        if not options["existing"] and Cattle.all_objects.exists():
+            raise CommandError(
+                "The database already has cattle: seed an empty database or "
+                "measure this data with --existing."
+            )
+
+        with transaction.atomic():
+            if options["existing"]:
+                dataset = {"existing": True, "cattle": Cattle.objects.count()}
+            else:
+                dataset = self._seed(options)
+            benchmarks.analyze()
+            results = benchmarks.run(
+                options["only"],
+                repeat=options["repeat"],
+                warmup=options["warmup"],
+                log=self.stdout.write,
+            )
+            transaction.set_rollback(True)
+
+        self._print(results)
+        benchmark_run = benchmarks.make_run(dataset, results, options["label"])
+        if options["no_save"]:
+            return
+        benchmarks.save_run(options["history"], benchmark_run)
+        self.stdout.write(f"Saved to {options['history']}")
+        if options["compare"]:
+            call_command(
+                "compare_benchmarks",
+                history=options["history"],
+                threshold=options["threshold"],
+                stdout=self.stdout,
+            )
+
+    def _seed(self, options) -> dict:
+        cattle = options["cattle"] or SCALES[options["scale"]]
+        dataset = {"cattle": cattle, "years": options["years"], "seed": options["seed"]}
+        self.stdout.write(self.style.WARNING(f"Seeding {cattle} cattle..."))
+        # The history ends today, so every run sees the same herd relative
+        # to the dashboard's and calendar's "now"
+        MockDataGenerator(
+            cattle=cattle, years=options["years"], seed=options["seed"]
+        ).generate()
+        return dataset
+
+    def _print(self, results: dict) -> None:
+        self.stdout.write(
+            self.style.MIGRATE_HEADING(
+                f"{'Scenario':<28}{'median ms':>11}{'min ms':>10}{'max ms':>10}"
+                f"{'queries':>9}{'peak KiB':>11}"
+            )
+        )
+        for name, result in results.items():
+            self.stdout.write(
+                f"{name:<28}{result['wall_ms']:>11.1f}{result['min_ms']:>10.1f}"
+                f"{result['max_ms']:>10.1f}{result['queries']:>9}"
+                f"{result['peak_kib']:>11.0f}"
+            )
@@ -0,0 +1,90 @@
+import logging
+from datetime import date, timedelta
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import reverse
+
+from apps.authentication.models import User
+from apps.base.utils import handler_benchmark
+from apps.locations.models import Location
+
+
+def default_urls() -> list[str]:
+    """The calendar feed of this month and the location lookup."""
+    first = date.today().replace(day=1)
+    end = (first + timedelta(days=32)).replace(day=1)
+    location_type = ContentType.objects.get_for_model(Location)
+    return [
+        f"{reverse('tasks:api-events')}?start={first}&end={end}",
+        f"{reverse('sales:api-item-lookup')}?content_type_id={location_type.pk}",
+    ]
+
+
+class Command(BaseCommand):
+    help = (
+        "Serve the same concurrent polling load through the WSGI handler "
+        "(one worker with --threads threads) and the ASGI handler (one event "
+        "loop) and compare throughput and latency. Run it on seeded data."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--url",
+            action="append",
+            help="Path to request, repeatable (default: the calendar feed and "
+            "the item lookup)",
+        )
+        parser.add_argument(
+            "--username", help="User whose session is used (default: a superuser)"
+        )
+        parser.add_argument(
+            "--clients", type=int, default=50, help="Concurrent polling clients"
+        )
+        parser.add_argument(
+            "--requests", type=int, default=500, help="Requests per URL and handler"
+        )
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=4,
+            help="Threads of the WSGI worker (gunicorn --threads)",
+        )
+
+    def handle(self, *args, **options):
+        if min(options["clients"], options["requests"], options["threads"]) < 1:
+            raise CommandError("--clients, --requests and --threads must be positive.")
+        users = User.objects.filter(is_active=True)
+        if options["username"]:
+            user = users.filter(username=options["username"]).first()
+        else:
+            user = users.filter(is_superuser=True).order_by("date_joined").first()
+        if user is None:
+            raise CommandError("No such active user; pass --username.")
+
+        # Thousands of per-request query lines would bury the results
+        logging.getLogger("cnv.queries").setLevel(logging.ERROR)
+        self.stdout.write(
+            f"{options['clients']} clients, {options['requests']} requests, "
+            f"WSGI with {options['threads']} threads"
+        )
+        for url in options["url"] or default_urls():
+            self.stdout.write(self.style.MIGRATE_HEADING(url))
+            self.stdout.write(
+                f"  {'handler':<8}{'rps':>8}{'mean ms':>10}{'p50 ms':>9}"
+                f"{'p95 ms':>9}{'max ms':>9}{'errors':>8}"
+            )
+            for summary in handler_benchmark.compare(
+                url,
+                user,
+                clients=options["clients"],
+                requests=options["requests"],
+                threads=options["threads"],
+            ):
+                line = (
+                    f"  {summary['handler']:<8}{summary['rps']:>8.1f}"
+                    f"{summary['mean_ms']:>10.1f}{summary['p50_ms']:>9.1f}"
+                    f"{summary['p95_ms']:>9.1f}{summary['max_ms']:>9.1f}"
+                    f"{summary['errors']:>8}"
+                )
+                self.stdout.write(self.style.ERROR(line) if summary["errors"] else line)
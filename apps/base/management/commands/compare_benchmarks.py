@@ -0,0 +1,77 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.base.utils import benchmarks
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare a benchmark run with the previous run on the same dataset "
+        "and fail when a scenario got slower, heavier or ran more queries."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--history",
+            default=settings.BENCHMARK_HISTORY,
+            help="JSON history file (default: BENCHMARK_HISTORY)",
+        )
+        parser.add_argument(
+            "--run",
+            type=int,
+            default=-1,
+            help="Index of the run to check in the history (default: the last)",
+        )
+        parser.add_argument(
+            "--baseline",
+            type=int,
+            help="Index of the run to compare with (default: the previous run "
+            "on the same dataset)",
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=benchmarks.THRESHOLD * 100,
+            help="Allowed slowdown in percent for time and memory (default 20)",
+        )
+
+    def handle(self, *args, **options):
+        history = benchmarks.load_history(options["history"])
+        try:
+            current = history[options["run"]]
+            if options["baseline"] is None:
+                baseline = benchmarks.find_baseline(history, current)
+            else:
+                baseline = history[options["baseline"]]
+        except IndexError as exc:
+            raise CommandError(
+                f"No such run in {options['history']} ({len(history)} runs)."
+            ) from exc
+        if baseline is None:
+            self.stdout.write("No earlier run on the same dataset to compare with")
+            return
+
+        threshold = options["threshold"] / 100
+        self.stdout.write(
+            f"{current['timestamp']} ({current['revision'] or '?'}) against "
+            f"{baseline['timestamp']} ({baseline['revision'] or '?'}), "
+            f"threshold {options['threshold']:g}%"
+        )
+        regressions = []
+        for comparison in benchmarks.compare(baseline, current):
+            line = (
+                f"  {comparison.scenario:<28}{comparison.metric:<10}"
+                f"{comparison.baseline:>12g} -> {comparison.current:<12g}"
+                f"{comparison.change:+.1%}"
+            )
+            if comparison.regressed(threshold):
+                regressions.append(comparison)
+                line = self.style.ERROR(f"{line}  REGRESSION")
+            self.stdout.write(line)
+
+        if regressions:
+            raise CommandError(
+                f"{len(regressions)} regression(s): "
+                + ", ".join(f"{c.scenario} {c.metric}" for c in regressions)
+            )
+        self.stdout.write(self.style.SUCCESS("No regressions"))
@@ -0,0 +1,97 @@
+import json
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.base.utils.load_test import LoadTest, LoadTestError, load_workload
+
+
+class Command(BaseCommand):
+    help = (
+        "Replay a weighted mix of authenticated requests against a running "
+        "server with concurrent clients and report throughput, latency "
+        "percentiles and error rates per URL name."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--base-url",
+            default="http://localhost:8000",
+            help="Server to load (default http://localhost:8000)",
+        )
+        parser.add_argument("--username", required=True, help="Account to log in")
+        parser.add_argument(
+            "--password",
+            default=os.environ.get("LOAD_TEST_PASSWORD", ""),
+            help="Its password (default: the LOAD_TEST_PASSWORD variable)",
+        )
+        parser.add_argument(
+            "--clients", type=int, default=10, help="Concurrent clients"
+        )
+        parser.add_argument(
+            "--duration", type=float, default=30, help="Seconds to run for"
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            help="Stop after this many requests instead of after --duration",
+        )
+        parser.add_argument(
+            "--think-time",
+            type=float,
+            default=0,
+            help="Mean pause in seconds between a client's requests",
+        )
+        parser.add_argument(
+            "--workload",
+            help="JSON file with the steps to replay instead of the default mix",
+        )
+        parser.add_argument("--seed", type=int, default=42, help="Random seed")
+        parser.add_argument(
+            "--json", action="store_true", help="Print the report as JSON"
+        )
+
+    def handle(self, *args, **options):
+        if options["clients"] < 1:
+            raise CommandError("--clients must be at least 1.")
+        try:
+            load_test = LoadTest(
+                base_url=options["base_url"],
+                username=options["username"],
+                password=options["password"],
+                workload=(
+                    load_workload(options["workload"]) if options["workload"] else None
+                ),
+                clients=options["clients"],
+                duration=options["duration"],
+                requests=options["requests"],
+                think_time=options["think_time"],
+                seed=options["seed"],
+                log=self.stderr.write,
+            )
+            report = load_test.run()
+        except (LoadTestError, OSError, TypeError, ValueError) as exc:
+            raise CommandError(str(exc)) from exc
+
+        if options["json"]:
+            self.stdout.write(json.dumps(report.as_dict(), indent=2))
+            return
+
+        self.stdout.write(
+            self.style.MIGRATE_HEADING(
+                f"{'URL name':<28}{'reqs':>7}{'err%':>7}{'rps':>8}{'p50':>8}"
+                f"{'p95':>8}{'p99':>8}{'max':>8}"
+            )
+        )
+        rows = [*report.by_name().items(), ("TOTAL", report.total())]
+        for name, summary in rows:
+            line = (
+                f"{name:<28}{summary['requests']:>7}"
+                f"{summary['error_rate']:>7.1%}{summary['rps']:>8.1f}"
+                f"{summary['p50_ms']:>8.0f}{summary['p95_ms']:>8.0f}"
+                f"{summary['p99_ms']:>8.0f}{summary['max_ms']:>8.0f}"
+            )
+            self.stdout.write(self.style.ERROR(line) if summary["errors"] else line)
+        self.stdout.write(f"Latencies in ms over {report.elapsed:.1f}s")
+        for (name, error), count in report.errors().most_common(10):
+            self.stdout.write(self.style.WARNING(f"  {name}: {error} x{count}"))
@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.base.utils import partitioning
+
+
+class Command(BaseCommand):
+    help = (
+        "Maintain the yearly partitions of the partitioned tables: create "
+        "those of the coming years (run it from cron, e.g. monthly)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--ahead",
+            type=int,
+            default=1,
+            help="Years past the current one to create partitions for (default 1)",
+        )
+
+    def handle(self, *args, **options):
+        this_year = timezone.localdate().year
+        tables = partitioning.partitioned_tables()
+        if not tables:
+            self.stdout.write("No partitioned tables")
+            return
+
+        for table, column in tables.items():
+            years = partitioning.partition_years(table)
+            for year in range(this_year, this_year + options["ahead"] + 1):
+                if year not in years:
+                    partitioning.create_partition(table, column, year)
+                    self.stdout.write(
+                        f"Created {partitioning.partition_name(table, year)}"
+                    )
+
+            years = partitioning.partition_years(table)
+            self.stdout.write(
+                f"{table} ({column}): "
+                + (f"{years[0]}-{years[-1]}" if years else "default only")
+            )
@@ -0,0 +1,87 @@
+from django.core.management.base import BaseCommand
+
+from apps.base.models import SlowQuery
+from apps.base.utils.profiling import explain
+
+ORDERINGS = {
+    "total": "-total_ms",
+    "p95": "-p95_ms",
+    "max": "-max_ms",
+    "calls": "-calls",
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "List the costliest SQL fingerprints captured by the slow-query "
+        "recorder, with example parameters and EXPLAIN plans."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit", type=int, default=10, help="Number of fingerprints to show"
+        )
+        parser.add_argument(
+            "--order",
+            choices=sorted(ORDERINGS),
+            default="total",
+            help="Rank by total time (default), p95, max or calls",
+        )
+        parser.add_argument("--view", help="Only this URL name, e.g. cattle:list")
+        parser.add_argument(
+            "--explain",
+            action="store_true",
+            help="Print the plan of each example statement",
+        )
+        parser.add_argument(
+            "--analyze",
+            action="store_true",
+            help="Run EXPLAIN (ANALYZE, BUFFERS), executing SELECT examples",
+        )
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Delete the captured fingerprints instead of listing them",
+        )
+
+    def handle(self, *args, **options):
+        queries = SlowQuery.objects.all()
+        if options["view"]:
+            queries = queries.filter(view=options["view"])
+
+        if options["reset"]:
+            deleted, _ = queries.delete()
+            self.stdout.write(f"Deleted {deleted} fingerprints")
+            return
+
+        queries = queries.order_by(ORDERINGS[options["order"]])[: options["limit"]]
+        if not queries:
+            self.stdout.write("No slow queries captured yet")
+            return
+
+        for rank, query in enumerate(queries, start=1):
+            self.stdout.write(
+                self.style.MIGRATE_HEADING(
+                    f"#{rank} {query.view}: {query.calls} calls, "
+                    f"{query.total_ms:.1f} ms total, {query.mean_ms:.2f} ms mean, "
+                    f"p95 {query.p95_ms:.2f} ms, max {query.max_ms:.2f} ms"
+                )
+            )
+            self.stdout.write(f"  {query.fingerprint}")
+            if query.example_sql:
+                self.stdout.write(
+                    f"  Example ({query.example_ms:.2f} ms) params:"
+                    f" {query.example_params}"
+                )
+            if options["explain"] or options["analyze"]:
+                plan = explain(
+                    {
+                        "alias": "default",
+                        "sql": query.example_sql,
+                        "params": query.example_params,
+                    },
+                    analyze=options["analyze"],
+                )
+                for line in (plan or "No plan available").splitlines():
+                    self.stdout.write(f"    {line}")
+            self.stdout.write("")
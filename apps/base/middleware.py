@@ -0,0 +1,262 @@
+import logging
+import time
+
+from asgiref.sync import (
+    async_to_sync,
+    iscoroutinefunction,
+    markcoroutinefunction,
+    sync_to_async,
+)
+from django.conf import settings
+from django.urls import reverse
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from apps.base.utils import metrics, profiling, replica, slow_queries
+from apps.base.utils.query_stats import QueryRecorder
+
+logger = logging.getLogger("cnv.queries")
+
+
+class StaticFilesMiddleware(WhiteNoiseMiddleware):
+    """
+    WhiteNoise, able to run async as well: a sync-only middleware at the
+    top of the stack would send every ASGI request through a thread on its
+    way to the async views.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, *args, **kwargs):
+        super().__init__(get_response, *args, **kwargs)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return await sync_to_async(self.serve)(static_file, request)
+        return await self.get_response(request)
+
+
+class QueryStatsMiddleware:
+    """
+    Records the SQL queries and latency of every request.
+
+    With QUERY_STATS_HEADERS on (the DEBUG default) the numbers are sent
+    back as X-Query-Count / X-Query-Duplicates and a Server-Timing header
+    that the browser's network panel charts. Requests that query are
+    logged to "cnv.queries"; those above QUERY_COUNT_WARNING queries or
+    SLOW_REQUEST_MS are logged as warnings with their repeated statements.
+    Every request is also counted in the /metrics histograms, labelled by
+    URL name, and its statements are added to the slow-query totals.
+
+    Streaming responses are measured up to the first byte only.
+
+    Under ASGI the recorder is installed from the request's sync thread,
+    where the async ORM runs its queries.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        start = time.perf_counter()
+        with QueryRecorder() as recorder:
+            response = self.get_response(request)
+        self.report(request, response, recorder, start)
+        return response
+
+    async def __acall__(self, request):
+        start = time.perf_counter()
+        recorder = QueryRecorder()
+        await sync_to_async(recorder.__enter__)()
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(recorder.__exit__)(None, None, None)
+        await sync_to_async(self.report)(request, response, recorder, start)
+        return response
+
+    @staticmethod
+    def report(request, response, recorder: QueryRecorder, start: float) -> None:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        sql_ms = recorder.duration * 1000
+
+        match = getattr(request, "resolver_match", None)
+        view = match.view_name if match else "unresolved"
+        metrics.observe_request(
+            view=view,
+            method=request.method,
+            status=response.status_code,
+            duration=elapsed_ms / 1000,
+            queries=recorder.count,
+            sql=recorder.duration,
+        )
+        if settings.SLOW_QUERY_CAPTURE and recorder.count:
+            slow_queries.record(view, recorder)
+            slow_queries.maybe_flush()
+
+        if settings.QUERY_STATS_HEADERS:
+            response["X-Query-Count"] = recorder.count
+            response["X-Query-Duplicates"] = recorder.duplicate_count
+            response["Server-Timing"] = (
+                f'db;dur={sql_ms:.1f};desc="{recorder.count} queries", '
+                f"total;dur={elapsed_ms:.1f}"
+            )
+
+        if recorder.count:
+            over_budget = (
+                recorder.count > settings.QUERY_COUNT_WARNING
+                or elapsed_ms > settings.SLOW_REQUEST_MS
+            )
+            logger.log(
+                logging.WARNING if over_budget else logging.INFO,
+                "%s %s %s: %s queries (%s repeated), %.1f ms SQL, %.1f ms total%s",
+                request.method,
+                request.path,
+                response.status_code,
+                recorder.count,
+                recorder.duplicate_count,
+                sql_ms,
+                elapsed_ms,
+                (
+                    "".join(
+                        f"\n  {times}x {sql}" for sql, times in recorder.duplicates()
+                    )
+                    if over_budget
+                    else ""
+                ),
+            )
+
+
+class ProfilerMiddleware:
+    """
+    Profiles requests on demand for superusers (see
+    apps.base.utils.profiling). Must follow AuthenticationMiddleware.
+
+    Under ASGI a profiled request runs in a thread, as a sync request.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not profiling.wants_profile(request):
+            return self.get_response(request)
+        return self.profile(request, self.get_response)
+
+    async def __acall__(self, request):
+        # The user is only loaded for requests asking for a profile
+        if not profiling.requested(request) or not (await request.auser()).is_superuser:
+            return await self.get_response(request)
+        return await sync_to_async(self.profile)(
+            request, async_to_sync(self.get_response)
+        )
+
+    @staticmethod
+    def profile(request, get_response):
+        if profiling.acquire_slot(request.user):
+            response, report_id = profiling.profile_request(get_response, request)
+            response["X-Profile-Url"] = reverse(
+                "base:profiler-detail", args=[report_id]
+            )
+        else:
+            response = get_response(request)
+
+        toggle = request.GET.get(profiling.PROFILE_PARAM)
+        if toggle == "on":
+            response.set_cookie(
+                profiling.PROFILE_COOKIE, "1", httponly=True, samesite="Lax"
+            )
+        elif toggle == "off":
+            response.delete_cookie(profiling.PROFILE_COOKIE)
+        return response
+
+
+class ReplicaMiddleware:
+    """
+    Sends the reads of read-only views (`read_replica = True`) to the
+    replica and pins a client to default for REPLICA_STICKY_SECONDS after
+    it writes (see apps.base.utils.replica). Does nothing unless
+    REPLICA_DATABASE is set.
+    """
+
+    sync_capable = True
+    async_capable = True
+    SAFE_METHODS = {"GET", "HEAD"}
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not replica.replica_alias():
+            return self.get_response(request)
+        # Reads start on default; process_view switches read-only views
+        with replica.reads_from_replica(False):
+            response = self.get_response(request)
+            self.pin(request, response)
+        return response
+
+    async def __acall__(self, request):
+        if not replica.replica_alias():
+            return await self.get_response(request)
+        with replica.reads_from_replica(False):
+            response = await self.get_response(request)
+            self.pin(request, response)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view = getattr(view_func, "view_class", view_func)
+        if (
+            replica.replica_alias()
+            and request.method in self.SAFE_METHODS
+            and getattr(view, "read_replica", False)
+            and not self.pinned(request)
+        ):
+            replica.start_reading()
+
+    @staticmethod
+    def pinned(request) -> bool:
+        try:
+            return float(request.COOKIES.get(replica.PIN_COOKIE, 0)) > time.time()
+        except ValueError:
+            return False
+
+    def pin(self, request, response) -> None:
+        if request.method in self.SAFE_METHODS and not replica.wrote():
+            return
+        seconds = settings.REPLICA_STICKY_SECONDS
+        response.set_cookie(
+            replica.PIN_COOKIE,
+            f"{time.time() + seconds:.3f}",
+            max_age=seconds,
+            httponly=True,
+            samesite="Lax",
+        )
@@ -0,0 +1,74 @@
+# Generated by Django 5.2.18 on 2026-10-19 01:04
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="SlowQuery",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="Created at"),
+                ),
+                (
+                    "modified_at",
+                    models.DateTimeField(auto_now=True, verbose_name="Modified at"),
+                ),
+                ("view", models.CharField(max_length=200, verbose_name="View")),
+                ("digest", models.CharField(max_length=32, verbose_name="Digest")),
+                ("fingerprint", models.TextField(verbose_name="Fingerprint")),
+                (
+                    "calls",
+                    models.PositiveBigIntegerField(default=0, verbose_name="Calls"),
+                ),
+                ("total_ms", models.FloatField(default=0, verbose_name="Total (ms)")),
+                ("max_ms", models.FloatField(default=0, verbose_name="Max (ms)")),
+                ("p95_ms", models.FloatField(default=0, verbose_name="p95 (ms)")),
+                ("samples", models.JSONField(default=list, verbose_name="Samples")),
+                (
+                    "example_sql",
+                    models.TextField(blank=True, verbose_name="Example SQL"),
+                ),
+                (
+                    "example_params",
+                    models.JSONField(
+                        blank=True,
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        null=True,
+                        verbose_name="Example params",
+                    ),
+                ),
+                (
+                    "example_ms",
+                    models.FloatField(default=0, verbose_name="Example (ms)"),
+                ),
+            ],
+            options={
+                "verbose_name": "Slow Query",
+                "verbose_name_plural": "Slow Queries",
+                "ordering": ["-total_ms"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("view", "digest"), name="unique_slow_query_per_view"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,34 @@
+from django.db import migrations
+
+# Trigger function for apps.base.utils.live_updates: NOTIFYs the channel
+# `<prefix><parent pk hex>` of the row's parent, e.g. trigger arguments
+# ('session_id', 'weighingsession_'). Postgres delivers it on commit and
+# folds duplicates within a transaction, so a batch write wakes once.
+CREATE_FUNCTION = """
+CREATE OR REPLACE FUNCTION cnv_notify_parent() RETURNS trigger AS $$
+DECLARE
+    parent_id text;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        parent_id := to_jsonb(OLD) ->> TG_ARGV[0];
+    ELSE
+        parent_id := to_jsonb(NEW) ->> TG_ARGV[0];
+    END IF;
+    PERFORM pg_notify(TG_ARGV[1] || replace(parent_id, '-', ''), '');
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+DROP_FUNCTION = "DROP FUNCTION IF EXISTS cnv_notify_parent();"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("base", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_FUNCTION, DROP_FUNCTION),
+    ]
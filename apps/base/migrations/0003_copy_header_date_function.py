@@ -0,0 +1,28 @@
+from django.db import migrations
+
+# Trigger function for apps.base.models.HeaderDateField: when a header's
+# date changes, copies it to its detail rows, e.g. trigger arguments
+# ('weight_weightrecord', 'session_id', 'session_date'). The rows of a
+# partitioned detail table move to the partition of the new year.
+CREATE_FUNCTION = """
+CREATE OR REPLACE FUNCTION cnv_copy_header_date() RETURNS trigger AS $$
+BEGIN
+    EXECUTE format('UPDATE %I SET %I = $1 WHERE %I = $2', TG_ARGV[0], TG_ARGV[2], TG_ARGV[1])
+    USING NEW.date, NEW.uuid;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+DROP_FUNCTION = "DROP FUNCTION IF EXISTS cnv_copy_header_date();"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("base", "0002_notify_progress_function"),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_FUNCTION, DROP_FUNCTION),
+    ]
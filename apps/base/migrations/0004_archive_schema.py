@@ -0,0 +1,19 @@
+from django.db import migrations
+
+# Tables of apps.base.utils.archive; created by the archiver itself, so
+# they follow the live tables' columns
+CREATE_SCHEMA = "CREATE SCHEMA IF NOT EXISTS archive;"
+
+# Refuses while archived rows exist
+DROP_SCHEMA = "DROP SCHEMA IF EXISTS archive;"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("base", "0003_copy_header_date_function"),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_SCHEMA, DROP_SCHEMA),
+    ]
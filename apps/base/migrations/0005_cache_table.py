@@ -0,0 +1,26 @@
+from django.db import migrations
+
+# The table of the default "db" cache backend (core.settings.CACHES), as
+# `manage.py createcachetable` would create it, so `migrate` alone is
+# enough; IF NOT EXISTS keeps databases where that command already ran
+CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS cnv_cache (
+    cache_key varchar(255) NOT NULL PRIMARY KEY,
+    value text NOT NULL,
+    expires timestamp with time zone NOT NULL
+);
+CREATE INDEX IF NOT EXISTS cnv_cache_expires ON cnv_cache (expires);
+"""
+
+DROP_TABLE = "DROP TABLE IF EXISTS cnv_cache;"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("base", "0004_archive_schema"),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_TABLE, DROP_TABLE),
+    ]
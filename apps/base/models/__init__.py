@@ -1,3 +1,11 @@
 from .base_model import AllObjectsManager, BaseManager, BaseModel
+from .fields import HeaderDateField
+from .slow_query import SlowQuery
 
-__all__ = ["BaseModel", "BaseManager", "AllObjectsManager"]
+__all__ = [
+    "BaseModel",
+    "BaseManager",
+    "AllObjectsManager",
+    "HeaderDateField",
+    "SlowQuery",
+]
@@ -3,14 +3,29 @@ from typing import Any, Optional, Union
 
 from django.db import models
 from django.db.models import ProtectedError
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from apps.base.utils import model_cache
+
 
 class BaseQuerySet(models.QuerySet):
     """
     Custom QuerySet with soft deletion support.
     """
 
+    def update(self, **kwargs) -> int:
+        """
+        Bulk updates stamp modified_at like save() does, so conditional
+        GET validators (max(modified_at)) see them, and bump the model's
+        cache version like the save/delete signals do.
+        """
+        kwargs.setdefault("modified_at", timezone.now())
+        rows = super().update(**kwargs)
+        if rows:
+            model_cache.bump(self.model)
+        return rows
+
     def delete(self, destroy: bool = False) -> Union[int, tuple[int, dict[str, int]]]:
         """
         Soft delete items in the queryset unless destroy is True.
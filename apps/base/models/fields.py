@@ -0,0 +1,32 @@
+from django.db import models
+
+
+class HeaderDateField(models.DateField):
+    """
+    A copy of the date of a detail row's header (e.g. the date of a weight
+    record's session), refreshed on every insert and save like auto_now
+    refreshes a timestamp, bulk_create included. It lets queries on the
+    detail table filter by date without joining the header, e.g. to prune
+    the partitions of a table partitioned by it (see
+    apps.base.utils.partitioning).
+
+    `header` names the foreign key; a header date edit reaches the copies
+    through the cnv_copy_header_date trigger.
+    """
+
+    def __init__(self, *args, header: str, **kwargs):
+        self.header = header
+        # Never entered: pre_save() sets it
+        kwargs["editable"], kwargs["blank"] = False, True
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        kwargs["header"] = self.header
+        del kwargs["editable"], kwargs["blank"]
+        return name, path, args, kwargs
+
+    def pre_save(self, model_instance, add):
+        value = getattr(model_instance, self.header).date
+        setattr(model_instance, self.attname, value)
+        return value
@@ -0,0 +1,44 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from apps.base.models.base_model import TimestampsOnlyBaseModel
+
+
+class SlowQuery(TimestampsOnlyBaseModel):
+    """
+    Running totals of one SQL fingerprint within one view, written by
+    apps.base.utils.slow_queries.
+    """
+
+    view = models.CharField(_("View"), max_length=200)
+    digest = models.CharField(_("Digest"), max_length=32)
+    fingerprint = models.TextField(_("Fingerprint"))
+    calls = models.PositiveBigIntegerField(_("Calls"), default=0)
+    total_ms = models.FloatField(_("Total (ms)"), default=0)
+    max_ms = models.FloatField(_("Max (ms)"), default=0)
+    p95_ms = models.FloatField(_("p95 (ms)"), default=0)
+    # Most recent durations, the basis of p95_ms
+    samples = models.JSONField(_("Samples"), default=list)
+    example_sql = models.TextField(_("Example SQL"), blank=True)
+    example_params = models.JSONField(
+        _("Example params"), null=True, blank=True, encoder=DjangoJSONEncoder
+    )
+    example_ms = models.FloatField(_("Example (ms)"), default=0)
+
+    class Meta:
+        verbose_name = _("Slow Query")
+        verbose_name_plural = _("Slow Queries")
+        ordering = ["-total_ms"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["view", "digest"], name="unique_slow_query_per_view"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.view}: {self.fingerprint[:80]}"
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
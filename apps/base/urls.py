@@ -0,0 +1,14 @@
+from django.urls import path
+
+from apps.base.views.profiling import ProfileReportDetailView, ProfileReportListView
+
+app_name = "base"
+
+urlpatterns = [
+    path("profiler/", ProfileReportListView.as_view(), name="profiler-list"),
+    path(
+        "profiler/<slug:report_id>/",
+        ProfileReportDetailView.as_view(),
+        name="profiler-detail",
+    ),
+]
@@ -0,0 +1,292 @@
+"""
+Archive tier for closed years of history.
+
+archive_before() moves the records dated before a horizon out of the live
+tables: weighing sessions and sanitary events with their detail rows,
+feeding events, and done or canceled tasks. They go to tables of the
+same name in the `archive` schema, which carry the live columns and
+nothing else (no foreign keys, checks or soft-delete indexes), plus one
+index on the column they are read by. Rows move in batches, each its own
+transaction with a single DELETE ... RETURNING into INSERT, so the live
+tables and their indexes keep only the years in use.
+
+Soft-deleted records stay live, in the trash, and so do records with
+soft-deleted detail rows, which would otherwise leave the trash with them.
+
+animal_latest() gives the state syncs (sync_treatment_state) the latest
+archived date of each animal, so re-syncing after an archive run doesn't
+forget treatments that were moved.
+
+animal_history() reads archived detail rows back as model instances,
+with their headers, flagged `archived`; the animal history services
+return them when asked for the full history.
+"""
+
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, router, transaction
+from django.db.models import Model, Q
+from django.db.models.expressions import RawSQL
+from django.utils import timezone
+
+from apps.base.utils import model_cache
+from apps.health.models import SanitaryEvent, SanitaryEventTarget
+from apps.nutrition.models import FeedingEvent
+from apps.tasks.models import Task
+from apps.weight.models import WeighingSession, WeightRecord
+
+SCHEMA = "archive"
+
+
+@dataclass(frozen=True)
+class Detail:
+    model: type[Model]
+    header: str  # Foreign key to the header
+    read_by: str = "animal"
+
+
+@dataclass(frozen=True)
+class History:
+    """A kind of record archived with its detail rows."""
+
+    model: type[Model]
+    date_field: str
+    closed: Q = Q()
+    details: tuple[Detail, ...] = ()
+
+
+HISTORY = [
+    History(WeighingSession, "date", details=(Detail(WeightRecord, "session"),)),
+    History(SanitaryEvent, "date", details=(Detail(SanitaryEventTarget, "event"),)),
+    History(FeedingEvent, "date"),
+    History(
+        Task,
+        "due_date",
+        closed=Q(status__in=[Task.Status.DONE, Task.Status.CANCELED]),
+    ),
+]
+
+
+def horizon(years: Optional[int] = None) -> date:
+    """January 1st, `years` (default ARCHIVE_AFTER_YEARS) years ago."""
+    if years is None:
+        years = settings.ARCHIVE_AFTER_YEARS
+    return date(timezone.localdate().year - years, 1, 1)
+
+
+def _archived(connection, model) -> str:
+    quote = connection.ops.quote_name
+    return f"{quote(SCHEMA)}.{quote(model._meta.db_table)}"
+
+
+def _columns(cursor, relation: str) -> dict[str, tuple[str, bool]]:
+    """{column: (type, not null)} of `relation`."""
+    cursor.execute(
+        """
+        SELECT attname, format_type(atttypid, atttypmod), attnotnull
+        FROM pg_attribute
+        WHERE attrelid = %s::regclass AND attnum > 0 AND NOT attisdropped
+        """,
+        [relation],
+    )
+    return {name: (type_, not_null) for name, type_, not_null in cursor.fetchall()}
+
+
+def ensure_table(model, index: Iterable[str], using: str = DEFAULT_DB_ALIAS) -> None:
+    """
+    Creates the archive table of `model`, indexed on the `index` columns,
+    or brings its columns in line with the live table's: new live columns
+    are added, and those the live table dropped become nullable.
+    """
+    connection = connections[using]
+    quote = connection.ops.quote_name
+    table, archived = model._meta.db_table, _archived(connection, model)
+    with connection.cursor() as cursor:
+        cursor.execute(f"CREATE TABLE IF NOT EXISTS {archived} (LIKE {quote(table)})")
+        live = _columns(cursor, quote(table))
+        kept = _columns(cursor, archived)
+        for name, (type_, _not_null) in live.items():
+            if name not in kept:
+                cursor.execute(
+                    f"ALTER TABLE {archived} ADD COLUMN {quote(name)} {type_}"
+                )
+        for name, (_type, not_null) in kept.items():
+            if name not in live and not_null:
+                cursor.execute(
+                    f"ALTER TABLE {archived} ALTER COLUMN {quote(name)} DROP NOT NULL"
+                )
+        for column in index:
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS {quote(f'{table}_{column}')} "
+                f"ON {archived} ({quote(column)})"
+            )
+
+
+def _move(cursor, model, column: str, ids: list) -> int:
+    """Moves the rows of `model` whose `column` is in `ids`."""
+    quote = cursor.db.ops.quote_name
+    columns = ", ".join(quote(field.column) for field in model._meta.concrete_fields)
+    cursor.execute(
+        f"WITH moved AS (DELETE FROM {quote(model._meta.db_table)} "
+        f"WHERE {quote(column)} = ANY(%s) RETURNING {columns}) "
+        f"INSERT INTO {_archived(cursor.db, model)} ({columns}) "
+        f"SELECT {columns} FROM moved",
+        [ids],
+    )
+    return cursor.rowcount
+
+
+def _closed(history: History, before: date, using: str):
+    queryset = history.model.objects.using(using).filter(
+        history.closed, **{f"{history.date_field}__lt": before}
+    )
+    for detail in history.details:
+        trashed = detail.model.all_objects.using(using).filter(is_deleted=True)
+        queryset = queryset.exclude(
+            pk__in=trashed.values(detail.model._meta.get_field(detail.header).attname)
+        )
+    return queryset
+
+
+def pending(before: date, using: str = DEFAULT_DB_ALIAS) -> dict[str, int]:
+    """{model label: records dated before `before`} still live."""
+    return {
+        history.model._meta.label: _closed(history, before, using).count()
+        for history in HISTORY
+    }
+
+
+def _archive_batch(
+    history: History, before: date, batch_size: int, using: str
+) -> Counter:
+    moved: Counter = Counter()
+    with transaction.atomic(using=using):
+        # Records being edited are left for the next run
+        ids = list(
+            _closed(history, before, using)
+            .order_by(history.date_field)
+            .select_for_update(skip_locked=True)
+            .values_list("pk", flat=True)[:batch_size]
+        )
+        if not ids:
+            return moved
+        with connections[using].cursor() as cursor:
+            for detail in history.details:
+                column = detail.model._meta.get_field(detail.header).column
+                moved[detail.model._meta.label] += _move(
+                    cursor, detail.model, column, ids
+                )
+            moved[history.model._meta.label] += _move(
+                cursor, history.model, history.model._meta.pk.column, ids
+            )
+        # Raw SQL passes by the cache invalidation signals
+        model_cache.bump(history.model, *(detail.model for detail in history.details))
+    return moved
+
+
+def archive_before(
+    before: date, batch_size: int, using: str = DEFAULT_DB_ALIAS
+) -> Counter:
+    """
+    Moves the history dated before `before` to the archive, `batch_size`
+    records (with their detail rows) per transaction. Returns the number
+    of rows moved per model label.
+    """
+    moved: Counter = Counter()
+    for history in HISTORY:
+        ensure_table(history.model, [history.model._meta.pk.column], using)
+        for detail in history.details:
+            column = detail.model._meta.get_field(detail.read_by).column
+            ensure_table(detail.model, [column], using)
+        while batch := _archive_batch(history, before, batch_size, using):
+            moved += batch
+            if batch[history.model._meta.label] < batch_size:
+                break
+    return moved
+
+
+def _exists(connection, model) -> bool:
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT to_regclass(%s)", [_archived(connection, model)])
+        return cursor.fetchone()[0] is not None
+
+
+def rows(model, column: str, values: Iterable) -> list:
+    """The archived rows of `model` whose `column` is in `values`."""
+    values = list(values)
+    using = router.db_for_read(model)
+    connection = connections[using]
+    if not values or not _exists(connection, model):
+        return []
+    found = list(
+        model.objects.raw(
+            f"SELECT * FROM {_archived(connection, model)} "
+            f"WHERE {connection.ops.quote_name(column)} = ANY(%s)",
+            [values],
+            using=using,
+        )
+    )
+    for row in found:
+        row.archived = True
+    return found
+
+
+def animal_history(detail_model, header: str, animal) -> list:
+    """
+    The live (not soft-deleted) archived detail rows of `animal`, e.g.
+    its weight records, each with its archived header set.
+    """
+    details = [
+        detail
+        for detail in rows(
+            detail_model, detail_model._meta.get_field("animal").column, [animal.pk]
+        )
+        if not detail.is_deleted
+    ]
+    field = detail_model._meta.get_field(header)
+    headers = {
+        row.pk: row
+        for row in rows(
+            field.related_model,
+            field.target_field.column,
+            {getattr(detail, field.attname) for detail in details},
+        )
+    }
+    for detail in details:
+        setattr(detail, header, headers[getattr(detail, field.attname)])
+    return details
+
+
+def animal_latest(
+    detail_model, header: str, using: str = DEFAULT_DB_ALIAS
+) -> Optional[RawSQL]:
+    """
+    For queries over Cattle: the latest header date (e.g. event date) of
+    each animal's archived `detail_model` rows, NULL when it has none.
+    None while nothing was archived.
+    """
+    connection = connections[using]
+    field = detail_model._meta.get_field(header)
+    header_model = field.related_model
+    if not (_exists(connection, detail_model) and _exists(connection, header_model)):
+        return None
+    quote = connection.ops.quote_name
+    history = next(history for history in HISTORY if history.model is header_model)
+    date_field = header_model._meta.get_field(history.date_field)
+    animal = detail_model._meta.get_field("animal")
+    return RawSQL(
+        f"SELECT max(h.{quote(date_field.column)}) "
+        f"FROM {_archived(connection, detail_model)} d "
+        f"JOIN {_archived(connection, header_model)} h "
+        f"ON h.{quote(field.target_field.column)} = d.{quote(field.column)} "
+        # Correlated with the outer cattle row
+        f"WHERE d.{quote(animal.column)} = "
+        f"{quote(animal.related_model._meta.db_table)}."
+        f"{quote(animal.target_field.column)} AND NOT d.is_deleted",
+        [],
+        output_field=date_field,
+    )
@@ -0,0 +1,395 @@
+"""
+Benchmarks of the hot paths against a seeded herd.
+
+Each scenario is a function registered with `@scenario` that takes the
+`Bench` and returns the action to measure; whatever it does before
+returning (picking animals, building forms) is not timed. `run()` calls
+every action inside a savepoint that is rolled back, so writes never pile
+up between repetitions: `warmup` discarded runs, `repeat` timed runs
+(median, min and max wall time, query count) and one last run under
+tracemalloc for the peak Python memory, kept apart because tracing slows
+the code down.
+
+Runs are appended to a JSON history file (BENCHMARK_HISTORY) and
+`compare()` flags the metrics that got worse than the previous run on the
+same dataset. Query counts are deterministic, so any increase counts.
+"""
+
+import gc
+import json
+import statistics
+import subprocess
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import Callable, NamedTuple, Optional
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection, transaction
+from django.db.models import Count
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.authentication.models import User
+from apps.base.utils.query_stats import QueryRecorder
+from apps.cattle.models import Cattle
+from apps.cattle.services.cattle_service import CattleService
+from apps.cattle.services.herd_query import HerdQuery
+from apps.health.models import Medication
+from apps.health.services.health_service import HealthService
+from apps.locations.models import Location, LocationType, MovementReason
+from apps.locations.services.movement_service import MovementService
+from apps.partners.models import Partner
+from apps.sales.models import Sale, SaleItem
+from apps.sales.services.sale_service import SaleService
+from apps.tasks.models import Task
+from apps.weight.models import WeighingSession
+from apps.weight.services.weight_service import WeightService
+
+THRESHOLD = 0.2
+# Smaller changes are noise whatever the percentage
+MIN_DELTA = {"wall_ms": 5.0, "queries": 0, "peak_kib": 256.0}
+
+SCENARIOS: dict[str, Callable] = {}
+
+
+class BenchmarkError(Exception):
+    pass
+
+
+def scenario(name: str):
+    def register(function):
+        SCENARIOS[name] = function
+        return function
+
+    return register
+
+
+@dataclass
+class Bench:
+    user: User
+    client: Client
+    today: date
+
+    @classmethod
+    def create(cls) -> "Bench":
+        user, _created = User.objects.get_or_create(
+            username="benchmark",
+            defaults={"is_staff": True, "is_superuser": True},
+        )
+        client = Client()
+        client.force_login(user)
+        return cls(user=user, client=client, today=timezone.localdate())
+
+    def get(self, url: str, **params):
+        response = self.client.get(url, params)
+        if response.status_code != 200:
+            raise BenchmarkError(f"GET {url} returned {response.status_code}")
+        return response
+
+    def herd(self, size: int) -> list[Cattle]:
+        """Up to `size` available animals clear of any withdrawal period."""
+        return list(
+            Cattle.objects.filter(status=Cattle.STATUS_AVAILABLE)
+            .exclude(withdrawal_until__gte=self.today)
+            .select_related("location")
+            .order_by("tag")[:size]
+        )
+
+
+# -- Scenarios
+
+
+@scenario("dashboard")
+def dashboard(bench: Bench):
+    return lambda: bench.get(reverse("dashboard:home"))
+
+
+@scenario("cattle_list")
+def cattle_list(bench: Bench):
+    return lambda: bench.get(reverse("cattle:list"))
+
+
+@scenario("cattle_search")
+def cattle_search(bench: Bench):
+    # The year prefix of the tags matches a sizeable share of the herd
+    term = Cattle.objects.order_by("tag").values_list("tag", flat=True).first()
+    return lambda: bench.get(reverse("cattle:list"), q=(term or "")[:3])
+
+
+# "Females, 18-30 months, ADG < 0.5 over 90 days, not treated in 60 days,
+# in feedlots": the cohort that motivated the herd query builder
+HERD_QUERY_COHORT = {
+    "sex": Cattle.SEX_FEMALE,
+    "status": Cattle.STATUS_AVAILABLE,
+    "age_min_months": 18,
+    "age_max_months": 30,
+    "adg_max": "0.5",
+    "adg_days": 90,
+    "not_treated_days": 60,
+    "location_type": LocationType.FEEDLOT,
+}
+
+
+@scenario("herd_query_cohort")
+def herd_query_cohort(bench: Bench):  # pylint: disable=unused-argument
+    criteria = HerdQuery(**HERD_QUERY_COHORT)
+
+    def select():
+        # What the list shows: the count and the first page
+        queryset = CattleService.get_all_cattle(criteria=criteria)
+        queryset.count()
+        list(queryset[:25])
+
+    return select
+
+
+@scenario("location_list")
+def location_list(bench: Bench):
+    return lambda: bench.get(reverse("locations:list"))
+
+
+@scenario("task_calendar_month")
+def task_calendar_month(bench: Bench):
+    first = bench.today.replace(day=1)
+    animals = bench.herd(max(Cattle.objects.count() // 10, 30))
+    content_type = ContentType.objects.get_for_model(Cattle)
+    Task.objects.bulk_create(
+        Task(
+            title=f"Check {animal.tag}",
+            due_date=first + timedelta(days=index % 28),
+            priority=Task.Priority.values[index % len(Task.Priority.values)],
+            assigned_to=bench.user if index % 3 else None,
+            content_type=content_type,
+            object_id=animal.pk,
+        )
+        for index, animal in enumerate(animals)
+    )
+    end = (first + timedelta(days=32)).replace(day=1)
+    return lambda: bench.get(
+        reverse("tasks:api-events"), start=first.isoformat(), end=end.isoformat()
+    )
+
+
+@scenario("batch_weighing_500")
+def batch_weighing(bench: Bench):
+    session = WeighingSession.objects.create(date=bench.today, name="Benchmark")
+    weights = [
+        (animal, (animal.current_weight or Decimal(300)) + Decimal("4.5"))
+        for animal in bench.herd(500)
+    ]
+    return lambda: WeightService.record_weights(session, weights)
+
+
+@scenario("batch_sanitary_event_1000")
+def batch_sanitary_event(bench: Bench):
+    medication = Medication.objects.order_by("name").first()
+    animal_ids = [str(animal.pk) for animal in bench.herd(1000)]
+    event_data = {
+        "date": bench.today,
+        "title": "Benchmark",
+        "medication": medication,
+        "total_cost": Decimal("2500.00"),
+        "performed_by": bench.user,
+    }
+    return lambda: HealthService.create_batch_event(event_data, animal_ids)
+
+
+@scenario("bulk_move")
+def bulk_move(bench: Bench):
+    origin = (
+        Location.objects.annotate(head=Count("cattle"))
+        .filter(is_active=True)
+        .order_by("-head", "name")
+        .first()
+    )
+    destination = (
+        Location.objects.filter(is_active=True)
+        .exclude(pk=origin.pk)
+        .order_by("name")
+        .first()
+    )
+    animals = list(
+        Cattle.objects.filter(location=origin).select_related("location")[:500]
+    )
+    return lambda: MovementService.move_cattle(
+        animals, destination, bench.user, MovementReason.ROTATION
+    )
+
+
+@scenario("sale_200_head")
+def sale_lot(bench: Bench):
+    partner = Partner.objects.order_by("name").first()
+    content_type = ContentType.objects.get_for_model(Cattle)
+    animals = bench.herd(200)
+
+    def sell():
+        items = [
+            SaleItem(
+                content_type=content_type,
+                object_id=animal.pk,
+                quantity=Decimal(1),
+                unit_price=Decimal("3200.00"),
+            )
+            for animal in animals
+        ]
+        SaleService.create_sale(Sale(partner=partner, date=bench.today), items)
+
+    return sell
+
+
+# -- Running
+
+
+def measure(bench: Bench, setup: Callable, repeat: int, warmup: int) -> dict:
+    walls, queries = [], 0
+    for index in range(warmup + repeat):
+        with transaction.atomic():
+            action = setup(bench)
+            with QueryRecorder() as recorder:
+                start = time.perf_counter()
+                action()
+                elapsed = time.perf_counter() - start
+            transaction.set_rollback(True)
+        if index >= warmup:
+            walls.append(elapsed * 1000)
+            queries = recorder.count
+
+    with transaction.atomic():
+        action = setup(bench)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            action()
+            _current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        transaction.set_rollback(True)
+
+    return {
+        "wall_ms": round(statistics.median(walls), 2),
+        "min_ms": round(min(walls), 2),
+        "max_ms": round(max(walls), 2),
+        "queries": queries,
+        "peak_kib": round(peak / 1024, 1),
+        "repeat": repeat,
+    }
+
+
+def run(
+    names: Optional[list[str]] = None,
+    repeat: int = 5,
+    warmup: int = 1,
+    log: Callable[[str], None] = lambda message: None,
+) -> dict:
+    """Measures the scenarios on the current data; returns name -> result."""
+    results = {}
+    # The test client's host
+    with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+        bench = Bench.create()
+        for name in names or SCENARIOS:
+            log(f"Running {name}...")
+            results[name] = measure(bench, SCENARIOS[name], repeat, warmup)
+    return results
+
+
+def analyze() -> None:
+    """Refreshes planner statistics after seeding, as autovacuum would."""
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=settings.BASE_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def make_run(dataset: dict, results: dict, label: str = "") -> dict:
+    return {
+        "timestamp": timezone.now().isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "label": label,
+        "database": connection.vendor,
+        "dataset": dataset,
+        "results": results,
+    }
+
+
+# -- History
+
+
+def load_history(path) -> list[dict]:
+    path = Path(path)
+    if not path.exists():
+        return []
+    with path.open(encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def save_run(path, benchmark_run: dict) -> None:
+    path = Path(path)
+    history = load_history(path)
+    history.append(benchmark_run)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_suffix(".tmp")
+    with temporary.open("w", encoding="utf-8") as handle:
+        json.dump(history, handle, indent=2)
+    temporary.replace(path)
+
+
+def find_baseline(history: list[dict], current: dict) -> Optional[dict]:
+    """The latest earlier run on the same dataset and database."""
+    for candidate in reversed(history):
+        if candidate is current:
+            continue
+        if (
+            candidate["dataset"] == current["dataset"]
+            and candidate["database"] == current["database"]
+            and candidate["timestamp"] <= current["timestamp"]
+        ):
+            return candidate
+    return None
+
+
+class Comparison(NamedTuple):
+    scenario: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """Relative change; positive is worse."""
+        if not self.baseline:
+            return 0.0 if not self.current else float("inf")
+        return (self.current - self.baseline) / self.baseline
+
+    def regressed(self, threshold: float = THRESHOLD) -> bool:
+        if self.current - self.baseline <= MIN_DELTA[self.metric]:
+            return False
+        return self.metric == "queries" or self.change > threshold
+
+
+def compare(baseline: dict, current: dict) -> list[Comparison]:
+    """Every metric of the scenarios present in both runs."""
+    return [
+        Comparison(name, metric, baseline["results"][name][metric], result[metric])
+        for name, result in current["results"].items()
+        if name in baseline["results"]
+        for metric in MIN_DELTA
+    ]
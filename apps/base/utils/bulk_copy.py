@@ -0,0 +1,109 @@
+"""
+Bulk loading of rows given as dicts of field attnames.
+
+On PostgreSQL rows are streamed with COPY ... FROM STDIN, which skips
+model instances, signals and per-statement overhead entirely; elsewhere
+they go through bulk_create. Either way fields left out of a row take the
+model default, `auto_now` timestamps are filled in and the caller is
+expected to set the primary key.
+
+    with BulkWriter() as writer:
+        writer.add(Cattle, {"uuid": uuid4(), "tag": "A1"})
+"""
+
+from collections import Counter, defaultdict
+
+from django.db import connection
+from django.db.models import NOT_PROVIDED
+from django.utils import timezone
+
+CHUNK_SIZE = 20_000
+
+
+class BulkWriter:
+    def __init__(self, chunk_size: int = CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        self.counts: Counter = Counter()
+        self._pending: dict = defaultdict(list)
+        self._now = timezone.now()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        if exc_type is None:
+            self.flush()
+
+    def add(self, model, row: dict) -> None:
+        pending = self._pending[model]
+        pending.append(row)
+        if len(pending) >= self.chunk_size:
+            self._write(model, pending)
+            pending.clear()
+
+    @property
+    def models(self) -> list:
+        """Every model rows were added for."""
+        return list(self._pending)
+
+    def flush(self) -> None:
+        for model, rows in self._pending.items():
+            if rows:
+                self._write(model, rows)
+                rows.clear()
+
+    def _defaults(self, model) -> list:
+        """(field, default) per concrete field; callables are called per row."""
+        defaults = []
+        for field in model._meta.concrete_fields:
+            if field.db_returning:
+                continue  # Serial keys come from the sequence
+            if getattr(field, "auto_now", False) or getattr(
+                field, "auto_now_add", False
+            ):
+                default = self._now
+            elif field.has_default() and callable(field.default):
+                default = field.default
+            else:
+                # "" for text columns, None for nullable ones
+                default = field.get_default()
+            defaults.append((field, default))
+        return defaults
+
+    def _write(self, model, rows: list) -> None:
+        defaults = self._defaults(model)
+        self.counts[model._meta.label] += len(rows)
+        if connection.vendor != "postgresql":
+            model._base_manager.bulk_create(
+                [
+                    model(
+                        **{
+                            field.attname: (
+                                row[field.attname]
+                                if field.attname in row
+                                else default() if callable(default) else default
+                            )
+                            for field, default in defaults
+                        }
+                    )
+                    for row in rows
+                ],
+                batch_size=1000,
+            )
+            return
+
+        columns = ", ".join(
+            connection.ops.quote_name(field.column) for field, _ in defaults
+        )
+        table = connection.ops.quote_name(model._meta.db_table)
+        # Raised as Django's DatabaseError subclasses, like any other query
+        with connection.cursor() as cursor, connection.wrap_database_errors:
+            with cursor.copy(f"COPY {table} ({columns}) FROM STDIN") as copy:
+                for row in rows:
+                    values = []
+                    for field, default in defaults:
+                        value = row.get(field.attname, NOT_PROVIDED)
+                        if value is NOT_PROVIDED:
+                            value = default() if callable(default) else default
+                        values.append(field.get_db_prep_save(value, connection))
+                    copy.write_row(values)
@@ -0,0 +1,205 @@
+"""
+The same concurrent polling load served by the WSGI and the ASGI handler.
+
+`clients` simulated tablets each send their share of `requests` GETs, one
+after the other, with the session cookie of a real user. The WSGI side
+is one worker with `threads` threads (gunicorn's gthread worker): a
+request waits for a free thread, and that wait counts in its latency.
+The ASGI side is one worker's event loop with every client in flight at
+once, as under uvicorn. Both call Django's own handlers in process, so
+the comparison needs no server and measures the stack below the socket:
+middleware, views and the database.
+
+Both sides read the committed data through their own connections; run it
+on a seeded database (populate_mock_data), not inside a transaction.
+"""
+
+import asyncio
+import io
+import statistics
+import threading
+import time
+from dataclasses import dataclass
+from importlib import import_module
+from typing import Optional
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.db import connections
+from django.test.utils import override_settings
+
+from apps.base.utils.slow_queries import percentile
+
+HOST = "testserver"
+
+
+def session_cookie(user) -> str:
+    """A logged-in session for `user`, as a Cookie header value."""
+    session = import_module(settings.SESSION_ENGINE).SessionStore()
+    session[SESSION_KEY] = user._meta.pk.value_to_string(user)
+    session[BACKEND_SESSION_KEY] = "django.contrib.auth.backends.ModelBackend"
+    session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+    session.save()
+    return f"{settings.SESSION_COOKIE_NAME}={session.session_key}"
+
+
+@dataclass
+class Result:
+    handler: str
+    latencies: list[float]  # seconds
+    errors: int
+    elapsed: float
+
+    def summary(self) -> dict:
+        milliseconds = [latency * 1000 for latency in self.latencies]
+        return {
+            "handler": self.handler,
+            "requests": len(milliseconds),
+            "errors": self.errors,
+            "rps": len(milliseconds) / self.elapsed if self.elapsed else 0.0,
+            "mean_ms": statistics.fmean(milliseconds) if milliseconds else 0.0,
+            "p50_ms": percentile(milliseconds, 0.5),
+            "p95_ms": percentile(milliseconds, 0.95),
+            "max_ms": max(milliseconds, default=0.0),
+        }
+
+
+def _shares(requests: int, clients: int) -> list[int]:
+    return [
+        requests // clients + (index < requests % clients) for index in range(clients)
+    ]
+
+
+def run_wsgi(url: str, cookie: str, clients: int, requests: int, threads: int):
+    handler = WSGIHandler()
+    path = urlsplit(url)
+    slots = threading.BoundedSemaphore(threads)
+    latencies, errors = [], []
+    lock = threading.Lock()
+
+    def call() -> bool:
+        statuses = []
+        environ = {
+            "REQUEST_METHOD": "GET",
+            "PATH_INFO": path.path,
+            "QUERY_STRING": path.query,
+            "SERVER_NAME": HOST,
+            "SERVER_PORT": "80",
+            "HTTP_HOST": HOST,
+            "HTTP_COOKIE": cookie,
+            "REMOTE_ADDR": "127.0.0.1",
+            "SERVER_PROTOCOL": "HTTP/1.1",
+            "wsgi.url_scheme": "http",
+            "wsgi.input": io.BytesIO(),
+            "wsgi.errors": io.StringIO(),
+            "wsgi.multithread": True,
+            "wsgi.multiprocess": False,
+            "wsgi.run_once": False,
+            "wsgi.version": (1, 0),
+        }
+        body = handler(environ, lambda status, headers: statuses.append(status))
+        try:
+            for _chunk in body:
+                pass
+        finally:
+            body.close()
+        return statuses[0].startswith("200")
+
+    def client(count: int):
+        for _ in range(count):
+            start = time.perf_counter()
+            with slots:
+                ok = call()
+            with lock:
+                latencies.append(time.perf_counter() - start)
+                errors.append(not ok)
+        connections.close_all()
+
+    workers = [
+        threading.Thread(target=client, args=(count,))
+        for count in _shares(requests, clients)
+    ]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return Result("wsgi", latencies, sum(errors), time.perf_counter() - start)
+
+
+async def _asgi_get(application, url: str, cookie: str) -> bool:
+    path = urlsplit(url)
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path.path,
+        "raw_path": path.path.encode(),
+        "query_string": path.query.encode(),
+        "root_path": "",
+        "headers": [(b"host", HOST.encode()), (b"cookie", cookie.encode())],
+        "client": ("127.0.0.1", 0),
+        "server": (HOST, 80),
+    }
+    received = False
+    messages = []
+
+    async def receive():
+        nonlocal received
+        if not received:
+            received = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        # The client stays connected; Django cancels this when done
+        await asyncio.Future()
+
+    async def send(message):
+        messages.append(message)
+
+    await application(scope, receive, send)
+    return messages[0]["status"] == 200
+
+
+def run_asgi(url: str, cookie: str, clients: int, requests: int):
+    application = ASGIHandler()
+    latencies, errors = [], []
+
+    async def client(count: int):
+        for _ in range(count):
+            start = time.perf_counter()
+            ok = await _asgi_get(application, url, cookie)
+            latencies.append(time.perf_counter() - start)
+            errors.append(not ok)
+
+    async def main():
+        await asyncio.gather(*(client(count) for count in _shares(requests, clients)))
+
+    start = time.perf_counter()
+    asyncio.run(main())
+    return Result("asgi", latencies, sum(errors), time.perf_counter() - start)
+
+
+def compare(
+    url: str,
+    user,
+    clients: int = 50,
+    requests: int = 500,
+    threads: int = 4,
+    warmup: Optional[int] = None,
+) -> list[dict]:
+    """Summaries of the WSGI and ASGI runs, in that order."""
+    cookie = session_cookie(user)
+    warmup = clients if warmup is None else warmup
+    with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, HOST]):
+        if warmup:
+            run_wsgi(url, cookie, min(clients, warmup), warmup, threads)
+            run_asgi(url, cookie, min(clients, warmup), warmup)
+        results = [
+            run_wsgi(url, cookie, clients, requests, threads),
+            run_asgi(url, cookie, clients, requests),
+        ]
+    return [result.summary() for result in results]
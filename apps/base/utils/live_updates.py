@@ -0,0 +1,61 @@
+"""
+Change notifications over Postgres LISTEN/NOTIFY, with no extra service.
+
+Row triggers on detail tables (weight records, sanitary event targets)
+NOTIFY the channel of their parent row whenever a row is inserted,
+updated or deleted, whatever wrote it: services, bulk writes, the admin
+or raw SQL. Postgres delivers notifications on commit and folds
+duplicates within a transaction, so a 500-head batch wakes a listener
+once. The payload is empty: a notification only means "look again", and
+the listener reads what changed from the tables themselves.
+
+    async with live_updates.listen(live_updates.channel(session)) as wait:
+        if await wait(15):
+            ...  # something changed
+"""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable
+
+import psycopg
+from django.db import connections
+from psycopg import sql
+
+
+def channel(obj) -> str:
+    """The channel the triggers notify for `obj` (see cnv_notify_parent)."""
+    return f"{obj._meta.model_name}_{obj.pk.hex}"
+
+
+def _connection_params(alias: str) -> dict:
+    params = connections[alias].get_connection_params()
+    # Bound to Django's sync cursors
+    params.pop("cursor_factory", None)
+    params.pop("context", None)
+    return params
+
+
+@asynccontextmanager
+async def listen(
+    name: str, alias: str = "default"
+) -> AsyncIterator[Callable[[float], Awaitable[bool]]]:
+    """
+    LISTENs on `name` through a dedicated connection (a listening
+    connection can't be shared or pooled) and yields `wait(timeout)`:
+    True once a notification arrives, False when `timeout` seconds pass
+    without one.
+    """
+    conn = await psycopg.AsyncConnection.connect(
+        **_connection_params(alias), autocommit=True
+    )
+    try:
+        await conn.execute(sql.SQL("LISTEN {}").format(sql.Identifier(name)))
+
+        async def wait(timeout: float) -> bool:
+            async for _notify in conn.notifies(timeout=timeout, stop_after=1):
+                return True
+            return False
+
+        yield wait
+    finally:
+        await conn.close()
@@ -0,0 +1,338 @@
+"""
+Concurrent replay of a weighted request mix against a running server.
+
+Every client is a thread with its own session: it logs in through the
+login form, then picks steps from the workload at random, in proportion
+to their weights, until the duration or the request budget runs out.
+Only the standard library is used, so any machine that can run
+manage.py can generate the load.
+
+A step names a URL and how to fill it in: `kwargs` map URL arguments to a
+model label, whose primary keys are sampled from the database the command
+is connected to (the server's own, or a copy with the same rows), and
+`params` are query-string values formatted with `today`, `month_start`
+and `next_month`. Steps whose model has no rows are skipped.
+
+    [{"name": "cattle:detail", "weight": 10, "kwargs": {"pk": "cattle.Cattle"}}]
+"""
+
+import http.cookiejar
+import json
+import random
+import statistics
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Callable, Optional
+
+from django.apps import apps
+from django.conf import settings
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.base.utils.slow_queries import percentile
+
+SAMPLE_SIZE = 500
+
+
+@dataclass
+class Step:
+    name: str
+    weight: float = 1
+    kwargs: dict = field(default_factory=dict)
+    params: dict = field(default_factory=dict)
+
+
+# Chute work (weighing, animal pages) and office work (lists, calendar,
+# trade) in roughly the proportions of a working day
+DEFAULT_WORKLOAD = [
+    Step("dashboard:home", 10),
+    Step("cattle:list", 12),
+    Step("cattle:list", 4, params={"q": "2"}),
+    Step("cattle:detail", 10, {"pk": "cattle.Cattle"}),
+    Step("cattle:detail-weights", 5, {"pk": "cattle.Cattle"}),
+    Step("cattle:detail-timeline", 3, {"pk": "cattle.Cattle"}),
+    Step("weight:session-list", 4),
+    Step("weight:session-detail", 4, {"pk": "weight.WeighingSession"}),
+    Step("weight:batch-entry", 8, {"pk": "weight.WeighingSession"}),
+    Step("locations:list", 5),
+    Step("locations:detail", 3, {"pk": "locations.Location"}),
+    Step("health:event-list", 4),
+    Step("health:event-detail", 2, {"pk": "health.SanitaryEvent"}),
+    Step("tasks:calendar", 2),
+    Step(
+        "tasks:api-events",
+        6,
+        params={"start": "{month_start}", "end": "{next_month}"},
+    ),
+    Step("reproduction:overview", 2),
+    Step("reproduction:calving_list", 2),
+    Step("nutrition:event-list", 2),
+    Step("sales:list", 2),
+    Step("purchases:list", 2),
+    Step("partners:list", 1),
+]
+
+
+class LoadTestError(Exception):
+    pass
+
+
+def load_workload(path: str) -> list[Step]:
+    with open(path, encoding="utf-8") as handle:
+        return [Step(**step) for step in json.load(handle)]
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    """Redirects are results too; a bounce to the login page is an error."""
+
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+
+class Sampler:
+    """Random primary keys per model label, loaded once."""
+
+    def __init__(self):
+        self._pks: dict[str, list[str]] = {}
+
+    def pks(self, label: str) -> list[str]:
+        if label not in self._pks:
+            model = apps.get_model(label)
+            self._pks[label] = [
+                str(pk)
+                for pk in model.objects.order_by("?").values_list("pk", flat=True)[
+                    :SAMPLE_SIZE
+                ]
+            ]
+        return self._pks[label]
+
+    def url(self, step: Step, context: dict, rng: random.Random) -> str:
+        kwargs = {
+            argument: rng.choice(self.pks(label))
+            for argument, label in step.kwargs.items()
+        }
+        url = reverse(step.name, kwargs=kwargs)
+        if step.params:
+            params = {
+                key: str(value).format(**context) for key, value in step.params.items()
+            }
+            url = f"{url}?{urllib.parse.urlencode(params)}"
+        return url
+
+
+@dataclass
+class Sample:
+    name: str
+    seconds: float
+    status: int
+    error: str = ""
+
+
+class _Client(threading.Thread):
+    def __init__(self, test: "LoadTest", number: int):
+        super().__init__(name=f"load-test-{number}", daemon=True)
+        self.test = test
+        self.rng = random.Random(f"{test.seed}-{number}")
+        self.samples: list[Sample] = []
+        self.failure: Optional[Exception] = None
+        self.cookies = http.cookiejar.CookieJar()
+        self.opener = urllib.request.build_opener(
+            urllib.request.HTTPCookieProcessor(self.cookies), _NoRedirect
+        )
+
+    def fetch(self, path: str, data: Optional[dict] = None) -> tuple[int, dict]:
+        url = self.test.base_url + path
+        body = urllib.parse.urlencode(data).encode() if data is not None else None
+        request = urllib.request.Request(url, data=body, headers={"Referer": url})
+        try:
+            with self.opener.open(request, timeout=self.test.timeout) as response:
+                response.read()
+                return response.status, dict(response.headers)
+        except urllib.error.HTTPError as exc:
+            exc.read()
+            return exc.code, dict(exc.headers)
+
+    def login(self) -> None:
+        login_path = reverse(settings.LOGIN_URL)
+        self.fetch(login_path)
+        token = next((c.value for c in self.cookies if c.name == "csrftoken"), "")
+        status, headers = self.fetch(
+            login_path,
+            {
+                "csrfmiddlewaretoken": token,
+                "username": self.test.username,
+                "password": self.test.password,
+            },
+        )
+        if status != 302 or login_path in headers.get("Location", ""):
+            raise LoadTestError(
+                f"Login as {self.test.username!r} failed (HTTP {status})"
+            )
+
+    def run(self):
+        try:
+            self.login()
+        except (LoadTestError, OSError) as exc:
+            self.failure = exc
+            return
+        login_path = reverse(settings.LOGIN_URL)
+        while self.test.take():
+            step, url = self.test.pick(self.rng)
+            start = time.perf_counter()
+            error = ""
+            try:
+                status, headers = self.fetch(url)
+            except OSError as exc:
+                status, headers, error = 0, {}, type(exc).__name__
+            seconds = time.perf_counter() - start
+            if not error and status >= 400:
+                error = f"HTTP {status}"
+            elif not error and login_path in headers.get("Location", ""):
+                error = "Session lost"
+            self.samples.append(Sample(step.name, seconds, status, error))
+            if self.test.think_time:
+                time.sleep(self.rng.uniform(0, 2 * self.test.think_time))
+
+
+class LoadTest:
+    def __init__(
+        self,
+        base_url: str,
+        username: str,
+        password: str,
+        workload: Optional[list[Step]] = None,
+        clients: int = 10,
+        duration: float = 30.0,
+        requests: Optional[int] = None,
+        think_time: float = 0.0,
+        seed: int = 42,
+        timeout: float = 30.0,
+        log: Callable[[str], None] = lambda message: None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.username = username
+        self.password = password
+        self.clients = clients
+        self.duration = duration
+        self.requests = requests
+        self.think_time = think_time
+        self.seed = seed
+        self.timeout = timeout
+        self.log = log
+        self._sampler = Sampler()
+        self.workload = self._usable(workload or DEFAULT_WORKLOAD)
+        self._context: dict = {}
+        self._lock = threading.Lock()
+        self._issued = 0
+        self._deadline = 0.0
+
+    def _usable(self, workload: list[Step]) -> list[Step]:
+        """The steps whose URL arguments have rows to sample from."""
+        usable = []
+        for step in workload:
+            missing = [
+                label for label in step.kwargs.values() if not self._sampler.pks(label)
+            ]
+            if missing:
+                self.log(f"Skipping {step.name}: no {', '.join(missing)} rows")
+            else:
+                usable.append(step)
+        if not usable:
+            raise LoadTestError("No step of the workload can be replayed.")
+        return usable
+
+    def pick(self, rng: random.Random) -> tuple[Step, str]:
+        step = rng.choices(self.workload, weights=[s.weight for s in self.workload])[0]
+        return step, self._sampler.url(step, self._context, rng)
+
+    def take(self) -> bool:
+        """Claims one request from the budget; False when the run is over."""
+        with self._lock:
+            if self.requests is not None and self._issued >= self.requests:
+                return False
+            if self.requests is None and time.monotonic() >= self._deadline:
+                return False
+            self._issued += 1
+            return True
+
+    def run(self) -> "Report":
+        today = timezone.localdate()
+        month_start = today.replace(day=1)
+        self._context = {
+            "today": today.isoformat(),
+            "month_start": month_start.isoformat(),
+            "next_month": (month_start + timedelta(days=32)).replace(day=1).isoformat(),
+        }
+        clients = [_Client(self, number) for number in range(self.clients)]
+        self.log(f"Replaying with {self.clients} clients against {self.base_url}...")
+        started = time.perf_counter()
+        self._deadline = time.monotonic() + self.duration
+        for client in clients:
+            client.start()
+        for client in clients:
+            client.join()
+        elapsed = time.perf_counter() - started
+
+        failures = [client.failure for client in clients if client.failure]
+        if len(failures) == len(clients):
+            raise LoadTestError(str(failures[0]))
+        return Report(
+            [sample for client in clients for sample in client.samples], elapsed
+        )
+
+
+class Report:
+    def __init__(self, samples: list[Sample], elapsed: float):
+        self.samples = samples
+        self.elapsed = elapsed
+
+    @staticmethod
+    def _summary(samples: list[Sample], elapsed: float) -> dict:
+        milliseconds = [sample.seconds * 1000 for sample in samples]
+        errors = sum(1 for sample in samples if sample.error)
+        return {
+            "requests": len(samples),
+            "errors": errors,
+            "error_rate": errors / len(samples) if samples else 0.0,
+            "rps": len(samples) / elapsed if elapsed else 0.0,
+            "mean_ms": statistics.fmean(milliseconds) if samples else 0.0,
+            "p50_ms": percentile(milliseconds, 0.5),
+            "p95_ms": percentile(milliseconds, 0.95),
+            "p99_ms": percentile(milliseconds, 0.99),
+            "max_ms": max(milliseconds, default=0.0),
+        }
+
+    def by_name(self) -> dict[str, dict]:
+        groups = defaultdict(list)
+        for sample in self.samples:
+            groups[sample.name].append(sample)
+        return {
+            name: self._summary(samples, self.elapsed)
+            for name, samples in sorted(groups.items())
+        }
+
+    def total(self) -> dict:
+        return self._summary(self.samples, self.elapsed)
+
+    def errors(self) -> Counter:
+        """(URL name, error) -> occurrences."""
+        return Counter(
+            (sample.name, sample.error) for sample in self.samples if sample.error
+        )
+
+    def as_dict(self) -> dict:
+        return {
+            "elapsed_s": round(self.elapsed, 2),
+            "total": self.total(),
+            "urls": self.by_name(),
+            "errors": [
+                {"name": name, "error": error, "count": count}
+                for (name, error), count in self.errors().most_common()
+            ],
+        }
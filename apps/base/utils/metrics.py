@@ -0,0 +1,264 @@
+"""
+Prometheus text-format metrics without a client library or a push
+gateway.
+
+Counters and histograms live in process memory. Under gunicorn every
+worker has its own copy, so with METRICS_DIR set each process also dumps
+its values to METRICS_DIR/<pid>.json (at most every FLUSH_INTERVAL seconds
+and at exit) and `render()` sums the files of every worker, past and
+present. Counters therefore survive worker restarts, as Prometheus
+expects. The directory must be emptied when the master starts (see
+core/gunicorn.conf.py).
+
+    @staticmethod
+    @timed
+    def record_weight(...): ...
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from functools import wraps
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+from django.conf import settings
+
+# Seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Queries per request
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+FLUSH_INTERVAL = 1.0  # seconds
+
+_lock = threading.Lock()
+_registry: dict[str, "Metric"] = {}
+_last_flush = 0.0
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(pairs: Iterable[tuple[str, str]]) -> str:
+    body = ",".join(f'{name}="{_escape(str(value))}"' for name, value in pairs)
+    return f"{{{body}}}" if body else ""
+
+
+def _format_number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        # label values -> the metric's numbers
+        self.values: dict[tuple, list] = {}
+        _registry[name] = self
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def merge(self, key: tuple, numbers: list) -> None:
+        current = self.values.setdefault(key, [0] * len(numbers))
+        for index, number in enumerate(numbers):
+            current[index] += number
+
+    def samples(self, values: dict) -> Iterable[str]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        with _lock:
+            self.merge(self._key(labels), [amount])
+        _maybe_flush()
+
+    def samples(self, values):
+        for key, (total,) in sorted(values.items()):
+            labels = _format_labels(zip(self.labelnames, key))
+            yield f"{self.name}{labels} {_format_number(total)}"
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, **labels) -> None:
+        # One slot per bucket, then +Inf, sum and count
+        numbers = [0] * (len(self.buckets) + 3)
+        index = next(
+            (i for i, bound in enumerate(self.buckets) if value <= bound),
+            len(self.buckets),
+        )
+        numbers[index] = 1
+        numbers[-2] = value
+        numbers[-1] = 1
+        with _lock:
+            self.merge(self._key(labels), numbers)
+        _maybe_flush()
+
+    def samples(self, values):
+        bounds = [*map(_format_number, self.buckets), "+Inf"]
+        for key, numbers in sorted(values.items()):
+            pairs = list(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, count in zip(bounds, numbers):
+                cumulative += count
+                labels = _format_labels([*pairs, ("le", bound)])
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(pairs)
+            yield f"{self.name}_sum{labels} {_format_number(numbers[-2])}"
+            yield f"{self.name}_count{labels} {numbers[-1]}"
+
+
+REQUESTS = Counter(
+    "cnv_http_requests_total",
+    "HTTP requests by URL name, method and status code.",
+    ["view", "method", "status"],
+)
+REQUEST_LATENCY = Histogram(
+    "cnv_http_request_duration_seconds",
+    "Time to the first byte of the response, by URL name.",
+    ["view", "method"],
+)
+DB_QUERIES = Histogram(
+    "cnv_db_queries_per_request",
+    "SQL queries run by one request, by URL name.",
+    ["view"],
+    buckets=QUERY_COUNT_BUCKETS,
+)
+DB_TIME = Histogram(
+    "cnv_db_query_duration_seconds",
+    "Total SQL time of one request, by URL name.",
+    ["view"],
+)
+SERVICE_LATENCY = Histogram(
+    "cnv_service_duration_seconds",
+    "Duration of instrumented service methods.",
+    ["service"],
+)
+SERVICE_ERRORS = Counter(
+    "cnv_service_errors_total",
+    "Instrumented service calls that raised, by exception type.",
+    ["service", "exception"],
+)
+
+
+def timed(func: Callable) -> Callable:
+    """Records the duration (and failures) of a service method."""
+    name = func.__qualname__
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except Exception as exc:
+            SERVICE_ERRORS.inc(service=name, exception=type(exc).__name__)
+            raise
+        finally:
+            SERVICE_LATENCY.observe(time.perf_counter() - start, service=name)
+
+    return wrapper
+
+
+def observe_request(
+    view: str, method: str, status: int, duration: float, queries: int, sql: float
+) -> None:
+    REQUESTS.inc(view=view, method=method, status=status)
+    REQUEST_LATENCY.observe(duration, view=view, method=method)
+    DB_QUERIES.observe(queries, view=view)
+    DB_TIME.observe(sql, view=view)
+
+
+def _directory() -> Optional[Path]:
+    directory = getattr(settings, "METRICS_DIR", "")
+    return Path(directory) if directory else None
+
+
+def _snapshot() -> dict:
+    with _lock:
+        return {
+            name: {json.dumps(key): numbers for key, numbers in metric.values.items()}
+            for name, metric in _registry.items()
+        }
+
+
+def flush() -> None:
+    """Writes this process's values to METRICS_DIR (atomically)."""
+    global _last_flush  # pylint: disable=global-statement
+    directory = _directory()
+    if directory is None:
+        return
+    _last_flush = time.monotonic()
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{os.getpid()}.json"
+    temporary = path.with_suffix(".tmp")
+    temporary.write_text(json.dumps(_snapshot()))
+    os.replace(temporary, path)
+
+
+def _maybe_flush() -> None:
+    if time.monotonic() - _last_flush >= FLUSH_INTERVAL:
+        flush()
+
+
+atexit.register(flush)
+
+
+def reset_directory(directory: Optional[str] = None) -> None:
+    """Deletes the per-worker files; call before the workers start."""
+    directory = Path(directory) if directory else _directory()
+    if directory is not None and directory.exists():
+        for path in directory.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+
+def _collect() -> dict[str, dict[tuple, list]]:
+    """Values of every process (or just this one without METRICS_DIR)."""
+    snapshots = [_snapshot()]
+    directory = _directory()
+    if directory is not None and directory.exists():
+        own = f"{os.getpid()}.json"
+        for path in directory.glob("*.json"):
+            if path.name == own:
+                continue  # The live values are fresher
+            try:
+                snapshots.append(json.loads(path.read_text()))
+            except (OSError, ValueError):
+                continue  # Being replaced or truncated; next scrape has it
+
+    merged: dict[str, dict[tuple, list]] = {name: {} for name in _registry}
+    for snapshot in snapshots:
+        for name, values in snapshot.items():
+            if name not in merged:
+                continue
+            for key, numbers in values.items():
+                key = tuple(json.loads(key))
+                current = merged[name].setdefault(key, [0] * len(numbers))
+                for index, number in enumerate(numbers):
+                    current[index] += number
+    return merged
+
+
+def render() -> str:
+    """All metrics in the Prometheus text exposition format (0.0.4)."""
+    lines = []
+    for name, values in _collect().items():
+        metric = _registry[name]
+        lines.append(f"# HELP {name} {metric.documentation}")
+        lines.append(f"# TYPE {name} {metric.kind}")
+        lines.extend(metric.samples(values))
+    return "\n".join(lines) + "\n"
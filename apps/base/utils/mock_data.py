@@ -0,0 +1,1023 @@
+"""
+Deterministic, production-sized mock data for development and benchmarks.
+
+`MockDataGenerator(cattle=100_000, years=3, seed=42).generate()` simulates
+a cow-calf and finishing operation over the last `years` years:
+
+- a founding herd of cows and bulls on rotating pastures, plus feeder
+  cattle bought in over the period and finished in feedlots;
+- one breeding season a year (November to January) with AI, fixed-time AI
+  and natural service, pregnancy checks, calvings and registered calves
+  with their sire and dam;
+- weaning, pasture rotations every six months, feedlot entries and
+  hospital stays, recorded as batch movements;
+- routine weighings every three months plus weaning, purchase and sale
+  weighings, with growth curves and ADG per animal;
+- yearly vaccination and deworming campaigns by location and individual
+  antibiotic treatments;
+- daily feedlot feeding, dry-season supplementation, feed and cattle
+  purchases, and sales of finished steers and culled cows;
+- calendar tasks on the animals over the last three months and the next
+  two.
+
+Everything random comes from one `random.Random(seed)`, primary keys
+included, so a seed, size and end date always give the same rows. The
+rows are written with BulkWriter (COPY on PostgreSQL); the cached
+per-animal state is rebuilt and the model cache bumped at the end.
+"""
+
+import bisect
+import random
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from datetime import time as day_time
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+from typing import Callable, Optional
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.db import transaction
+from django.utils import timezone
+
+from apps.base.utils import model_cache
+from apps.base.utils.bulk_copy import BulkWriter
+from apps.cattle.models import Cattle
+from apps.health.models import (
+    Medication,
+    MedicationType,
+    MedicationUnit,
+    SanitaryEvent,
+    SanitaryEventTarget,
+)
+from apps.locations.models import Location, LocationType, Movement, MovementReason
+from apps.nutrition.models import Diet, DietItem, FeedingEvent, FeedIngredient
+from apps.partners.models import Partner
+from apps.purchases.models import Purchase, PurchaseItem
+from apps.reproduction.models import (
+    BreedingEvent,
+    Calving,
+    PregnancyCheck,
+    ReproductiveSeason,
+)
+from apps.sales.models import Sale, SaleItem
+from apps.tasks.models import Task
+from apps.weight.models import WeighingSession, WeighingSessionType, WeightRecord
+
+SCALES = {"1k": 1_000, "10k": 10_000, "100k": 100_000}
+
+# Share of the final herd registered as calves born on the farm; founders
+# are sized so the breeding seasons produce it, purchases fill the rest.
+CALF_SHARE = 0.55
+CALVES_PER_COW_YEAR = 0.72
+COWS_PER_BULL = 25
+HEAD_PER_LOCATION = 150
+
+BREEDS = [
+    (Cattle.BREED_NELORE, 70),
+    (Cattle.BREED_ANGUS, 10),
+    (Cattle.BREED_BRAHMAN, 8),
+    (Cattle.BREED_SIMMENTAL, 5),
+    (Cattle.BREED_HEREFORD, 4),
+    (Cattle.BREED_OTHER, 3),
+]
+COW_NAMES = [
+    "Estrela",
+    "Mimosa",
+    "Pintada",
+    "Serena",
+    "Baronesa",
+    "Jandaia",
+    "Faceira",
+    "Boneca",
+    "Princesa",
+    "Aurora",
+    "Brisa",
+    "Cigana",
+    "Duquesa",
+    "Flor",
+]
+AI_SIRES = [
+    "REM Arma",
+    "Backup TE",
+    "Jaguar FIV",
+    "Bitelo da SS",
+    "Brahman Don",
+    "Angus Rito",
+    "Fajardo",
+    "Quilate TE",
+    "Horizonte",
+    "Nobre CV",
+]
+CUSTOMER_NAMES = ["Frigorífico", "Meat Packers", "Cattle Traders", "Ranch"]
+SUPPLIER_NAMES = ["Feed Mill", "Agro Supply", "Cattle Ranch", "Grain Co-op"]
+
+# name, type, unit, default dose, price per dose, meat withdrawal days
+MEDICATIONS = [
+    ("Clostridial vaccine", MedicationType.VACCINE, MedicationUnit.ML, "5", "1.20", 21),
+    (
+        "Brucellosis vaccine",
+        MedicationType.VACCINE,
+        MedicationUnit.DOSE,
+        "1",
+        "4.50",
+        0,
+    ),
+    ("Ivermectin 1%", MedicationType.VERMIFUGE, MedicationUnit.ML, "10", "2.10", 35),
+    ("Albendazole", MedicationType.VERMIFUGE, MedicationUnit.ML, "15", "1.80", 14),
+    (
+        "Oxytetracycline LA",
+        MedicationType.ANTIBIOTIC,
+        MedicationUnit.ML,
+        "20",
+        "6.00",
+        28,
+    ),
+    ("Florfenicol", MedicationType.ANTIBIOTIC, MedicationUnit.ML, "12", "9.50", 30),
+    ("ADE vitamins", MedicationType.SUPPLEMENT, MedicationUnit.ML, "5", "0.90", 0),
+    (
+        "Progesterone implant",
+        MedicationType.HORMONE,
+        MedicationUnit.UNIT,
+        "1",
+        "12.00",
+        0,
+    ),
+]
+# name, unit cost per kg
+INGREDIENTS = [
+    ("Ground corn", "1.10"),
+    ("Soybean meal", "2.40"),
+    ("Cottonseed", "1.35"),
+    ("Corn silage", "0.28"),
+    ("Sorghum silage", "0.24"),
+    ("Citrus pulp", "0.95"),
+    ("Urea", "3.20"),
+    ("Mineral salt", "3.80"),
+]
+# name, [(ingredient index, percent)]
+DIETS = [
+    ("Finishing ration", [(0, 45), (1, 10), (3, 40), (6, 1), (7, 4)]),
+    ("Growing ration", [(0, 25), (2, 10), (4, 60), (7, 5)]),
+    ("Creep feed", [(0, 60), (1, 30), (5, 8), (7, 2)]),
+    ("Dry-season supplement", [(0, 50), (1, 25), (6, 10), (7, 15)]),
+]
+
+
+@dataclass
+class _Animal:
+    id: uuid.UUID
+    tag: str
+    sex: str
+    breed: str
+    birth: date
+    arrival: date
+    birth_weight: float
+    adg: float
+    mature_weight: float
+    dam: Optional["_Animal"] = None
+    sire_id: Optional[uuid.UUID] = None
+    sire_external: str = ""
+    dam_external: str = ""
+    name: str = ""
+    exit: Optional[date] = None
+    exit_kind: str = ""  # "sale" or "dead"
+    # (from, location id or None while rotating, pasture offset, reason)
+    placements: list = field(default_factory=list)
+    reproduction: tuple = (Cattle.REP_STATUS_OPEN, None)
+    bought_from: Optional[uuid.UUID] = None
+    # (date, weight) of the last weighing and the weight at sale
+    last_weighing: Optional[tuple] = None
+    sale_weight: Optional[Decimal] = None
+
+    def present(self, day: date) -> bool:
+        return self.arrival <= day and (self.exit is None or day < self.exit)
+
+    def age_days(self, day: date) -> int:
+        return (day - self.birth).days
+
+
+class MockDataGenerator:
+    def __init__(
+        self,
+        cattle: int = SCALES["1k"],
+        years: int = 3,
+        seed: int = 42,
+        end_date: Optional[date] = None,
+        log: Callable[[str], None] = lambda message: None,
+    ):
+        self.rng = random.Random(seed)
+        self.target = cattle
+        self.end = end_date or timezone.localdate()
+        self.start = self.end - timedelta(days=round(365.25 * years))
+        self.years = years
+        self.log = log
+        self.writer = BulkWriter()
+        self.animals: list[_Animal] = []
+        self.calves_left = 0
+        self._tag_seq = 0
+        self._sessions: dict = {}
+
+    # -- Helpers
+
+    def _uuid(self) -> uuid.UUID:
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def _add(self, model, pk=None, **row) -> uuid.UUID:
+        row[model._meta.pk.attname] = pk = pk or self._uuid()
+        self.writer.add(model, row)
+        return pk
+
+    def _day(self, low: date, high: date) -> date:
+        return low + timedelta(days=self.rng.randint(0, max((high - low).days, 0)))
+
+    def _weighted(self, choices):
+        values, weights = zip(*choices)
+        return self.rng.choices(values, weights=weights)[0]
+
+    @staticmethod
+    def _on(day: date, day_of_month: int) -> date:
+        """The given day of `day`'s month, or of the next month if past it."""
+        if day.day <= day_of_month:
+            return day.replace(day=day_of_month)
+        return (day.replace(day=1) + timedelta(days=32)).replace(day=day_of_month)
+
+    @staticmethod
+    def _money(value: float) -> Decimal:
+        return Decimal(value).quantize(Decimal("0.01"))
+
+    @staticmethod
+    def _moment(day: date) -> datetime:
+        return timezone.make_aware(datetime.combine(day, day_time(8)))
+
+    def _rotation_dates(self) -> list[date]:
+        """Pasture rotations: January 1st and July 1st."""
+        return [
+            date(year, month, 1)
+            for year in range(self.start.year, self.end.year + 1)
+            for month in (1, 7)
+            if self.start < date(year, month, 1) <= self.end
+        ]
+
+    # -- Entry point
+
+    def generate(self) -> dict:
+        started = time.perf_counter()
+        with transaction.atomic():
+            with self.writer:
+                self._reference_data()
+                self._founders()
+                self._breeding_seasons()
+                self._purchased_cattle()
+                self._deaths_and_treatments()
+                self._write_weighings()
+                self._write_cattle()
+                self._write_movements()
+                self._write_campaigns()
+                self._write_trade()
+                self._write_feeding()
+                self._write_tasks()
+            self.log("Rebuilding cached cattle state...")
+            call_command("rebuild_cattle_state", batch_size=5_000, stdout=StringIO())
+            model_cache.bump(*self.writer.models)
+        self.log(f"Done in {time.perf_counter() - started:.1f}s")
+        return dict(self.writer.counts)
+
+    # -- Reference data
+
+    def _reference_data(self):
+        self.log("Creating partners, locations, medications and diets...")
+        self.customers = [
+            self._add(
+                Partner,
+                name=f"{self.rng.choice(CUSTOMER_NAMES)} {number:03d}",
+                is_customer=True,
+                is_supplier=False,
+                email=f"buyer{number}@example.com",
+            )
+            for number in range(max(5, self.target // 2_000))
+        ]
+        self.suppliers = [
+            self._add(
+                Partner,
+                name=f"{self.rng.choice(SUPPLIER_NAMES)} {number:03d}",
+                is_customer=False,
+                is_supplier=True,
+                email=f"supplier{number}@example.com",
+            )
+            for number in range(max(5, self.target // 2_000))
+        ]
+
+        count = max(8, self.target // HEAD_PER_LOCATION)
+        self.hospital = self._location("Hospital", LocationType.HOSPITAL, 30, 2)
+        self._location("Maternity", LocationType.MATERNITY, 80, 10)
+        self.corral = self._location("Quarantine corral", LocationType.CORRAL, 200, 3)
+        feedlots = max(1, count * 15 // 100)
+        self.feedlots = [
+            self._location(f"Feedlot {n + 1:03d}", LocationType.FEEDLOT, 600, 4)
+            for n in range(feedlots)
+        ]
+        self.pastures = [
+            self._location(
+                f"Pasture {n + 1:03d}",
+                LocationType.PASTURE,
+                self.rng.randint(150, 300),
+                self.rng.uniform(60, 200),
+            )
+            for n in range(count - feedlots)
+        ]
+
+        self.medications = {}
+        for name, kind, unit, dose, price, withdrawal in MEDICATIONS:
+            self.medications[name] = (
+                self._add(
+                    Medication,
+                    name=name,
+                    medication_type=kind,
+                    unit=unit,
+                    default_dose=Decimal(dose),
+                    withdrawal_days_meat=withdrawal,
+                    manufacturer="Mock Labs",
+                ),
+                Decimal(dose),
+                Decimal(price),
+            )
+
+        self.ingredients = [
+            (
+                self._add(
+                    FeedIngredient,
+                    name=name,
+                    unit_cost=Decimal(cost),
+                    stock_quantity=Decimal(50_000),
+                    min_stock_alert=Decimal(5_000),
+                ),
+                Decimal(cost),
+            )
+            for name, cost in INGREDIENTS
+        ]
+        self.diets = []
+        for name, items in DIETS:
+            diet_id = self._add(Diet, name=name)
+            cost = Decimal(0)
+            for index, percent in items:
+                ingredient_id, unit_cost = self.ingredients[index]
+                self._add(
+                    DietItem,
+                    diet_id=diet_id,
+                    ingredient_id=ingredient_id,
+                    proportion_percent=Decimal(percent),
+                )
+                cost += unit_cost * percent / 100
+            self.diets.append((diet_id, cost))
+
+    def _location(self, name, kind, capacity, area) -> uuid.UUID:
+        return self._add(
+            Location,
+            name=name,
+            type=kind,
+            capacity_head=capacity,
+            area_hectares=self._money(area),
+        )
+
+    # -- Herd
+
+    def _new_animal(self, sex, birth, arrival, **extra) -> _Animal:
+        self._tag_seq += 1
+        male = sex == Cattle.SEX_MALE
+        animal = _Animal(
+            id=self._uuid(),
+            tag=f"{birth.year % 100:02d}-{self._tag_seq:06d}",
+            sex=sex,
+            breed=extra.pop("breed", None) or self._weighted(BREEDS),
+            birth=birth,
+            arrival=arrival,
+            birth_weight=self.rng.uniform(27, 38),
+            adg=max(0.25, self.rng.gauss(0.62 if male else 0.5, 0.1)),
+            mature_weight=self.rng.uniform(*((700, 900) if male else (420, 540))),
+            **extra,
+        )
+        self.animals.append(animal)
+        return animal
+
+    def _place(self, animal, day, reason, location=None, offset=None):
+        """Moves the animal to `location`, or onto a rotating pasture."""
+        if location is None and offset is None:
+            offset = self.rng.randrange(len(self.pastures))
+        animal.placements.append((day, location, offset, reason))
+
+    def _founders(self):
+        cows = max(
+            10,
+            round(
+                self.target * CALF_SHARE / (CALVES_PER_COW_YEAR * max(self.years, 1))
+            ),
+        )
+        cows = min(cows, self.target)
+        bulls = min(max(1, cows // COWS_PER_BULL), self.target - cows)
+        self.log(f"Creating {cows} founding cows and {bulls} bulls...")
+        for index in range(cows + bulls):
+            sex = Cattle.SEX_FEMALE if index < cows else Cattle.SEX_MALE
+            birth = self._day(
+                self.start - timedelta(days=9 * 365),
+                self.start - timedelta(days=3 * 365),
+            )
+            animal = self._new_animal(
+                sex,
+                birth,
+                self.start,
+                sire_external=self.rng.choice(AI_SIRES),
+                dam_external=f"Reg {self.rng.randint(10_000, 99_999)}",
+                name=(
+                    self.rng.choice(COW_NAMES)
+                    if index < cows and index % 8 == 0
+                    else ""
+                ),
+            )
+            self._place(animal, self.start, MovementReason.OTHER)
+        self.bulls = self.animals[cows:]
+        self.calves_left = int(self.target * CALF_SHARE)
+
+    def _location_at(self, animal: _Animal, day: date) -> tuple:
+        """(location id or None, pasture offset) on `day`."""
+        index = bisect.bisect_right([p[0] for p in animal.placements], day) - 1
+        _start, location, offset, _reason = animal.placements[max(index, 0)]
+        return location, offset
+
+    def _pasture(self, offset: int, day: date) -> uuid.UUID:
+        rotations = bisect.bisect_right(self.rotations, day)
+        return self.pastures[(offset + rotations) % len(self.pastures)]
+
+    def _breeding_seasons(self):
+        self.rotations = self._rotation_dates()
+        for year in range(self.start.year, self.end.year + 1):
+            season_start = date(year, 11, 1)
+            if not self.start <= season_start <= self.end:
+                continue
+            season_id = self._add(
+                ReproductiveSeason,
+                name=f"Breeding season {year}/{year + 1}",
+                start_date=season_start,
+                end_date=date(year + 1, 1, 31),
+            )
+            bulls = [bull for bull in self.bulls if bull.present(season_start)]
+            cows = [
+                animal
+                for animal in self.animals
+                if animal.sex == Cattle.SEX_FEMALE
+                and animal.present(season_start)
+                and animal.age_days(season_start) >= 730
+            ]
+            self.log(f"Breeding season {year}: {len(cows)} cows...")
+            for cow in cows:
+                self._breed(cow, season_id, season_start, bulls)
+
+    def _breed(self, cow: _Animal, season_id, season_start: date, bulls):
+        bred_on = season_start + timedelta(days=self.rng.randint(0, 75))
+        if bred_on > self.end or not cow.present(bred_on):
+            return
+        method = self._weighted(
+            [
+                (BreedingEvent.METHOD_IATF, 50),
+                (BreedingEvent.METHOD_AI, 20),
+                (BreedingEvent.METHOD_NATURAL, 25),
+                (BreedingEvent.METHOD_ET, 5),
+            ]
+        )
+        if method == BreedingEvent.METHOD_NATURAL and not bulls:
+            method = BreedingEvent.METHOD_AI
+        sire = (
+            self.rng.choice(bulls) if method == BreedingEvent.METHOD_NATURAL else None
+        )
+        sire_name = "" if sire else self.rng.choice(AI_SIRES)
+        event_id = self._add(
+            BreedingEvent,
+            dam_id=cow.id,
+            date=bred_on,
+            breeding_method=method,
+            sire_id=sire.id if sire else None,
+            sire_name=sire_name,
+            batch_id=season_id,
+        )
+        cow.reproduction = (Cattle.REP_STATUS_BRED, bred_on)
+
+        checked_on = bred_on + timedelta(days=self.rng.randint(30, 60))
+        if checked_on > self.end:
+            return
+        positive = self.rng.random() < (0.82 if cow.age_days(bred_on) > 1_100 else 0.7)
+        self._add(
+            PregnancyCheck,
+            breeding_event_id=event_id,
+            date=checked_on,
+            result=(
+                PregnancyCheck.RESULT_POSITIVE
+                if positive
+                else PregnancyCheck.RESULT_NEGATIVE
+            ),
+            fetus_days=(checked_on - bred_on).days if positive else None,
+            expected_calving_date=bred_on + timedelta(days=285) if positive else None,
+        )
+        if not positive:
+            cow.reproduction = (Cattle.REP_STATUS_OPEN, checked_on)
+            if self.rng.random() < 0.5 and cow.exit is None:
+                cow.exit = self._on(checked_on + timedelta(days=30), 20)
+                cow.exit_kind = "sale"
+            return
+        cow.reproduction = (Cattle.REP_STATUS_PREGNANT, checked_on)
+
+        calved_on = bred_on + timedelta(days=self.rng.randint(278, 295))
+        if calved_on > self.end or not cow.present(calved_on):
+            return
+        calf = None
+        if self.calves_left > 0:
+            self.calves_left -= 1
+            calf = self._calf(cow, calved_on, sire, sire_name)
+        self._add(
+            Calving,
+            dam_id=cow.id,
+            breeding_event_id=event_id,
+            date=calved_on,
+            calf_id=calf.id if calf else None,
+            ease_of_birth=self._weighted(
+                [
+                    (Calving.EASE_EASY, 90),
+                    (Calving.EASE_ASSISTED, 8),
+                    (Calving.EASE_C_SECTION, 2),
+                ]
+            ),
+            notes="" if calf else "Calf not registered",
+        )
+        cow.reproduction = (Cattle.REP_STATUS_LACTATING, calved_on)
+
+    def _calf(self, dam: _Animal, born: date, sire, sire_name) -> _Animal:
+        sex = self.rng.choice([Cattle.SEX_MALE, Cattle.SEX_FEMALE])
+        calf = self._new_animal(
+            sex,
+            born,
+            born,
+            breed=dam.breed if self.rng.random() < 0.8 else None,
+            dam=dam,
+            sire_id=sire.id if sire else None,
+            sire_external=sire_name,
+        )
+        # Born with the dam, weaned onto another pasture at 7-8 months
+        _location, offset = self._location_at(dam, born)
+        self._place(calf, born, "", offset=offset or 0)
+        weaned = self._on(born + timedelta(days=self.rng.randint(200, 235)), 1)
+        self._place(calf, weaned, MovementReason.WEANING)
+
+        if sex == Cattle.SEX_MALE:
+            sold = self._on(born + timedelta(days=self.rng.randint(600, 850)), 20)
+            self._place(
+                calf,
+                sold - timedelta(days=self.rng.randint(100, 150)),
+                MovementReason.ROTATION,
+                location=self.rng.choice(self.feedlots),
+            )
+            calf.exit, calf.exit_kind = sold, "sale"
+        elif self.rng.random() < 0.25:
+            calf.exit = self._on(born + timedelta(days=self.rng.randint(500, 700)), 20)
+            calf.exit_kind = "sale"
+        return calf
+
+    def _purchased_cattle(self):
+        count = self.target - len(self.animals)
+        self.log(f"Buying {count} feeder cattle...")
+        for _ in range(count):
+            arrival = self._on(self._day(self.start, self.end), 5)
+            if arrival > self.end:
+                arrival -= timedelta(days=31)
+            sex = Cattle.SEX_MALE if self.rng.random() < 0.8 else Cattle.SEX_FEMALE
+            animal = self._new_animal(
+                sex,
+                arrival - timedelta(days=self.rng.randint(300, 480)),
+                arrival,
+                bought_from=self.rng.choice(self.suppliers),
+                sire_external=self.rng.choice(AI_SIRES),
+            )
+            self._place(animal, arrival, MovementReason.OTHER, location=self.corral)
+            settled = arrival + timedelta(days=self.rng.randint(15, 30))
+            if sex == Cattle.SEX_MALE:
+                self._place(
+                    animal,
+                    settled,
+                    MovementReason.ROTATION,
+                    location=self.rng.choice(self.feedlots),
+                )
+                animal.exit = self._on(
+                    settled + timedelta(days=self.rng.randint(110, 200)), 20
+                )
+                animal.exit_kind = "sale"
+            else:
+                self._place(animal, settled, MovementReason.ROTATION)
+
+    def _deaths_and_treatments(self):
+        self.log("Simulating deaths and hospital treatments...")
+        self.treatments = []
+        for animal in self.animals:
+            last_day = min(animal.exit or self.end, self.end)
+            if last_day <= animal.arrival:
+                continue
+            if self.rng.random() < 0.02:
+                animal.exit = self._day(animal.arrival + timedelta(days=1), last_day)
+                animal.exit_kind = "dead"
+                last_day = animal.exit
+            years = (last_day - animal.arrival).days / 365
+            if self.rng.random() < 0.04 * years:
+                treated = self._day(animal.arrival, last_day - timedelta(days=1))
+                if treated + timedelta(days=7) < last_day:
+                    location, offset = self._location_at(animal, treated)
+                    self._place(
+                        animal, treated, MovementReason.MEDICAL, location=self.hospital
+                    )
+                    back = treated + timedelta(days=7)
+                    self._place(animal, back, MovementReason.OTHER, location, offset)
+                    animal.placements.sort(key=lambda p: p[0])
+                    self.treatments.append((animal, treated))
+            # Placements after leaving the farm or the history never happened
+            animal.placements = [
+                p
+                for p in animal.placements
+                if p[0] <= self.end and animal.present(p[0])
+            ]
+
+    # -- Writing
+
+    def _current_location(self, animal: _Animal) -> Optional[uuid.UUID]:
+        if not animal.present(self.end):
+            return None
+        location, offset = self._location_at(animal, self.end)
+        return location or self._pasture(offset, self.end)
+
+    def _write_cattle(self):
+        self.log(f"Writing {len(self.animals)} cattle...")
+        for animal in self.animals:
+            status = Cattle.STATUS_AVAILABLE
+            if animal.exit and animal.exit <= self.end:
+                status = (
+                    Cattle.STATUS_SOLD
+                    if animal.exit_kind == "sale"
+                    else Cattle.STATUS_DEAD
+                )
+            reproduction, since = animal.reproduction
+            if (
+                reproduction == Cattle.REP_STATUS_LACTATING
+                and (self.end - since).days > 210
+            ):
+                reproduction = Cattle.REP_STATUS_OPEN
+            self._add(
+                Cattle,
+                pk=animal.id,
+                tag=animal.tag,
+                name=animal.name,
+                electronic_id=f"982000{self.rng.randint(10**8, 10**9 - 1)}",
+                sex=animal.sex,
+                breed=animal.breed,
+                birth_date=animal.birth,
+                weight_kg=self._money(animal.birth_weight),
+                reproduction_status=(
+                    reproduction
+                    if animal.sex == Cattle.SEX_FEMALE
+                    else Cattle.REP_STATUS_OPEN
+                ),
+                sire_id=animal.sire_id,
+                sire_external_id="" if animal.sire_id else animal.sire_external,
+                dam_id=animal.dam.id if animal.dam else None,
+                dam_external_id=animal.dam_external,
+                status=status,
+                location_id=self._current_location(animal),
+                current_weight=(
+                    animal.last_weighing[1] if animal.last_weighing else None
+                ),
+                last_weighing_date=(
+                    animal.last_weighing[0] if animal.last_weighing else None
+                ),
+            )
+
+    def _write_movements(self):
+        self.log("Writing movements...")
+        batches: dict = {}
+        for animal in self.animals:
+            previous = None
+            for start, location, offset, reason in animal.placements:
+                destination = location or self._pasture(offset, start)
+                if reason and destination != previous:
+                    batches.setdefault(
+                        (start, previous, destination, reason), []
+                    ).append(animal.id)
+                previous = destination
+                if location is None:
+                    # The group rotates with its pasture until the next placement
+                    next_start = next(
+                        (p[0] for p in animal.placements if p[0] > start), self.end
+                    )
+                    for rotation in self.rotations:
+                        if start < rotation < next_start and animal.present(rotation):
+                            destination = self._pasture(offset, rotation)
+                            batches.setdefault(
+                                (
+                                    rotation,
+                                    previous,
+                                    destination,
+                                    MovementReason.ROTATION,
+                                ),
+                                [],
+                            ).append(animal.id)
+                            previous = destination
+        through = Movement.animals.through
+        for (day, origin, destination, reason), animal_ids in sorted(
+            batches.items(),
+            key=lambda item: (item[0][0], str(item[0][1]), str(item[0][2])),
+        ):
+            movement_id = self._add(
+                Movement,
+                date=self._moment(day),
+                origin_id=origin,
+                destination_id=destination,
+                reason=reason,
+            )
+            for animal_id in animal_ids:
+                self.writer.add(
+                    through, {"movement_id": movement_id, "cattle_id": animal_id}
+                )
+
+    def _session(self, day: date, kind: str) -> uuid.UUID:
+        key = (day, kind)
+        if key not in self._sessions:
+            self._sessions[key] = self._add(
+                WeighingSession,
+                date=day,
+                name=f"{WeighingSessionType(kind).label} {day:%Y-%m-%d}",
+                session_type=kind,
+            )
+        return self._sessions[key]
+
+    def _weight_at(self, animal: _Animal, day: date) -> float:
+        grown = animal.birth_weight + animal.adg * animal.age_days(day)
+        if grown > animal.mature_weight:
+            grown = animal.mature_weight
+        # Pastures dry out from June to September
+        if day.month in (6, 7, 8, 9):
+            grown *= 0.97
+        return grown * self.rng.gauss(1, 0.012)
+
+    def _write_weighings(self):
+        self.log("Writing weighings...")
+        months = []
+        day = self.start.replace(day=15)
+        while day <= self.end:
+            if day >= self.start:
+                months.append(day)
+            day = (day + timedelta(days=32)).replace(day=15)
+
+        for animal in self.animals:
+            phase = self.rng.randrange(3)
+            weighings = [
+                (day, WeighingSessionType.ROUTINE)
+                for index, day in enumerate(months)
+                if index % 3 == phase and animal.present(day) and day > animal.birth
+            ]
+            for start, _location, _offset, reason in animal.placements:
+                if reason == MovementReason.WEANING:
+                    weighings.append((start, WeighingSessionType.WEANING))
+            if animal.bought_from:
+                weighings.append((animal.arrival, WeighingSessionType.PURCHASE))
+            if animal.exit_kind == "sale" and animal.exit <= self.end:
+                weighings.append((animal.exit, WeighingSessionType.SALE))
+            weighings.sort()
+
+            previous = None
+            for day, kind in weighings:
+                weight = self._money(self._weight_at(animal, day))
+                adg = days = None
+                if previous:
+                    days = (day - previous[0]).days
+                    if days <= 0:
+                        continue
+                    adg = ((weight - previous[1]) / days).quantize(Decimal("0.001"))
+                self._add(
+                    WeightRecord,
+                    session_id=self._session(day, kind),
+                    session_date=day,
+                    animal_id=animal.id,
+                    weight_kg=weight,
+                    adg=adg,
+                    days_since_prev_weight=days,
+                )
+                previous = (day, weight)
+                if kind == WeighingSessionType.SALE:
+                    animal.sale_weight = weight
+            animal.last_weighing = previous
+
+    def _write_campaigns(self):
+        self.log("Writing sanitary events...")
+        campaigns = []
+        for year in range(self.start.year, self.end.year + 1):
+            campaigns += [
+                (date(year, 5, 10), "Clostridial vaccine", "Vaccination campaign"),
+                (date(year, 9, 10), "Ivermectin 1%", "Deworming campaign"),
+            ]
+        for day, medication, title in campaigns:
+            if not self.start <= day <= self.end:
+                continue
+            groups: dict = {}
+            for animal in self.animals:
+                if animal.present(day):
+                    location, offset = self._location_at(animal, day)
+                    location = location or self._pasture(offset, day)
+                    groups.setdefault(location, []).append(animal.id)
+            for animal_ids in groups.values():
+                self._sanitary_event(day, medication, title, animal_ids)
+
+        for animal, day in self.treatments:
+            medication = self.rng.choice(["Oxytetracycline LA", "Florfenicol"])
+            self._sanitary_event(day, medication, "Individual treatment", [animal.id])
+
+    def _sanitary_event(self, day, medication, title, animal_ids):
+        medication_id, dose, price = self.medications[medication]
+        cost = self._money(dose * price)
+        event_id = self._add(
+            SanitaryEvent,
+            date=day,
+            title=title,
+            medication_id=medication_id,
+            total_cost=cost * len(animal_ids),
+        )
+        for animal_id in animal_ids:
+            self._add(
+                SanitaryEventTarget,
+                event_id=event_id,
+                event_date=day,
+                animal_id=animal_id,
+                applied_dose=dose,
+                cost_per_head=cost,
+            )
+
+    def _write_trade(self):
+        self.log("Writing sales and purchases...")
+        cattle_type = ContentType.objects.get_for_model(Cattle)
+        ingredient_type = ContentType.objects.get_for_model(FeedIngredient)
+
+        sales: dict = {}
+        bought: dict = {}
+        for animal in self.animals:
+            if animal.exit_kind == "sale" and animal.exit <= self.end:
+                # Finished steers and culled females go to different buyers
+                buyer = self.customers[
+                    (animal.exit.toordinal() + (animal.sex == Cattle.SEX_MALE))
+                    % len(self.customers)
+                ]
+                sales.setdefault((animal.exit, buyer), []).append(animal)
+            if animal.bought_from:
+                bought.setdefault((animal.arrival, animal.bought_from), []).append(
+                    animal
+                )
+
+        for (day, buyer), animals in sorted(sales.items(), key=lambda item: item[0][0]):
+            price = Decimal(str(round(self.rng.uniform(10.5, 13.5), 2)))
+            items = [
+                (
+                    animal.id,
+                    self._money(float(animal.sale_weight or 0) or animal.mature_weight)
+                    * price,
+                )
+                for animal in animals
+            ]
+            sale_id = self._add(
+                Sale,
+                partner_id=buyer,
+                date=day,
+                type=Sale.TYPE_SALE,
+                total_amount=sum(total for _animal, total in items),
+            )
+            for animal_id, total in items:
+                self._add(
+                    SaleItem,
+                    sale_id=sale_id,
+                    content_type_id=cattle_type.pk,
+                    object_id=animal_id,
+                    quantity=Decimal(1),
+                    unit_price=total,
+                    total_price=total,
+                )
+
+        for (day, supplier), animals in sorted(
+            bought.items(), key=lambda item: item[0][0]
+        ):
+            unit_price = self._money(self.rng.uniform(2_400, 3_200))
+            self._purchase(
+                supplier,
+                day,
+                [
+                    (cattle_type, animal.id, Decimal(1), unit_price)
+                    for animal in animals
+                ],
+            )
+
+        # Monthly feed deliveries
+        day = self._on(self.start, 10)
+        while day <= self.end:
+            items = [
+                (
+                    ingredient_type,
+                    ingredient_id,
+                    Decimal(self.rng.randrange(5_000, 40_000, 500)),
+                    self._money(float(cost) * self.rng.uniform(0.9, 1.1)),
+                )
+                for ingredient_id, cost in self.rng.sample(self.ingredients, 3)
+            ]
+            self._purchase(self.rng.choice(self.suppliers), day, items)
+            day = self._on(day + timedelta(days=1), 10)
+
+    def _purchase(self, supplier, day, items):
+        purchase_id = self._add(
+            Purchase,
+            partner_id=supplier,
+            date=day,
+            type=Purchase.TYPE_PURCHASE,
+            total_amount=sum(quantity * price for _type, _id, quantity, price in items),
+        )
+        for content_type, object_id, quantity, price in items:
+            self._add(
+                PurchaseItem,
+                purchase_id=purchase_id,
+                content_type_id=content_type.pk,
+                object_id=object_id,
+                quantity=quantity,
+                unit_price=price,
+                total_price=quantity * price,
+            )
+
+    def _write_feeding(self):
+        self.log("Writing feeding events...")
+        finishing, _growing, _creep, supplement = self.diets
+        day = self.start
+        while day <= self.end:
+            for feedlot in self.feedlots:
+                amount = self._money(600 * self.rng.uniform(0.5, 0.9) * 10)
+                self._feeding(day, feedlot, finishing, amount)
+            # Weekly supplement on the pastures in the dry season
+            if day.month in (6, 7, 8, 9) and day.weekday() == 0:
+                for pasture in self.pastures:
+                    amount = self._money(self.rng.uniform(150, 300))
+                    self._feeding(day, pasture, supplement, amount)
+            day += timedelta(days=1)
+
+    def _feeding(self, day, location, diet, amount):
+        diet_id, cost = diet
+        self._add(
+            FeedingEvent,
+            date=day,
+            location_id=location,
+            diet_id=diet_id,
+            amount_kg=amount,
+            cost_total=self._money(float(amount * cost)),
+        )
+
+    def _write_tasks(self):
+        self.log("Writing tasks...")
+        titles = [
+            "Weigh",
+            "Vaccinate",
+            "Pregnancy check",
+            "Check withdrawal",
+            "Move to pasture",
+            "Hoof trimming",
+        ]
+        priorities = [
+            (Task.Priority.LOW, 3),
+            (Task.Priority.MEDIUM, 5),
+            (Task.Priority.HIGH, 2),
+            (Task.Priority.CRITICAL, 1),
+        ]
+        herd = [animal for animal in self.animals if animal.present(self.end)]
+        if not herd:
+            return
+        content_type = ContentType.objects.get_for_model(Cattle)
+        first = self.end - timedelta(days=90)
+        for _ in range(max(len(herd) // 4, 10)):
+            animal = self.rng.choice(herd)
+            due = self._day(first, self.end + timedelta(days=60))
+            if due < self.end:
+                status = self._weighted(
+                    [(Task.Status.DONE, 9), (Task.Status.CANCELED, 1)]
+                )
+            else:
+                status = self._weighted(
+                    [(Task.Status.PENDING, 4), (Task.Status.IN_PROGRESS, 1)]
+                )
+            self._add(
+                Task,
+                title=f"{self.rng.choice(titles)} {animal.tag}",
+                due_date=due,
+                priority=self._weighted(priorities),
+                status=status,
+                completed_at=(
+                    self._moment(due) if status == Task.Status.DONE else None
+                ),
+                content_type_id=content_type.pk,
+                object_id=animal.id,
+            )
@@ -0,0 +1,136 @@
+"""
+Cache keys namespaced by per-model version counters.
+
+Every project model (BaseModel / TimestampsOnlyBaseModel) has a counter
+in the shared cache. Saving, deleting or bulk-updating
+(BaseQuerySet.update) a row increments its model's counter, so keys built
+from the old versions are never read again and simply expire. Nothing is
+deleted by pattern, which works the same on every cache backend.
+
+    @staticmethod
+    @memoize(Sale)
+    def get_sales_stats() -> dict: ...
+
+Writes that bypass both signals and update() (bulk_create, raw SQL) call
+`bump()` themselves.
+"""
+
+import hashlib
+import time
+from functools import wraps
+from typing import Callable
+
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.cache.backends.db import DatabaseCache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from apps.base.utils import replica
+
+KEY_PREFIX = "mv"
+
+# Called with the model label after each bump (e.g. to drop process-local copies)
+_listeners: list[Callable[[str], None]] = []
+
+
+def _label(model) -> str:
+    return model._meta.label_lower
+
+
+def _version_key(label: str) -> str:
+    return f"{KEY_PREFIX}:version:{label}"
+
+
+def _on_change(sender, **kwargs):  # pylint: disable=unused-argument
+    # pylint: disable=import-outside-toplevel
+    from apps.base.models.base_model import BaseModel, TimestampsOnlyBaseModel
+
+    if issubclass(sender, (BaseModel, TimestampsOnlyBaseModel)):
+        bump(sender)
+
+
+def connect_signals() -> None:
+    """Called from BaseConfig.ready()."""
+    post_save.connect(_on_change, dispatch_uid=f"{KEY_PREFIX}:post_save")
+    post_delete.connect(_on_change, dispatch_uid=f"{KEY_PREFIX}:post_delete")
+
+
+def add_listener(callback: Callable[[str], None]) -> None:
+    _listeners.append(callback)
+
+
+def get_versions(*models) -> tuple:
+    """Current counters of `models`, in order."""
+    keys = [_version_key(_label(model)) for model in models]
+    found = cache.get_many(keys)
+    for key in keys:
+        if key not in found:
+            # Start from the clock so an evicted counter never reuses an old key
+            cache.add(key, time.time_ns(), None)
+            found[key] = cache.get(key)
+    return tuple(found[key] for key in keys)
+
+
+def _increment(label: str) -> None:
+    key = _version_key(label)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns(), None)
+    for callback in _listeners:
+        callback(label)
+
+
+def _in_database() -> bool:
+    return isinstance(caches[DEFAULT_CACHE_ALIAS], DatabaseCache)
+
+
+def bump(*models) -> None:
+    """Invalidates every value cached from `models`."""
+    in_transaction = transaction.get_connection().in_atomic_block
+    # Inside the transaction a database cache would hold the counter row
+    # locked until commit, serializing every writer of the model
+    early = not (in_transaction and _in_database())
+    for model in models:
+        label = _label(model)
+        if early:
+            _increment(label)
+        if in_transaction:
+            # A concurrent reader may refill the cache from pre-commit rows
+            transaction.on_commit(lambda label=label: _increment(label))
+
+
+def versioned_key(name: str, models, *parts) -> str:
+    """A cache key for `name` that changes whenever one of `models` does."""
+    versions = ".".join(map(str, get_versions(*models)))
+    key = f"{KEY_PREFIX}:{name}:{versions}"
+    if parts:
+        key += ":" + hashlib.md5(repr(parts).encode()).hexdigest()
+    return key
+
+
+def memoize(*models, timeout=DEFAULT_TIMEOUT) -> Callable:
+    """
+    Caches a function's result per arguments until one of `models`
+    changes (or `timeout` seconds pass; default: the cache's TIMEOUT).
+    Arguments must have a stable repr(); results must be picklable.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        name = f"{func.__module__}.{func.__qualname__}"
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = versioned_key(name, models, args, sorted(kwargs.items()))
+            value = cache.get(key)
+            if value is None:
+                # A lagging replica would be cached under the new version
+                with replica.reads_from_primary():
+                    value = func(*args, **kwargs)
+                cache.set(key, value, timeout)
+            return value
+
+        return wrapper
+
+    return decorator
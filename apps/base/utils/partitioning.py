@@ -0,0 +1,247 @@
+"""
+Yearly range partitions for the high-volume, date-bounded tables: weight
+records (by session date), sanitary event targets (by event date) and
+tasks (by due date).
+
+A partitioned table has one partition per calendar year,
+`<table>_y<year>`, and a default partition, `<table>_default`, for the
+rows of years without one, so a write never fails on a missing
+partition. A query filtering on the partition key only scans the
+partitions of the years it covers: withdrawal's 365-day window reads
+this year's and last year's, whatever the length of the history.
+
+Postgres requires the partition key in every unique index of a
+partitioned table: its primary key is (uuid, key), its unique
+constraints include the key, and no foreign key can point to it.
+
+PartitionByYear converts a table in a migration; the `partitions`
+command creates the partitions of the coming years ahead of time.
+Closed years leave the live tables through the archive
+(apps.base.utils.archive), which keeps them readable.
+"""
+
+import re
+from datetime import date
+
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.migrations.operations.base import Operation
+from django.utils import timezone
+
+
+def partition_name(table: str, year: int) -> str:
+    return f"{table}_y{year}"
+
+
+def default_partition(table: str) -> str:
+    return f"{table}_default"
+
+
+def partitioned_tables(using: str = DEFAULT_DB_ALIAS) -> dict[str, str]:
+    """{table: partition key column} of the partitioned tables."""
+    with connections[using].cursor() as cursor:
+        cursor.execute("""
+            SELECT c.relname, a.attname
+            FROM pg_partitioned_table p
+            JOIN pg_class c ON c.oid = p.partrelid
+            JOIN pg_attribute a
+                ON a.attrelid = p.partrelid AND a.attnum = p.partattrs[0]
+            WHERE pg_table_is_visible(c.oid)
+            ORDER BY c.relname
+            """)
+        return dict(cursor.fetchall())
+
+
+def partition_years(table: str, using: str = DEFAULT_DB_ALIAS) -> list[int]:
+    """The years `table` has an attached partition for."""
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT c.relname FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = %s::regclass
+            """,
+            [table],
+        )
+        pattern = re.compile(rf"{re.escape(table)}_y(\d{{4}})")
+        return sorted(
+            int(match[1])
+            for (name,) in cursor.fetchall()
+            if (match := pattern.fullmatch(name))
+        )
+
+
+def _bounds(year: int) -> list[date]:
+    return [date(year, 1, 1), date(year + 1, 1, 1)]
+
+
+def create_partition(
+    table: str, column: str, year: int, using: str = DEFAULT_DB_ALIAS
+) -> None:
+    """
+    Creates the partition of `year`, moving the rows of that year already
+    in the default partition into it.
+    """
+    connection = connections[using]
+    quote = connection.ops.quote_name
+    parent, partition = quote(table), quote(partition_name(table, year))
+    default, column = quote(default_partition(table)), quote(column)
+    in_year = f"{column} >= %s AND {column} < %s"
+    with transaction.atomic(using=using), connection.cursor() as cursor:
+        cursor.execute(f"LOCK TABLE {parent} IN SHARE ROW EXCLUSIVE MODE")
+        cursor.execute(
+            f"SELECT EXISTS (SELECT 1 FROM {default} WHERE {in_year})", _bounds(year)
+        )
+        (strays,) = cursor.fetchone()
+        if strays:
+            # The default partition must not hold rows of a new partition
+            cursor.execute(f"ALTER TABLE {parent} DETACH PARTITION {default}")
+        cursor.execute(
+            f"CREATE TABLE {partition} PARTITION OF {parent} "
+            "FOR VALUES FROM (%s) TO (%s)",
+            _bounds(year),
+        )
+        if strays:
+            cursor.execute(
+                f"INSERT INTO {parent} SELECT * FROM {default} WHERE {in_year}",
+                _bounds(year),
+            )
+            cursor.execute(f"DELETE FROM {default} WHERE {in_year}", _bounds(year))
+            cursor.execute(f"ALTER TABLE {parent} ATTACH PARTITION {default} DEFAULT")
+
+
+class PartitionByYear(Operation):
+    """
+    Migration operation rebuilding a model's table as partitioned by year
+    of `column`, rows included, with the partitions of the years its rows
+    cover, the current year and the next. The primary key gains `column`;
+    indexes, foreign keys and triggers are recreated as they were. Unique
+    constraints must be removed before and added back with `column`.
+
+    Reversing it rebuilds an ordinary table.
+    """
+
+    reversible = True
+
+    def __init__(self, model_name: str, column: str):
+        self.model_name = model_name
+        self.column = column
+
+    def deconstruct(self):
+        return (
+            self.__class__.__name__,
+            [],
+            {"model_name": self.model_name, "column": self.column},
+        )
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            _rebuild(schema_editor, model, self.column)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            _rebuild(schema_editor, model, None)
+
+    def describe(self):
+        return f"Partition {self.model_name} by year of {self.column}"
+
+    @property
+    def migration_name_fragment(self):
+        return f"partition_{self.model_name.lower()}"
+
+
+def _rebuild(schema_editor, model, column) -> None:
+    """Rebuilds the table of `model`, partitioned by `column` unless None."""
+    table = model._meta.db_table
+    quote = schema_editor.quote_name
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT conname FROM pg_constraint WHERE confrelid = %s::regclass",
+            [table],
+        )
+        if referenced_by := [name for (name,) in cursor.fetchall()]:
+            raise ValueError(f"{table} is referenced by {', '.join(referenced_by)}")
+        cursor.execute(
+            """
+            SELECT ix.indisprimary, ix.indisunique, c.relname,
+                pg_get_indexdef(ix.indexrelid)
+            FROM pg_index ix JOIN pg_class c ON c.oid = ix.indexrelid
+            WHERE ix.indrelid = %s::regclass
+            """,
+            [table],
+        )
+        indexes = cursor.fetchall()
+        cursor.execute(
+            """
+            SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint
+            WHERE conrelid = %s::regclass AND contype = 'f'
+            """,
+            [table],
+        )
+        foreign_keys = cursor.fetchall()
+        cursor.execute(
+            """
+            SELECT pg_get_triggerdef(oid) FROM pg_trigger
+            WHERE tgrelid = %s::regclass AND NOT tgisinternal
+            """,
+            [table],
+        )
+        triggers = [definition for (definition,) in cursor.fetchall()]
+        years = set()
+        if column:
+            cursor.execute(
+                f"SELECT DISTINCT extract(year FROM {quote(column)})::int "
+                f"FROM {quote(table)}"
+            )
+            this_year = timezone.localdate().year
+            years = {year for (year,) in cursor.fetchall()} | {
+                this_year,
+                this_year + 1,
+            }
+
+    for primary, unique, name, _definition in indexes:
+        if unique and not primary:
+            raise ValueError(f"Remove the unique index {name} of {table} first")
+
+    rebuilt = f"{table}__rebuilt"
+    partition_by = f" PARTITION BY RANGE ({quote(column)})" if column else ""
+    schema_editor.execute(
+        f"CREATE TABLE {quote(rebuilt)} (LIKE {quote(table)} "
+        f"INCLUDING DEFAULTS INCLUDING CONSTRAINTS){partition_by}"
+    )
+    if column:
+        schema_editor.execute(
+            f"CREATE TABLE {quote(default_partition(table))} "
+            f"PARTITION OF {quote(rebuilt)} DEFAULT"
+        )
+        for year in sorted(years):
+            start, end = _bounds(year)
+            schema_editor.execute(
+                f"CREATE TABLE {quote(partition_name(table, year))} "
+                f"PARTITION OF {quote(rebuilt)} "
+                f"FOR VALUES FROM ('{start}') TO ('{end}')"
+            )
+    schema_editor.execute(f"INSERT INTO {quote(rebuilt)} SELECT * FROM {quote(table)}")
+    schema_editor.execute(f"DROP TABLE {quote(table)}")
+    schema_editor.execute(f"ALTER TABLE {quote(rebuilt)} RENAME TO {quote(table)}")
+
+    key = [model._meta.pk.column, *([column] if column else [])]
+    for primary, _unique, name, definition in indexes:
+        if primary:
+            schema_editor.execute(
+                f"ALTER TABLE {quote(table)} ADD CONSTRAINT {quote(name)} "
+                f"PRIMARY KEY ({', '.join(map(quote, key))})"
+            )
+        else:
+            # A partitioned table's own indexes are defined ON ONLY it
+            schema_editor.execute(definition.replace(" ON ONLY ", " ON ", 1))
+    for name, definition in foreign_keys:
+        schema_editor.execute(
+            f"ALTER TABLE {quote(table)} ADD CONSTRAINT {quote(name)} {definition}"
+        )
+    for definition in triggers:
+        schema_editor.execute(definition)
@@ -0,0 +1,198 @@
+"""
+On-demand profiling of single requests, for superusers only.
+
+ProfilerMiddleware runs a request under cProfile when the superuser adds
+`?profile` to the URL or holds the PROFILE_COOKIE cookie (set with
+`?profile=on`, cleared with `?profile=off`). Every SQL statement is
+timed, and the slowest SELECTs are re-run with
+`EXPLAIN (ANALYZE, BUFFERS)` once the response is ready. The report is
+kept in the shared cache for PROFILER_TTL seconds and linked from the
+X-Profile-Url response header and the profiler pages.
+
+Profiling is throttled to one request per user every PROFILER_INTERVAL
+seconds; requests inside the window are served normally.
+"""
+
+import cProfile
+import io
+import logging
+import pstats
+import time
+import uuid
+from contextlib import ExitStack
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, connections
+from django.utils import timezone
+
+from apps.base.utils.query_stats import fingerprint
+
+logger = logging.getLogger("cnv.profiler")
+
+PROFILE_PARAM = "profile"
+PROFILE_COOKIE = "cnv_profile"
+
+INDEX_KEY = "profiler:index"
+INDEX_SIZE = 50
+FUNCTION_ROWS = 40
+EXPLAIN_LIMIT = 5
+
+
+def _report_key(report_id: str) -> str:
+    return f"profiler:report:{report_id}"
+
+
+class SQLCapture:
+    """execute_wrapper keeping every statement with its params and time."""
+
+    def __init__(self):
+        self.statements: list[dict] = []
+        self._stack = ExitStack()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.statements.append(
+                {
+                    "alias": context["connection"].alias,
+                    "sql": sql,
+                    "params": None if many else params,
+                    "ms": (time.perf_counter() - start) * 1000,
+                }
+            )
+
+    def __enter__(self):
+        for connection in connections.all():
+            self._stack.enter_context(connection.execute_wrapper(self))
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stack.close()
+
+    def slowest(self, limit: int) -> list[dict]:
+        """The slowest statement of each fingerprint, slowest first."""
+        groups: dict[str, dict] = {}
+        for statement in self.statements:
+            group = groups.setdefault(
+                fingerprint(statement["sql"]),
+                {"count": 0, "total_ms": 0.0, "slowest": statement},
+            )
+            group["count"] += 1
+            group["total_ms"] += statement["ms"]
+            if statement["ms"] > group["slowest"]["ms"]:
+                group["slowest"] = statement
+        ranked = sorted(groups.items(), key=lambda item: -item[1]["total_ms"])
+        return [
+            {
+                "sql": sql,
+                "count": group["count"],
+                "total_ms": round(group["total_ms"], 2),
+                "max_ms": round(group["slowest"]["ms"], 2),
+                "statement": group["slowest"],
+            }
+            for sql, group in ranked[:limit]
+        ]
+
+
+def explain(statement: dict, analyze: bool = True) -> str:
+    """
+    The plan of a statement; with `analyze` the executed plan. EXPLAIN
+    ANALYZE runs the query, so then anything but a SELECT is left alone.
+    """
+    sql = statement["sql"]
+    if statement["params"] is None:
+        return ""
+    if analyze and not sql.lstrip().upper().startswith("SELECT"):
+        return ""
+    connection = connections[statement["alias"]]
+    if connection.vendor != "postgresql":
+        return ""
+    options = "(ANALYZE, BUFFERS) " if analyze else ""
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN {options}{sql}", statement["params"])
+            return "\n".join(row[0] for row in cursor.fetchall())
+    except DatabaseError as exc:
+        return f"EXPLAIN failed: {exc}"
+
+
+def requested(request) -> bool:
+    """Whether the request asks for a profile, whoever sent it."""
+    return PROFILE_PARAM in request.GET or PROFILE_COOKIE in request.COOKIES
+
+
+def wants_profile(request) -> bool:
+    if not requested(request):
+        return False
+    user = getattr(request, "user", None)
+    return user is not None and user.is_superuser
+
+
+def acquire_slot(user) -> bool:
+    """False while the user's previous profile is within PROFILER_INTERVAL."""
+    return cache.add(f"profiler:throttle:{user.pk}", 1, settings.PROFILER_INTERVAL)
+
+
+def profile_request(get_response, request) -> tuple:
+    """Runs the request under the profiler; returns (response, report id)."""
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    with SQLCapture() as capture:
+        profiler.enable()
+        try:
+            response = get_response(request)
+        finally:
+            profiler.disable()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    functions = io.StringIO()
+    stats = pstats.Stats(profiler, stream=functions)
+    stats.strip_dirs().sort_stats("cumulative").print_stats(FUNCTION_ROWS)
+
+    queries = capture.slowest(EXPLAIN_LIMIT)
+    for query in queries:
+        query["plan"] = explain(query.pop("statement"))
+
+    match = getattr(request, "resolver_match", None)
+    report = {
+        "id": uuid.uuid4().hex,
+        "created_at": timezone.now().isoformat(),
+        "user": request.user.get_username(),
+        "method": request.method,
+        "path": request.get_full_path(),
+        "view": match.view_name if match else "",
+        "status": response.status_code,
+        "total_ms": round(elapsed_ms, 1),
+        "sql_count": len(capture.statements),
+        "sql_ms": round(sum(s["ms"] for s in capture.statements), 1),
+        "functions": functions.getvalue(),
+        "queries": queries,
+    }
+    save_report(report)
+    logger.info("Profiled %s %s as %s", request.method, request.path, report["id"])
+    return response, report["id"]
+
+
+def save_report(report: dict) -> None:
+    cache.set(_report_key(report["id"]), report, settings.PROFILER_TTL)
+    index = [report["id"], *cache.get(INDEX_KEY, [])][:INDEX_SIZE]
+    cache.set(INDEX_KEY, index, settings.PROFILER_TTL)
+
+
+def get_report(report_id: str) -> Optional[dict]:
+    return cache.get(_report_key(report_id))
+
+
+def recent_reports() -> list[dict]:
+    """Stored reports, newest first; expired ones drop out."""
+    index = cache.get(INDEX_KEY, [])
+    reports = cache.get_many([_report_key(report_id) for report_id in index])
+    return [
+        reports[_report_key(report_id)]
+        for report_id in index
+        if _report_key(report_id) in reports
+    ]
@@ -0,0 +1,86 @@
+"""
+Per-request SQL accounting: how many queries ran, how long they took and
+which statements repeated (the N+1 signature).
+
+`QueryRecorder` hooks every database connection with
+`connection.execute_wrapper()`, so it works with DEBUG off and adds no
+cost beyond a timer per query. QueryStatsMiddleware reports one recorder
+per request; the `query_budget` test fixture asserts on one.
+"""
+
+import re
+import time
+from collections import Counter, defaultdict
+from contextlib import ExitStack
+
+from django.db import connections
+
+# Collapses "IN (%s, %s, %s)" and VALUES lists so batches of different
+# sizes share a fingerprint
+_PLACEHOLDER_LIST = re.compile(r"\((?:\s*%s\s*,)+\s*%s\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(sql: str) -> str:
+    """The statement with its parameter lists collapsed."""
+    return _WHITESPACE.sub(" ", _PLACEHOLDER_LIST.sub("(...)", sql)).strip()
+
+
+class QueryRecorder:
+    """
+    Context manager recording every query run on any connection.
+
+        with QueryRecorder() as recorder:
+            ...
+        recorder.count, recorder.duration, recorder.duplicates()
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0  # seconds
+        self.fingerprints: Counter = Counter()
+        # fingerprint -> durations (seconds), and the slowest call as
+        # (seconds, sql, params)
+        self.timings: dict[str, list[float]] = defaultdict(list)
+        self.examples: dict[str, tuple[float, str, object]] = {}
+        self._stack = ExitStack()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - start
+            key = fingerprint(sql)
+            self.duration += elapsed
+            self.count += 1
+            self.fingerprints[key] += 1
+            self.timings[key].append(elapsed)
+            if not many and elapsed > self.examples.get(key, (-1, None))[0]:
+                self.examples[key] = (elapsed, sql, params)
+
+    def __enter__(self):
+        for connection in connections.all():
+            self._stack.enter_context(connection.execute_wrapper(self))
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stack.close()
+
+    def duplicates(self, limit: int = 5) -> list[tuple[str, int]]:
+        """Statements run more than once, most repeated first."""
+        return [
+            (sql, times)
+            for sql, times in self.fingerprints.most_common(limit)
+            if times > 1
+        ]
+
+    @property
+    def duplicate_count(self) -> int:
+        """Executions beyond the first of each statement."""
+        return sum(times - 1 for times in self.fingerprints.values())
+
+    def report(self) -> str:
+        lines = [f"{self.count} queries in {self.duration * 1000:.1f} ms"]
+        lines += [f"  {times}x {sql}" for sql, times in self.duplicates()]
+        return "\n".join(lines)
@@ -0,0 +1,108 @@
+"""
+Cached reference data: the small, rarely-changing lists behind filter
+dropdowns and form selects (locations, partners, medications, diets,
+ingredients).
+
+A loader decorated with `reference_data(*models)` is read through two
+layers:
+
+- a per-process LRU, trusted for LOCAL_TIMEOUT seconds before it checks
+  the shared versions again;
+- the shared Django cache, under a key versioned by the dependent
+  models (see model_cache), expiring after SHARED_TIMEOUT seconds.
+
+Saving, deleting or bulk-updating a dependent model bumps its version
+and drops this process's copies, so a stale list is never read again.
+Other processes pick the change up within LOCAL_TIMEOUT.
+
+Loaders return lists of model instances; callers must not mutate them.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Callable, Iterable
+
+from django.core.cache import cache
+
+from apps.base.utils import model_cache, replica
+
+# Lifetime of an entry in the shared cache
+SHARED_TIMEOUT = 300  # seconds
+# How long a process serves its own copy without checking the versions
+LOCAL_TIMEOUT = 5  # seconds
+LOCAL_MAX_ENTRIES = 64
+
+_local: "OrderedDict[str, tuple]" = OrderedDict()
+_lock = threading.Lock()
+# model label -> names of the loaders that depend on it
+_dependents: dict[str, set[str]] = {}
+
+
+def _drop_local(label: str) -> None:
+    with _lock:
+        for name in _dependents.get(label, ()):
+            _local.pop(name, None)
+
+
+model_cache.add_listener(_drop_local)
+
+
+def clear_local() -> None:
+    """Empties this process's layer (tests clear the shared cache too)."""
+    with _lock:
+        _local.clear()
+
+
+def reference_data(*models) -> Callable:
+    """
+    Caches the result of a no-argument loader until one of `models`
+    changes.
+    """
+
+    def decorator(loader: Callable[[], list]) -> Callable[[], list]:
+        name = f"{loader.__module__}.{loader.__qualname__}"
+        for model in models:
+            _dependents.setdefault(model._meta.label_lower, set()).add(name)
+
+        @wraps(loader)
+        def wrapper() -> list:
+            now = time.monotonic()
+            with _lock:
+                entry = _local.get(name)
+                if entry and now - entry[2] < LOCAL_TIMEOUT:
+                    _local.move_to_end(name)
+                    return entry[1]
+
+            key = model_cache.versioned_key(name, models)
+            if entry and entry[0] == key:
+                value = entry[1]
+            else:
+                value = cache.get(key)
+                if value is None:
+                    with replica.reads_from_primary():
+                        value = list(loader())
+                    cache.set(key, value, SHARED_TIMEOUT)
+
+            with _lock:
+                _local[name] = (key, value, now)
+                _local.move_to_end(name)
+                while len(_local) > LOCAL_MAX_ENTRIES:
+                    _local.popitem(last=False)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def set_cached_choices(field, objects: Iterable) -> None:
+    """
+    Renders a ModelChoiceField's options from `objects` instead of
+    querying its queryset; the queryset still validates submitted values.
+    """
+    choices = [(obj.pk, field.label_from_instance(obj)) for obj in objects]
+    if field.empty_label is not None:
+        choices.insert(0, ("", field.empty_label))
+    field.choices = choices
@@ -0,0 +1,104 @@
+"""
+Read-replica routing.
+
+With a read-only alias configured (REPLICA_DATABASE, set when
+DB_REPLICA_HOST is), the queries of read-only views (dashboard, overview,
+lists, exports, the calendar feed: views with `read_replica = True`) go
+to the replica; every write, and every read elsewhere, goes to default.
+ReplicaMiddleware decides per request:
+
+- unsafe methods (POST...) always read from default;
+- once a request writes, its later reads go to default (a transaction
+  reads its own writes), and the client is
+  pinned to default for REPLICA_STICKY_SECONDS (a cookie), so the page it
+  is redirected to shows what it just saved despite replication lag.
+
+Sessions, users and the database cache always use default: a login, a
+deactivated account or a cache version bump must apply at once, and
+their writes don't pin.
+Cached values (model_cache.memoize, reference_data) are computed on
+default too, or a lagging replica would freeze stale rows under a fresh
+version key.
+"""
+
+import contextvars
+from contextlib import contextmanager
+from typing import Optional
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+PIN_COOKIE = "cnv_primary_until"
+
+# Read back immediately after they are written
+PRIMARY_ONLY_APPS = {"sessions", "django_cache", "auth", "authentication"}
+
+_reading = contextvars.ContextVar("replica_reading", default=False)
+_wrote = contextvars.ContextVar("replica_wrote", default=False)
+
+
+def replica_alias() -> Optional[str]:
+    return getattr(settings, "REPLICA_DATABASE", None)
+
+
+def read_alias() -> str:
+    """The alias reads go to right now."""
+    alias = replica_alias()
+    if alias and _reading.get() and not _wrote.get():
+        return alias
+    return DEFAULT_DB_ALIAS
+
+
+def wrote() -> bool:
+    """Whether the current request (or block) has written."""
+    return _wrote.get()
+
+
+@contextmanager
+def reads_from_replica(enabled: bool = True):
+    """Routes the reads of the block to the replica (when configured)."""
+    reading, written = _reading.set(enabled), _wrote.set(False)
+    try:
+        yield
+    finally:
+        _reading.reset(reading)
+        _wrote.reset(written)
+
+
+@contextmanager
+def reads_from_primary():
+    """Keeps the reads of the block on default."""
+    token = _reading.set(False)
+    try:
+        yield
+    finally:
+        _reading.reset(token)
+
+
+def start_reading() -> None:
+    """Like reads_from_replica(), up to the end of the enclosing block."""
+    _reading.set(True)
+
+
+class ReplicaRouter:
+    """DATABASE_ROUTERS entry; a no-op without REPLICA_DATABASE."""
+
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label in PRIMARY_ONLY_APPS:
+            return DEFAULT_DB_ALIAS
+        return read_alias()
+
+    def db_for_write(self, model, **hints):
+        if model._meta.app_label not in PRIMARY_ONLY_APPS:
+            _wrote.set(True)
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases hold the same rows
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # The replica follows default's schema through replication
+        if db != DEFAULT_DB_ALIAS:
+            return False
+        return None
@@ -0,0 +1,123 @@
+"""
+Slow-query capture without pg_stat_statements.
+
+QueryStatsMiddleware hands every request's QueryRecorder to `record()`,
+which adds its statements, grouped by fingerprint and URL name, to
+totals held by the process. At most every SLOW_QUERY_FLUSH_INTERVAL
+seconds the SLOW_QUERY_TOP costliest groups are merged into SlowQuery
+rows and the totals restart. `manage.py slow_queries` ranks the rows.
+
+p95 is computed over the last SAMPLE_SIZE durations of each group.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import threading
+import time
+from collections import deque
+from typing import Iterable
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DatabaseError, transaction
+
+from apps.base.models import SlowQuery
+from apps.base.utils.query_stats import QueryRecorder
+
+logger = logging.getLogger("cnv.queries")
+
+SAMPLE_SIZE = 500
+
+_lock = threading.Lock()
+_groups: dict[tuple[str, str], "_Group"] = {}
+_last_flush = time.monotonic()
+
+
+class _Group:
+    def __init__(self):
+        self.calls = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.samples: deque = deque(maxlen=SAMPLE_SIZE)
+        self.example: tuple = (0.0, "", None)  # (ms, sql, params)
+
+
+def digest(fingerprint: str) -> str:
+    return hashlib.md5(fingerprint.encode(), usedforsecurity=False).hexdigest()
+
+
+def percentile(values: Iterable[float], fraction: float = 0.95) -> float:
+    """Nearest-rank percentile; 0 for no values."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[max(math.ceil(fraction * len(ordered)) - 1, 0)]
+
+
+def _json_safe(params):
+    try:
+        json.dumps(params, cls=DjangoJSONEncoder)
+        return params
+    except TypeError:
+        return [repr(param) for param in params]
+
+
+def record(view: str, recorder: QueryRecorder) -> None:
+    with _lock:
+        for fingerprint, durations in recorder.timings.items():
+            group = _groups.setdefault((view, fingerprint), _Group())
+            milliseconds = [seconds * 1000 for seconds in durations]
+            group.calls += len(milliseconds)
+            group.total_ms += sum(milliseconds)
+            group.max_ms = max(group.max_ms, *milliseconds)
+            group.samples.extend(milliseconds)
+            if fingerprint in recorder.examples:
+                seconds, sql, params = recorder.examples[fingerprint]
+                if seconds * 1000 >= group.example[0]:
+                    group.example = (seconds * 1000, sql, params)
+
+
+def maybe_flush() -> None:
+    if time.monotonic() - _last_flush >= settings.SLOW_QUERY_FLUSH_INTERVAL:
+        try:
+            flush()
+        except DatabaseError:
+            logger.warning("Could not store slow queries", exc_info=True)
+
+
+def flush() -> int:
+    """Merges the costliest groups into SlowQuery rows; returns how many."""
+    global _last_flush  # pylint: disable=global-statement
+    with _lock:
+        groups = sorted(_groups.items(), key=lambda item: -item[1].total_ms)
+        _groups.clear()
+        _last_flush = time.monotonic()
+    groups = groups[: settings.SLOW_QUERY_TOP]
+
+    with transaction.atomic():
+        for (view, fingerprint), group in groups:
+            row, _created = SlowQuery.objects.select_for_update().get_or_create(
+                view=view,
+                digest=digest(fingerprint),
+                defaults={"fingerprint": fingerprint},
+            )
+            row.calls += group.calls
+            row.total_ms += group.total_ms
+            row.max_ms = max(row.max_ms, group.max_ms)
+            row.samples = [*row.samples, *group.samples][-SAMPLE_SIZE:]
+            row.p95_ms = percentile(row.samples)
+            example_ms, sql, params = group.example
+            if sql and example_ms >= row.example_ms:
+                row.example_ms = example_ms
+                row.example_sql = sql
+                row.example_params = _json_safe(params)
+            row.save()
+    return len(groups)
+
+
+def reset() -> None:
+    """Drops the totals not yet stored (used by tests)."""
+    with _lock:
+        _groups.clear()
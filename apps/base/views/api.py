@@ -1,25 +1,35 @@
-from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.contenttypes.models import ContentType
 from django.http import JsonResponse
 from django.views import View
 
+from apps.authentication.permissions import AsyncLoginRequiredMixin
+from apps.base.views.conditional import ConditionalGetMixin
 
-class ItemLookupView(LoginRequiredMixin, View):
-    def get(self, request):
+
+class ItemLookupView(AsyncLoginRequiredMixin, ConditionalGetMixin, View):
+    """
+    Async, like every JSON endpoint polled by the tablets: under ASGI a
+    slow lookup waits on the database without holding a worker.
+    """
+
+    async def get_lookup(self, request):
+        """
+        Returns (queryset, None) for a valid lookup or (None, error response).
+        """
         content_type_id = request.GET.get("content_type_id")
         if not content_type_id:
-            return JsonResponse({"error": "Missing content_type_id"}, status=400)
+            return None, JsonResponse({"error": "Missing content_type_id"}, status=400)
 
         try:
-            ct = ContentType.objects.get_for_id(content_type_id)
-        except ContentType.DoesNotExist:
-            return JsonResponse({"error": "Invalid content_type_id"}, status=404)
+            ct = await ContentType.objects.aget(pk=content_type_id)
+        except (ContentType.DoesNotExist, ValueError):
+            return None, JsonResponse({"error": "Invalid content_type_id"}, status=404)
 
         # Security/Whitelist check (Optional but good practice)
         # Custom whitelist
         allowed_models = ["cattle", "location", "partner"]
         if ct.model not in allowed_models:
-            return JsonResponse(
+            return None, JsonResponse(
                 {"error": "Model not allowed for sale lookup"}, status=403
             )
 
@@ -30,7 +40,17 @@ class ItemLookupView(LoginRequiredMixin, View):
         qs = model_class.objects.all()
         if hasattr(model_class, "is_deleted"):
             qs = qs.filter(is_deleted=False)
+        return qs, None
+
+    async def aget_validator_querysets(self):
+        qs, _error = await self.get_lookup(self.request)
+        return [qs] if qs is not None else []
+
+    async def get(self, request):
+        qs, error = await self.get_lookup(request)
+        if error:
+            return error
 
         # Return list
-        data = [{"id": str(obj.pk), "name": str(obj)} for obj in qs]
+        data = [{"id": str(obj.pk), "name": str(obj)} async for obj in qs.aiterator()]
         return JsonResponse({"results": data})
@@ -0,0 +1,187 @@
+import hashlib
+from datetime import datetime, time
+from typing import Iterable
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib import messages
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Count, Max, QuerySet
+from django.http import HttpRequest
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from django.utils.translation import get_language
+from django.views.generic.detail import SingleObjectMixin
+from django.views.generic.list import MultipleObjectMixin
+
+from apps.base.utils import model_cache
+
+
+def _validators(
+    request: HttpRequest, user, stats: list[dict], versions: tuple = ()
+) -> tuple[str, datetime]:
+    # Pages also show what depends on the date (overdue tasks, withdrawal
+    # badges, ages), so they change at midnight
+    today = timezone.localdate()
+    parts = [
+        today.isoformat(),
+        settings.RELEASE,
+        str(getattr(user, "pk", "")),
+        get_language() or "",
+        request.META.get("CSRF_COOKIE", ""),
+        # The same URL answers full pages and htmx partials
+        request.headers.get("HX-Request", ""),
+        request.headers.get("HX-Target", ""),
+        ".".join(map(str, versions)),
+    ]
+    last_modified = timezone.make_aware(datetime.combine(today, time.min))
+    for stat in stats:
+        parts.append(
+            f"{stat['last'].isoformat() if stat['last'] else ''}:{stat['rows']}"
+        )
+        if stat["last"] and stat["last"] > last_modified:
+            last_modified = stat["last"]
+
+    digest = hashlib.md5("|".join(parts).encode(), usedforsecurity=False).hexdigest()
+    # Weak: the CSRF token is re-masked on every render
+    return f'W/"{digest}"', last_modified
+
+
+def queryset_validators(
+    request: HttpRequest, querysets: Iterable[QuerySet], models: Iterable = ()
+) -> tuple[str, datetime]:
+    """
+    Returns (etag, last_modified) for a response built from `querysets`
+    and from any row of `models`.
+
+    Each queryset costs one aggregate, max(modified_at) with the row count;
+    the count catches hard deletes, which leave no newer timestamp behind.
+    Whole tables (`models`) cost no query: their model_cache versions go
+    into the ETag instead. The ETag also covers what every page embeds
+    besides the data: the user, the language, the CSRF secret, the release
+    and today's date.
+    """
+    stats = [
+        queryset.order_by().aggregate(last=Max("modified_at"), rows=Count("pk"))
+        for queryset in querysets
+    ]
+    versions = model_cache.get_versions(*models)
+    return _validators(request, request.user, stats, versions)
+
+
+async def aqueryset_validators(
+    request: HttpRequest, querysets: Iterable[QuerySet], models: Iterable = ()
+) -> tuple[str, datetime]:
+    """queryset_validators() for async views."""
+    stats = [
+        await queryset.order_by().aaggregate(last=Max("modified_at"), rows=Count("pk"))
+        for queryset in querysets
+    ]
+    versions = await sync_to_async(model_cache.get_versions)(*models) if models else ()
+    return _validators(request, await request.auser(), stats, versions)
+
+
+def generic_object_querysets(items: QuerySet) -> list[QuerySet]:
+    """
+    The rows `items` link to through their content_type / object_id
+    generic foreign key, one queryset per linked model.
+    """
+    content_type_ids = (
+        items.filter(content_type__isnull=False)
+        .order_by()
+        .values_list("content_type", flat=True)
+        .distinct()
+    )
+    querysets = []
+    for content_type_id in content_type_ids:
+        model = ContentType.objects.get_for_id(content_type_id).model_class()
+        linked = items.filter(content_type=content_type_id).values("object_id")
+        querysets.append(model._base_manager.filter(pk__in=linked))
+    return querysets
+
+
+class ConditionalGetMixin:
+    """
+    Answers GET/HEAD with 304 Not Modified, before the view queries or
+    renders anything, when the data behind the response did not change
+    since the client's copy.
+
+    get_validator_querysets() lists the querysets the response is built
+    from; detail views default to their object, list views to their
+    (filtered) queryset. get_validator_models() lists the models any of
+    whose rows the page may show (filter dropdowns, names in the rows),
+    checked by version instead of scanning them. Responses are private and
+    must be revalidated.
+
+    Async views are handled too; they may override
+    aget_validator_querysets() when listing the querysets needs the
+    database.
+    """
+
+    request: HttpRequest
+
+    def get_validator_querysets(self) -> list[QuerySet]:
+        if isinstance(self, SingleObjectMixin):
+            return [self.get_queryset().filter(pk=self.kwargs[self.pk_url_kwarg])]
+        if isinstance(self, MultipleObjectMixin):
+            return [self.get_queryset()]
+        raise NotImplementedError(
+            f"{type(self).__name__} must define get_validator_querysets()"
+        )
+
+    async def aget_validator_querysets(self) -> list[QuerySet]:
+        return self.get_validator_querysets()
+
+    def get_validator_models(self) -> list:
+        return []
+
+    def dispatch(self, request, *args, **kwargs):
+        if self.view_is_async:
+            return self._adispatch(request, *args, **kwargs)
+
+        # A pending flash message has to be rendered, not served from cache
+        if request.method not in ("GET", "HEAD") or len(messages.get_messages(request)):
+            return super().dispatch(request, *args, **kwargs)
+
+        etag, last_modified = queryset_validators(
+            request, self.get_validator_querysets(), self.get_validator_models()
+        )
+        response = self._not_modified(request, etag, last_modified)
+        if response is None:
+            response = super().dispatch(request, *args, **kwargs)
+        return self._add_validators(response, etag, last_modified)
+
+    async def _adispatch(self, request, *args, **kwargs):
+        # Async views answer JSON, which never renders flash messages
+        if request.method not in ("GET", "HEAD"):
+            return await super().dispatch(request, *args, **kwargs)
+
+        etag, last_modified = await aqueryset_validators(
+            request,
+            await self.aget_validator_querysets(),
+            self.get_validator_models(),
+        )
+        response = self._not_modified(request, etag, last_modified)
+        if response is None:
+            response = await super().dispatch(request, *args, **kwargs)
+        return self._add_validators(response, etag, last_modified)
+
+    @staticmethod
+    def _not_modified(request, etag, last_modified):
+        return get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=last_modified and int(last_modified.timestamp()),
+        )
+
+    @staticmethod
+    def _add_validators(response, etag, last_modified):
+        if response.status_code in (200, 304):
+            response.setdefault("ETag", etag)
+            if last_modified:
+                response.setdefault(
+                    "Last-Modified", http_date(last_modified.timestamp())
+                )
+            patch_cache_control(response, private=True, no_cache=True)
+        return response
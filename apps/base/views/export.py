@@ -0,0 +1,56 @@
+import uuid
+from datetime import date
+from typing import Optional
+
+from django.http import HttpResponseBadRequest
+from django.utils.dateparse import parse_date
+from django.views import View
+
+from apps.base.utils import replica
+from apps.base.utils.export import FORMAT_CSV, FORMATS, export_response
+from apps.base.views.progress import serves_streams
+
+
+class ExportView(View):
+    """
+    Streams a CSV (default) or JSON Lines download, picked with ?format=.
+
+    Subclasses set `export_name` and `columns` and implement
+    get_queryset(); filters come from the same GET parameters as the
+    matching list page, so "Export" downloads what the user is looking at.
+    Under ASGI the rows are read asynchronously (see export_response).
+    """
+
+    export_name = ""
+    columns: dict = {}
+    read_replica = True
+
+    def get_queryset(self):
+        raise NotImplementedError
+
+    def get_date(self, param: str) -> Optional[date]:
+        """Parses a YYYY-MM-DD GET parameter; invalid dates are ignored."""
+        try:
+            return parse_date(self.request.GET.get(param) or "")
+        except ValueError:
+            return None
+
+    def get_uuid(self, param: str) -> Optional[uuid.UUID]:
+        try:
+            return uuid.UUID(self.request.GET.get(param) or "")
+        except ValueError:
+            return None
+
+    def get(self, request, *args, **kwargs):
+        fmt = request.GET.get("format") or FORMAT_CSV
+        if fmt not in FORMATS:
+            return HttpResponseBadRequest(f"Unknown export format: {fmt}")
+        # Streamed after the view returns, so the read alias is fixed now
+        queryset = self.get_queryset().using(replica.read_alias())
+        return export_response(
+            queryset,
+            self.columns,
+            self.export_name,
+            fmt,
+            asynchronous=serves_streams(request),
+        )
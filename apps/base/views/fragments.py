@@ -0,0 +1,59 @@
+from django.shortcuts import get_object_or_404
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import conditional_page
+from django.views.generic import ListView, TemplateView
+
+from apps.base.views.conditional import ConditionalGetMixin
+
+
+class FragmentMixin:
+    """
+    A partial of a detail page, fetched on demand (hx-get) once the shell
+    has rendered.
+
+    Subclasses set `parent_model`; the object from the URL's `pk` is
+    available as `self.parent` and, in the template, as `parent` and as
+    `parent_context_name`.
+    """
+
+    parent_model = None
+    parent_context_name = None
+
+    def get_parent_queryset(self):
+        return self.parent_model.objects.all()
+
+    def dispatch(self, request, *args, **kwargs):
+        self.parent = get_object_or_404(self.get_parent_queryset(), pk=kwargs["pk"])
+        return super().dispatch(request, *args, **kwargs)
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["parent"] = self.parent
+        if self.parent_context_name:
+            context[self.parent_context_name] = self.parent
+        # Pagination links reload the fragment in place, keeping its query
+        context["fragment_url"] = self.request.path
+        query = self.request.GET.copy()
+        query.pop("page", None)
+        context["fragment_query"] = query.urlencode()
+        return context
+
+
+@method_decorator(cache_control(private=True, no_cache=True), name="dispatch")
+@method_decorator(conditional_page, name="dispatch")
+class FragmentView(FragmentMixin, TemplateView):
+    """
+    A fragment built from several sources; it is revalidated against an
+    ETag of the rendered content.
+    """
+
+
+class FragmentListView(FragmentMixin, ConditionalGetMixin, ListView):
+    """
+    A paginated related collection; `?page=` swaps the fragment in place.
+    Revalidation is answered from the collection's max(modified_at)
+    without rendering.
+    """
+
+    paginate_by = 10
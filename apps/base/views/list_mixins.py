@@ -1,5 +1,6 @@
 from django.db.models import QuerySet
 from django.http import HttpRequest
+from django.utils.cache import patch_vary_headers
 
 
 class StandardizedListMixin:
@@ -34,3 +35,49 @@ class StandardizedListMixin:
         context["date_after"] = self.request.GET.get("date_after", "")
         context["date_before"] = self.request.GET.get("date_before", "")
         return context
+
+
+class PartialListMixin:
+    """
+    Lets filter changes and page flips refresh only the list results.
+
+    The filter form and the pagination links send htmx requests aimed at
+    the `#list-results` container; those get `partial_template_name` (the
+    table plus pagination) instead of the whole page, and the filter
+    dropdowns' reference data (get_reference_data()) is not queried.
+    """
+
+    request: HttpRequest
+    partial_template_name = None
+    partial_target = "list-results"
+
+    def is_partial(self) -> bool:
+        headers = self.request.headers
+        return (
+            headers.get("HX-Request") == "true"
+            and headers.get("HX-Target") == self.partial_target
+            # Back/forward cache misses need the full page
+            and headers.get("HX-History-Restore-Request") != "true"
+        )
+
+    def get_reference_data(self) -> dict:
+        """Context only the full page needs (choices, dropdown querysets)."""
+        return {}
+
+    def get_template_names(self):
+        if self.is_partial():
+            return [self.partial_template_name]
+        return super().get_template_names()
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["partial_target"] = self.partial_target
+        if not self.is_partial():
+            context.update(self.get_reference_data())
+        return context
+
+    def render_to_response(self, context, **response_kwargs):
+        response = super().render_to_response(context, **response_kwargs)
+        # The same URL serves the page and the fragment
+        patch_vary_headers(response, ("HX-Request", "HX-Target"))
+        return response
@@ -0,0 +1,28 @@
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from django.utils.crypto import constant_time_compare
+from django.views import View
+
+from apps.base.utils import metrics
+
+
+class MetricsView(View):
+    """
+    Prometheus scrape endpoint. With METRICS_TOKEN set the scraper must
+    send "Authorization: Bearer <token>"; without one only staff (or any
+    client in DEBUG) may read it.
+    """
+
+    content_type = "text/plain; version=0.0.4; charset=utf-8"
+
+    def has_access(self, request) -> bool:
+        token = settings.METRICS_TOKEN
+        if token:
+            header = request.headers.get("Authorization", "")
+            return constant_time_compare(header, f"Bearer {token}")
+        return settings.DEBUG or request.user.is_staff
+
+    def get(self, request):
+        if not self.has_access(request):
+            return HttpResponseForbidden()
+        return HttpResponse(metrics.render(), content_type=self.content_type)
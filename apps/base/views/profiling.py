@@ -0,0 +1,28 @@
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import Http404
+from django.views.generic import TemplateView
+
+from apps.authentication.permissions import AdminRequiredMixin
+from apps.base.utils import profiling
+
+
+class ProfileReportListView(LoginRequiredMixin, AdminRequiredMixin, TemplateView):
+    template_name = "base/profile_list.html"
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["reports"] = profiling.recent_reports()
+        context["profiling_on"] = profiling.PROFILE_COOKIE in self.request.COOKIES
+        return context
+
+
+class ProfileReportDetailView(LoginRequiredMixin, AdminRequiredMixin, TemplateView):
+    template_name = "base/profile_detail.html"
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        report = profiling.get_report(self.kwargs["report_id"])
+        if report is None:
+            raise Http404
+        context["report"] = report
+        return context
@@ -0,0 +1,132 @@
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import Http404, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.views import View
+
+from apps.authentication.permissions import AsyncLoginRequiredMixin
+from apps.base.utils import live_updates
+
+
+def serves_streams(request) -> bool:
+    """
+    Whether `request` came in over ASGI. Under WSGI, StreamingHttpResponse
+    drains an async iterator before sending anything, so a progress stream
+    would hold a sync worker for its whole lifetime and deliver nothing.
+    """
+    return isinstance(request, ASGIRequest)
+
+
+class ProgressPageMixin:
+    """
+    Context of a detail page that follows a ProgressStreamView:
+    `live_progress` when the page may open the stream, and `rendered_at`,
+    where the stream picks up.
+    """
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["live_progress"] = serves_streams(self.request)
+        context["rendered_at"] = timezone.now().isoformat()
+        return context
+
+
+class ProgressStreamView(AsyncLoginRequiredMixin, View):
+    """
+    Server-Sent Events of a record's progress while its detail rows are
+    written (a weighing session, a batch treatment), so the office watches
+    the chute without re-rendering the detail page.
+
+    Each `progress` event carries the rows written since the client's
+    cursor, the ids of the rows soft-deleted since, and the running
+    `summary` of the live rows; its id is the new cursor (the rows' latest
+    modified_at). The first cursor is `?since=`, the page's render time;
+    on reconnect the browser sends it back as Last-Event-ID.
+
+    modified_at is stamped before commit, so a row can become visible
+    after rows stamped later than it. Each read therefore goes back
+    `settle` behind the cursor, and clients upsert rows by id.
+
+    The stream waits on LISTEN (see live_updates) and holds a second
+    database connection while open. It is only served under ASGI (see
+    serves_streams); under WSGI it answers 404 and pages don't open it.
+
+    Subclasses set `model` and `summary` (aggregates) and implement
+    `get_rows()`, the detail rows of `self.object` including deleted
+    ones, and `serialize_row()`.
+    """
+
+    model = None
+    summary: dict = {}
+    keepalive = 15  # seconds between comments while nothing changes
+    # Longest a transaction writing detail rows may take to commit
+    settle = timedelta(seconds=60)
+    # The browser reconnects from the last event id, so closing loses
+    # nothing and returns the connections of forgotten tabs
+    lifetime = 600  # seconds
+
+    def get_rows(self):
+        raise NotImplementedError
+
+    def serialize_row(self, row) -> dict:
+        raise NotImplementedError
+
+    def get_since(self) -> datetime:
+        value = self.request.headers.get("Last-Event-ID") or self.request.GET.get(
+            "since", ""
+        )
+        try:
+            since = parse_datetime(value)
+        except ValueError:
+            since = None
+        return since or timezone.now()
+
+    async def get_progress(self, since: datetime) -> tuple[dict, datetime]:
+        rows = self.get_rows()
+        written, removed = [], []
+        changed = rows.filter(modified_at__gt=since - self.settle)
+        async for row in changed.order_by("modified_at"):
+            since = max(since, row.modified_at)
+            if row.is_deleted:
+                removed.append(str(row.pk))
+            else:
+                written.append(self.serialize_row(row))
+        summary = await rows.filter(is_deleted=False).aaggregate(**self.summary)
+        return {"rows": written, "removed": removed, **summary}, since
+
+    @staticmethod
+    def format_event(progress: dict, cursor: datetime) -> str:
+        data = json.dumps(progress, cls=DjangoJSONEncoder)
+        return f"id: {cursor.isoformat()}\nevent: progress\ndata: {data}\n\n"
+
+    async def stream(self, since: datetime):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.lifetime
+        # LISTEN first, so nothing committed after the first read is missed
+        async with live_updates.listen(live_updates.channel(self.object)) as wait:
+            changed = True
+            while (remaining := deadline - loop.time()) > 0:
+                if changed:
+                    progress, since = await self.get_progress(since)
+                    yield self.format_event(progress, since)
+                else:
+                    yield ": keepalive\n\n"
+                changed = await wait(min(self.keepalive, remaining))
+
+    async def get(self, request, pk):
+        if not serves_streams(request):
+            raise Http404
+        try:
+            self.object = await self.model.objects.aget(pk=pk)
+        except self.model.DoesNotExist as error:
+            raise Http404 from error
+        return StreamingHttpResponse(
+            self.stream(self.get_since()),
+            content_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
@@ -43,3 +43,19 @@ class CattleForm(forms.ModelForm):
             )
 
         return tag
+
+
+class CattleImportForm(forms.Form):
+    file = forms.FileField(
+        label=_("CSV File"),
+        help_text=_(
+            "Header row required. Columns: tag, name, electronic_id, sex, breed, "
+            "birth_date, weight_kg, status, reproduction_status, sire, dam, "
+            "location, notes."
+        ),
+        widget=forms.ClearableFileInput(attrs={"accept": ".csv,text/csv"}),
+    )
+    dry_run = forms.BooleanField(
+        label=_("Validate only (do not save)"),
+        required=False,
+    )
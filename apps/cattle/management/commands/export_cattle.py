@@ -0,0 +1,30 @@
+from django.http import QueryDict
+
+from apps.base.utils.export import ExportCommand
+from apps.cattle.services.cattle_service import CattleService
+from apps.cattle.services.herd_query import HerdQuery
+
+
+class Command(ExportCommand):
+    help = (
+        "Export active cattle as CSV or JSON Lines, optionally narrowed by a "
+        "saved-search query string (e.g. 'sex=female&breed=nelore')."
+    )
+
+    name = "cattle"
+    columns = CattleService.EXPORT_COLUMNS
+
+    def add_filter_arguments(self, parser):
+        parser.add_argument(
+            "--query", default="", help="Herd filter query string from a search link"
+        )
+        parser.add_argument(
+            "--condition",
+            choices=[code for code, _label in CattleService.CONDITION_CHOICES],
+        )
+
+    def get_queryset(self, options):
+        return CattleService.get_all_cattle(
+            condition=options["condition"],
+            criteria=HerdQuery.from_params(QueryDict(options["query"])),
+        )
@@ -0,0 +1,59 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.cattle.services.import_service import CattleImportService
+
+
+class Command(BaseCommand):
+    help = (
+        "Import cattle from a CSV file (header row with at least a 'tag' "
+        "column). Rows with errors are reported and skipped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Path to the CSV file")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=CattleImportService.CHUNK_SIZE,
+            help="Rows validated and inserted per transaction",
+        )
+        parser.add_argument(
+            "--encoding", default="utf-8-sig", help="File encoding (default utf-8)"
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Validate every row without saving anything",
+        )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        try:
+            with open(
+                options["path"], newline="", encoding=options["encoding"]
+            ) as stream:
+                result = CattleImportService.import_csv(
+                    stream,
+                    chunk_size=options["chunk_size"],
+                    dry_run=options["dry_run"],
+                )
+        except (OSError, UnicodeDecodeError) as e:
+            raise CommandError(str(e)) from e
+
+        for line, message in result["errors"]:
+            self.stderr.write(f"Line {line}: {message}")
+        if result["error_count"] > len(result["errors"]):
+            self.stderr.write(
+                f"... {result['error_count'] - len(result['errors'])} more errors."
+            )
+
+        verb = "Validated" if options["dry_run"] else "Imported"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{verb} {result['created']} of {result['rows']} rows "
+                f"({result['error_count']} errors) in "
+                f"{time.perf_counter() - started:.1f}s."
+            )
+        )
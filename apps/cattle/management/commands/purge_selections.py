@@ -0,0 +1,24 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from apps.cattle.services.selection_service import SelectionService
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete unnamed cattle selections left behind by batch flows. "
+        "Named selections are kept."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=SelectionService.MAX_AGE.days,
+            help="Delete selections older than this many days",
+        )
+
+    def handle(self, *args, **options):
+        deleted = SelectionService.purge_stale(timedelta(days=options["days"]))
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} stale selections."))
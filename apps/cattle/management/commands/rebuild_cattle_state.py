@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.cattle.models import Cattle
+from apps.health.services.health_service import HealthService
+from apps.locations.services.movement_service import MovementService
+from apps.reproduction.services.reproduction_service import ReproductionService
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the cached per-animal state columns (withdrawal, treatment, "
+        "breeding, calving and location dates) from the event history."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of animals updated per transaction",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        pks = list(Cattle.all_objects.order_by("pk").values_list("pk", flat=True))
+
+        for start in range(0, len(pks), batch_size):
+            batch = pks[start : start + batch_size]
+            with transaction.atomic():
+                HealthService.sync_treatment_state(batch)
+                ReproductionService.sync_breeding_state(batch)
+                MovementService.sync_location_state(batch)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt cached state for {len(pks)} cattle.")
+        )
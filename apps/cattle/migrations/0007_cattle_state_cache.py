@@ -0,0 +1,83 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cattle", "0006_cattle_location"),
+        ("locations", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="cattle",
+            name="expected_calving_date",
+            field=models.DateField(
+                blank=True, null=True, verbose_name="Expected Calving Date"
+            ),
+        ),
+        migrations.AddField(
+            model_name="cattle",
+            name="last_breeding_date",
+            field=models.DateField(
+                blank=True, null=True, verbose_name="Last Breeding Date"
+            ),
+        ),
+        migrations.AddField(
+            model_name="cattle",
+            name="last_treatment_date",
+            field=models.DateField(
+                blank=True, null=True, verbose_name="Last Treatment Date"
+            ),
+        ),
+        migrations.AddField(
+            model_name="cattle",
+            name="location_since",
+            field=models.DateTimeField(
+                blank=True, null=True, verbose_name="At Location Since"
+            ),
+        ),
+        migrations.AddField(
+            model_name="cattle",
+            name="withdrawal_until",
+            field=models.DateField(
+                blank=True,
+                help_text="End of the longest meat withdrawal period.",
+                null=True,
+                verbose_name="Withdrawal Until",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="cattle",
+            index=models.Index(
+                fields=["withdrawal_until"], name="cattle_catt_withdra_311127_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="cattle",
+            index=models.Index(
+                fields=["last_treatment_date"], name="cattle_catt_last_tr_f4622f_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="cattle",
+            index=models.Index(
+                fields=["last_breeding_date"], name="cattle_catt_last_br_e46809_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="cattle",
+            index=models.Index(
+                fields=["expected_calving_date"], name="cattle_catt_expecte_44f958_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="cattle",
+            index=models.Index(
+                fields=["location", "location_since"],
+                name="cattle_catt_locatio_ddc164_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,106 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:21
+
+import uuid
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cattle", "0007_cattle_state_cache"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Selection",
+            fields=[
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="Created at"),
+                ),
+                (
+                    "modified_at",
+                    models.DateTimeField(auto_now=True, verbose_name="Modified at"),
+                ),
+                (
+                    "uuid",
+                    models.UUIDField(
+                        db_index=True,
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                        verbose_name="uuid",
+                    ),
+                ),
+                ("is_deleted", models.BooleanField(db_index=True, default=False)),
+                (
+                    "name",
+                    models.CharField(blank=True, max_length=100, verbose_name="Name"),
+                ),
+                ("size", models.PositiveIntegerField(default=0, verbose_name="Size")),
+                (
+                    "created_by",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="cattle_selections",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Created By",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Selection",
+                "verbose_name_plural": "Selections",
+                "ordering": ["-created_at"],
+            },
+        ),
+        migrations.CreateModel(
+            name="SelectionMember",
+            fields=[
+                (
+                    "pk",
+                    models.CompositePrimaryKey(
+                        "selection",
+                        "animal",
+                        blank=True,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "animal",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="selection_memberships",
+                        to="cattle.cattle",
+                    ),
+                ),
+                (
+                    "selection",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="members",
+                        to="cattle.selection",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Selection Member",
+                "verbose_name_plural": "Selection Members",
+                "indexes": [
+                    models.Index(
+                        fields=["animal"], name="cattle_sele_animal__72dba2_idx"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cattle", "0008_selection"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="cattle",
+            index=models.Index(
+                fields=["modified_at"], name="cattle_catt_modifie_1fe7ed_idx"
+            ),
+        ),
+    ]
@@ -1,3 +1,4 @@
 from .cattle import Cattle
+from .selection import Selection, SelectionMember
 
-__all__ = ["Cattle"]
+__all__ = ["Cattle", "Selection", "SelectionMember"]
@@ -4,6 +4,7 @@ from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.urls import reverse
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from apps.base.models.base_model import BaseModel
@@ -180,6 +181,25 @@ class Cattle(BaseModel):
         help_text=_("Where the animal is currently located."),
     )
 
+    # State Cache (Updated by HealthService, ReproductionService and
+    # MovementService; rebuilt by the rebuild_cattle_state command)
+    withdrawal_until = models.DateField(
+        _("Withdrawal Until"),
+        null=True,
+        blank=True,
+        help_text=_("End of the longest meat withdrawal period."),
+    )
+    last_treatment_date = models.DateField(
+        _("Last Treatment Date"), null=True, blank=True
+    )
+    last_breeding_date = models.DateField(
+        _("Last Breeding Date"), null=True, blank=True
+    )
+    expected_calving_date = models.DateField(
+        _("Expected Calving Date"), null=True, blank=True
+    )
+    location_since = models.DateTimeField(_("At Location Since"), null=True, blank=True)
+
     class Meta(BaseModel.Meta):
         verbose_name = _("Cattle")
         verbose_name_plural = _("Cattle")
@@ -190,6 +210,18 @@ class Cattle(BaseModel):
                 name="unique_active_cattle_tag",
             )
         ]
+        indexes = [
+            models.Index(fields=["withdrawal_until"]),
+            models.Index(fields=["last_treatment_date"]),
+            models.Index(fields=["last_breeding_date"]),
+            models.Index(fields=["expected_calving_date"]),
+            models.Index(fields=["location", "location_since"]),
+            # max(modified_at) of the conditional GET validators
+            models.Index(fields=["modified_at"]),
+        ]
+
+    # Selection memberships are transient batch-flow state, never a dependency
+    strict_deletion_ignore_fields = ["selection_memberships"]
 
     def delete(self, using=None, keep_parents=False, destroy=False):
         """
@@ -261,6 +293,20 @@ class Cattle(BaseModel):
             return f"{diff_years}y {diff_months}m"
         return f"{diff_months}m"
 
+    @property
+    def in_withdrawal(self):
+        """True while the meat withdrawal period is still running."""
+        return bool(
+            self.withdrawal_until and self.withdrawal_until > timezone.localdate()
+        )
+
+    @property
+    def days_at_location(self):
+        """Days since the animal arrived at its current location."""
+        if not self.location_since:
+            return None
+        return (timezone.localdate() - timezone.localdate(self.location_since)).days
+
     def get_absolute_url(self):
         return reverse("cattle:detail", kwargs={"pk": self.pk})
 
@@ -0,0 +1,54 @@
+from django.conf import settings
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from apps.base.models.base_model import BaseModel
+
+
+class Selection(BaseModel):
+    """
+    A persisted set of cattle, referenced by a single ID across the
+    batch flows (health events, weighing, movements, breeding) instead
+    of passing raw lists of cattle IDs through POST bodies and sessions.
+    """
+
+    name = models.CharField(_("Name"), max_length=100, blank=True)
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="cattle_selections",
+        verbose_name=_("Created By"),
+    )
+    size = models.PositiveIntegerField(_("Size"), default=0)
+
+    class Meta:
+        verbose_name = _("Selection")
+        verbose_name_plural = _("Selections")
+        ordering = ["-created_at"]
+
+    # Members are part of the selection itself (cascade deleted)
+    strict_deletion_ignore_fields = ["members"]
+
+    def __str__(self):
+        return self.name or _("Selection of %(size)s animals") % {"size": self.size}
+
+
+class SelectionMember(models.Model):
+    """Membership row: two columns, keyed by (selection, animal)."""
+
+    pk = models.CompositePrimaryKey("selection", "animal")
+    selection = models.ForeignKey(
+        Selection, on_delete=models.CASCADE, related_name="members"
+    )
+    animal = models.ForeignKey(
+        "cattle.Cattle",
+        on_delete=models.CASCADE,
+        related_name="selection_memberships",
+    )
+
+    class Meta:
+        verbose_name = _("Selection Member")
+        verbose_name_plural = _("Selection Members")
+        indexes = [models.Index(fields=["animal"])]
@@ -1,58 +1,187 @@
+from datetime import timedelta
 from typing import Optional
 
-from django.db.models import Count, Q, QuerySet
+from django.db import transaction
+from django.db.models import Count, F, Q, QuerySet
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
 
+from apps.base.utils import model_cache
+from apps.base.utils.model_cache import memoize
 from apps.cattle.models import Cattle
+from apps.cattle.services.herd_query import HerdQuery
+from apps.locations.services import MovementService
 
 
 class CattleService:
+    CONDITION_IN_WITHDRAWAL = "in_withdrawal"
+    CONDITION_CALVING_SOON = "calving_soon"
+    CONDITION_NOT_TREATED = "not_treated"
+    CALVING_SOON_DAYS = 30
+    NOT_TREATED_DAYS = 180
+    CONDITION_CHOICES = [
+        (CONDITION_IN_WITHDRAWAL, _("In withdrawal")),
+        (CONDITION_CALVING_SOON, _("Calving in 30 days")),
+        (CONDITION_NOT_TREATED, _("No treatment in 180 days")),
+    ]
+
+    SORT_OPTIONS = {
+        "tag": _("Tag"),
+        "expected_calving_date": _("Expected calving"),
+        "-withdrawal_until": _("Withdrawal end"),
+        "-last_treatment_date": _("Last treatment"),
+        "-last_breeding_date": _("Last breeding"),
+        "location_since": _("Longest at location"),
+    }
+
+    HERD_SUMMARY_TIMEOUT = 300  # seconds
+
+    # Export header -> lookup. The identity columns match the CSV import so
+    # an export can be re-imported; parents unknown to the herd keep their
+    # external ID.
+    EXPORT_COLUMNS = {
+        "tag": "tag",
+        "name": "name",
+        "electronic_id": "electronic_id",
+        "sex": "sex",
+        "breed": "breed",
+        "birth_date": "birth_date",
+        "weight_kg": "weight_kg",
+        "current_weight": "current_weight",
+        "status": "status",
+        "reproduction_status": "reproduction_status",
+        "sire": Coalesce("sire__tag", "sire_external_id"),
+        "dam": Coalesce("dam__tag", "dam_external_id"),
+        "location": "location__name",
+        "location_since": "location_since",
+        "last_treatment_date": "last_treatment_date",
+        "withdrawal_until": "withdrawal_until",
+        "expected_calving_date": "expected_calving_date",
+        "notes": "notes",
+    }
+
     @staticmethod
-    def get_cattle_stats() -> dict:
+    def _compute_herd_summary() -> dict:
         """
-        Returns statistics about cattle.
+        Builds the herd summary from a single scan of the cattle table.
+        Rows are grouped by breed and every other breakdown is a
+        COUNT(*) FILTER (WHERE ...) column, summed across the breed rows.
         """
-        total_cattle = Cattle.objects.filter(status=Cattle.STATUS_AVAILABLE).count()
-        status_counts = Cattle.objects.values("status").annotate(count=Count("status"))
+        available = Q(status=Cattle.STATUS_AVAILABLE)
+        available_female = available & Q(sex=Cattle.SEX_FEMALE)
+
+        aggregates = {
+            f"status_{code}": Count("pk", filter=Q(status=code))
+            for code, _label in Cattle.STATUS_CHOICES
+        }
+        aggregates.update(
+            {
+                f"sex_{code}": Count("pk", filter=available & Q(sex=code))
+                for code, _label in Cattle.SEX_CHOICES
+            }
+        )
+        aggregates.update(
+            {
+                f"rep_{code}": Count(
+                    "pk", filter=available_female & Q(reproduction_status=code)
+                )
+                for code, _label in Cattle.REP_STATUS_CHOICES
+            }
+        )
 
-        # Convert QuerySet to a more usable dict
-        stats = {item["status"]: item["count"] for item in status_counts}
+        rows = (
+            Cattle.objects.order_by()
+            .values("breed")
+            .annotate(**aggregates)
+            .values("breed", *aggregates.keys())
+        )
 
-        # Calculate breed breakdown
-        # Calculate breed breakdown for active herd only
-        active_cattle = Cattle.objects.filter(status=Cattle.STATUS_AVAILABLE)
-        breed_counts = active_cattle.values("breed").annotate(count=Count("breed"))
+        totals = dict.fromkeys(aggregates, 0)
         breed_dict = dict(Cattle.BREED_CHOICES)
+        breed_stats: dict = {}
+        for row in rows:
+            for key in aggregates:
+                totals[key] += row[key]
 
-        breed_stats = {}
-        for item in breed_counts:
-            code = item["breed"] or Cattle.BREED_OTHER
-            label = breed_dict.get(
-                code, code
-            ).title()  # Fallback to code if not found, title cased
-            breed_stats[label] = item["count"]
+            count = row[f"status_{Cattle.STATUS_AVAILABLE}"]
+            if count:
+                code = row["breed"] or Cattle.BREED_OTHER
+                # Fallback to code if not found, title cased
+                label = str(breed_dict.get(code, code)).title()
+                breed_stats[label] = breed_stats.get(label, 0) + count
+
+        status_stats = {
+            code: totals[f"status_{code}"]
+            for code, _label in Cattle.STATUS_CHOICES
+            if totals[f"status_{code}"]
+        }
+        sex_stats = {code: totals[f"sex_{code}"] for code, _label in Cattle.SEX_CHOICES}
+        reproduction_stats = {
+            code: totals[f"rep_{code}"] for code, _label in Cattle.REP_STATUS_CHOICES
+        }
 
         return {
-            "total": total_cattle,
-            "status_breakdown": stats,
+            "total": totals[f"status_{Cattle.STATUS_AVAILABLE}"],
+            "status_breakdown": status_stats,
             "breed_breakdown": breed_stats,
-            "available": stats.get(Cattle.STATUS_AVAILABLE, 0),
-            "sold": stats.get(Cattle.STATUS_SOLD, 0),
-            "dead": stats.get(Cattle.STATUS_DEAD, 0),
+            "sex_breakdown": sex_stats,
+            "reproduction_breakdown": reproduction_stats,
+            "total_females": sex_stats[Cattle.SEX_FEMALE],
+            "available": totals[f"status_{Cattle.STATUS_AVAILABLE}"],
+            "sold": totals[f"status_{Cattle.STATUS_SOLD}"],
+            "dead": totals[f"status_{Cattle.STATUS_DEAD}"],
         }
 
+    @staticmethod
+    @memoize(Cattle, timeout=HERD_SUMMARY_TIMEOUT)
+    def get_herd_summary() -> dict:
+        """
+        Returns status, breed, sex and reproduction-status breakdowns of the
+        herd. Breed, sex and reproduction figures cover the active
+        (available) herd only; reproduction figures cover females only.
+        The result is cached and invalidated whenever a Cattle row changes.
+        """
+        return CattleService._compute_herd_summary()
+
+    @staticmethod
+    def invalidate_herd_summary() -> None:
+        """For bulk writes that skip signals and update() (bulk_create)."""
+        model_cache.bump(Cattle)
+
+    @staticmethod
+    def get_cattle_stats() -> dict:
+        """
+        Returns statistics about cattle.
+        """
+        return CattleService.get_herd_summary()
+
     @staticmethod
     def get_all_cattle(
         search_query: Optional[str] = None,
         breed: Optional[str] = None,
         status: Optional[str] = None,
         location_id: Optional[str] = None,
+        condition: Optional[str] = None,
+        ordering: Optional[str] = None,
+        criteria: Optional[HerdQuery] = None,
     ) -> QuerySet[Cattle]:
         """
-        Returns all cattle records ordered by tag.
-        Optionally filters by tag, name, breed, status, or location.
+        Returns all cattle records ordered by tag, or by one of
+        SORT_OPTIONS. Optionally filters by tag, name, breed, status,
+        location, one of the CONDITION_CHOICES, or a HerdQuery cohort.
         """
         queryset = Cattle.objects.all().order_by("tag")
 
+        if ordering in CattleService.SORT_OPTIONS and ordering != "tag":
+            field = F(ordering.lstrip("-"))
+            order = (
+                field.desc(nulls_last=True)
+                if ordering.startswith("-")
+                else field.asc(nulls_last=True)
+            )
+            queryset = queryset.order_by(order, "tag")
+
         if search_query:
             queryset = queryset.filter(
                 Q(tag__icontains=search_query) | Q(name__icontains=search_query)
@@ -67,6 +196,38 @@ class CattleService:
         if location_id:
             queryset = queryset.filter(location_id=location_id)
 
+        if condition:
+            queryset = CattleService.filter_by_condition(queryset, condition)
+
+        if criteria:
+            queryset = criteria.apply(queryset)
+
+        return queryset
+
+    @staticmethod
+    def filter_by_condition(queryset: QuerySet[Cattle], condition: str) -> QuerySet:
+        """
+        Filters on the cached state columns. Unknown conditions are ignored.
+        """
+        today = timezone.localdate()
+
+        if condition == CattleService.CONDITION_IN_WITHDRAWAL:
+            return queryset.filter(withdrawal_until__gt=today)
+        if condition == CattleService.CONDITION_CALVING_SOON:
+            return queryset.filter(
+                reproduction_status=Cattle.REP_STATUS_PREGNANT,
+                expected_calving_date__gte=today,
+                expected_calving_date__lte=today
+                + timedelta(days=CattleService.CALVING_SOON_DAYS),
+            )
+        if condition == CattleService.CONDITION_NOT_TREATED:
+            return queryset.filter(
+                Q(last_treatment_date__isnull=True)
+                | Q(
+                    last_treatment_date__lt=today
+                    - timedelta(days=CattleService.NOT_TREATED_DAYS)
+                )
+            )
         return queryset
 
     @staticmethod
@@ -75,11 +236,24 @@ class CattleService:
         return Cattle.objects.create(**data)
 
     @staticmethod
+    @transaction.atomic
     def update_cattle(cattle: Cattle, data: dict) -> Cattle:
-        """Updates an existing cattle record."""
+        """
+        Updates an existing cattle record. A changed location re-syncs
+        location_since from the movements into the new location.
+        """
+        moved = (
+            "location" in data
+            and Cattle.all_objects.filter(pk=cattle.pk)
+            .exclude(location=data["location"])
+            .exists()
+        )
         for key, value in data.items():
             setattr(cattle, key, value)
         cattle.save()
+        if moved:
+            MovementService.sync_location_state([cattle.pk])
+            cattle.refresh_from_db(fields=["location_since"])
         return cattle
 
     @staticmethod
@@ -0,0 +1,279 @@
+import uuid
+from datetime import date, timedelta
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Optional
+from urllib.parse import urlencode
+
+from django.db.models import Avg, Exists, OuterRef, Q, QuerySet, Subquery
+from django.utils import timezone
+
+from apps.cattle.models import Cattle
+from apps.health.models import SanitaryEventTarget
+from apps.locations.models import LocationType
+from apps.reproduction.models import Calving
+from apps.weight.models import WeightRecord
+
+
+def _month_start(day: date, months_back: int) -> date:
+    """First day of the month `months_back` months before `day`."""
+    year, month = divmod(day.year * 12 + day.month - 1 - months_back, 12)
+    return date(year, month + 1, 1)
+
+
+def _parse_choice(choices) -> Callable[[Any], str]:
+    valid = {str(code) for code, _label in choices}
+
+    def parse(value):
+        if str(value) not in valid:
+            raise ValueError(f"Invalid choice: {value}")
+        return str(value)
+
+    return parse
+
+
+def _parse_choices(choices) -> Callable[[Any], list]:
+    single = _parse_choice(choices)
+
+    def parse(value):
+        values = value if isinstance(value, (list, tuple)) else [value]
+        return [single(v) for v in values if v not in (None, "")]
+
+    return parse
+
+
+def _parse_positive_int(value) -> int:
+    number = int(value)
+    if number < 0:
+        raise ValueError("Value must be positive.")
+    return number
+
+
+def _parse_decimal(value) -> Decimal:
+    try:
+        return Decimal(str(value))
+    except InvalidOperation as e:
+        raise ValueError(f"Invalid number: {value}") from e
+
+
+def _parse_bool(value) -> bool:
+    if isinstance(value, bool):
+        return value
+    if str(value).lower() in ("1", "true", "on", "yes"):
+        return True
+    if str(value).lower() in ("0", "false", "off", "no"):
+        return False
+    raise ValueError(f"Invalid boolean: {value}")
+
+
+def _parse_uuid(value) -> str:
+    return str(uuid.UUID(str(value)))
+
+
+def _parse_uuid_list(value) -> list:
+    values = value if isinstance(value, (list, tuple)) else [value]
+    return [_parse_uuid(v) for v in values if v not in (None, "")]
+
+
+class HerdQuery:
+    """
+    Composable cohort filter over Cattle.
+
+    Criteria are combined with AND and compiled into a single SQL statement:
+    plain columns (including the cached state columns) become WHERE clauses,
+    weight, health and reproduction history become correlated EXISTS /
+    subqueries. A query round-trips through URL parameters so any cohort
+    can be bookmarked or shared as a saved search.
+
+    Example:
+        HerdQuery().where(
+            sex=Cattle.SEX_FEMALE,
+            age_min_months=18,
+            age_max_months=30,
+            adg_max="0.5",
+            adg_days=90,
+            not_treated_days=60,
+            location_type=LocationType.FEEDLOT,
+        ).apply()
+    """
+
+    DEFAULT_ADG_DAYS = 90
+
+    # name -> parser; parsers raise ValueError on bad input
+    FILTERS: dict[str, Callable[[Any], Any]] = {
+        "q": str,
+        "sex": _parse_choice(Cattle.SEX_CHOICES),
+        "breed": _parse_choices(Cattle.BREED_CHOICES),
+        "status": _parse_choices(Cattle.STATUS_CHOICES),
+        "reproduction_status": _parse_choices(Cattle.REP_STATUS_CHOICES),
+        "location": _parse_uuid_list,
+        "location_type": _parse_choices(LocationType.choices),
+        "age_min_months": _parse_positive_int,
+        "age_max_months": _parse_positive_int,
+        "adg_min": _parse_decimal,
+        "adg_max": _parse_decimal,
+        "adg_days": _parse_positive_int,
+        "not_treated_days": _parse_positive_int,
+        "treated_with": _parse_uuid,
+        "in_withdrawal": _parse_bool,
+        "calving_within_days": _parse_positive_int,
+        "has_calved": _parse_bool,
+        "min_days_at_location": _parse_positive_int,
+    }
+
+    def __init__(self, **criteria):
+        self.criteria: dict[str, Any] = {}
+        self.where(**criteria)
+
+    def where(self, **criteria) -> "HerdQuery":
+        """
+        Adds or replaces criteria. Empty values remove the criterion.
+        Raises ValueError for unknown names or invalid values.
+        """
+        for name, value in criteria.items():
+            if name not in self.FILTERS:
+                raise ValueError(f"Unknown herd filter: {name}")
+            if value in (None, "", []):
+                self.criteria.pop(name, None)
+                continue
+            parsed = self.FILTERS[name](value)
+            if parsed in ("", []):
+                self.criteria.pop(name, None)
+            else:
+                self.criteria[name] = parsed
+        return self
+
+    def __bool__(self):
+        return bool(self.criteria)
+
+    # --- Serialization -----------------------------------------------------
+
+    @classmethod
+    def from_params(cls, params) -> "HerdQuery":
+        """
+        Builds a query from a QueryDict (request.GET) or a plain dict.
+        Unknown parameters and invalid values are ignored so stale or
+        hand-edited URLs still render.
+        """
+        query = cls()
+        for name in cls.FILTERS:
+            if hasattr(params, "getlist"):
+                values = params.getlist(name)
+                value = values if len(values) > 1 else (values[0] if values else None)
+            else:
+                value = params.get(name)
+            try:
+                query.where(**{name: value})
+            except (ValueError, TypeError):
+                continue
+        return query
+
+    def to_params(self) -> dict[str, Any]:
+        """Returns the criteria as URL-ready strings (lists for multi-values)."""
+        params: dict[str, Any] = {}
+        for name, value in self.criteria.items():
+            if isinstance(value, list):
+                params[name] = [str(v) for v in value]
+            elif isinstance(value, bool):
+                params[name] = "1" if value else "0"
+            else:
+                params[name] = str(value)
+        return params
+
+    def to_querystring(self) -> str:
+        return urlencode(self.to_params(), doseq=True)
+
+    # --- Compilation -------------------------------------------------------
+
+    def apply(self, queryset: Optional[QuerySet] = None) -> QuerySet:
+        """Returns `queryset` (default: all active cattle) narrowed to the cohort."""
+        if queryset is None:
+            queryset = Cattle.objects.all()
+
+        c = self.criteria
+        today = timezone.localdate()
+        conditions = Q()
+
+        if "q" in c:
+            conditions &= Q(tag__icontains=c["q"]) | Q(name__icontains=c["q"])
+        if "sex" in c:
+            conditions &= Q(sex=c["sex"])
+        if "breed" in c:
+            conditions &= Q(breed__in=c["breed"])
+        if "status" in c:
+            conditions &= Q(status__in=c["status"])
+        if "reproduction_status" in c:
+            conditions &= Q(reproduction_status__in=c["reproduction_status"])
+        if "location" in c:
+            conditions &= Q(location_id__in=c["location"])
+        if "location_type" in c:
+            conditions &= Q(location__type__in=c["location_type"])
+
+        # Age in whole calendar months, matching Cattle.age
+        if "age_min_months" in c:
+            conditions &= Q(birth_date__lt=_month_start(today, c["age_min_months"] - 1))
+        if "age_max_months" in c:
+            conditions &= Q(birth_date__gte=_month_start(today, c["age_max_months"]))
+
+        # Cached state columns (see rebuild_cattle_state)
+        if "not_treated_days" in c:
+            cutoff = today - timedelta(days=c["not_treated_days"])
+            conditions &= Q(last_treatment_date__isnull=True) | Q(
+                last_treatment_date__lt=cutoff
+            )
+        if "in_withdrawal" in c:
+            in_withdrawal = Q(withdrawal_until__gt=today)
+            conditions &= in_withdrawal if c["in_withdrawal"] else ~in_withdrawal
+        if "calving_within_days" in c:
+            conditions &= Q(
+                reproduction_status=Cattle.REP_STATUS_PREGNANT,
+                expected_calving_date__gte=today,
+                expected_calving_date__lte=today
+                + timedelta(days=c["calving_within_days"]),
+            )
+        if "min_days_at_location" in c:
+            conditions &= Q(
+                location_since__lte=timezone.now()
+                - timedelta(days=c["min_days_at_location"])
+            )
+
+        # Related history
+        if "treated_with" in c:
+            conditions &= Q(
+                Exists(
+                    SanitaryEventTarget.objects.filter(
+                        animal=OuterRef("pk"),
+                        event__is_deleted=False,
+                        event__medication_id=c["treated_with"],
+                    )
+                )
+            )
+        if "has_calved" in c:
+            calved = Exists(Calving.objects.filter(dam=OuterRef("pk")))
+            conditions &= Q(calved) if c["has_calved"] else ~Q(calved)
+
+        queryset = queryset.filter(conditions)
+
+        if "adg_min" in c or "adg_max" in c:
+            queryset = queryset.annotate(window_adg=self._adg_subquery(today))
+            if "adg_min" in c:
+                queryset = queryset.filter(window_adg__gte=c["adg_min"])
+            if "adg_max" in c:
+                queryset = queryset.filter(window_adg__lt=c["adg_max"])
+
+        return queryset
+
+    def _adg_subquery(self, today: date) -> Subquery:
+        """Average recorded ADG per animal over the last `adg_days` days."""
+        days = self.criteria.get("adg_days", self.DEFAULT_ADG_DAYS)
+        return Subquery(
+            WeightRecord.objects.filter(
+                animal=OuterRef("pk"),
+                adg__isnull=False,
+                session__is_deleted=False,
+                session_date__gte=today - timedelta(days=days),
+            )
+            .order_by()
+            .values("animal")
+            .annotate(avg_adg=Avg("adg"))
+            .values("avg_adg")
+        )
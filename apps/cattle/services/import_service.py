@@ -0,0 +1,343 @@
+import csv
+import uuid
+from contextlib import nullcontext
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+from typing import Iterable, Iterator, Optional, TextIO
+
+from django.db import DatabaseError, transaction
+from django.db.models import Q
+from django.db.models.functions import Lower
+from django.utils import timezone
+from django.utils.translation import gettext as _
+
+from apps.base.utils.bulk_copy import BulkWriter
+from apps.cattle.models import Cattle
+from apps.cattle.services.cattle_service import CattleService
+from apps.locations.models import Location
+
+
+class RowError(ValueError):
+    """A CSV row that cannot be imported; the rest of the file continues."""
+
+
+class CattleImportService:
+    """
+    Streaming CSV import for whole herds (auction lists, registry exports).
+
+    The file is read row by row and processed in chunks: each chunk is
+    validated in Python, checked against the active-tag constraint and
+    the parent/location lookups with a handful of set-based queries, then
+    streamed into the table with one COPY inside its own transaction. Memory stays
+    bounded by the chunk size and a bad row only produces an error entry.
+    """
+
+    CHUNK_SIZE = 5_000
+    MAX_REPORTED_ERRORS = 1_000
+    DATE_FORMATS = ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y")
+
+    # CSV header -> Cattle field (headers are matched case-insensitively)
+    COLUMNS = {
+        "tag": "tag",
+        "name": "name",
+        "electronic_id": "electronic_id",
+        "sex": "sex",
+        "breed": "breed",
+        "birth_date": "birth_date",
+        "weight_kg": "weight_kg",
+        "status": "status",
+        "reproduction_status": "reproduction_status",
+        "sire": "sire",
+        "dam": "dam",
+        "location": "location",
+        "notes": "notes",
+    }
+
+    # Text fields checked against their column width
+    LENGTH_FIELDS = ("tag", "name", "electronic_id")
+
+    CHOICE_FIELDS = {
+        "sex": Cattle.SEX_CHOICES,
+        "breed": Cattle.BREED_CHOICES,
+        "status": Cattle.STATUS_CHOICES,
+        "reproduction_status": Cattle.REP_STATUS_CHOICES,
+    }
+
+    # --- Parsing -----------------------------------------------------------
+
+    @staticmethod
+    def _choice_lookup(choices) -> dict[str, str]:
+        """Accepts both codes and (translated) labels, case-insensitively."""
+        lookup = {}
+        for code, label in choices:
+            lookup[str(code).lower()] = code
+            lookup[str(label).lower()] = code
+        return lookup
+
+    @staticmethod
+    def _parse_date(value: str) -> date:
+        for fmt in CattleImportService.DATE_FORMATS:
+            try:
+                return datetime.strptime(value, fmt).date()
+            except ValueError:
+                continue
+        raise RowError(_("Invalid birth date: %(value)s") % {"value": value})
+
+    @staticmethod
+    def _parse_row(row: dict, lookups: dict) -> dict:
+        """Validates one CSV row into Cattle field values (FKs unresolved)."""
+        values = {
+            field: (row.get(column) or "").strip()
+            for column, field in CattleImportService.COLUMNS.items()
+        }
+        if not values["tag"]:
+            raise RowError(_("Tag is required."))
+        for field in CattleImportService.LENGTH_FIELDS:
+            model_field = Cattle._meta.get_field(field)
+            max_length = model_field.max_length
+            if len(values[field]) > max_length:
+                message = _("%(field)s is longer than %(max_length)d characters.")
+                params = {"field": model_field.verbose_name, "max_length": max_length}
+                raise RowError(message % params)
+
+        for field, lookup in lookups.items():
+            if not values[field]:
+                values.pop(field)
+                continue
+            code = lookup.get(values[field].lower())
+            if code is None:
+                message = _("Invalid %(field)s: %(value)s")
+                raise RowError(message % {"field": field, "value": values[field]})
+            values[field] = code
+
+        values["birth_date"] = (
+            CattleImportService._parse_date(values["birth_date"])
+            if values["birth_date"]
+            else None
+        )
+        if values["weight_kg"]:
+            try:
+                values["weight_kg"] = Decimal(values["weight_kg"].replace(",", "."))
+            except InvalidOperation as e:
+                raise RowError(
+                    _("Invalid weight: %(value)s") % {"value": values["weight_kg"]}
+                ) from e
+            if not values["weight_kg"].is_finite():  # "nan", "inf"
+                raise RowError(
+                    _("Invalid weight: %(value)s") % {"value": values["weight_kg"]}
+                )
+            if values["weight_kg"] < 0:
+                raise RowError(_("Weight cannot be negative."))
+            # Also copied to current_weight, the narrower column
+            field = Cattle._meta.get_field("current_weight")
+            if values["weight_kg"] >= 10 ** (field.max_digits - field.decimal_places):
+                raise RowError(
+                    _("Weight is too large: %(value)s") % {"value": values["weight_kg"]}
+                )
+        else:
+            values["weight_kg"] = None
+        return values
+
+    @staticmethod
+    def _chunks(rows: Iterable, size: int) -> Iterator[list]:
+        iterator = iter(rows)
+        while chunk := list(islice(iterator, size)):
+            yield chunk
+
+    # --- Chunk resolution --------------------------------------------------
+
+    @staticmethod
+    def _existing_parents(refs: set) -> dict[str, tuple]:
+        """Active cattle matching `refs` by tag or electronic ID -> (pk, sex)."""
+        if not refs:
+            return {}
+        found: dict[str, tuple] = {}
+        rows = Cattle.objects.filter(
+            Q(tag__in=refs) | Q(electronic_id__in=refs)
+        ).values_list("pk", "tag", "electronic_id", "sex")
+        for pk, tag, electronic_id, sex in rows:
+            if electronic_id in refs:
+                found.setdefault(electronic_id, (pk, sex))
+            if tag in refs:
+                found[tag] = (pk, sex)  # Tags win over electronic IDs
+        return found
+
+    @staticmethod
+    def _resolve_parent(instance, field, ref, parents, expected_sex):
+        if not ref:
+            return
+        match = parents.get(ref)
+        if match is None:
+            # Hybrid parentage: unknown parents are kept as external IDs
+            setattr(instance, f"{field}_external_id", ref[:100])
+            return
+        pk, sex = match
+        if sex != expected_sex:
+            raise RowError(
+                _("%(field)s %(ref)s has the wrong sex.") % {"field": field, "ref": ref}
+            )
+        if pk == instance.pk:
+            raise RowError(_("An animal cannot be its own parent."))
+        setattr(instance, f"{field}_id", pk)
+
+    @staticmethod
+    def _build_chunk(chunk: list, lookups: dict, locations: dict, report) -> list:
+        """Turns a chunk of (line, row) into unsaved Cattle instances."""
+        parsed = []
+        for line, row in chunk:
+            try:
+                parsed.append((line, CattleImportService._parse_row(row, lookups)))
+            except RowError as e:
+                report(line, str(e))
+
+        # Tag uniqueness: against active cattle (incl. earlier chunks) and
+        # within this chunk
+        tags = {values["tag"] for _line, values in parsed}
+        taken = set(Cattle.objects.filter(tag__in=tags).values_list("tag", flat=True))
+
+        refs = {values[f] for _line, values in parsed for f in ("sire", "dam")}
+        refs.discard("")
+        parents = CattleImportService._existing_parents(refs)
+
+        instances = []
+        now = timezone.now()
+        for line, values in parsed:
+            tag = values["tag"]
+            if tag in taken:
+                report(line, _("Tag %(tag)s already exists.") % {"tag": tag})
+                continue
+
+            location_id = None
+            location_name = values.pop("location")
+            if location_name:
+                location_id = locations.get(location_name.lower())
+                if location_id is None:
+                    report(
+                        line,
+                        _("Unknown location: %(name)s") % {"name": location_name},
+                    )
+                    continue
+
+            sire_ref = values.pop("sire")
+            dam_ref = values.pop("dam")
+            instance = Cattle(
+                uuid=uuid.uuid4(),
+                location_id=location_id,
+                location_since=now if location_id else None,
+                current_weight=values["weight_kg"],
+                **values,
+            )
+            try:
+                CattleImportService._resolve_parent(
+                    instance, "sire", sire_ref, parents, Cattle.SEX_MALE
+                )
+                CattleImportService._resolve_parent(
+                    instance, "dam", dam_ref, parents, Cattle.SEX_FEMALE
+                )
+            except RowError as e:
+                report(line, str(e))
+                continue
+
+            taken.add(tag)
+            # Later rows of the same chunk may reference this animal
+            parents[tag] = (instance.pk, instance.sex)
+            if instance.electronic_id:
+                parents.setdefault(instance.electronic_id, (instance.pk, instance.sex))
+            instances.append((line, instance))
+        return instances
+
+    @staticmethod
+    def _copy(instances: list) -> None:
+        """Streams the instances into the cattle table (COPY on PostgreSQL)."""
+        fields = Cattle._meta.concrete_fields
+        with BulkWriter() as writer:
+            for instance in instances:
+                writer.add(
+                    Cattle,
+                    {
+                        field.attname: field.pre_save(instance, add=True)
+                        for field in fields
+                    },
+                )
+
+    @staticmethod
+    def _save_chunk(instances: list, report) -> int:
+        """
+        One COPY per chunk. If a concurrent writer took a tag in the
+        meantime, or a value slipped past _parse_row, fall back to per-row
+        savepoints for this chunk so only the offending rows are reported.
+        """
+        try:
+            with transaction.atomic():
+                CattleImportService._copy([instance for _line, instance in instances])
+            return len(instances)
+        except DatabaseError:
+            pass
+
+        created = 0
+        for line, instance in instances:
+            try:
+                with transaction.atomic():
+                    instance.save(force_insert=True)
+                created += 1
+            except DatabaseError as e:
+                report(line, str(e).splitlines()[0])
+        return created
+
+    # --- Entry point -------------------------------------------------------
+
+    @staticmethod
+    def import_csv(
+        stream: TextIO, chunk_size: Optional[int] = None, dry_run: bool = False
+    ) -> dict:
+        """
+        Imports cattle from a CSV text stream with a header row.
+
+        Returns {"rows", "created", "error_count", "errors"} where errors
+        is a list of (line_number, message), capped at MAX_REPORTED_ERRORS.
+        With dry_run the rows are fully validated but nothing is saved.
+        """
+        chunk_size = chunk_size or CattleImportService.CHUNK_SIZE
+        result = {"rows": 0, "created": 0, "error_count": 0, "errors": []}
+
+        def report(line, message):
+            result["error_count"] += 1
+            if len(result["errors"]) < CattleImportService.MAX_REPORTED_ERRORS:
+                result["errors"].append((line, message))
+
+        reader = csv.DictReader(stream)
+        if reader.fieldnames is None or "tag" not in [
+            (name or "").strip().lower() for name in reader.fieldnames
+        ]:
+            report(1, _("The file must have a header row with a 'tag' column."))
+            return result
+        reader.fieldnames = [(name or "").strip().lower() for name in reader.fieldnames]
+
+        lookups = {
+            field: CattleImportService._choice_lookup(choices)
+            for field, choices in CattleImportService.CHOICE_FIELDS.items()
+        }
+        locations = dict(
+            Location.objects.annotate(key=Lower("name")).values_list("key", "pk")
+        )
+
+        # Line numbers match the file (header is line 1)
+        numbered = ((reader.line_num, row) for row in reader)
+
+        # Chunks commit independently; a dry run wraps them all in one
+        # transaction that is rolled back, so it reports the same errors.
+        with transaction.atomic() if dry_run else nullcontext():
+            for chunk in CattleImportService._chunks(numbered, chunk_size):
+                result["rows"] += len(chunk)
+                instances = CattleImportService._build_chunk(
+                    chunk, lookups, locations, report
+                )
+                result["created"] += CattleImportService._save_chunk(instances, report)
+            if dry_run:
+                transaction.set_rollback(True)
+
+        result["errors"].sort(key=lambda error: error[0])
+        if result["created"] and not dry_run:
+            CattleService.invalidate_herd_summary()
+        return result
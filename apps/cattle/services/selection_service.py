@@ -0,0 +1,201 @@
+import uuid
+from datetime import timedelta
+from typing import Iterable, Optional, Union
+
+from django.db import connection, transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from apps.cattle.models import Cattle, Selection, SelectionMember
+
+
+class SelectionService:
+    """
+    Server-side cattle selections.
+
+    Batch flows create a Selection once (from list checkboxes or a cohort
+    queryset) and pass only its ID around. Members are written with a
+    single INSERT ... SELECT and set operations run as UNION / EXCEPT /
+    INTERSECT inside the database, so no ID list ever round-trips
+    through Python, POST bodies or the session.
+    """
+
+    PARAM = "selection"
+    LEGACY_PARAM = "cattle_ids"
+    MAX_AGE = timedelta(days=7)
+
+    @staticmethod
+    def _parse_ids(values: Iterable) -> list[str]:
+        """
+        Valid UUID strings from a list of IDs or Cattle instances; string
+        values may be comma-joined.
+        """
+        ids = []
+        for value in values:
+            for part in str(getattr(value, "pk", value)).split(","):
+                try:
+                    ids.append(str(uuid.UUID(part.strip())))
+                except ValueError:
+                    continue
+        return ids
+
+    @staticmethod
+    def _insert_members(selection: Selection, animal_ids: QuerySet) -> int:
+        """
+        Inserts the single-column `animal_ids` queryset as members of
+        `selection` in one statement and refreshes the cached size.
+        """
+        sql, params = animal_ids.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {SelectionMember._meta.db_table} "
+                "(selection_id, animal_id) "
+                f"SELECT %s, ids.animal_id FROM ({sql}) AS ids(animal_id) "
+                "ON CONFLICT DO NOTHING",
+                [selection.pk, *params],
+            )
+            inserted = cursor.rowcount
+
+        selection.size = selection.members.count()
+        selection.save(update_fields=["size"])
+        return inserted
+
+    @staticmethod
+    @transaction.atomic
+    def create_selection(
+        cattle: Union[QuerySet, Iterable, None] = None, user=None, name: str = ""
+    ) -> Selection:
+        """
+        Creates a selection from a Cattle queryset (e.g. HerdQuery.apply())
+        or an iterable of cattle IDs. Unknown or deleted animals are dropped.
+        """
+        selection = Selection.objects.create(name=name, created_by=user)
+        SelectionService.add(selection, cattle if cattle is not None else [])
+        return selection
+
+    @staticmethod
+    def get_selection(selection_id, user=None) -> Optional[Selection]:
+        """The selection with this ID, only among `user`'s when given."""
+        selections = Selection.objects.all()
+        if user is not None:
+            selections = selections.filter(created_by=user)
+        try:
+            return selections.get(pk=uuid.UUID(str(selection_id)))
+        except (ValueError, Selection.DoesNotExist):
+            return None
+
+    @staticmethod
+    def resolve(request) -> Optional[Selection]:
+        """
+        Returns the requesting user's selection referenced by the
+        `selection` parameter (POST, then GET). For entry points that
+        still post raw `cattle_ids` (list checkboxes), a new selection is
+        created from them; a GET never writes one. Returns None when the
+        request carries neither, or for anonymous users.
+        """
+        if not request.user.is_authenticated:
+            return None
+
+        selection_id = request.POST.get(SelectionService.PARAM) or request.GET.get(
+            SelectionService.PARAM
+        )
+        if selection_id:
+            return SelectionService.get_selection(selection_id, user=request.user)
+
+        cattle_ids = request.POST.getlist(SelectionService.LEGACY_PARAM)
+        if request.method != "POST" or not cattle_ids:
+            return None
+        return SelectionService.create_selection(cattle_ids, user=request.user)
+
+    @staticmethod
+    def get_cattle(selection: Optional[Selection]) -> QuerySet:
+        """Active cattle in the selection."""
+        if selection is None:
+            return Cattle.objects.none()
+        return Cattle.objects.filter(
+            pk__in=selection.members.values("animal_id")
+        ).order_by("tag")
+
+    @staticmethod
+    def member_ids(selection: Selection) -> QuerySet:
+        return SelectionMember.objects.filter(selection=selection).values("animal_id")
+
+    @staticmethod
+    @transaction.atomic
+    def add(selection: Selection, cattle: Union[QuerySet, Iterable]) -> int:
+        """Adds cattle to an existing selection; returns the number added."""
+        if isinstance(cattle, QuerySet):
+            animal_ids = cattle.order_by().values("pk")
+        else:
+            animal_ids = Cattle.objects.filter(
+                pk__in=SelectionService._parse_ids(cattle)
+            ).values("pk")
+        return SelectionService._insert_members(selection, animal_ids)
+
+    @staticmethod
+    @transaction.atomic
+    def remove(selection: Selection, cattle_ids: Iterable) -> int:
+        """Removes cattle from a selection; returns the number removed."""
+        removed, _ = SelectionMember.objects.filter(
+            selection=selection,
+            animal_id__in=SelectionService._parse_ids(cattle_ids),
+        ).delete()
+        selection.size = selection.members.count()
+        selection.save(update_fields=["size"])
+        return removed
+
+    @staticmethod
+    @transaction.atomic
+    def _combine(combined: QuerySet, user=None, name: str = "") -> Selection:
+        selection = Selection.objects.create(name=name, created_by=user)
+        SelectionService._insert_members(selection, combined)
+        return selection
+
+    @staticmethod
+    def union(first: Selection, second: Selection, user=None, name="") -> Selection:
+        """New selection with the animals in either selection (SQL UNION)."""
+        return SelectionService._combine(
+            SelectionService.member_ids(first).union(
+                SelectionService.member_ids(second)
+            ),
+            user=user,
+            name=name,
+        )
+
+    @staticmethod
+    def difference(
+        first: Selection, second: Selection, user=None, name=""
+    ) -> Selection:
+        """New selection with the animals in `first` but not `second` (SQL EXCEPT)."""
+        return SelectionService._combine(
+            SelectionService.member_ids(first).difference(
+                SelectionService.member_ids(second)
+            ),
+            user=user,
+            name=name,
+        )
+
+    @staticmethod
+    def intersection(
+        first: Selection, second: Selection, user=None, name=""
+    ) -> Selection:
+        """New selection with the animals in both selections (SQL INTERSECT)."""
+        return SelectionService._combine(
+            SelectionService.member_ids(first).intersection(
+                SelectionService.member_ids(second)
+            ),
+            user=user,
+            name=name,
+        )
+
+    @staticmethod
+    def purge_stale(max_age: Optional[timedelta] = None) -> int:
+        """
+        Hard-deletes unnamed selections older than `max_age`. Named
+        selections are kept as saved cohorts. Returns the number deleted.
+        """
+        cutoff = timezone.now() - (max_age or SelectionService.MAX_AGE)
+        stale = Selection.all_objects.filter(name="", created_at__lt=cutoff)
+        SelectionMember.objects.filter(selection__in=stale).delete()
+        deleted, _ = stale.delete(destroy=True)
+        return deleted
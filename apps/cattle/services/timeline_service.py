@@ -0,0 +1,284 @@
+import uuid
+from datetime import date
+from typing import Optional
+
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import CharField, F, Q, QuerySet, Value
+from django.db.models.functions import Cast, Coalesce, TruncDate
+from django.urls import reverse
+from django.utils.translation import gettext as _
+
+from apps.cattle.models import Cattle
+from apps.health.models import SanitaryEventTarget
+from apps.locations.models import Movement, MovementReason
+from apps.purchases.models import Purchase, PurchaseItem
+from apps.reproduction.models import BreedingEvent, Calving, PregnancyCheck
+from apps.sales.models import Sale, SaleItem
+from apps.weight.models import WeightRecord
+
+# Normalized columns every branch of the UNION ALL selects, in this order
+COLUMNS = ("t_date", "t_kind", "t_key", "t_ref", "t_code", "t_text")
+
+
+class TimelineService:
+    """
+    Everything that happened to one animal, newest first.
+
+    Each event table contributes one branch that is narrowed to the animal,
+    normalized to (date, kind, key, ref, code, text) and cut to one page
+    with the keyset condition; the branches are merged with a single
+    UNION ALL, so a page costs one round trip however long the history is.
+    """
+
+    PAGE_SIZE = 25
+
+    KIND_HEALTH = "health"
+    KIND_WEIGHT = "weight"
+    KIND_BREEDING = "breeding"
+    KIND_PREGNANCY_CHECK = "pregnancy_check"
+    KIND_CALVING = "calving"
+    KIND_BIRTH = "birth"
+    KIND_MOVEMENT = "movement"
+    KIND_SALE = "sale"
+    KIND_PURCHASE = "purchase"
+
+    # kind -> URL name taking the row's `ref` (kinds without one are not linked)
+    URL_NAMES = {
+        KIND_HEALTH: "health:event-detail",
+        KIND_WEIGHT: "weight:session-detail",
+        KIND_CALVING: "cattle:detail",
+        KIND_BIRTH: "cattle:detail",
+        KIND_MOVEMENT: "locations:detail",
+        KIND_SALE: "sales:detail",
+        KIND_PURCHASE: "purchases:detail",
+    }
+
+    # --- Branches ----------------------------------------------------------
+
+    @staticmethod
+    def _normalize(queryset, kind, when, key, ref, code, text) -> QuerySet:
+        # Dates and UUIDs already line up across branches; the free-form
+        # columns are cast to text so numbers and dates union with names
+        return queryset.annotate(
+            t_date=when,
+            t_kind=Value(kind, output_field=CharField()),
+            t_key=key,
+            t_ref=ref,
+            t_code=Cast(code, CharField()),
+            t_text=Cast(text, CharField()),
+        ).values_list(*COLUMNS)
+
+    @staticmethod
+    def _branches(animal: Cattle) -> list:
+        cattle_type = ContentType.objects.get_for_model(Cattle)
+        normalize = TimelineService._normalize
+        empty = Value("")
+
+        return [
+            normalize(
+                SanitaryEventTarget.objects.filter(
+                    animal=animal, event__is_deleted=False
+                ),
+                TimelineService.KIND_HEALTH,
+                F("event__date"),
+                F("pk"),
+                F("event_id"),
+                Coalesce("event__medication__name", empty),
+                F("event__title"),
+            ),
+            normalize(
+                WeightRecord.objects.filter(animal=animal, session__is_deleted=False),
+                TimelineService.KIND_WEIGHT,
+                F("session__date"),
+                F("pk"),
+                F("session_id"),
+                F("adg"),
+                F("weight_kg"),
+            ),
+            normalize(
+                BreedingEvent.objects.filter(Q(dam=animal) | Q(sire=animal)),
+                TimelineService.KIND_BREEDING,
+                F("date"),
+                F("pk"),
+                F("pk"),
+                F("breeding_method"),
+                # The other partner, seen from this animal
+                (
+                    Coalesce("sire__tag", "sire_name")
+                    if animal.sex == Cattle.SEX_FEMALE
+                    else F("dam__tag")
+                ),
+            ),
+            normalize(
+                PregnancyCheck.objects.filter(breeding_event__dam=animal),
+                TimelineService.KIND_PREGNANCY_CHECK,
+                F("date"),
+                F("pk"),
+                F("pk"),
+                F("result"),
+                F("expected_calving_date"),
+            ),
+            normalize(
+                Calving.objects.filter(dam=animal),
+                TimelineService.KIND_CALVING,
+                F("date"),
+                F("pk"),
+                F("calf_id"),
+                F("ease_of_birth"),
+                Coalesce("calf__tag", empty),
+            ),
+            normalize(
+                Calving.objects.filter(calf=animal),
+                TimelineService.KIND_BIRTH,
+                F("date"),
+                F("pk"),
+                F("dam_id"),
+                F("ease_of_birth"),
+                F("dam__tag"),
+            ),
+            normalize(
+                Movement.animals.through.objects.filter(
+                    cattle=animal, movement__is_deleted=False
+                ),
+                TimelineService.KIND_MOVEMENT,
+                TruncDate("movement__date"),
+                F("movement_id"),
+                F("movement__destination_id"),
+                F("movement__reason"),
+                F("movement__destination__name"),
+            ),
+            normalize(
+                SaleItem.objects.filter(
+                    content_type=cattle_type,
+                    object_id=animal.pk,
+                    sale__is_deleted=False,
+                ),
+                TimelineService.KIND_SALE,
+                F("sale__date"),
+                F("pk"),
+                F("sale_id"),
+                F("sale__type"),
+                F("sale__partner__name"),
+            ),
+            normalize(
+                PurchaseItem.objects.filter(
+                    content_type=cattle_type,
+                    object_id=animal.pk,
+                    purchase__is_deleted=False,
+                ),
+                TimelineService.KIND_PURCHASE,
+                F("purchase__date"),
+                F("pk"),
+                F("purchase_id"),
+                F("purchase__type"),
+                F("purchase__partner__name"),
+            ),
+        ]
+
+    # --- Keyset pagination -------------------------------------------------
+
+    @staticmethod
+    def encode_cursor(entry: dict) -> str:
+        return f"{entry['date'].isoformat()}_{entry['key']}"
+
+    @staticmethod
+    def decode_cursor(cursor: Optional[str]) -> Optional[tuple]:
+        """Returns (date, key), or None for the first page or a bad cursor."""
+        try:
+            day, key = (cursor or "").split("_", 1)
+            return date.fromisoformat(day), uuid.UUID(key)
+        except ValueError:
+            return None
+
+    # --- Summaries ---------------------------------------------------------
+
+    @staticmethod
+    def _summary(kind: str, code: str, text: str) -> str:
+        if kind == TimelineService.KIND_HEALTH:
+            return f"{text} ({code})" if code else text
+        if kind == TimelineService.KIND_WEIGHT:
+            summary = _("Weighed %(weight)s kg") % {"weight": text}
+            if code:
+                summary += " " + _("(ADG %(adg)s kg/day)") % {"adg": code}
+            return summary
+        if kind == TimelineService.KIND_BREEDING:
+            method = dict(BreedingEvent.METHOD_CHOICES).get(code, code)
+            return f"{method}: {text}" if text else str(method)
+        if kind == TimelineService.KIND_PREGNANCY_CHECK:
+            result = dict(PregnancyCheck.RESULT_CHOICES).get(code, code)
+            if text:
+                return _("Pregnancy check %(result)s, calving expected %(date)s") % {
+                    "result": result,
+                    "date": text,
+                }
+            return _("Pregnancy check %(result)s") % {"result": result}
+        if kind == TimelineService.KIND_CALVING:
+            ease = dict(Calving.EASE_CHOICES).get(code, code)
+            return _("Calved %(calf)s (%(ease)s)") % {"calf": text or "-", "ease": ease}
+        if kind == TimelineService.KIND_BIRTH:
+            return _("Born to %(dam)s") % {"dam": text}
+        if kind == TimelineService.KIND_MOVEMENT:
+            reason = dict(MovementReason.choices).get(code, code)
+            return _("Moved to %(location)s (%(reason)s)") % {
+                "location": text,
+                "reason": reason,
+            }
+        # Sales and purchases: the transaction type and partner
+        choices = (
+            Sale.TYPE_CHOICES
+            if kind == TimelineService.KIND_SALE
+            else (Purchase.TYPE_CHOICES)
+        )
+        return f"{dict(choices).get(code, code)}: {text}"
+
+    @staticmethod
+    def _url(kind: str, ref) -> Optional[str]:
+        url_name = TimelineService.URL_NAMES.get(kind)
+        if not url_name or ref is None:
+            return None
+        return reverse(url_name, args=[ref])
+
+    # --- Entry point -------------------------------------------------------
+
+    @staticmethod
+    def get_timeline(
+        animal: Cattle, cursor: Optional[str] = None, limit: Optional[int] = None
+    ) -> dict:
+        """
+        Returns one page of the animal's timeline, newest first:
+        {"entries": [{date, kind, summary, ref, url, key}], "next_cursor"}.
+
+        Pass `next_cursor` back as `cursor` to get the following page.
+        """
+        limit = limit or TimelineService.PAGE_SIZE
+        position = TimelineService.decode_cursor(cursor)
+
+        branches = []
+        for branch in TimelineService._branches(animal):
+            if position:
+                day, key = position
+                branch = branch.filter(Q(t_date__lt=day) | Q(t_date=day, t_key__lt=key))
+            # Each branch is cut to one page before the merge
+            branches.append(branch.order_by("-t_date", "-t_key")[: limit + 1])
+
+        rows = list(
+            branches[0]
+            .union(*branches[1:], all=True)
+            .order_by("-t_date", "-t_key")[: limit + 1]
+        )
+
+        entries = [
+            {
+                "date": day,
+                "kind": kind,
+                "key": key,
+                "ref": ref,
+                "summary": TimelineService._summary(kind, code or "", text or ""),
+                "url": TimelineService._url(kind, ref),
+            }
+            for day, kind, key, ref, code, text in rows[:limit]
+        ]
+        next_cursor = (
+            TimelineService.encode_cursor(entries[-1]) if len(rows) > limit else None
+        )
+        return {"entries": entries, "next_cursor": next_cursor}
@@ -7,7 +7,27 @@ app_name = "cattle"
 urlpatterns = [
     path("", views.CattleListView.as_view(), name="list"),
     path("create/", views.CattleCreateView.as_view(), name="create"),
+    path("export/", views.CattleExportView.as_view(), name="export"),
+    path("import/", views.CattleImportView.as_view(), name="import"),
     path("<uuid:pk>/", views.CattleDetailView.as_view(), name="detail"),
+    path(
+        "<uuid:pk>/timeline/",
+        views.CattleTimelineFragmentView.as_view(),
+        name="detail-timeline",
+    ),
+    path(
+        "<uuid:pk>/health/",
+        views.CattleHealthFragmentView.as_view(),
+        name="detail-health",
+    ),
+    path(
+        "<uuid:pk>/weights/",
+        views.CattleWeightsFragmentView.as_view(),
+        name="detail-weights",
+    ),
+    path(
+        "<uuid:pk>/tasks/", views.CattleTasksFragmentView.as_view(), name="detail-tasks"
+    ),
     path("<uuid:pk>/edit/", views.CattleUpdateView.as_view(), name="update"),
     path("<uuid:pk>/delete/", views.CattleDeleteView.as_view(), name="delete"),
     path("trash/", views.CattleTrashListView.as_view(), name="trash"),
@@ -1,3 +1,6 @@
+import csv
+import io
+
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.core.exceptions import ValidationError
@@ -11,57 +14,168 @@ from django.views.generic import (
     CreateView,
     DeleteView,
     DetailView,
+    FormView,
     ListView,
     UpdateView,
 )
 
+from apps.base.views.conditional import ConditionalGetMixin
+from apps.base.views.export import ExportView
+from apps.base.views.fragments import FragmentListView, FragmentView
+from apps.base.views.list_mixins import PartialListMixin
 from apps.base.views.mixins import HandleProtectedErrorMixin
-from apps.cattle.forms import CattleForm
+from apps.cattle.forms import CattleForm, CattleImportForm
 from apps.cattle.models.cattle import Cattle
 from apps.cattle.services.cattle_service import CattleService
+from apps.cattle.services.herd_query import HerdQuery
+from apps.cattle.services.import_service import CattleImportService
+from apps.cattle.services.timeline_service import TimelineService
 from apps.health.services.health_service import HealthService
-from apps.locations.models import Location, LocationStatus
+from apps.locations.models import Location, LocationType
+from apps.locations.services import LocationService
 from apps.tasks.models import Task
 from apps.weight.services.weight_service import WeightService
 
 
-class CattleDetailView(LoginRequiredMixin, DetailView):
+class CattleDetailView(LoginRequiredMixin, ConditionalGetMixin, DetailView):
+    """Renders the animal itself; the history tabs are fragments below."""
+
     model = Cattle
     template_name = "cattle/cattle_detail.html"
     context_object_name = "cattle"
 
+    def get_validator_querysets(self):
+        pk = self.kwargs["pk"]
+        # The page shows the animal's pasture by name
+        return [Cattle.objects.filter(pk=pk), Location.objects.filter(cattle=pk)]
+
+
+# --- Detail fragments ------------------------------------------------------
+# The detail page is a shell; its history tabs are loaded from these on
+# demand, one page at a time.
+
+
+class CattleTimelineFragmentView(LoginRequiredMixin, FragmentView):
+    parent_model = Cattle
+    parent_context_name = "cattle"
+    template_name = "cattle/fragments/timeline.html"
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["health_events"] = HealthService.get_animal_health_history(self.object)
-        context["weight_history"] = WeightService.get_animal_weight_history(self.object)
+        # Health, movements, breeding, calvings and transactions in one query
+        context["timeline"] = TimelineService.get_timeline(
+            self.parent, cursor=self.request.GET.get("before")
+        )
+        return context
+
+
+class ArchivedHistoryMixin:
+    """
+    `?archived=1` lists the full history, rows moved to the archive
+    included. Subclasses implement get_history(include_archived).
+    """
+
+    def include_archived(self) -> bool:
+        return bool(self.request.GET.get("archived"))
+
+    def get_history(self, include_archived: bool):
+        raise NotImplementedError
+
+    def get_queryset(self):
+        return self.get_history(self.include_archived())
 
-        # Pending Tasks
-        context["pending_tasks"] = Task.objects.filter(
-            content_type__model="cattle",
-            object_id=self.object.pk,
-            status__in=[Task.Status.PENDING, Task.Status.IN_PROGRESS],
-        ).order_by("due_date")
+    def get_validator_querysets(self):
+        # Archiving deletes the live rows, which changes these validators
+        return [self.get_history(include_archived=False)]
 
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["include_archived"] = self.include_archived()
+        return context
+
+
+class CattleHealthFragmentView(
+    LoginRequiredMixin, ArchivedHistoryMixin, FragmentListView
+):
+    parent_model = Cattle
+    parent_context_name = "cattle"
+    template_name = "cattle/fragments/health.html"
+    context_object_name = "health_records"
+
+    def get_history(self, include_archived: bool):
+        return HealthService.get_animal_health_history(self.parent, include_archived)
+
+
+class CattleWeightsFragmentView(
+    LoginRequiredMixin, ArchivedHistoryMixin, FragmentListView
+):
+    parent_model = Cattle
+    parent_context_name = "cattle"
+    template_name = "cattle/fragments/weights.html"
+    context_object_name = "weight_records"
+
+    def get_history(self, include_archived: bool):
+        history = WeightService.get_animal_weight_history(self.parent, include_archived)
+        if include_archived:
+            return history[::-1]
+        return history.order_by("-session__date")
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        if self.include_archived():
+            series = [
+                (record.session.date, record.weight_kg)
+                for record in reversed(self.object_list)
+            ]
+        else:
+            # The chart shows the whole curve, so only the two plotted columns
+            series = WeightService.get_animal_weight_history(self.parent).values_list(
+                "session__date", "weight_kg"
+            )
+        context["weight_series"] = [
+            {"x": day.isoformat(), "y": float(weight)} for day, weight in series
+        ]
         return context
 
 
-class CattleListView(LoginRequiredMixin, ListView):
+class CattleTasksFragmentView(LoginRequiredMixin, FragmentListView):
+    parent_model = Cattle
+    parent_context_name = "cattle"
+    template_name = "cattle/fragments/tasks.html"
+    context_object_name = "pending_tasks"
+
+    def get_queryset(self):
+        return (
+            Task.objects.filter(
+                content_type__model="cattle",
+                object_id=self.parent.pk,
+                status__in=[Task.Status.PENDING, Task.Status.IN_PROGRESS],
+            )
+            .select_related("assigned_to")
+            .order_by("due_date")
+        )
+
+
+class CattleListView(
+    LoginRequiredMixin, ConditionalGetMixin, PartialListMixin, ListView
+):
+    read_replica = True
     model = Cattle
     template_name = "cattle/cattle_list.html"
+    partial_template_name = "cattle/partials/cattle_list_results.html"
     context_object_name = "cattle_list"
     paginate_by = 10
 
     def get_queryset(self):
-        search_query = self.request.GET.get("q")
-        breed = self.request.GET.get("breed")
-        status = self.request.GET.get("status")
-        location_id = self.request.GET.get("location")
+        # Search, breed, status and location are herd filters as well
+        self.criteria = HerdQuery.from_params(self.request.GET)
+        condition = self.request.GET.get("condition")
+        ordering = self.request.GET.get("sort")
 
         return CattleService.get_all_cattle(
-            search_query=search_query,
-            breed=breed,
-            status=status,
-            location_id=location_id,
+            condition=condition,
+            ordering=ordering,
+            criteria=self.criteria,
         )
 
     def get_context_data(self, **kwargs):
@@ -70,13 +184,44 @@ class CattleListView(LoginRequiredMixin, ListView):
         context["selected_breed"] = self.request.GET.get("breed", "")
         context["selected_status"] = self.request.GET.get("status", "")
         context["selected_location"] = self.request.GET.get("location", "")
-        context["breed_choices"] = Cattle.BREED_CHOICES
-        context["status_choices"] = Cattle.STATUS_CHOICES
-        context["locations"] = Location.objects.filter(
-            is_active=True, status=LocationStatus.ACTIVE
-        ).order_by("name")
+        context["selected_condition"] = self.request.GET.get("condition", "")
+        context["selected_sort"] = self.request.GET.get("sort", "")
+        context["criteria"] = self.criteria.criteria
+        context["advanced_filters_active"] = bool(
+            set(self.criteria.criteria) - {"q", "breed", "status", "location"}
+        )
+        context["saved_search_query"] = self.criteria.to_querystring()
         return context
 
+    def get_validator_models(self):
+        # The location filter lists the pastures by name
+        return [Location]
+
+    def get_reference_data(self):
+        return {
+            "condition_choices": CattleService.CONDITION_CHOICES,
+            "sort_choices": CattleService.SORT_OPTIONS.items(),
+            "location_type_choices": LocationType.choices,
+            "sex_choices": Cattle.SEX_CHOICES,
+            "breed_choices": Cattle.BREED_CHOICES,
+            "status_choices": Cattle.STATUS_CHOICES,
+            "locations": LocationService.get_active_locations(),
+        }
+
+
+class CattleExportView(LoginRequiredMixin, ExportView):
+    """Exports the cattle list with its current filters and sort."""
+
+    export_name = "cattle"
+    columns = CattleService.EXPORT_COLUMNS
+
+    def get_queryset(self):
+        return CattleService.get_all_cattle(
+            condition=self.request.GET.get("condition"),
+            ordering=self.request.GET.get("sort"),
+            criteria=HerdQuery.from_params(self.request.GET),
+        )
+
 
 class CattleCreateView(LoginRequiredMixin, CreateView):
     model = Cattle
@@ -94,6 +239,51 @@ class CattleCreateView(LoginRequiredMixin, CreateView):
         return HttpResponseRedirect(self.get_success_url())
 
 
+class CattleImportView(LoginRequiredMixin, FormView):
+    form_class = CattleImportForm
+    template_name = "cattle/cattle_import.html"
+    max_displayed_errors = 100
+
+    def form_valid(self, form):
+        # Uploads larger than FILE_UPLOAD_MAX_MEMORY_SIZE are spooled to disk
+        # and read back line by line; the file is never loaded whole.
+        stream = io.TextIOWrapper(form.cleaned_data["file"].file, encoding="utf-8-sig")
+        try:
+            result = CattleImportService.import_csv(
+                stream, dry_run=form.cleaned_data["dry_run"]
+            )
+        except (UnicodeDecodeError, csv.Error) as e:
+            form.add_error("file", _("Could not read the CSV file: %s") % e)
+            return self.form_invalid(form)
+        finally:
+            stream.detach()
+
+        if form.cleaned_data["dry_run"]:
+            messages.info(
+                self.request,
+                _("Validation finished: %(created)s of %(rows)s rows can be imported.")
+                % result,
+            )
+        elif result["created"]:
+            messages.success(
+                self.request,
+                _("Imported %(created)s of %(rows)s rows.") % result,
+            )
+        if result["error_count"]:
+            messages.warning(
+                self.request,
+                _("%(error_count)s rows had errors.") % result,
+            )
+
+        return self.render_to_response(
+            self.get_context_data(
+                form=form,
+                result=result,
+                errors=result["errors"][: self.max_displayed_errors],
+            )
+        )
+
+
 class CattleUpdateView(LoginRequiredMixin, UpdateView):
     model = Cattle
     form_class = CattleForm
@@ -132,6 +322,7 @@ class CattleTrashListView(LoginRequiredMixin, ListView):
     model = Cattle
     template_name = "cattle/cattle_trash_list.html"
     context_object_name = "cattle_list"
+    paginate_by = 10
 
     def get_queryset(self):
         return CattleService.get_deleted_cattle()
@@ -13,6 +13,7 @@ from apps.weight.services.weight_service import WeightService
 
 
 class HomeView(LoginRequiredMixin, TemplateView):
+    read_replica = True
     template_name = "dashboard/home.html"
 
     def get_context_data(self, **kwargs):
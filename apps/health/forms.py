@@ -1,5 +1,8 @@
 from django import forms
 
+from apps.base.utils.reference_data import set_cached_choices
+from apps.health.services import HealthService
+
 from .models import Medication, SanitaryEvent
 
 
@@ -55,8 +58,10 @@ class SanitaryEventForm(forms.ModelForm):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         # Customize labels or required states if needed
-        self.fields["medication"].queryset = Medication.objects.all()
         self.fields["medication"].empty_label = "--- No Medication (Procedure Only) ---"
+        set_cached_choices(
+            self.fields["medication"], HealthService.get_medication_choices()
+        )
 
 
 class MedicationForm(forms.ModelForm):
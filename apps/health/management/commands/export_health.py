@@ -0,0 +1,23 @@
+from apps.base.utils.export import ExportCommand, add_date_range_arguments
+from apps.health.models.health import MedicationType
+from apps.health.services import HealthService
+
+
+class Command(ExportCommand):
+    help = (
+        "Export sanitary history (one row per treated animal) as CSV or " "JSON Lines."
+    )
+
+    name = "health"
+    columns = HealthService.EXPORT_COLUMNS
+
+    def add_filter_arguments(self, parser):
+        add_date_range_arguments(parser)
+        parser.add_argument("--medication-type", choices=MedicationType.values)
+
+    def get_queryset(self, options):
+        return HealthService.get_export_queryset(
+            date_after=options["date_after"],
+            date_before=options["date_before"],
+            medication_type=options["medication_type"],
+        )
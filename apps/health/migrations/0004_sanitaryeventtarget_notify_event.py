@@ -0,0 +1,24 @@
+from django.db import migrations
+
+CREATE_TRIGGER = """
+CREATE TRIGGER health_sanitaryeventtarget_notify_event
+AFTER INSERT OR UPDATE OR DELETE ON health_sanitaryeventtarget
+FOR EACH ROW EXECUTE FUNCTION cnv_notify_parent('event_id', 'sanitaryevent_');
+"""
+
+DROP_TRIGGER = (
+    "DROP TRIGGER IF EXISTS health_sanitaryeventtarget_notify_event"
+    " ON health_sanitaryeventtarget;"
+)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("base", "0002_notify_progress_function"),
+        ("health", "0003_alter_sanitaryevent_performed_by"),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_TRIGGER, DROP_TRIGGER),
+    ]
@@ -0,0 +1,62 @@
+import apps.base.models.fields
+import apps.base.utils.partitioning
+from django.db import migrations, models
+
+COPY_DATES = """
+UPDATE health_sanitaryeventtarget SET event_date = header.date
+FROM health_sanitaryevent header WHERE header.uuid = health_sanitaryeventtarget.event_id;
+"""
+
+CREATE_TRIGGER = """
+CREATE TRIGGER health_sanitaryevent_copy_date
+AFTER UPDATE OF date ON health_sanitaryevent
+FOR EACH ROW WHEN (OLD.date IS DISTINCT FROM NEW.date)
+EXECUTE FUNCTION cnv_copy_header_date('health_sanitaryeventtarget', 'event_id', 'event_date');
+"""
+
+DROP_TRIGGER = (
+    "DROP TRIGGER IF EXISTS health_sanitaryevent_copy_date ON health_sanitaryevent;"
+)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("base", "0003_copy_header_date_function"),
+        ("health", "0004_sanitaryeventtarget_notify_event"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sanitaryeventtarget",
+            name="event_date",
+            field=apps.base.models.fields.HeaderDateField(
+                header="event", null=True, verbose_name="Event date"
+            ),
+        ),
+        migrations.RunSQL(COPY_DATES, migrations.RunSQL.noop),
+        migrations.AlterField(
+            model_name="sanitaryeventtarget",
+            name="event_date",
+            field=apps.base.models.fields.HeaderDateField(
+                header="event", verbose_name="Event date"
+            ),
+        ),
+        # Unique indexes of a partitioned table must include its key
+        migrations.RemoveConstraint(
+            model_name="sanitaryeventtarget",
+            name="unique_animal_per_event",
+        ),
+        apps.base.utils.partitioning.PartitionByYear(
+            model_name="sanitaryeventtarget", column="event_date"
+        ),
+        migrations.AddConstraint(
+            model_name="sanitaryeventtarget",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("is_deleted", False)),
+                fields=("event", "animal", "event_date"),
+                name="unique_animal_per_event",
+            ),
+        ),
+        migrations.RunSQL(CREATE_TRIGGER, DROP_TRIGGER),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("health", "0005_partition_sanitaryeventtarget"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="sanitaryevent",
+            index=models.Index(
+                fields=["modified_at"], name="health_sani_modifie_b3d857_idx"
+            ),
+        ),
+    ]
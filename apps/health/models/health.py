@@ -3,6 +3,7 @@ from django.db.models import ProtectedError
 from django.utils.translation import gettext_lazy as _
 
 from apps.base.models.base_model import BaseModel
+from apps.base.models.fields import HeaderDateField
 from apps.base.models.mixins import PerformedByMixin
 from apps.cattle.models.cattle import Cattle
 
@@ -121,6 +122,10 @@ class SanitaryEvent(PerformedByMixin, BaseModel):
         ordering = ["-date", "-created_at"]
         verbose_name = _("Sanitary Event")
         verbose_name_plural = _("Sanitary Events")
+        indexes = [
+            # max(modified_at) of the conditional GET validators
+            models.Index(fields=["modified_at"]),
+        ]
 
     # Ignore targets for strict deletion check (they are composition pieces, cascade deleted)
     strict_deletion_ignore_fields = ["targets"]
@@ -140,6 +145,8 @@ class SanitaryEventTarget(BaseModel):
         related_name="targets",
         verbose_name=_("Event"),
     )
+    # The table is partitioned by year of it (see apps.base.utils.partitioning)
+    event_date = HeaderDateField(_("Event date"), header="event")
     animal = models.ForeignKey(
         Cattle,
         on_delete=models.CASCADE,
@@ -161,7 +168,8 @@ class SanitaryEventTarget(BaseModel):
         verbose_name_plural = _("Sanitary Event Targets")
         constraints = [
             models.UniqueConstraint(
-                fields=["event", "animal"],
+                # With the partition key, as Postgres requires
+                fields=["event", "animal", "event_date"],
                 name="unique_animal_per_event",
                 condition=models.Q(is_deleted=False),
             )
@@ -1,17 +1,46 @@
-from datetime import timedelta
+from datetime import date, timedelta
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from django.db import transaction
-from django.db.models import Count
+from django.db.models import (
+    Count,
+    DateField,
+    DurationField,
+    ExpressionWrapper,
+    F,
+    OuterRef,
+    QuerySet,
+    Subquery,
+    Value,
+    prefetch_related_objects,
+)
+from django.db.models.functions import Cast, Coalesce, Greatest
 from django.utils import timezone
 
+from apps.base.utils import archive
+from apps.base.utils.metrics import timed
+from apps.base.utils.reference_data import reference_data
 from apps.cattle.models import Cattle
 from apps.health.models import Medication, SanitaryEvent, SanitaryEventTarget
 
 
 class HealthService:
+    # One row per treated animal
+    EXPORT_COLUMNS = {
+        "date": "event__date",
+        "event": "event__title",
+        "medication": "event__medication__name",
+        "medication_type": "event__medication__medication_type",
+        "tag": "animal__tag",
+        "applied_dose": "applied_dose",
+        "cost_per_head": "cost_per_head",
+        "observation": "observation",
+        "performed_by": "event__performed_by__username",
+    }
+
     @staticmethod
+    @timed
     @transaction.atomic
     def create_batch_event(
         event_data: Dict[str, Any], cattle_uuids: List[str]
@@ -57,8 +86,89 @@ class HealthService:
 
         SanitaryEventTarget.objects.bulk_create(targets)
 
+        # 4. Update the animals' treatment state cache
+        HealthService._apply_treatment(event, cattle_uuids)
+
         return event
 
+    @staticmethod
+    def _apply_treatment(event: SanitaryEvent, cattle_uuids: List[str]) -> None:
+        """
+        Pushes a new event into Cattle.last_treatment_date and
+        Cattle.withdrawal_until, keeping the latest dates.
+        """
+        event_date = Value(event.date, output_field=DateField())
+        changes: Dict[str, Any] = {
+            "last_treatment_date": Greatest(
+                Coalesce("last_treatment_date", event_date), event_date
+            ),
+            "modified_at": timezone.now(),
+        }
+
+        withdrawal_days = (
+            event.medication.withdrawal_days_meat if event.medication else 0
+        )
+        if withdrawal_days > 0:
+            withdrawal_end = Value(
+                event.date + timedelta(days=withdrawal_days), output_field=DateField()
+            )
+            changes["withdrawal_until"] = Greatest(
+                Coalesce("withdrawal_until", withdrawal_end), withdrawal_end
+            )
+
+        Cattle.all_objects.filter(pk__in=cattle_uuids).update(**changes)
+
+    @staticmethod
+    def sync_treatment_state(cattle_ids: Optional[Iterable] = None) -> int:
+        """
+        Recomputes Cattle.last_treatment_date and Cattle.withdrawal_until from
+        the active sanitary history, archived events included for the last
+        treatment (their withdrawal periods are long over). Used after events
+        are edited, deleted or restored, and by the rebuild_cattle_state
+        command.
+
+        Args:
+            cattle_ids: Restrict the update to these animals (all if None).
+
+        Returns:
+            Number of cattle rows updated.
+        """
+        targets = SanitaryEventTarget.objects.filter(
+            animal=OuterRef("pk"), event__is_deleted=False
+        )
+        last_treatment = Subquery(
+            targets.order_by("-event__date").values("event__date")[:1]
+        )
+        archived = archive.animal_latest(SanitaryEventTarget, "event")
+        if archived is not None:
+            # GREATEST skips NULLs on PostgreSQL
+            last_treatment = Greatest(last_treatment, archived)
+        withdrawal_end = (
+            targets.filter(event__medication__withdrawal_days_meat__gt=0)
+            .annotate(
+                withdrawal_end=Cast(
+                    F("event__date")
+                    + ExpressionWrapper(
+                        F("event__medication__withdrawal_days_meat")
+                        * Value(timedelta(days=1)),
+                        output_field=DurationField(),
+                    ),
+                    output_field=DateField(),
+                )
+            )
+            .order_by("-withdrawal_end")
+            .values("withdrawal_end")[:1]
+        )
+
+        queryset = Cattle.all_objects.all()
+        if cattle_ids is not None:
+            queryset = queryset.filter(pk__in=list(cattle_ids))
+
+        return queryset.update(
+            last_treatment_date=last_treatment,
+            withdrawal_until=Subquery(withdrawal_end),
+        )
+
     @staticmethod
     def check_withdrawal_status(animal: Cattle) -> Tuple[bool, Optional[str]]:
         """
@@ -70,12 +180,13 @@ class HealthService:
         today = timezone.localdate()
 
         # Optimization: Only look at events with medication in the recent past.
-        # Assuming no withdrawal period exceeds 365 days, we can filter query.
+        # Assuming no withdrawal period exceeds 365 days, we can filter query
+        # (on event_date, so only the partitions of the window are scanned).
         cutoff_date = today - timedelta(days=365)
 
         relevant_targets = SanitaryEventTarget.objects.filter(
             animal=animal,
-            event__date__gte=cutoff_date,
+            event_date__gte=cutoff_date,
             event__medication__isnull=False,
             event__is_deleted=False,
         ).select_related("event", "event__medication")
@@ -98,57 +209,59 @@ class HealthService:
         return False, None
 
     @staticmethod
-    def get_animal_health_history(animal: Cattle):
+    def get_animal_health_history(animal: Cattle, include_archived: bool = False):
         """
         Returns all health events for a specific animal, ordered by date.
+        With include_archived, the full history as a list, events moved
+        to the archive (flagged `archived`) included.
         """
-        return (
+        targets = (
             SanitaryEventTarget.objects.filter(animal=animal, event__is_deleted=False)
             .select_related("event", "event__medication", "event__performed_by")
             .order_by("-event__date")
         )
+        if not include_archived:
+            return targets
+        archived = archive.animal_history(SanitaryEventTarget, "event", animal)
+        prefetch_related_objects(archived, "event__medication", "event__performed_by")
+        return sorted(
+            archived + list(targets),
+            key=lambda target: target.event.date,
+            reverse=True,
+        )
 
     @staticmethod
-    def get_active_withdrawal_count() -> int:
+    def get_export_queryset(
+        date_after: Optional[date] = None,
+        date_before: Optional[date] = None,
+        medication_type: Optional[str] = None,
+    ) -> QuerySet[SanitaryEventTarget]:
         """
-        Returns the number of distinct active animals currently in a withdrawal period.
+        Targets of active sanitary events for the export, oldest first.
         """
-        today = timezone.localdate()
-        # Look back enough days to cover max withdrawal.
-        # 365 days is a safe upper bound for most cattle meds.
-        cutoff_date = today - timedelta(days=365)
-
-        # 1. Fetch relevant targets (candidates)
-        # We filter for active animals and events with medication that has withdrawal
-        candidates = (
-            SanitaryEventTarget.objects.filter(
-                animal__status=Cattle.STATUS_AVAILABLE,
-                event__date__gte=cutoff_date,
-                event__is_deleted=False,
-                event__medication__withdrawal_days_meat__gt=0,
-            )
-            .select_related("event", "event__medication")
-            .values(
-                "animal_id", "event__date", "event__medication__withdrawal_days_meat"
-            )
+        queryset = SanitaryEventTarget.objects.filter(event__is_deleted=False).order_by(
+            "event__date", "event_id", "animal__tag"
         )
+        if date_after:
+            queryset = queryset.filter(event_date__gte=date_after)
+        if date_before:
+            queryset = queryset.filter(event_date__lte=date_before)
+        if medication_type:
+            queryset = queryset.filter(
+                event__medication__medication_type=medication_type
+            )
+        return queryset
 
-        # 2. Filter in Python to avoid complex DB Date math for now
-        blocked_animal_ids = set()
-
-        for item in candidates:
-            animal_id = item["animal_id"]
-            if animal_id in blocked_animal_ids:
-                continue
-
-            event_date = item["event__date"]
-            days = item["event__medication__withdrawal_days_meat"]
-            end_date = event_date + timedelta(days=days)
-
-            if end_date > today:
-                blocked_animal_ids.add(animal_id)
-
-        return len(blocked_animal_ids)
+    @staticmethod
+    def get_active_withdrawal_count() -> int:
+        """
+        Returns the number of active animals currently in a withdrawal period,
+        counted on the withdrawal_until state column.
+        """
+        return Cattle.objects.filter(
+            status=Cattle.STATUS_AVAILABLE,
+            withdrawal_until__gt=timezone.localdate(),
+        ).count()
 
     @staticmethod
     def get_deleted_events():
@@ -168,6 +281,9 @@ class HealthService:
         Restores a soft-deleted event.
         """
         event.restore()
+        HealthService.sync_treatment_state(
+            event.targets.values_list("animal_id", flat=True)
+        )
 
     @staticmethod
     @transaction.atomic
@@ -175,7 +291,9 @@ class HealthService:
         """
         Permanently deletes an event.
         """
+        animal_ids = list(event.targets.values_list("animal_id", flat=True))
         event.delete(destroy=True)
+        HealthService.sync_treatment_state(animal_ids)
 
     @staticmethod
     def get_recent_events(limit: int = 5):
@@ -188,6 +306,12 @@ class HealthService:
             .order_by("-date", "-created_at")[:limit]
         )
 
+    @staticmethod
+    @reference_data(Medication)
+    def get_medication_choices() -> List[Medication]:
+        """Medications for dropdowns, served from the reference cache."""
+        return Medication.objects.order_by("name")
+
     @staticmethod
     def get_deleted_medications():
         """
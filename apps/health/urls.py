@@ -11,9 +11,12 @@ from apps.health.views import (
     SanitaryEventCreateView,
     SanitaryEventDeleteView,
     SanitaryEventDetailView,
+    SanitaryEventExportView,
     SanitaryEventHardDeleteView,
     SanitaryEventListView,
+    SanitaryEventProgressView,
     SanitaryEventRestoreView,
+    SanitaryEventTargetsFragmentView,
     SanitaryEventTrashListView,
     SanitaryEventUpdateView,
 )
@@ -23,8 +26,19 @@ app_name = "health"
 urlpatterns = [
     path("events/", SanitaryEventListView.as_view(), name="event-list"),
     path("events/trash/", SanitaryEventTrashListView.as_view(), name="event-trash"),
+    path("events/export/", SanitaryEventExportView.as_view(), name="event-export"),
     path("events/create/", SanitaryEventCreateView.as_view(), name="event-create"),
     path("events/<uuid:pk>/", SanitaryEventDetailView.as_view(), name="event-detail"),
+    path(
+        "events/<uuid:pk>/targets/",
+        SanitaryEventTargetsFragmentView.as_view(),
+        name="event-targets",
+    ),
+    path(
+        "events/<uuid:pk>/progress/",
+        SanitaryEventProgressView.as_view(),
+        name="event-progress",
+    ),
     path(
         "events/<uuid:pk>/edit/", SanitaryEventUpdateView.as_view(), name="event-update"
     ),
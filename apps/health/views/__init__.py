@@ -2,9 +2,12 @@ from .event_views import (
     SanitaryEventCreateView,
     SanitaryEventDeleteView,
     SanitaryEventDetailView,
+    SanitaryEventExportView,
     SanitaryEventHardDeleteView,
     SanitaryEventListView,
+    SanitaryEventProgressView,
     SanitaryEventRestoreView,
+    SanitaryEventTargetsFragmentView,
     SanitaryEventTrashListView,
     SanitaryEventUpdateView,
 )
@@ -22,9 +25,12 @@ __all__ = [
     "SanitaryEventCreateView",
     "SanitaryEventDeleteView",
     "SanitaryEventDetailView",
+    "SanitaryEventExportView",
     "SanitaryEventHardDeleteView",
     "SanitaryEventListView",
+    "SanitaryEventProgressView",
     "SanitaryEventRestoreView",
+    "SanitaryEventTargetsFragmentView",
     "SanitaryEventTrashListView",
     "SanitaryEventUpdateView",
     "MedicationCreateView",
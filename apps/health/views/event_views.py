@@ -2,14 +2,19 @@ from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.db.models import Count, Q
 from django.shortcuts import redirect, render
-from django.urls import reverse_lazy
+from django.urls import reverse, reverse_lazy
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import DeleteView, DetailView, FormView, ListView, UpdateView
 
-from apps.base.views.list_mixins import StandardizedListMixin
+from apps.base.views.conditional import ConditionalGetMixin
+from apps.base.views.export import ExportView
+from apps.base.views.fragments import FragmentListView
+from apps.base.views.list_mixins import PartialListMixin, StandardizedListMixin
+from apps.base.views.progress import ProgressPageMixin, ProgressStreamView
 from apps.cattle.models import Cattle
+from apps.cattle.services.selection_service import SelectionService
 from apps.health.forms import SanitaryEventForm
-from apps.health.models import SanitaryEvent
+from apps.health.models import Medication, SanitaryEvent, SanitaryEventTarget
 from apps.health.models.health import MedicationType
 from apps.health.services import HealthService
 
@@ -22,13 +27,13 @@ class SanitaryEventCreateView(FormView):
     def post(self, request, *args, **kwargs):
         """
         Handles two types of POSTs:
-        1. 'Initial': Incoming from Cattle List with just 'cattle_ids'.
-        2. 'Save': Incoming from this form with data + 'cattle_ids'.
+        1. 'Initial': Incoming from Cattle List with 'cattle_ids' checkboxes,
+           which are stored once as a server-side Selection.
+        2. 'Save': Incoming from this form with data + the 'selection' ID.
         """
-        # Extract cattle IDs from either the List selection or the Hidden Fields
-        cattle_ids = request.POST.getlist("cattle_ids")
+        selection = SelectionService.resolve(request)
 
-        if not cattle_ids:
+        if not selection or not selection.size:
             messages.error(request, _("No cattle selected for this event."))
             return redirect("cattle:list")
 
@@ -37,69 +42,61 @@ class SanitaryEventCreateView(FormView):
         if "action" in request.POST and request.POST["action"] == "save_event":
             form = self.get_form()
             if form.is_valid():
-                return self.form_valid(form, cattle_ids)
-            return self.form_invalid(form, cattle_ids)
+                return self.form_valid(form, selection)
+            return self.form_invalid(form, selection)
 
         # Otherwise, this is the Initial request from Cattle List.
         # Render the empty form.
-        return self.render_initial_form(cattle_ids)
+        return self.render_initial_form(selection)
 
-    def render_initial_form(self, cattle_ids):
+    def render_initial_form(self, selection):
         """Helper to render the form with the selected cattle context"""
-        form = self.get_form()
-        context = self.get_context_data(form=form)
-
-        # Fetch objects to show a summary (e.g. "Applying to 5 animals: Cow 101, Bull 202...")
-        selected_cattle = Cattle.objects.filter(pk__in=cattle_ids)
-        context["selected_cattle"] = selected_cattle
-        context["cattle_ids"] = cattle_ids
-        return render(self.request, self.template_name, context)
+        return self.form_invalid(self.form_class(initial=self.get_initial()), selection)
 
     # pylint: disable=arguments-differ
-    def form_valid(self, form, cattle_ids):
+    def form_valid(self, form, selection):
         try:
-            # Inject user who performed
-            # Note: The form doesn't show 'performed_by' to keep it simple,
-            # so we can auto-assign request.user or extract if added to form.
-            # Ideally, event_data should have it.
-            event_data = form.cleaned_data
-            if not event_data.get("performed_by"):
-                # If model allows it or logic requires, assign current user
-                # But form.cleaned_data is a dict copy.
-                pass
-
-            # Note: HealthService.create_batch_event expects dict.
-            # We might want to set performed_by to request.user if not in form.
-            # But the user draft form has no performed_by field.
-            # I will add it to the data.
-            full_data = event_data.copy()
+            # The form has no performed_by field; the current user applied it.
+            full_data = form.cleaned_data.copy()
             full_data["performed_by"] = self.request.user
 
             HealthService.create_batch_event(
-                event_data=full_data, cattle_uuids=cattle_ids
+                event_data=full_data,
+                cattle_uuids=list(
+                    SelectionService.get_cattle(selection).values_list("pk", flat=True)
+                ),
             )
             messages.success(self.request, _("Sanitary event created successfully."))
             return super().form_valid(form)
         except Exception as e:  # pylint: disable=broad-exception-caught
             # If service fails (e.g. data error), return to form with error
             messages.error(self.request, str(e))
-            return self.form_invalid(form, cattle_ids)
+            return self.form_invalid(form, selection)
 
     # pylint: disable=arguments-differ
-    def form_invalid(self, form, cattle_ids):
+    def form_invalid(self, form, selection):
         """
-        If form fails (e.g. missing date), we MUST re-pass the cattle_ids
-        so they aren't lost on the re-render.
+        Re-renders the form carrying only the selection ID, so the
+        cattle list is never re-posted.
         """
         context = self.get_context_data(form=form)
-        context["selected_cattle"] = Cattle.objects.filter(pk__in=cattle_ids)
-        context["cattle_ids"] = cattle_ids
+        context["selection"] = selection
+        # Summary only (e.g. "Applying to 5 animals: Cow 101, Bull 202...")
+        context["selected_cattle"] = SelectionService.get_cattle(selection)
         return render(self.request, self.template_name, context)
 
 
-class SanitaryEventListView(LoginRequiredMixin, StandardizedListMixin, ListView):
+class SanitaryEventListView(
+    LoginRequiredMixin,
+    ConditionalGetMixin,
+    StandardizedListMixin,
+    PartialListMixin,
+    ListView,
+):
+    read_replica = True
     model = SanitaryEvent
     template_name = "health/event_list.html"
+    partial_template_name = "health/partials/event_list_results.html"
     context_object_name = "events"
     paginate_by = 10
 
@@ -136,12 +133,19 @@ class SanitaryEventListView(LoginRequiredMixin, StandardizedListMixin, ListView)
             "medication_type", ""
         )
 
-        context["medication_type_choices"] = MedicationType.choices
-
         return context
 
+    def get_validator_models(self):
+        # Rows show the medication by name
+        return [Medication]
 
-class SanitaryEventDetailView(LoginRequiredMixin, DetailView):
+    def get_reference_data(self):
+        return {"medication_type_choices": MedicationType.choices}
+
+
+class SanitaryEventDetailView(
+    LoginRequiredMixin, ConditionalGetMixin, ProgressPageMixin, DetailView
+):
     model = SanitaryEvent
     template_name = "health/event_detail.html"
     context_object_name = "event"
@@ -149,15 +153,56 @@ class SanitaryEventDetailView(LoginRequiredMixin, DetailView):
     def get_queryset(self):
         return super().get_queryset().select_related("medication", "performed_by")
 
+    def get_validator_querysets(self):
+        pk = self.kwargs["pk"]
+        return [
+            SanitaryEvent.objects.filter(pk=pk),
+            SanitaryEventTarget.objects.filter(event=pk),
+        ]
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        # Add targets to context
-        context["targets"] = (
-            self.object.targets.all().select_related("animal").order_by("animal__tag")
-        )
+        # The targets themselves are paged in by SanitaryEventTargetsFragmentView
+        context["target_count"] = self.object.targets.count()
         return context
 
 
+class SanitaryEventProgressView(ProgressStreamView):
+    model = SanitaryEvent
+    summary = {"count": Count("pk")}
+
+    def get_rows(self):
+        return SanitaryEventTarget.all_objects.filter(event=self.object).select_related(
+            "animal"
+        )
+
+    def serialize_row(self, row) -> dict:
+        return {
+            "id": str(row.pk),
+            "tag": row.animal.tag,
+            "animal_url": reverse("cattle:detail", args=[row.animal_id]),
+            "applied_dose": row.applied_dose,
+            "cost_per_head": row.cost_per_head,
+        }
+
+
+class SanitaryEventTargetsFragmentView(LoginRequiredMixin, FragmentListView):
+    parent_model = SanitaryEvent
+    parent_context_name = "event"
+    template_name = "health/fragments/targets.html"
+    context_object_name = "targets"
+
+    def get_queryset(self):
+        return self.parent.targets.select_related("animal").order_by("animal__tag")
+
+    def get_validator_querysets(self):
+        # Rows show the animals' tags and status too
+        return [
+            self.get_queryset(),
+            Cattle.all_objects.filter(health_records__event=self.parent),
+        ]
+
+
 class SanitaryEventUpdateView(LoginRequiredMixin, UpdateView):
     model = SanitaryEvent
     form_class = SanitaryEventForm
@@ -167,6 +212,7 @@ class SanitaryEventUpdateView(LoginRequiredMixin, UpdateView):
         return reverse_lazy("health:event-detail", kwargs={"pk": self.object.pk})
 
     def form_valid(self, form):
+        animal_ids = list(self.object.targets.values_list("animal_id", flat=True))
         response = super().form_valid(form)
 
         # 1. Handle Target Removal
@@ -180,6 +226,10 @@ class SanitaryEventUpdateView(LoginRequiredMixin, UpdateView):
         if "total_cost" in form.changed_data or targets_to_remove:
             self._recalculate_costs()
 
+        # 3. Refresh the animals' treatment state cache
+        if targets_to_remove or {"date", "medication"} & set(form.changed_data):
+            HealthService.sync_treatment_state(animal_ids)
+
         messages.success(self.request, _("Sanitary event updated successfully."))
         return response
 
@@ -208,7 +258,10 @@ class SanitaryEventDeleteView(LoginRequiredMixin, DeleteView):
     # pylint: disable=broad-exception-caught
     def form_valid(self, form):
         try:
-            return super().form_valid(form)
+            animal_ids = list(self.object.targets.values_list("animal_id", flat=True))
+            response = super().form_valid(form)
+            HealthService.sync_treatment_state(animal_ids)
+            return response
         except Exception as e:
             # Handle potential protected errors if any (though BaseModel soft deletes usually work fine)
             messages.error(self.request, str(e))
@@ -264,3 +317,18 @@ class SanitaryEventHardDeleteView(LoginRequiredMixin, DeleteView):
                 {"object": self.object, "error": str(e)},
             )
         return redirect(self.success_url)
+
+
+class SanitaryEventExportView(LoginRequiredMixin, ExportView):
+    """Exports one row per treated animal, filtered like the event list."""
+
+    export_name = "health"
+    columns = HealthService.EXPORT_COLUMNS
+
+    def get_queryset(self):
+        medication_type = self.request.GET.get("medication_type")
+        return HealthService.get_export_queryset(
+            date_after=self.get_date("date_after"),
+            date_before=self.get_date("date_before"),
+            medication_type=medication_type if medication_type != "None" else None,
+        )
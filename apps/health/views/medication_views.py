@@ -14,6 +14,7 @@ from apps.health.services import HealthService
 
 
 class MedicationListView(LoginRequiredMixin, ListView):
+    read_replica = True
     model = Medication
     template_name = "health/medication_list.html"
     context_object_name = "medications"
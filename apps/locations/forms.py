@@ -62,7 +62,7 @@ class LocationForm(forms.ModelForm):
 
 
 class MovementForm(forms.ModelForm):
-    cattle_ids = forms.CharField(widget=forms.HiddenInput(), required=False)
+    selection = forms.UUIDField(widget=forms.HiddenInput(), required=False)
 
     class Meta:
         model = Movement
@@ -71,12 +71,3 @@ class MovementForm(forms.ModelForm):
             "date": forms.DateInput(attrs={"type": "date"}),
             "notes": forms.Textarea(attrs={"rows": 3}),
         }
-
-    def clean(self):
-        cleaned_data = super().clean()
-        # Custom validation if needed, e.g. checking if cattle_ids are present
-        cattle_ids = cleaned_data.get("cattle_ids")
-        if not cattle_ids:
-            # It might be valid if we populate it differently, but for this form usage we expect IDs
-            pass
-        return cleaned_data
@@ -1,12 +1,42 @@
 from decimal import Decimal
 
 from django.db import models
-from django.db.models import Sum
+from django.db.models import QuerySet, Sum
 
+from apps.base.utils.model_cache import memoize
+from apps.base.utils.reference_data import reference_data
+from apps.cattle.models import Cattle
 from apps.locations.models import Location, LocationStatus
 
 
 class LocationService:
+    @staticmethod
+    @reference_data(Location)
+    def get_location_choices() -> list[Location]:
+        """Locations for dropdowns, by name, served from the reference cache."""
+        return Location.objects.order_by("name")
+
+    @staticmethod
+    def get_active_locations() -> list[Location]:
+        """Locations animals can currently be in."""
+        return [
+            location
+            for location in LocationService.get_location_choices()
+            if location.is_active and location.status == LocationStatus.ACTIVE
+        ]
+
+    @staticmethod
+    def with_stocking(queryset: QuerySet[Location]) -> QuerySet[Location]:
+        """
+        Annotates the head count and total weight of the animals at each
+        location, so calculate_stocking_rate() runs no query per location.
+        """
+        present = models.Q(cattle__is_deleted=False)
+        return queryset.annotate(
+            stocking_head_count=models.Count("cattle", filter=present),
+            stocking_total_weight=Sum("cattle__current_weight", filter=present),
+        )
+
     @staticmethod
     def calculate_stocking_rate(location: Location) -> dict:
         """
@@ -31,20 +61,26 @@ class LocationService:
                 "occupancy_rate": 0.0,
             }
 
-        cattle_in_location = location.cattle.filter(is_deleted=False)
-
-        # Calculate Total Weight using current_weight cache
-        # If current_weight is null, maybe fallback to weight_kg or 0?
-        # Using 0 for integrity if unknown.
-        aggregated = cattle_in_location.aggregate(total_weight=Sum("current_weight"))
-        total_weight = aggregated["total_weight"] or Decimal(0)
+        if hasattr(location, "stocking_head_count"):
+            head_count = location.stocking_head_count
+            total_weight = location.stocking_total_weight
+        else:
+            # Calculate Total Weight using current_weight cache
+            # If current_weight is null, maybe fallback to weight_kg or 0?
+            # Using 0 for integrity if unknown.
+            aggregated = location.cattle.filter(is_deleted=False).aggregate(
+                head_count=models.Count("pk"),
+                total_weight=Sum("current_weight"),
+            )
+            head_count = aggregated["head_count"]
+            total_weight = aggregated["total_weight"]
+        total_weight = total_weight or Decimal(0)
 
         kg_per_ha = total_weight / Decimal(str(location.area_hectares))
 
         # 1 AU = 450kg
         au_per_ha = kg_per_ha / Decimal(450)
 
-        head_count = cattle_in_location.count()
         occupancy = 0.0
         if location.capacity_head and location.capacity_head > 0:
             occupancy = (head_count / location.capacity_head) * 100
@@ -75,13 +111,24 @@ class LocationService:
             .filter(current_head_count__gt=0)
         )
 
-        # Top Occupancy
+        return {
+            "resting_violations": resting_violations,
+            "top_occupancy": LocationService._top_occupancy(),
+        }
+
+    @staticmethod
+    @memoize(Location, Cattle)
+    def _top_occupancy() -> list[dict]:
+        """
+        Top 5 locations by occupancy. Cached until a location or an animal
+        changes, since it computes the stocking rate of every location.
+        """
         # This is harder to do purely in ORM if capacity varies and we want %,
         # but we can do a rough fetch or just python sort for small number of locations.
         # For scalability, simple list.
-        locations = Location.objects.filter(
-            is_active=True, capacity_head__gt=0
-        ).prefetch_related("cattle")
+        locations = LocationService.with_stocking(
+            Location.objects.filter(is_active=True, capacity_head__gt=0)
+        )
         occupancy_list = []
         for loc in locations:
             stats = LocationService.calculate_stocking_rate(loc)
@@ -97,11 +144,7 @@ class LocationService:
 
         # Sort by occupancy descending
         occupancy_list.sort(key=lambda x: x["occupancy_rate"], reverse=True)
-
-        return {
-            "resting_violations": resting_violations,
-            "top_occupancy": occupancy_list[:5],
-        }
+        return occupancy_list[:5]
 
     @staticmethod
     def get_deleted_locations():
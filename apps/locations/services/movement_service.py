@@ -1,18 +1,21 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 from django.core.exceptions import ValidationError
 from django.db import transaction
+from django.db.models import OuterRef, Subquery
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from apps.authentication.models import User
+from apps.base.utils.metrics import timed
 from apps.cattle.models import Cattle
 from apps.locations.models import Location, Movement
 
 
 class MovementService:
     @staticmethod
+    @timed
     @transaction.atomic
     def move_cattle(
         cattle_list: List[Cattle],
@@ -79,6 +82,33 @@ class MovementService:
         # 3. Update Inventory
         for animal in cattle_list:
             animal.location = destination
-            animal.save(update_fields=["location", "modified_at"])
+            animal.location_since = move_date
+            animal.save(update_fields=["location", "location_since", "modified_at"])
 
         return movement
+
+    @staticmethod
+    def sync_location_state(cattle_ids: Optional[Iterable] = None) -> int:
+        """
+        Recomputes Cattle.location_since from the latest active movement into
+        each animal's current location.
+
+        Args:
+            cattle_ids: Restrict the update to these animals (all if None).
+
+        Returns:
+            Number of cattle rows updated.
+        """
+        arrival = (
+            Movement.objects.filter(
+                animals=OuterRef("pk"), destination=OuterRef("location")
+            )
+            .order_by("-date")
+            .values("date")[:1]
+        )
+
+        queryset = Cattle.all_objects.all()
+        if cattle_ids is not None:
+            queryset = queryset.filter(pk__in=list(cattle_ids))
+
+        return queryset.update(location_since=Subquery(arrival))
@@ -9,6 +9,16 @@ urlpatterns = [
     path("trash/", views.LocationTrashListView.as_view(), name="trash"),
     path("create/", views.LocationCreateView.as_view(), name="create"),
     path("<uuid:pk>/", views.LocationDetailView.as_view(), name="detail"),
+    path(
+        "<uuid:pk>/inventory/",
+        views.LocationInventoryFragmentView.as_view(),
+        name="detail-inventory",
+    ),
+    path(
+        "<uuid:pk>/movements/",
+        views.LocationMovementsFragmentView.as_view(),
+        name="detail-movements",
+    ),
     path("<uuid:pk>/update/", views.LocationUpdateView.as_view(), name="update"),
     path("<uuid:pk>/delete/", views.LocationDeleteView.as_view(), name="delete"),
     path("<uuid:pk>/restore/", views.LocationRestoreView.as_view(), name="restore"),
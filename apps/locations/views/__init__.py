@@ -2,7 +2,9 @@ from .location_views import (
     LocationCreateView,
     LocationDeleteView,
     LocationDetailView,
+    LocationInventoryFragmentView,
     LocationListView,
+    LocationMovementsFragmentView,
     LocationPermanentDeleteView,
     LocationRestoreView,
     LocationTrashListView,
@@ -13,6 +15,8 @@ from .movement_views import MovementCreateView
 __all__ = [
     "LocationListView",
     "LocationDetailView",
+    "LocationInventoryFragmentView",
+    "LocationMovementsFragmentView",
     "LocationCreateView",
     "LocationUpdateView",
     "LocationDeleteView",
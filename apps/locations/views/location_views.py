@@ -1,7 +1,7 @@
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.core.exceptions import ValidationError
-from django.db.models import ProtectedError
+from django.db.models import Count, ProtectedError, Q
 from django.http import HttpResponseRedirect
 from django.shortcuts import render
 from django.urls import reverse_lazy
@@ -15,9 +15,12 @@ from django.views.generic import (
     View,
 )
 
+from apps.base.views.conditional import ConditionalGetMixin
+from apps.base.views.fragments import FragmentListView
 from apps.base.views.mixins import HandleProtectedErrorMixin, SafeDeleteMixin
+from apps.cattle.models import Cattle
 from apps.locations.forms import LocationForm
-from apps.locations.models import Location, LocationStatus, LocationType
+from apps.locations.models import Location, LocationStatus, LocationType, Movement
 from apps.locations.services import LocationService
 
 LOCATION_LIST_URL = "locations:list"
@@ -25,13 +28,14 @@ LOCATION_NOT_FOUND_MSG = _("Location not found.")
 
 
 class LocationListView(LoginRequiredMixin, ListView):
+    read_replica = True
     model = Location
     template_name = "locations/location_list.html"
     context_object_name = "locations"
     paginate_by = 10
 
     def get_queryset(self):
-        queryset = Location.objects.prefetch_related("cattle").order_by("name")
+        queryset = LocationService.with_stocking(Location.objects.order_by("name"))
 
         # Search
         search_query = self.request.GET.get("q")
@@ -90,34 +94,52 @@ class LocationListView(LoginRequiredMixin, ListView):
         return context
 
 
-class LocationDetailView(LoginRequiredMixin, DetailView):
+class LocationDetailView(LoginRequiredMixin, ConditionalGetMixin, DetailView):
     model = Location
     template_name = "locations/location_detail.html"
     context_object_name = "location"
 
+    def get_validator_querysets(self):
+        pk = self.kwargs["pk"]
+        # Stocking stats are computed from the animals in the location
+        return [Location.objects.filter(pk=pk), Cattle.objects.filter(location=pk)]
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         # Stats
         context["stats"] = LocationService.calculate_stocking_rate(self.object)
 
-        # Inventory
-        context["cattle_list"] = self.object.cattle.filter(
-            is_deleted=False
-        ).select_related("sire")
-
-        # History (Log of In/Out)
-        # Union of movements_in and movements_out or just list them?
-        # Showing just recent movements involving this location
-        movements = (
-            (self.object.movements_in.all() | self.object.movements_out.all())
-            .distinct()
-            .order_by("-date")[:50]
-        )
-        context["movements"] = movements
-
+        # Inventory and movement history are fragments loaded by the page
         return context
 
 
+class LocationInventoryFragmentView(LoginRequiredMixin, FragmentListView):
+    parent_model = Location
+    parent_context_name = "location"
+    template_name = "locations/fragments/inventory.html"
+    context_object_name = "cattle_list"
+
+    def get_queryset(self):
+        return self.parent.cattle.filter(is_deleted=False).order_by("tag")
+
+
+class LocationMovementsFragmentView(LoginRequiredMixin, FragmentListView):
+    parent_model = Location
+    parent_context_name = "location"
+    template_name = "locations/fragments/movements.html"
+    context_object_name = "movements"
+
+    def get_queryset(self):
+        # Movements into or out of this location, with the head count
+        # aggregated in the same query
+        return (
+            Movement.objects.filter(Q(origin=self.parent) | Q(destination=self.parent))
+            .select_related("origin", "destination")
+            .annotate(animal_count=Count("animals"))
+            .order_by("-date")
+        )
+
+
 class LocationCreateView(LoginRequiredMixin, CreateView):
     model = Location
     form_class = LocationForm
@@ -6,7 +6,7 @@ from django.urls import reverse_lazy
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import CreateView
 
-from apps.cattle.models import Cattle
+from apps.cattle.services.selection_service import SelectionService
 from apps.locations.forms import MovementForm
 from apps.locations.models import Movement
 from apps.locations.services import MovementService
@@ -18,30 +18,36 @@ class MovementCreateView(LoginRequiredMixin, CreateView):
     template_name = "locations/movement_form.html"
     success_url = reverse_lazy("locations:list")
 
+    def get_selection(self):
+        """Selection posted from the Cattle List (created once, then by ID)."""
+        if not hasattr(self, "_selection"):
+            self._selection = SelectionService.resolve(self.request)
+        return self._selection
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         # Pass cattle list for display
-        cattle_ids = self._get_cattle_ids()
-        if cattle_ids:
-            context["cattle_list"] = Cattle.objects.filter(pk__in=cattle_ids)
+        selection = self.get_selection()
+        if selection:
+            context["selection"] = selection
+            context["cattle_list"] = SelectionService.get_cattle(selection)
         return context
 
     def get_initial(self):
         initial = super().get_initial()
-        cattle_ids = self._get_cattle_ids()
-        if cattle_ids:
-            initial["cattle_ids"] = ",".join(cattle_ids)
+        selection = self.get_selection()
+        if selection:
+            initial["selection"] = selection.pk
         return initial
 
     def form_valid(self, form):
         # Use Service instead of standard form save
-        cattle_ids_str = form.cleaned_data.get("cattle_ids")
-        if not cattle_ids_str:
+        selection = self.get_selection()
+        if not selection:
             messages.error(self.request, _("No cattle selected."))
             return self.form_invalid(form)
 
-        cattle_ids = cattle_ids_str.split(",")
-        cattle_list = list(Cattle.objects.filter(pk__in=cattle_ids))
+        cattle_list = list(SelectionService.get_cattle(selection))
 
         if not cattle_list:
             messages.error(self.request, _("Invalid cattle selection."))
@@ -67,37 +73,15 @@ class MovementCreateView(LoginRequiredMixin, CreateView):
     def post(self, request, *args, **kwargs):
         # If 'destination' is not in POST, checks if this is the initial bulk action request
         if "destination" not in request.POST:
-            # Treat as initial form load with data from POST
-            cattle_ids = self._get_cattle_ids()
-            if not cattle_ids:
+            # Treat as initial form load with the selection from POST
+            selection = self.get_selection()
+            if not selection or not selection.size:
                 messages.error(request, _("No cattle selected."))
                 return redirect("cattle:list")
 
-            # Initialize form with the cattle IDs
-            form = self.form_class(initial={"cattle_ids": ",".join(cattle_ids)})
+            # Initialize form with the selection ID
+            form = self.form_class(initial={"selection": selection.pk})
             self.object = None
             return self.render_to_response(self.get_context_data(form=form))
 
         return super().post(request, *args, **kwargs)
-
-    def _get_cattle_ids(self):
-        # 1. Try GET list
-        ids_list = self.request.GET.getlist("cattle_ids")
-        if ids_list:
-            return ids_list
-
-        # 2. Try POST list
-        ids_list = self.request.POST.getlist("cattle_ids")
-
-        # If list has > 1 item, it's definitely multiple checkboxes
-        if len(ids_list) > 1:
-            return ids_list
-
-        # If list has 1 item, it could be a single checkbox ("id1") OR a hidden field ("id1,id2")
-        if len(ids_list) == 1:
-            val = ids_list[0]
-            if "," in val:
-                return val.split(",")
-            return [val]
-
-        return []
@@ -1,7 +1,10 @@
 from django import forms
 from django.forms import inlineformset_factory
 
+from apps.base.utils.reference_data import set_cached_choices
+from apps.locations.services import LocationService
 from apps.nutrition.models import Diet, DietItem, FeedingEvent, FeedIngredient
+from apps.nutrition.services import DietService, IngredientService
 
 
 class FeedIngredientForm(forms.ModelForm):
@@ -21,6 +24,13 @@ class DietItemForm(forms.ModelForm):
         model = DietItem
         fields = ["ingredient", "proportion_percent"]
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Rendered once per formset row, so never from the database
+        set_cached_choices(
+            self.fields["ingredient"], IngredientService.get_ingredient_choices()
+        )
+
 
 DietItemFormSet = inlineformset_factory(
     Diet,
@@ -38,3 +48,10 @@ class FeedingEventForm(forms.ModelForm):
         widgets = {
             "date": forms.DateInput(attrs={"type": "date"}),
         }
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        set_cached_choices(
+            self.fields["location"], LocationService.get_location_choices()
+        )
+        set_cached_choices(self.fields["diet"], DietService.get_diet_choices())
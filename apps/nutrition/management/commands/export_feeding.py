@@ -0,0 +1,18 @@
+from apps.base.utils.export import ExportCommand, add_date_range_arguments
+from apps.nutrition.services import FeedingService
+
+
+class Command(ExportCommand):
+    help = "Export feeding events as CSV or JSON Lines."
+
+    name = "feeding"
+    columns = FeedingService.EXPORT_COLUMNS
+
+    def add_filter_arguments(self, parser):
+        add_date_range_arguments(parser)
+
+    def get_queryset(self, options):
+        return FeedingService.get_export_queryset(
+            date_after=options["date_after"],
+            date_before=options["date_before"],
+        )
@@ -1,7 +1,14 @@
+from apps.base.utils.reference_data import reference_data
 from apps.nutrition.models.diet import Diet
 
 
 class DietService:
+    @staticmethod
+    @reference_data(Diet)
+    def get_diet_choices() -> list[Diet]:
+        """Diets for dropdowns, served from the reference cache."""
+        return Diet.objects.order_by("name")
+
     @staticmethod
     def get_deleted_diets():
         return Diet.all_objects.filter(is_deleted=True).order_by("-modified_at")
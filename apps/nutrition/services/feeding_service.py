@@ -1,9 +1,13 @@
+from datetime import date
 from decimal import Decimal
+from typing import Optional
 
 from django.core.exceptions import ValidationError
 from django.db import transaction
+from django.db.models import QuerySet
 from django.utils.translation import gettext_lazy as _
 
+from apps.base.utils.metrics import timed
 from apps.locations.models.location import Location
 from apps.nutrition.models.diet import Diet
 from apps.nutrition.models.event import FeedingEvent
@@ -11,7 +15,17 @@ from apps.nutrition.models.ingredient import FeedIngredient
 
 
 class FeedingService:
+    EXPORT_COLUMNS = {
+        "date": "date",
+        "location": "location__name",
+        "diet": "diet__name",
+        "amount_kg": "amount_kg",
+        "cost_total": "cost_total",
+        "performed_by": "performed_by__username",
+    }
+
     @staticmethod
+    @timed
     @transaction.atomic
     def record_feeding(
         location: Location,
@@ -77,3 +91,21 @@ class FeedingService:
         )
 
         return event
+
+    @staticmethod
+    def get_export_queryset(
+        date_after: Optional[date] = None,
+        date_before: Optional[date] = None,
+        location_id: Optional[str] = None,
+    ) -> QuerySet[FeedingEvent]:
+        """
+        Active feeding events for the export, oldest first.
+        """
+        queryset = FeedingEvent.objects.order_by("date", "created_at")
+        if date_after:
+            queryset = queryset.filter(date__gte=date_after)
+        if date_before:
+            queryset = queryset.filter(date__lte=date_before)
+        if location_id:
+            queryset = queryset.filter(location_id=location_id)
+        return queryset
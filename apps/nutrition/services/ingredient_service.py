@@ -1,7 +1,17 @@
+from apps.base.utils.reference_data import reference_data
 from apps.nutrition.models.ingredient import FeedIngredient
 
 
 class IngredientService:
+    @staticmethod
+    @reference_data(FeedIngredient)
+    def get_ingredient_choices() -> list[FeedIngredient]:
+        """
+        Ingredients for dropdowns, served from the reference cache. Their
+        labels show the stock, so stock updates invalidate it too.
+        """
+        return FeedIngredient.objects.order_by("name")
+
     @staticmethod
     def get_deleted_ingredients():
         return FeedIngredient.all_objects.filter(is_deleted=True).order_by(
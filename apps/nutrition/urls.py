@@ -53,5 +53,6 @@ urlpatterns = [
     ),
     # Feeding Events
     path("events/", views.FeedingEventListView.as_view(), name="event-list"),
+    path("events/export/", views.FeedingEventExportView.as_view(), name="event-export"),
     path("events/create/", views.FeedingEventCreateView.as_view(), name="event-create"),
 ]
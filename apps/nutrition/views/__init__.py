@@ -7,7 +7,11 @@ from .diet_views import (
     DietTrashListView,
     DietUpdateView,
 )
-from .event_views import FeedingEventCreateView, FeedingEventListView
+from .event_views import (
+    FeedingEventCreateView,
+    FeedingEventExportView,
+    FeedingEventListView,
+)
 from .ingredient_views import (
     IngredientCreateView,
     IngredientDeleteView,
@@ -35,4 +39,5 @@ __all__ = [
     "IngredientUpdateView",
     "FeedingEventCreateView",
     "FeedingEventListView",
+    "FeedingEventExportView",
 ]
@@ -20,6 +20,7 @@ DIET_NOT_FOUND_MSG = _("Diet not found.")
 
 
 class DietListView(StandardizedListMixin, ListView):
+    read_replica = True
     model = Diet
     template_name = "nutrition/diet_list.html"
     context_object_name = "diets"
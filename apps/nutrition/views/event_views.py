@@ -7,6 +7,7 @@ from django.urls import reverse_lazy
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import CreateView, ListView
 
+from apps.base.views.export import ExportView
 from apps.base.views.list_mixins import StandardizedListMixin
 from apps.nutrition.forms import FeedingEventForm
 from apps.nutrition.models.event import FeedingEvent
@@ -14,6 +15,7 @@ from apps.nutrition.services.feeding_service import FeedingService
 
 
 class FeedingEventListView(LoginRequiredMixin, StandardizedListMixin, ListView):
+    read_replica = True
     model = FeedingEvent
     template_name = "nutrition/event_list.html"
     context_object_name = "events"
@@ -62,3 +64,17 @@ class FeedingEventCreateView(CreateView):
         except ValidationError as e:
             form.add_error(None, e)
             return self.form_invalid(form)
+
+
+class FeedingEventExportView(LoginRequiredMixin, ExportView):
+    """Exports feeding events, filtered like the event list."""
+
+    export_name = "feeding"
+    columns = FeedingService.EXPORT_COLUMNS
+
+    def get_queryset(self):
+        return FeedingService.get_export_queryset(
+            date_after=self.get_date("date_after"),
+            date_before=self.get_date("date_before"),
+            location_id=self.get_uuid("location"),
+        )
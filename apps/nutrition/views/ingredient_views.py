@@ -19,6 +19,7 @@ INGREDIENT_NOT_FOUND_MSG = _("Ingredient not found.")
 
 
 class IngredientListView(LoginRequiredMixin, StandardizedListMixin, ListView):
+    read_replica = True
     model = FeedIngredient
     template_name = "nutrition/ingredient_list.html"
     context_object_name = "ingredients"
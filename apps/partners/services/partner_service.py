@@ -3,10 +3,22 @@ from typing import Optional
 from django.db.models import DecimalField, Q, QuerySet, Sum, Value
 from django.db.models.functions import Coalesce
 
+from apps.base.utils.reference_data import reference_data
 from apps.partners.models import Partner
 
 
 class PartnerService:
+    @staticmethod
+    @reference_data(Partner)
+    def get_partner_choices() -> list[Partner]:
+        """Partners for dropdowns, by name, served from the reference cache."""
+        return Partner.objects.order_by("name")
+
+    @staticmethod
+    def get_customer_choices() -> list[Partner]:
+        """Cached partners flagged as customers."""
+        return [p for p in PartnerService.get_partner_choices() if p.is_customer]
+
     @staticmethod
     def get_partners(search_query: Optional[str] = None) -> QuerySet[Partner]:
         """
@@ -14,6 +14,8 @@ from django.views.generic import (
     UpdateView,
 )
 
+from apps.base.views.conditional import ConditionalGetMixin
+
 from .forms import PartnerForm
 from .models import Partner
 from .services.partner_service import PartnerService
@@ -22,6 +24,7 @@ SUCCESS_URL = reverse_lazy("partners:list")
 
 
 class PartnerListView(LoginRequiredMixin, ListView):
+    read_replica = True
     model = Partner
     template_name = "partners/partner_list.html"
     context_object_name = "partners"
@@ -157,7 +160,7 @@ class PartnerDeleteView(LoginRequiredMixin, DeleteView):
         return HttpResponseRedirect(self.success_url)
 
 
-class PartnerDetailView(LoginRequiredMixin, DetailView):
+class PartnerDetailView(LoginRequiredMixin, ConditionalGetMixin, DetailView):
     model = Partner
     template_name = "partners/partner_detail.html"
     context_object_name = "partner"
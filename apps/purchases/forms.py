@@ -4,6 +4,9 @@ from django.contrib.contenttypes.models import ContentType
 from django.forms import BaseInlineFormSet, inlineformset_factory
 from django.utils.translation import gettext_lazy as _
 
+from apps.base.utils.reference_data import set_cached_choices
+from apps.cattle.models import Cattle
+from apps.nutrition.models import FeedIngredient
 from apps.partners.services import PartnerService
 from apps.purchases.models import Purchase, PurchaseItem
 
@@ -19,13 +22,15 @@ class PurchaseForm(forms.ModelForm):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        # Populate partners from service to respect soft-delete rules if needed,
-        # though ModelChoiceField naturally respects the default manager
-        # (usually non-deleted). Ensuring we order them nicely.
-        self.fields["partner"].queryset = PartnerService.get_partners()
+        # Options come from the reference cache; the default manager's
+        # queryset (non-deleted partners) still validates the choice.
+        set_cached_choices(self.fields["partner"], PartnerService.get_partner_choices())
 
 
 class PurchaseItemForm(forms.ModelForm):
+    # Options come from the in-process ContentType cache
+    ITEM_MODELS = (Cattle, FeedIngredient)
+
     # Specialized field for selecting Cattle
     # In a full Generic implementation, this would be more complex.
     # We assume 'cattle' for now.
@@ -57,6 +62,10 @@ class PurchaseItemForm(forms.ModelForm):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        set_cached_choices(
+            self.fields["content_type"],
+            ContentType.objects.get_for_models(*self.ITEM_MODELS).values(),
+        )
 
         # If bound or instance exists, set initial ContentType and ObjectId
         # Use content_type_id check to avoid RelatedObjectDoesNotExist
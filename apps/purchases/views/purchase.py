@@ -13,13 +13,15 @@ from django.views.generic import (
     UpdateView,
 )
 
+from apps.base.views.conditional import ConditionalGetMixin, generic_object_querysets
 from apps.partners.models.partner import Partner
 from apps.purchases.forms import PurchaseForm, PurchaseItemFormSet
-from apps.purchases.models import Purchase
+from apps.purchases.models import Purchase, PurchaseItem
 from apps.purchases.services.purchase_service import PurchaseService
 
 
 class PurchaseListView(LoginRequiredMixin, ListView):
+    read_replica = True
     model = Purchase
     template_name = "purchases/purchase_list.html"
     context_object_name = "purchases"
@@ -127,11 +129,22 @@ class PurchaseUpdateView(LoginRequiredMixin, UpdateView):
         return self.form_invalid(form)
 
 
-class PurchaseDetailView(LoginRequiredMixin, DetailView):
+class PurchaseDetailView(LoginRequiredMixin, ConditionalGetMixin, DetailView):
     model = Purchase
     template_name = "purchases/purchase_detail.html"
     context_object_name = "purchase"
 
+    def get_validator_querysets(self):
+        pk = self.kwargs["pk"]
+        items = PurchaseItem.objects.filter(purchase=pk)
+        # The page shows the partner's name and each item's object
+        return [
+            Purchase.objects.filter(pk=pk),
+            items,
+            Partner.all_objects.filter(purchases=pk),
+            *generic_object_querysets(items),
+        ]
+
 
 class PurchaseDeleteView(LoginRequiredMixin, DeleteView):
     model = Purchase
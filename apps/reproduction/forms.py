@@ -83,3 +83,25 @@ class BreedingEventForm(forms.ModelForm):
         self.fields["sire"].required = False
         self.fields["sire_name"].required = False
         self.fields["batch"].required = False
+
+
+class BreedingBatchForm(forms.ModelForm):
+    """Service details applied to every dam of a selection."""
+
+    class Meta:
+        model = BreedingEvent
+        fields = ["date", "breeding_method", "sire", "sire_name", "batch"]
+        widgets = {
+            "date": forms.DateInput(attrs={"type": "date"}),
+        }
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        for _field_name, field in self.fields.items():
+            field.widget.attrs["class"] = (
+                "block w-full rounded-md border-0 py-1.5 text-gray-900 shadow-sm ring-1 ring-inset ring-gray-300 placeholder:text-gray-400 focus:ring-2 focus:ring-inset focus:ring-indigo-600 sm:text-sm sm:leading-6"
+            )
+
+        self.fields["sire"].required = False
+        self.fields["sire_name"].required = False
+        self.fields["batch"].required = False
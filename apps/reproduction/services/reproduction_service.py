@@ -1,6 +1,8 @@
 from datetime import timedelta
+from typing import Iterable, Optional
 
 from django.db import transaction
+from django.db.models import Case, OuterRef, Subquery, When
 from django.utils.translation import gettext as _
 
 from apps.cattle.models.cattle import Cattle
@@ -42,10 +44,47 @@ class ReproductionService:
 
         # Update Cow Status
         dam.reproduction_status = Cattle.REP_STATUS_BRED
+        if not dam.last_breeding_date or date > dam.last_breeding_date:
+            dam.last_breeding_date = date
+        dam.expected_calving_date = None
         dam.save()
 
         return event
 
+    BATCH_ELIGIBLE_STATUSES = [Cattle.REP_STATUS_OPEN, Cattle.REP_STATUS_LACTATING]
+
+    @staticmethod
+    @transaction.atomic
+    def record_batch_breeding(
+        dams, date, method, sire=None, sire_name="", batch=None
+    ) -> tuple[list, int]:
+        """
+        Records the same service for every Open or Lactating female in
+        `dams` (e.g. the cattle of a Selection). Other animals are skipped.
+        Returns (events, skipped_count).
+        """
+        events = []
+        skipped = 0
+        for dam in dams:
+            if (
+                dam.sex != Cattle.SEX_FEMALE
+                or dam.reproduction_status
+                not in ReproductionService.BATCH_ELIGIBLE_STATUSES
+            ):
+                skipped += 1
+                continue
+            events.append(
+                ReproductionService.record_breeding(
+                    dam=dam,
+                    date=date,
+                    method=method,
+                    sire=sire,
+                    sire_name=sire_name,
+                    batch=batch,
+                )
+            )
+        return events, skipped
+
     @staticmethod
     @transaction.atomic
     def record_diagnosis(breeding_event, date, result, fetus_days=None):
@@ -81,6 +120,7 @@ class ReproductionService:
             dam.reproduction_status = Cattle.REP_STATUS_PREGNANT
         else:
             dam.reproduction_status = Cattle.REP_STATUS_OPEN
+        dam.expected_calving_date = expected_date
         dam.save()
 
         return check
@@ -132,10 +172,54 @@ class ReproductionService:
 
         # 3. Update Dam Status
         dam.reproduction_status = Cattle.REP_STATUS_LACTATING
+        dam.expected_calving_date = None
         dam.save()
 
         return calving, calf
 
+    @staticmethod
+    def sync_breeding_state(cattle_ids: Optional[Iterable] = None) -> int:
+        """
+        Recomputes Cattle.last_breeding_date and Cattle.expected_calving_date
+        from the active breeding history. The expected calving date comes from
+        the latest positive check and is only kept while the cow is pregnant.
+
+        Args:
+            cattle_ids: Restrict the update to these animals (all if None).
+
+        Returns:
+            Number of cattle rows updated.
+        """
+        last_breeding = (
+            BreedingEvent.objects.filter(dam=OuterRef("pk"))
+            .order_by("-date")
+            .values("date")[:1]
+        )
+        expected_calving = (
+            PregnancyCheck.objects.filter(
+                breeding_event__dam=OuterRef("pk"),
+                breeding_event__is_deleted=False,
+                result=PregnancyCheck.RESULT_POSITIVE,
+            )
+            .order_by("-date", "-created_at")
+            .values("expected_calving_date")[:1]
+        )
+
+        queryset = Cattle.all_objects.all()
+        if cattle_ids is not None:
+            queryset = queryset.filter(pk__in=list(cattle_ids))
+
+        return queryset.update(
+            last_breeding_date=Subquery(last_breeding),
+            expected_calving_date=Case(
+                When(
+                    reproduction_status=Cattle.REP_STATUS_PREGNANT,
+                    then=Subquery(expected_calving),
+                ),
+                default=None,
+            ),
+        )
+
     @staticmethod
     def get_deleted_breeding_events():
         """
@@ -155,6 +239,7 @@ class ReproductionService:
         """
         event = BreedingEvent.all_objects.get(pk=pk)
         event.restore()
+        ReproductionService.sync_breeding_state([event.dam_id])
 
     @staticmethod
     @transaction.atomic
@@ -164,6 +249,7 @@ class ReproductionService:
         """
         event = BreedingEvent.all_objects.get(pk=pk)
         event.delete(destroy=True)
+        ReproductionService.sync_breeding_state([event.dam_id])
 
     @staticmethod
     def get_deleted_pregnancy_checks():
@@ -184,6 +270,7 @@ class ReproductionService:
         """
         check = PregnancyCheck.all_objects.get(pk=pk)
         check.restore()
+        ReproductionService.sync_breeding_state([check.breeding_event.dam_id])
 
     @staticmethod
     @transaction.atomic
@@ -193,6 +280,7 @@ class ReproductionService:
         """
         check = PregnancyCheck.all_objects.get(pk=pk)
         check.delete(destroy=True)
+        ReproductionService.sync_breeding_state([check.breeding_event.dam_id])
 
     @staticmethod
     def get_deleted_calving_records():
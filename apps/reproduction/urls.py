@@ -1,6 +1,7 @@
 from django.urls import path
 
 from apps.reproduction.views.breeding import (
+    BreedingBatchCreateView,
     BreedingCreateView,
     BreedingDeleteView,
     BreedingListView,
@@ -41,6 +42,11 @@ urlpatterns = [
     path("", ReproductionOverviewView.as_view(), name="overview"),
     path("breeding/", BreedingListView.as_view(), name="breeding_list"),
     path("breeding/add/", BreedingCreateView.as_view(), name="breeding_add"),
+    path(
+        "breeding/batch/",
+        BreedingBatchCreateView.as_view(),
+        name="breeding_batch_add",
+    ),
     path("breeding/trash/", BreedingTrashListView.as_view(), name="breeding_trash"),
     path(
         "breeding/<uuid:pk>/delete/",
@@ -6,14 +6,17 @@ from django.shortcuts import redirect, render
 from django.urls import reverse_lazy
 from django.utils.translation import gettext_lazy as _
 from django.views import View
-from django.views.generic import CreateView, ListView
+from django.views.generic import CreateView, FormView, ListView
 
 from apps.base.views.list_mixins import StandardizedListMixin
+from apps.cattle.services.selection_service import SelectionService
+from apps.reproduction.forms import BreedingBatchForm
 from apps.reproduction.models.reproduction import BreedingEvent
 from apps.reproduction.services.reproduction_service import ReproductionService
 
 
 class BreedingListView(StandardizedListMixin, ListView):
+    read_replica = True
     model = BreedingEvent
     template_name = "reproduction/breeding_event_list.html"
     context_object_name = "events"
@@ -76,6 +79,54 @@ class BreedingCreateView(CreateView):
             return self.form_invalid(form)
 
 
+class BreedingBatchCreateView(LoginRequiredMixin, FormView):
+    """Records one breeding service for every eligible dam of a selection."""
+
+    form_class = BreedingBatchForm
+    template_name = "reproduction/breeding_batch_form.html"
+    success_url = reverse_lazy("reproduction:breeding_list")
+
+    def post(self, request, *args, **kwargs):
+        selection = SelectionService.resolve(request)
+
+        if not selection or not selection.size:
+            messages.error(request, _("No cattle selected for breeding."))
+            return redirect("cattle:list")
+
+        # Initial request from the Cattle List carries no form data
+        if request.POST.get("action") != "save_breeding":
+            return self.render_form(self.form_class(), selection)
+
+        form = self.get_form()
+        if not form.is_valid():
+            return self.render_form(form, selection)
+
+        events, skipped = ReproductionService.record_batch_breeding(
+            dams=SelectionService.get_cattle(selection),
+            date=form.cleaned_data["date"],
+            method=form.cleaned_data["breeding_method"],
+            sire=form.cleaned_data["sire"],
+            sire_name=form.cleaned_data["sire_name"],
+            batch=form.cleaned_data["batch"],
+        )
+        messages.success(
+            request,
+            _("Breeding recorded for %(count)s animals.") % {"count": len(events)},
+        )
+        if skipped:
+            message = _(
+                "%(count)s animals were skipped (not Open or Lactating females)."
+            )
+            messages.warning(request, message % {"count": skipped})
+        return redirect(self.success_url)
+
+    def render_form(self, form, selection):
+        context = self.get_context_data(form=form)
+        context["selection"] = selection
+        context["selected_cattle"] = SelectionService.get_cattle(selection)
+        return render(self.request, self.template_name, context)
+
+
 class BreedingTrashListView(LoginRequiredMixin, ListView):
     model = BreedingEvent
     template_name = "reproduction/breeding_event_trash_list.html"
@@ -138,6 +189,7 @@ class BreedingDeleteView(LoginRequiredMixin, View):
         try:
             event = BreedingEvent.objects.get(pk=pk)
             event.delete()
+            ReproductionService.sync_breeding_state([event.dam_id])
             messages.success(request, _("Breeding event deleted."))
         except BreedingEvent.DoesNotExist:
             messages.error(request, _("Breeding event not found."))
@@ -15,6 +15,7 @@ from apps.reproduction.services.reproduction_service import ReproductionService
 
 
 class CalvingListView(LoginRequiredMixin, StandardizedListMixin, ListView):
+    read_replica = True
     model = Calving
     template_name = "reproduction/calving_list.html"
     context_object_name = "calvings"
@@ -18,6 +18,7 @@ PREGNANCY_CHECK_NOT_FOUND_MSG = _("Pregnancy Check not found.")
 
 
 class DiagnosisListView(StandardizedListMixin, ListView):
+    read_replica = True
     model = PregnancyCheck
     template_name = "reproduction/pregnancy_check_list.html"
     context_object_name = "checks"
@@ -91,6 +92,7 @@ class DiagnosisDeleteView(LoginRequiredMixin, View):
         try:
             check = PregnancyCheck.objects.get(pk=pk)
             check.delete()
+            ReproductionService.sync_breeding_state([check.breeding_event.dam_id])
             messages.success(request, _("Pregnancy Check deleted."))
         except ProtectedError as e:
             messages.error(request, str(e))
@@ -4,34 +4,24 @@ from django.utils import timezone
 from django.views.generic import TemplateView
 
 from apps.cattle.models.cattle import Cattle
+from apps.cattle.services.cattle_service import CattleService
 from apps.reproduction.models import BreedingEvent, Calving, ReproductiveSeason
 
 
 class ReproductionOverviewView(LoginRequiredMixin, TemplateView):
+    read_replica = True
     template_name = "reproduction/overview.html"
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
-        # Calculate Stats
-        context["total_females"] = Cattle.objects.filter(
-            sex=Cattle.SEX_FEMALE, status=Cattle.STATUS_AVAILABLE
-        ).count()
-        context["open_cows"] = Cattle.objects.filter(
-            sex=Cattle.SEX_FEMALE,
-            status=Cattle.STATUS_AVAILABLE,
-            reproduction_status=Cattle.REP_STATUS_OPEN,
-        ).count()
-        context["bred_cows"] = Cattle.objects.filter(
-            sex=Cattle.SEX_FEMALE,
-            status=Cattle.STATUS_AVAILABLE,
-            reproduction_status=Cattle.REP_STATUS_BRED,
-        ).count()
-        context["pregnant_cows"] = Cattle.objects.filter(
-            sex=Cattle.SEX_FEMALE,
-            status=Cattle.STATUS_AVAILABLE,
-            reproduction_status=Cattle.REP_STATUS_PREGNANT,
-        ).count()
+        # Calculate Stats (single cached scan of the herd)
+        summary = CattleService.get_herd_summary()
+        reproduction = summary["reproduction_breakdown"]
+        context["total_females"] = summary["total_females"]
+        context["open_cows"] = reproduction[Cattle.REP_STATUS_OPEN]
+        context["bred_cows"] = reproduction[Cattle.REP_STATUS_BRED]
+        context["pregnant_cows"] = reproduction[Cattle.REP_STATUS_PREGNANT]
 
         # Recent Activity
         context["recent_breedings"] = BreedingEvent.objects.order_by("-date")[:5]
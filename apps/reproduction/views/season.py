@@ -13,6 +13,7 @@ from apps.reproduction.services.reproduction_service import ReproductionService
 
 
 class SeasonListView(LoginRequiredMixin, ListView):
+    read_replica = True
     model = ReproductiveSeason
     template_name = "reproduction/season_list.html"
     context_object_name = "seasons"
@@ -4,6 +4,8 @@ from django.core.exceptions import ValidationError
 from django.forms import BaseInlineFormSet, inlineformset_factory
 from django.utils.translation import gettext_lazy as _
 
+from apps.base.utils.reference_data import set_cached_choices
+from apps.cattle.models import Cattle
 from apps.partners.services import PartnerService
 from apps.sales.models import Sale, SaleItem
 from apps.sales.services.sale_service import SaleService
@@ -20,13 +22,15 @@ class SaleForm(forms.ModelForm):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        # Populate partners from service to respect soft-delete rules if needed,
-        # though ModelChoiceField naturally respects the default manager
-        # (usually non-deleted). Ensuring we order them nicely.
-        self.fields["partner"].queryset = PartnerService.get_partners()
+        # Options come from the reference cache; the default manager's
+        # queryset (non-deleted partners) still validates the choice.
+        set_cached_choices(self.fields["partner"], PartnerService.get_partner_choices())
 
 
 class SaleItemForm(forms.ModelForm):
+    # Options come from the in-process ContentType cache
+    ITEM_MODELS = (Cattle,)
+
     # Specialized field for selecting Cattle
     # In a full Generic implementation, this would be more complex.
     # We assume 'cattle' for now.
@@ -56,6 +60,10 @@ class SaleItemForm(forms.ModelForm):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        set_cached_choices(
+            self.fields["content_type"],
+            ContentType.objects.get_for_models(*self.ITEM_MODELS).values(),
+        )
 
         # If bound or instance exists, set initial ContentType and ObjectId
         # Use content_type_id check to avoid RelatedObjectDoesNotExist
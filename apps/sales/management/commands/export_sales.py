@@ -0,0 +1,26 @@
+from apps.base.utils.export import ExportCommand, add_date_range_arguments
+from apps.sales.models import Sale
+from apps.sales.services.sale_service import SaleService
+
+
+class Command(ExportCommand):
+    help = (
+        "Export sales and purchases (one row per transaction item) as CSV or "
+        "JSON Lines."
+    )
+
+    name = "sales"
+    columns = SaleService.EXPORT_COLUMNS
+
+    def add_filter_arguments(self, parser):
+        add_date_range_arguments(parser)
+        parser.add_argument(
+            "--type", choices=[code for code, _label in Sale.TYPE_CHOICES]
+        )
+
+    def get_queryset(self, options):
+        return SaleService.get_export_queryset(
+            date_after=options["date_after"],
+            date_before=options["date_before"],
+            sale_type=options["type"],
+        )
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("sales", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="sale",
+            index=models.Index(
+                fields=["modified_at"], name="sales_sale_modifie_4aeba2_idx"
+            ),
+        ),
+    ]
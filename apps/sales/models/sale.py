@@ -36,6 +36,10 @@ class Sale(BaseModel):
     class Meta(BaseModel.Meta):
         verbose_name = _("Transaction")
         verbose_name_plural = _("Transactions")
+        indexes = [
+            # max(modified_at) of the conditional GET validators
+            models.Index(fields=["modified_at"]),
+        ]
 
     def __str__(self):
         return f"{self.get_type_display()} - {self.partner} - {self.date}"
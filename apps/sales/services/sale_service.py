@@ -1,25 +1,61 @@
 # pylint: disable=duplicate-code
+from datetime import date
+
 from django.core.exceptions import ValidationError
 from django.db import transaction
-from django.db.models import Count, Q, Sum
+from django.db.models import Count, OuterRef, Q, QuerySet, Subquery, Sum
+from django.db.models.functions import Coalesce
 from django.utils.translation import gettext_lazy as _
 
+from apps.base.utils.metrics import timed
+from apps.base.utils.model_cache import memoize
 from apps.base.utils.money import Money
 from apps.cattle.models import Cattle
 from apps.health.services import HealthService
+from apps.locations.models import Location
+from apps.partners.models import Partner
 from apps.sales.models import Sale, SaleItem
 
 
 class SaleService:
+    # One row per transaction item; `item` names the sold object (cattle
+    # tag, location or partner name) without loading the generic relation.
+    EXPORT_COLUMNS = {
+        "transaction": "sale_id",
+        "date": "sale__date",
+        "type": "sale__type",
+        "partner": "sale__partner__name",
+        "item_type": "content_type__model",
+        "item": Coalesce(
+            Subquery(
+                Cattle.all_objects.filter(pk=OuterRef("object_id")).values("tag")[:1]
+            ),
+            Subquery(
+                Location.all_objects.filter(pk=OuterRef("object_id")).values("name")[:1]
+            ),
+            Subquery(
+                Partner.all_objects.filter(pk=OuterRef("object_id")).values("name")[:1]
+            ),
+        ),
+        "quantity": "quantity",
+        "unit_price": "unit_price",
+        "total_price": "total_price",
+        "transaction_total": "sale__total_amount",
+    }
+
     @staticmethod
+    @memoize(Sale, Partner)
     def get_sales_stats() -> dict:
         """
-        Returns statistics about sales.
+        Returns statistics about sales. Cached until a sale or partner
+        changes.
         """
         queryset = Sale.objects.all()
         total_count = queryset.count()
         total_revenue = queryset.aggregate(total=Sum("total_amount"))["total"] or 0
-        recent_sales = queryset.order_by("-date", "-created_at")[:5]
+        recent_sales = list(
+            queryset.select_related("partner").order_by("-date", "-created_at")[:5]
+        )
 
         return {
             "count": total_count,
@@ -50,6 +86,29 @@ class SaleService:
 
         return queryset
 
+    @staticmethod
+    def get_export_queryset(
+        date_after: date | None = None,
+        date_before: date | None = None,
+        sale_type: str | None = None,
+        partner_id: str | None = None,
+    ) -> QuerySet[SaleItem]:
+        """
+        Items of active transactions for the export, oldest first.
+        """
+        queryset = SaleItem.objects.filter(sale__is_deleted=False).order_by(
+            "sale__date", "sale_id", "created_at"
+        )
+        if date_after:
+            queryset = queryset.filter(sale__date__gte=date_after)
+        if date_before:
+            queryset = queryset.filter(sale__date__lte=date_before)
+        if sale_type:
+            queryset = queryset.filter(sale__type=sale_type)
+        if partner_id:
+            queryset = queryset.filter(sale__partner_id=partner_id)
+        return queryset
+
     @staticmethod
     def validate_item_for_sale(item_object):
         """
@@ -113,6 +172,7 @@ class SaleService:
         sale.save()
 
     @staticmethod
+    @timed
     @transaction.atomic
     def create_sale_from_forms(form, formset) -> Sale:
         """
@@ -11,6 +11,7 @@ urlpatterns = [
     path("<uuid:pk>/", views.SaleDetailView.as_view(), name="detail"),
     path("<uuid:pk>/edit/", views.SaleUpdateView.as_view(), name="update"),
     path("<uuid:pk>/delete/", views.SaleDeleteView.as_view(), name="delete"),
+    path("export/", views.SaleExportView.as_view(), name="export"),
     path("trash/", views.SaleTrashView.as_view(), name="trash"),
     path("<uuid:pk>/restore/", views.SaleRestoreView.as_view(), name="restore"),
     path(
@@ -3,6 +3,7 @@ from .sale import (
     SaleCreateView,
     SaleDeleteView,
     SaleDetailView,
+    SaleExportView,
     SaleHardDeleteView,
     SaleListView,
     SaleRestoreView,
@@ -20,4 +21,5 @@ __all__ = [
     "SaleHardDeleteView",
     "ItemLookupView",
     "SaleDetailView",
+    "SaleExportView",
 ]
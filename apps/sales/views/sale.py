@@ -12,18 +12,29 @@ from django.views.generic import (
     UpdateView,
 )
 
-from apps.base.views.list_mixins import StandardizedListMixin
-from apps.partners.models.partner import Partner
+from apps.base.views.conditional import ConditionalGetMixin, generic_object_querysets
+from apps.base.views.export import ExportView
+from apps.base.views.list_mixins import PartialListMixin, StandardizedListMixin
+from apps.partners.models import Partner
+from apps.partners.services import PartnerService
 from apps.sales.forms import SaleForm, SaleItemFormSet
-from apps.sales.models import Sale
+from apps.sales.models import Sale, SaleItem
 from apps.sales.services.sale_service import SaleService
 
 SALE_LIST_URL = "sales:list"
 
 
-class SaleListView(LoginRequiredMixin, StandardizedListMixin, ListView):
+class SaleListView(
+    LoginRequiredMixin,
+    ConditionalGetMixin,
+    StandardizedListMixin,
+    PartialListMixin,
+    ListView,
+):
+    read_replica = True
     model = Sale
     template_name = "sales/sale_list.html"
+    partial_template_name = "sales/partials/sale_list_results.html"
     context_object_name = "sales"
     ordering = ["-date"]
     paginate_by = 10
@@ -48,10 +59,15 @@ class SaleListView(LoginRequiredMixin, StandardizedListMixin, ListView):
         # We need to ensure mixin's get_context_data is called or we call it and add our extras.
         # StandardizedListMixin.get_context_data calls super().
 
-        context["partners"] = Partner.objects.filter(is_customer=True)
-
         return context
 
+    def get_validator_models(self):
+        # Rows and the partner filter show partners by name
+        return [Partner]
+
+    def get_reference_data(self):
+        return {"partners": PartnerService.get_customer_choices()}
+
 
 class SaleCreateView(LoginRequiredMixin, CreateView):
     model = Sale
@@ -123,11 +139,22 @@ class SaleUpdateView(LoginRequiredMixin, UpdateView):
         return self.form_invalid(form)
 
 
-class SaleDetailView(LoginRequiredMixin, DetailView):
+class SaleDetailView(LoginRequiredMixin, ConditionalGetMixin, DetailView):
     model = Sale
     template_name = "sales/sale_detail.html"
     context_object_name = "sale"
 
+    def get_validator_querysets(self):
+        pk = self.kwargs["pk"]
+        items = SaleItem.objects.filter(sale=pk)
+        # The page shows the partner's name and each item's object
+        return [
+            Sale.objects.filter(pk=pk),
+            items,
+            Partner.all_objects.filter(sales=pk),
+            *generic_object_querysets(items),
+        ]
+
 
 class SaleDeleteView(LoginRequiredMixin, DeleteView):
     model = Sale
@@ -182,3 +209,18 @@ class SaleHardDeleteView(LoginRequiredMixin, DeleteView):
         SaleService.hard_delete_sale(self.object)
         messages.success(self.request, _("Sale permanently deleted."))
         return HttpResponseRedirect(self.success_url)
+
+
+class SaleExportView(LoginRequiredMixin, ExportView):
+    """Exports one row per transaction item."""
+
+    export_name = "sales"
+    columns = SaleService.EXPORT_COLUMNS
+
+    def get_queryset(self):
+        return SaleService.get_export_queryset(
+            date_after=self.get_date("date_after"),
+            date_before=self.get_date("date_before"),
+            sale_type=self.request.GET.get("type"),
+            partner_id=self.get_uuid("partner"),
+        )
@@ -1,10 +1,17 @@
 from django import forms
 from django.contrib.contenttypes.models import ContentType
 
+from apps.base.utils.reference_data import set_cached_choices
+from apps.cattle.models import Cattle
+from apps.locations.models import Location
+from apps.partners.models import Partner
 from apps.tasks.models import Task
 
 
 class TaskForm(forms.ModelForm):
+    # Options come from the in-process ContentType cache
+    LINKABLE_MODELS = (Cattle, Location, Partner)
+
     # Field to select the ContentType (e.g. 'cattle')
     content_type = forms.ModelChoiceField(
         queryset=ContentType.objects.filter(
@@ -32,6 +39,13 @@ class TaskForm(forms.ModelForm):
             "due_date": forms.DateInput(attrs={"type": "date"}),
         }
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        set_cached_choices(
+            self.fields["content_type"],
+            ContentType.objects.get_for_models(*self.LINKABLE_MODELS).values(),
+        )
+
     def clean_object_id(self):
         # Convert empty string to None for NULLable UUIDField
         data = self.cleaned_data["object_id"]
@@ -0,0 +1,15 @@
+import apps.base.utils.partitioning
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0001_initial"),
+    ]
+
+    operations = [
+        apps.base.utils.partitioning.PartitionByYear(
+            model_name="task", column="due_date"
+        ),
+    ]
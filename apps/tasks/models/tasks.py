@@ -48,6 +48,7 @@ class Task(BaseModel):
 
     title = models.CharField(_("Title"), max_length=200)
     description = models.TextField(_("Description"), blank=True)
+    # The table is partitioned by year of it (see apps.base.utils.partitioning)
     due_date = models.DateField(_("Due Date"))
 
     priority = models.CharField(
@@ -101,6 +102,8 @@ class Task(BaseModel):
         indexes = [
             models.Index(fields=["due_date", "status"]),
             models.Index(fields=["content_type", "object_id"]),
+            # max(modified_at) of the conditional GET validators
+            models.Index(fields=["modified_at"]),
         ]
 
     def __str__(self):
@@ -200,4 +200,4 @@ class TaskService:
         """
         Return a queryset of soft-deleted tasks.
         """
-        return Task.all_objects.filter(is_deleted=True)
+        return Task.all_objects.filter(is_deleted=True).order_by("-modified_at")
@@ -11,6 +11,9 @@ from django.views.generic import (
     UpdateView,
 )
 
+from apps.authentication.models import User
+from apps.base.views.conditional import ConditionalGetMixin, generic_object_querysets
+from apps.base.views.list_mixins import PartialListMixin
 from apps.base.views.mixins import HandleProtectedErrorMixin
 from apps.tasks.forms import TaskForm
 from apps.tasks.models import Task
@@ -28,9 +31,11 @@ class TaskCalendarView(LoginRequiredMixin, ListView):
         return context
 
 
-class TaskListView(LoginRequiredMixin, ListView):
+class TaskListView(LoginRequiredMixin, ConditionalGetMixin, PartialListMixin, ListView):
+    read_replica = True
     model = Task
     template_name = "tasks/task_list.html"
+    partial_template_name = "tasks/partials/task_list_results.html"
     context_object_name = "tasks"
     paginate_by = 20
 
@@ -53,18 +58,32 @@ class TaskListView(LoginRequiredMixin, ListView):
         context["search_query"] = self.request.GET.get("q", "")
         context["selected_status"] = self.request.GET.get("status", "")
         context["selected_priority"] = self.request.GET.get("priority", "")
-        context["status_choices"] = Task.Status.choices
-        context["priority_choices"] = Task.Priority.choices
         return context
 
+    def get_reference_data(self):
+        return {
+            "status_choices": Task.Status.choices,
+            "priority_choices": Task.Priority.choices,
+        }
 
-class TaskDetailView(LoginRequiredMixin, DetailView):
+
+class TaskDetailView(LoginRequiredMixin, ConditionalGetMixin, DetailView):
     model = Task
     template_name = "tasks/task_detail.html"
 
     def get_queryset(self):
         return super().get_queryset().select_related("content_type", "assigned_to")
 
+    def get_validator_querysets(self):
+        pk = self.kwargs["pk"]
+        task = Task.objects.filter(pk=pk)
+        # The page shows the assignee's name and the linked object
+        return [
+            task,
+            User.all_objects.filter(tasks=pk),
+            *generic_object_querysets(task),
+        ]
+
 
 class TaskCreateView(LoginRequiredMixin, CreateView):
     model = Task
@@ -18,6 +18,7 @@ class TaskTrashListView(LoginRequiredMixin, ListView):
     model = Task
     template_name = "tasks/task_trash_list.html"
     context_object_name = "tasks"
+    paginate_by = 10
 
     def get_queryset(self):
         return TaskService.get_deleted_tasks()
@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+from django.utils.translation import gettext_lazy as _
+
+
+class TrashConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.trash"
+    label = "trash"
+    verbose_name = _("Trash")
@@ -0,0 +1,3 @@
+from .trash_service import TRASH_REGISTRY, TrashService
+
+__all__ = ["TrashService", "TRASH_REGISTRY"]
@@ -0,0 +1,367 @@
+import base64
+import uuid
+from datetime import datetime
+from typing import Iterable, Optional
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import CharField, F, ProtectedError, Q, QuerySet, Value
+from django.db.models.functions import Cast
+from django.utils.translation import gettext_lazy as _
+
+from apps.cattle.models import Cattle
+from apps.health.models import Medication, SanitaryEvent
+from apps.health.services import HealthService
+from apps.locations.models import Location
+from apps.nutrition.models import Diet, FeedIngredient
+from apps.partners.models import Partner
+from apps.purchases.models import Purchase, PurchaseItem
+from apps.reproduction.models import (
+    BreedingEvent,
+    Calving,
+    PregnancyCheck,
+    ReproductiveSeason,
+)
+from apps.reproduction.services.reproduction_service import ReproductionService
+from apps.sales.models import Sale, SaleItem
+from apps.tasks.models import Task
+from apps.weight.models import WeighingSession
+
+# Soft-deletable models exposed in the unified trash.
+# "label" is the ORM expression used to describe a row in the index.
+# "animal" (the path to the animals a row concerns) and "sync" (which
+# recomputes their denormalized state) are set for the kinds that feed the
+# per-animal state columns of Cattle.
+TRASH_REGISTRY = {
+    "cattle": {"model": Cattle, "label": "tag", "verbose_name": _("Cattle")},
+    "task": {"model": Task, "label": "title", "verbose_name": _("Task")},
+    "sanitary_event": {
+        "model": SanitaryEvent,
+        "label": "title",
+        "verbose_name": _("Sanitary Event"),
+        "animal": "targets__animal",
+        "sync": HealthService.sync_treatment_state,
+    },
+    "medication": {
+        "model": Medication,
+        "label": "name",
+        "verbose_name": _("Medication"),
+    },
+    "season": {
+        "model": ReproductiveSeason,
+        "label": "name",
+        "verbose_name": _("Reproductive Season"),
+    },
+    "breeding": {
+        "model": BreedingEvent,
+        "label": "dam__tag",
+        "verbose_name": _("Breeding Event"),
+        "animal": "dam",
+        "sync": ReproductionService.sync_breeding_state,
+    },
+    "diagnosis": {
+        "model": PregnancyCheck,
+        "label": "breeding_event__dam__tag",
+        "verbose_name": _("Pregnancy Check"),
+        "animal": "breeding_event__dam",
+        "sync": ReproductionService.sync_breeding_state,
+    },
+    "calving": {"model": Calving, "label": "dam__tag", "verbose_name": _("Calving")},
+    "sale": {"model": Sale, "label": "partner__name", "verbose_name": _("Sale")},
+    "purchase": {
+        "model": Purchase,
+        "label": "partner__name",
+        "verbose_name": _("Purchase"),
+    },
+    "partner": {"model": Partner, "label": "name", "verbose_name": _("Partner")},
+    "diet": {"model": Diet, "label": "name", "verbose_name": _("Diet")},
+    "ingredient": {
+        "model": FeedIngredient,
+        "label": "name",
+        "verbose_name": _("Feed Ingredient"),
+    },
+    "location": {"model": Location, "label": "name", "verbose_name": _("Location")},
+    "weighing_session": {
+        "model": WeighingSession,
+        "label": "name",
+        "verbose_name": _("Weighing Session"),
+    },
+}
+
+
+class TrashService:
+    DEFAULT_PAGE_SIZE = 25
+
+    @staticmethod
+    def encode_cursor(modified_at: datetime, pk) -> str:
+        """Encodes a (modified_at, pk) keyset position as an URL-safe token."""
+        raw = f"{modified_at.isoformat()}|{pk}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+        """
+        Decodes a cursor produced by encode_cursor.
+        Raises ValueError if the token is malformed.
+        """
+        try:
+            raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+            timestamp, pk = raw.split("|", 1)
+            return datetime.fromisoformat(timestamp), uuid.UUID(pk)
+        except (ValueError, UnicodeDecodeError) as e:
+            raise ValueError("Invalid trash cursor.") from e
+
+    @staticmethod
+    def _branch(kind: str, cursor: Optional[tuple], limit: int) -> QuerySet:
+        """
+        Builds the per-model SELECT of the UNION ALL.
+        Each branch is ordered and limited on its own so Postgres only reads
+        the top rows of every table.
+        """
+        entry = TRASH_REGISTRY[kind]
+        queryset = entry["model"].all_objects.filter(is_deleted=True)
+
+        if cursor:
+            modified_at, pk = cursor
+            queryset = queryset.filter(
+                Q(modified_at__lt=modified_at) | Q(modified_at=modified_at, pk__lt=pk)
+            )
+
+        return (
+            queryset.annotate(
+                kind=Value(kind, output_field=CharField()),
+                label=Cast(F(entry["label"]), output_field=CharField()),
+            )
+            .values("uuid", "modified_at", "kind", "label")
+            .order_by("-modified_at", "-uuid")[:limit]
+        )
+
+    @staticmethod
+    def get_page(
+        kinds: Optional[Iterable[str]] = None,
+        cursor: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> dict:
+        """
+        Returns one page of deleted objects across all registered models,
+        newest deletion first, using a single UNION ALL keyset query.
+
+        Returns:
+            dict: {"items": list of dicts, "next_cursor": str | None}
+        """
+        selected = [k for k in kinds or TRASH_REGISTRY if k in TRASH_REGISTRY]
+        if not selected:
+            return {"items": [], "next_cursor": None}
+
+        position = TrashService.decode_cursor(cursor) if cursor else None
+        limit = page_size + 1
+
+        branches = [TrashService._branch(k, position, limit) for k in selected]
+        queryset = branches[0]
+        if len(branches) > 1:
+            queryset = (
+                branches[0]
+                .union(*branches[1:], all=True)
+                .order_by("-modified_at", "-uuid")[:limit]
+            )
+
+        rows = list(queryset)
+        next_cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            last = rows[-1]
+            next_cursor = TrashService.encode_cursor(last["modified_at"], last["uuid"])
+
+        for row in rows:
+            row["kind_display"] = TRASH_REGISTRY[row["kind"]]["verbose_name"]
+
+        return {"items": rows, "next_cursor": next_cursor}
+
+    @staticmethod
+    def group_selection(tokens: Iterable[str]) -> dict[str, list[str]]:
+        """
+        Groups "kind:pk" tokens posted by the trash index per model kind.
+        Unknown kinds and malformed pks are ignored.
+        """
+        grouped: dict[str, list[str]] = {}
+        for token in tokens:
+            kind, _sep, pk = token.partition(":")
+            if kind not in TRASH_REGISTRY:
+                continue
+            try:
+                grouped.setdefault(kind, []).append(str(uuid.UUID(pk)))
+            except ValueError:
+                continue
+        return grouped
+
+    @staticmethod
+    def _restore_conflicts(kind: str, queryset: QuerySet) -> QuerySet:
+        """
+        Drops rows that cannot be restored without breaking a constraint.
+        Cattle tags must stay unique among active animals.
+        """
+        if kind == "cattle":
+            queryset = queryset.exclude(tag__in=Cattle.objects.values("tag"))
+        return queryset
+
+    @staticmethod
+    def _blocked_pks(kind: str, pks: list) -> set:
+        """
+        Set-based counterpart of BaseModel._check_dependencies:
+        returns the pks that are still referenced by active related rows.
+        """
+        model = TRASH_REGISTRY[kind]["model"]
+        ignored = getattr(model, "strict_deletion_ignore_fields", [])
+        blocked: set = set()
+
+        for rel in model._meta.get_fields(include_hidden=True):
+            if not (
+                (rel.one_to_many or rel.one_to_one)
+                and rel.auto_created
+                and not rel.concrete
+            ):
+                continue
+
+            accessor = rel.get_accessor_name()  # type: ignore[union-attr]
+            if not accessor or accessor in ignored:
+                continue
+
+            field = rel.field  # type: ignore[union-attr]
+            blocked.update(
+                rel.related_model._default_manager.filter(
+                    **{f"{field.name}__in": pks}
+                ).values_list(field.attname, flat=True)
+            )
+
+        if kind == "cattle":
+            # Mirrors Cattle.delete: linked transaction items protect the animal.
+            ct = ContentType.objects.get_for_model(Cattle)
+            for item_model in (SaleItem, PurchaseItem):
+                blocked.update(
+                    item_model.objects.filter(
+                        content_type=ct, object_id__in=pks
+                    ).values_list("object_id", flat=True)
+                )
+
+        return blocked
+
+    @staticmethod
+    def _affected_animals(kind: str, queryset: QuerySet) -> list:
+        """
+        Ids of the animals whose denormalized state depends on the rows of
+        `queryset`; read before the rows are restored or deleted.
+        """
+        path = TRASH_REGISTRY[kind].get("animal")
+        if not path:
+            return []
+        return list(
+            queryset.filter(**{f"{path}__isnull": False})
+            .values_list(path, flat=True)
+            .distinct()
+        )
+
+    @staticmethod
+    def _sync_animals(kind: str, animal_ids: list) -> None:
+        if animal_ids:
+            TRASH_REGISTRY[kind]["sync"](animal_ids)
+
+    @staticmethod
+    @transaction.atomic
+    def bulk_restore(selection: dict[str, list[str]]) -> dict:
+        """
+        Restores the selected objects with one UPDATE per model kind, then
+        recomputes the state columns of the animals they concern.
+
+        Returns:
+            dict: {"restored": int, "skipped": int}
+        """
+        restored = 0
+        requested = 0
+
+        for kind, pks in selection.items():
+            requested += len(pks)
+            queryset = TRASH_REGISTRY[kind]["model"].all_objects.filter(
+                pk__in=pks, is_deleted=True
+            )
+            queryset = TrashService._restore_conflicts(kind, queryset)
+
+            if kind == "cattle":
+                # Two deleted animals sharing a tag cannot both come back.
+                seen_tags: set = set()
+                restorable = []
+                for pk, tag in queryset.values_list("pk", "tag"):
+                    if tag not in seen_tags:
+                        seen_tags.add(tag)
+                        restorable.append(pk)
+                queryset = Cattle.all_objects.filter(pk__in=restorable)
+
+            animal_ids = TrashService._affected_animals(kind, queryset)
+            restored += queryset.restore()
+            TrashService._sync_animals(kind, animal_ids)
+
+        return {"restored": restored, "skipped": requested - restored}
+
+    @staticmethod
+    def _purge(kind: str, queryset: QuerySet) -> int:
+        """Deletes `queryset` in one savepoint and re-syncs its animals."""
+        model = TRASH_REGISTRY[kind]["model"]
+        with transaction.atomic():
+            animal_ids = TrashService._affected_animals(kind, queryset)
+            _total, per_model = queryset.delete(destroy=True)
+            TrashService._sync_animals(kind, animal_ids)
+        return per_model.get(model._meta.label, 0)
+
+    @staticmethod
+    def _describe(kind: str, pks: Iterable) -> list[str]:
+        """ "Kind: label" of each trashed row in `pks`, for messages."""
+        entry = TRASH_REGISTRY[kind]
+        labels = entry["model"].all_objects.filter(pk__in=pks, is_deleted=True)
+        return [
+            f"{entry['verbose_name']}: {label}"
+            for label in labels.values_list(entry["label"], flat=True)
+        ]
+
+    @staticmethod
+    def bulk_purge(selection: dict[str, list[str]]) -> dict:
+        """
+        Permanently deletes the selected objects, one DELETE per model kind.
+        Objects still referenced by active records are skipped, matching the
+        strict deletion rules of the single-object views. If a kind hits a
+        protected reference anyway (e.g. from a trashed row), its rows are
+        deleted one by one so only the protected ones stay. The state
+        columns of the animals they concerned are recomputed.
+
+        Returns:
+            dict: {"purged": int, "skipped": int, "blocked": list[str]},
+            where "blocked" describes the trashed rows kept for a reference.
+        """
+        purged = 0
+        requested = 0
+        blocked_items: list[str] = []
+
+        for kind, pks in selection.items():
+            requested += len(pks)
+            model = TRASH_REGISTRY[kind]["model"]
+            blocked = TrashService._blocked_pks(kind, pks)
+            queryset = model.all_objects.filter(pk__in=pks, is_deleted=True).exclude(
+                pk__in=blocked
+            )
+
+            try:
+                purged += TrashService._purge(kind, queryset)
+            except ProtectedError:
+                for pk in queryset.values_list("pk", flat=True):
+                    try:
+                        purged += TrashService._purge(
+                            kind, model.all_objects.filter(pk=pk)
+                        )
+                    except ProtectedError:
+                        blocked.add(pk)
+
+            blocked_items += TrashService._describe(kind, blocked)
+
+        return {
+            "purged": purged,
+            "skipped": requested - purged,
+            "blocked": blocked_items,
+        }
@@ -0,0 +1,10 @@
+from django.urls import path
+
+from apps.trash import views
+
+app_name = "trash"
+
+urlpatterns = [
+    path("", views.TrashListView.as_view(), name="list"),
+    path("bulk/", views.TrashBulkActionView.as_view(), name="bulk-action"),
+]
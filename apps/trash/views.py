@@ -0,0 +1,84 @@
+from django.contrib import messages
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.shortcuts import redirect
+from django.utils.translation import gettext as _
+from django.views import View
+from django.views.generic import TemplateView
+
+from apps.trash.services import TRASH_REGISTRY, TrashService
+
+
+class TrashListView(LoginRequiredMixin, TemplateView):
+    """
+    Unified trash index over every soft-deletable model, keyset paginated.
+    """
+
+    template_name = "trash/trash_list.html"
+    page_size = TrashService.DEFAULT_PAGE_SIZE
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        kinds = [kind for kind in self.request.GET.getlist("kind") if kind]
+        cursor = self.request.GET.get("after")
+
+        try:
+            page = TrashService.get_page(
+                kinds=kinds or None, cursor=cursor, page_size=self.page_size
+            )
+        except ValueError:
+            # Stale or tampered cursor: start over from the newest deletion.
+            cursor = None
+            page = TrashService.get_page(kinds=kinds or None, page_size=self.page_size)
+
+        context["items"] = page["items"]
+        context["next_cursor"] = page["next_cursor"]
+        context["is_first_page"] = not cursor
+        context["selected_kinds"] = kinds
+        context["kind_choices"] = [
+            (kind, entry["verbose_name"]) for kind, entry in TRASH_REGISTRY.items()
+        ]
+        return context
+
+
+class TrashBulkActionView(LoginRequiredMixin, View):
+    """
+    Restores or permanently deletes the selected trash rows in bulk.
+    """
+
+    def post(self, request):
+        selection = TrashService.group_selection(request.POST.getlist("items"))
+        action = request.POST.get("action")
+
+        if not selection:
+            messages.error(request, _("No items selected."))
+            return redirect("trash:list")
+
+        if action == "restore":
+            result = TrashService.bulk_restore(selection)
+            messages.success(
+                request,
+                _("%(count)d item(s) restored.") % {"count": result["restored"]},
+            )
+        elif action == "purge":
+            result = TrashService.bulk_purge(selection)
+            message = _("%(count)d item(s) permanently deleted.")
+            messages.success(request, message % {"count": result["purged"]})
+            if result["blocked"]:
+                message = _("Still referenced, kept in the trash: %(items)s")
+                items = ", ".join(result["blocked"])
+                messages.warning(request, message % {"items": items})
+        else:
+            messages.error(request, _("Invalid action."))
+            return redirect("trash:list")
+
+        if result["skipped"]:
+            messages.warning(
+                request,
+                _(
+                    "%(count)d item(s) were skipped because they conflict with "
+                    "active records or are still referenced."
+                )
+                % {"count": result["skipped"]},
+            )
+
+        return redirect("trash:list")
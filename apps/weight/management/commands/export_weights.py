@@ -0,0 +1,21 @@
+from apps.base.utils.export import ExportCommand, add_date_range_arguments
+from apps.weight.models import WeighingSessionType
+from apps.weight.services import WeightService
+
+
+class Command(ExportCommand):
+    help = "Export weight history (one row per weighing) as CSV or JSON Lines."
+
+    name = "weights"
+    columns = WeightService.EXPORT_COLUMNS
+
+    def add_filter_arguments(self, parser):
+        add_date_range_arguments(parser)
+        parser.add_argument("--type", choices=WeighingSessionType.values)
+
+    def get_queryset(self, options):
+        return WeightService.get_export_queryset(
+            date_after=options["date_after"],
+            date_before=options["date_before"],
+            session_type=options["type"],
+        )
@@ -0,0 +1,23 @@
+from django.db import migrations
+
+CREATE_TRIGGER = """
+CREATE TRIGGER weight_weightrecord_notify_session
+AFTER INSERT OR UPDATE OR DELETE ON weight_weightrecord
+FOR EACH ROW EXECUTE FUNCTION cnv_notify_parent('session_id', 'weighingsession_');
+"""
+
+DROP_TRIGGER = (
+    "DROP TRIGGER IF EXISTS weight_weightrecord_notify_session ON weight_weightrecord;"
+)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("base", "0002_notify_progress_function"),
+        ("weight", "0002_alter_weighingsession_performed_by"),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_TRIGGER, DROP_TRIGGER),
+    ]
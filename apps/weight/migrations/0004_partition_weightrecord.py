@@ -0,0 +1,62 @@
+import apps.base.models.fields
+import apps.base.utils.partitioning
+from django.db import migrations, models
+
+COPY_DATES = """
+UPDATE weight_weightrecord SET session_date = header.date
+FROM weight_weighingsession header WHERE header.uuid = weight_weightrecord.session_id;
+"""
+
+CREATE_TRIGGER = """
+CREATE TRIGGER weight_weighingsession_copy_date
+AFTER UPDATE OF date ON weight_weighingsession
+FOR EACH ROW WHEN (OLD.date IS DISTINCT FROM NEW.date)
+EXECUTE FUNCTION cnv_copy_header_date('weight_weightrecord', 'session_id', 'session_date');
+"""
+
+DROP_TRIGGER = (
+    "DROP TRIGGER IF EXISTS weight_weighingsession_copy_date ON weight_weighingsession;"
+)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("base", "0003_copy_header_date_function"),
+        ("weight", "0003_weightrecord_notify_session"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="weightrecord",
+            name="session_date",
+            field=apps.base.models.fields.HeaderDateField(
+                header="session", null=True, verbose_name="Session date"
+            ),
+        ),
+        migrations.RunSQL(COPY_DATES, migrations.RunSQL.noop),
+        migrations.AlterField(
+            model_name="weightrecord",
+            name="session_date",
+            field=apps.base.models.fields.HeaderDateField(
+                header="session", verbose_name="Session date"
+            ),
+        ),
+        # Unique indexes of a partitioned table must include its key
+        migrations.RemoveConstraint(
+            model_name="weightrecord",
+            name="unique_animal_per_session",
+        ),
+        apps.base.utils.partitioning.PartitionByYear(
+            model_name="weightrecord", column="session_date"
+        ),
+        migrations.AddConstraint(
+            model_name="weightrecord",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("is_deleted", False)),
+                fields=("session", "animal", "session_date"),
+                name="unique_animal_per_session",
+            ),
+        ),
+        migrations.RunSQL(CREATE_TRIGGER, DROP_TRIGGER),
+    ]
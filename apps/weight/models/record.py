@@ -2,6 +2,7 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 from apps.base.models.base_model import BaseModel
+from apps.base.models.fields import HeaderDateField
 from apps.cattle.models.cattle import Cattle
 from apps.weight.models.session import WeighingSession
 
@@ -17,6 +18,8 @@ class WeightRecord(BaseModel):
         related_name="records",
         verbose_name=_("Session"),
     )
+    # The table is partitioned by year of it (see apps.base.utils.partitioning)
+    session_date = HeaderDateField(_("Session date"), header="session")
     animal = models.ForeignKey(
         Cattle,
         on_delete=models.CASCADE,
@@ -45,7 +48,8 @@ class WeightRecord(BaseModel):
         ordering = ["animal__tag"]
         constraints = [
             models.UniqueConstraint(
-                fields=["session", "animal"],
+                # With the partition key, as Postgres requires
+                fields=["session", "animal", "session_date"],
                 name="unique_animal_per_session",
                 condition=models.Q(is_deleted=False),
             )
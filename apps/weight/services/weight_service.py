@@ -1,18 +1,39 @@
-from datetime import timedelta
+from datetime import date, timedelta
 from decimal import Decimal
-from typing import Optional
+from typing import Iterable, Optional, Union
 
 from django.db import transaction
-from django.db.models import Avg, QuerySet
+from django.db.models import Avg, Count, QuerySet
+from django.db.models.functions import Round
 from django.utils import timezone
 
+from apps.base.utils import archive, model_cache
+from apps.base.utils.metrics import timed
+from apps.base.utils.model_cache import memoize
 from apps.cattle.models import Cattle
 from apps.weight.models import WeighingSession, WeightRecord
 
 
 class WeightService:
+    EXPORT_COLUMNS = {
+        "date": "session__date",
+        "session": "session__name",
+        "session_type": "session__session_type",
+        "tag": "animal__tag",
+        "weight_kg": "weight_kg",
+        "adg": "adg",
+        "days_since_prev_weight": "days_since_prev_weight",
+    }
+
+    # Running figures of a session's live records
+    SESSION_SUMMARY = {
+        "count": Count("pk"),
+        "avg_weight": Round(Avg("weight_kg"), 1),
+        "avg_adg": Round(Avg("adg"), 3),
+    }
+
     @staticmethod
-    @transaction.atomic
+    @timed
     def record_weight(
         session: WeighingSession, animal: Cattle, weight_kg: Decimal
     ) -> WeightRecord:
@@ -28,59 +49,138 @@ class WeightService:
         Returns:
             The created WeightRecord.
         """
-        # 1. Fetch Previous Record
-        # Find the most recent record strictly before this session's date
-        previous_record = (
-            WeightRecord.objects.filter(animal=animal, session__date__lt=session.date)
-            .select_related("session")
-            .order_by("-session__date")
-            .first()
-        )
+        return WeightService.record_weights(session, [(animal, weight_kg)])[0]
 
-        # 2. Calculate ADG
-        adg: Optional[Decimal] = None
-        days_diff: Optional[int] = None
-
-        if previous_record:
-            days_diff = (session.date - previous_record.session.date).days
-            if days_diff > 0:
-                weight_diff = weight_kg - previous_record.weight_kg
-                # Calculate ADG: Kg gained / Days elapsed
-                # Result is Kg/Day
-                adg = weight_diff / Decimal(days_diff)
-
-        # 3. Save Record
-        # Update or create to allow re-weighing in same session (correction)
-        record, _ = WeightRecord.objects.update_or_create(
-            session=session,
-            animal=animal,
-            defaults={
-                "weight_kg": weight_kg,
-                "adg": adg,
-                "days_since_prev_weight": days_diff,
-            },
-        )
+    @staticmethod
+    @timed
+    @transaction.atomic
+    def record_weights(
+        session: WeighingSession, weights: Iterable[tuple[Cattle, Decimal]]
+    ) -> list[WeightRecord]:
+        """
+        Records the weights of a batch of animals in one session with a
+        fixed number of queries, whatever the batch size: one lookup of the
+        previous weighings, one of the records already in the session, then
+        bulk writes for the records and the animals' inventory columns.
+
+        Returns the records in the order of `weights`.
+        """
+        weights = list(weights)
+        animal_ids = [animal.pk for animal, _weight in weights]
+
+        # 1. Fetch Previous Records
+        # The most recent record of each animal strictly before this
+        # session's date (DISTINCT ON keeps the first row per animal)
+        previous = {
+            animal_id: (weight_kg, weighed_on)
+            for animal_id, weight_kg, weighed_on in (
+                WeightRecord.objects.filter(
+                    animal_id__in=animal_ids, session_date__lt=session.date
+                )
+                .order_by("animal_id", "-session_date")
+                .distinct("animal_id")
+                .values_list("animal_id", "weight_kg", "session_date")
+            )
+        }
+        existing = {
+            record.animal_id: record
+            for record in WeightRecord.objects.filter(
+                session=session, animal_id__in=animal_ids
+            )
+        }
 
-        # 4. Update Cattle Inventory
-        # We only update the inventory if this is the *latest* weighing.
-        # This allows inserting historical records without messing up current state.
-        if not animal.last_weighing_date or session.date >= animal.last_weighing_date:
-            animal.current_weight = weight_kg
-            animal.last_weighing_date = session.date
-            animal.save(update_fields=["current_weight", "last_weighing_date"])
+        records, to_create, to_update, weighed = [], [], [], []
+        for animal, weight_kg in weights:
+            # 2. Calculate ADG: Kg gained / Days elapsed
+            adg: Optional[Decimal] = None
+            days_diff: Optional[int] = None
+            if animal.pk in previous:
+                previous_weight, previous_date = previous[animal.pk]
+                days_diff = (session.date - previous_date).days
+                if days_diff > 0:
+                    adg = (weight_kg - previous_weight) / Decimal(days_diff)
 
-        return record
+            # 3. Record, correcting a re-weighing in the same session
+            record = existing.get(animal.pk)
+            if record is None:
+                record = WeightRecord(session=session, animal=animal)
+                to_create.append(record)
+            else:
+                to_update.append(record)
+            record.weight_kg = weight_kg
+            record.adg = adg
+            record.days_since_prev_weight = days_diff
+            records.append(record)
+
+            # 4. Update Cattle Inventory
+            # We only update the inventory if this is the *latest* weighing.
+            # This allows inserting historical records without messing up
+            # current state.
+            if (
+                not animal.last_weighing_date
+                or session.date >= animal.last_weighing_date
+            ):
+                animal.current_weight = weight_kg
+                animal.last_weighing_date = session.date
+                weighed.append(animal)
+
+        if to_create:
+            WeightRecord.objects.bulk_create(to_create)
+            # bulk_create sends no post_save (bulk_update bumps through update())
+            model_cache.bump(WeightRecord)
+        WeightRecord.objects.bulk_update(
+            to_update, ["weight_kg", "adg", "days_since_prev_weight"]
+        )
+        Cattle.objects.bulk_update(weighed, ["current_weight", "last_weighing_date"])
+        return records
 
     @staticmethod
-    def get_animal_weight_history(animal: Cattle) -> QuerySet[WeightRecord]:
+    def get_session_summary(session: WeighingSession) -> dict:
+        """Head count, average weight and average ADG of a session."""
+        return WeightRecord.objects.filter(session=session).aggregate(
+            **WeightService.SESSION_SUMMARY
+        )
+
+    @staticmethod
+    def get_animal_weight_history(
+        animal: Cattle, include_archived: bool = False
+    ) -> Union[QuerySet[WeightRecord], list[WeightRecord]]:
         """
         Returns the weight history for a specific animal, ordered by date.
+        With include_archived, the full history as a list, records moved
+        to the archive (flagged `archived`) included.
         """
-        return (
+        records = (
             WeightRecord.objects.filter(animal=animal)
             .select_related("session")
             .order_by("session__date")
         )
+        if not include_archived:
+            return records
+        return sorted(
+            archive.animal_history(WeightRecord, "session", animal) + list(records),
+            key=lambda record: record.session.date,
+        )
+
+    @staticmethod
+    def get_export_queryset(
+        date_after: Optional[date] = None,
+        date_before: Optional[date] = None,
+        session_type: Optional[str] = None,
+    ) -> QuerySet[WeightRecord]:
+        """
+        Weight records of active sessions for the export, oldest first.
+        """
+        queryset = WeightRecord.objects.filter(session__is_deleted=False).order_by(
+            "session__date", "session_id", "animal__tag"
+        )
+        if date_after:
+            queryset = queryset.filter(session_date__gte=date_after)
+        if date_before:
+            queryset = queryset.filter(session_date__lte=date_before)
+        if session_type:
+            queryset = queryset.filter(session__session_type=session_type)
+        return queryset
 
     @staticmethod
     def get_herd_adg_stats(days: int = 90) -> dict:
@@ -88,11 +188,16 @@ class WeightService:
         Calculates the average ADG for the herd based on weighings in the last 'days'.
         """
         cutoff_date = timezone.now().date() - timedelta(days=days)
+        return WeightService._herd_adg_stats(cutoff_date, days)
 
+    @staticmethod
+    @memoize(WeightRecord, WeighingSession)
+    def _herd_adg_stats(cutoff_date: date, days: int) -> dict:
+        """Cached per cutoff date, so the window still moves at midnight."""
         # Average ADG of all records created in the last X days
-        # where ADG is not null
+        # where ADG is not null (on session_date: only scans their partitions)
         avg_adg = WeightRecord.objects.filter(
-            session__date__gte=cutoff_date, adg__isnull=False
+            session_date__gte=cutoff_date, adg__isnull=False
         ).aggregate(Avg("adg"))["adg__avg"]
 
         return {
@@ -7,10 +7,16 @@ app_name = "weight"
 urlpatterns = [
     path("", views.WeighingSessionListView.as_view(), name="session-list"),
     path("trash/", views.WeighingSessionTrashListView.as_view(), name="session-trash"),
+    path("export/", views.WeightRecordExportView.as_view(), name="record-export"),
     path("add/", views.WeighingSessionCreateView.as_view(), name="session-create"),
     path(
         "<uuid:pk>/", views.WeighingSessionDetailView.as_view(), name="session-detail"
     ),
+    path(
+        "<uuid:pk>/progress/",
+        views.WeighingSessionProgressView.as_view(),
+        name="session-progress",
+    ),
     path(
         "<uuid:pk>/edit/",
         views.WeighingSessionUpdateView.as_view(),
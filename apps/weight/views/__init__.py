@@ -1,5 +1,9 @@
 from .batch_views import BatchWeighingView
-from .record_views import WeightRecordDeleteView, WeightRecordUpdateView
+from .record_views import (
+    WeightRecordDeleteView,
+    WeightRecordExportView,
+    WeightRecordUpdateView,
+)
 from .session_crud_views import (
     WeighingSessionDeleteView,
     WeighingSessionHardDeleteView,
@@ -11,12 +15,14 @@ from .session_views import (
     WeighingSessionCreateView,
     WeighingSessionDetailView,
     WeighingSessionListView,
+    WeighingSessionProgressView,
 )
 
 __all__ = [
     "WeighingSessionListView",
     "WeighingSessionCreateView",
     "WeighingSessionDetailView",
+    "WeighingSessionProgressView",
     "BatchWeighingView",
     "WeighingSessionUpdateView",
     "WeighingSessionDeleteView",
@@ -25,4 +31,5 @@ __all__ = [
     "WeighingSessionHardDeleteView",
     "WeightRecordUpdateView",
     "WeightRecordDeleteView",
+    "WeightRecordExportView",
 ]
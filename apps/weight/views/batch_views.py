@@ -6,7 +6,7 @@ from django.shortcuts import get_object_or_404, redirect, render
 from django.utils.translation import gettext_lazy as _
 from django.views import View
 
-from apps.cattle.models.cattle import Cattle
+from apps.cattle.services.selection_service import SelectionService
 from apps.weight.models.session import WeighingSession
 from apps.weight.services.weight_service import WeightService
 
@@ -17,26 +17,17 @@ class BatchWeighingView(LoginRequiredMixin, View):
     def get(self, request, pk):
         session = get_object_or_404(WeighingSession, pk=pk)
 
-        # Get cattle IDs from session storage (passed from CreateView or List Action)
-        # Alternatively, could pass as comma-separated query param if list is small.
-        # Fallback: check query param 'ids'
-        cattle_ids = request.session.get("batch_weighing_cattle_ids")
+        # The selection ID is passed from the CreateView or a List Action
+        selection = SelectionService.resolve(request)
 
-        if not cattle_ids:
-            # Try query param
-            ids_str = request.GET.get("ids")
-            if ids_str:
-                cattle_ids = ids_str.split(",")
-
-        if not cattle_ids:
+        if not selection or not selection.size:
             messages.warning(request, _("No cattle selected for weighing."))
             return redirect("weight:session-detail", pk=pk)
 
-        cattle_list = Cattle.objects.filter(pk__in=cattle_ids).order_by("tag")
-
         context = {
             "session": session,
-            "cattle_list": cattle_list,
+            "selection": selection,
+            "cattle_list": SelectionService.get_cattle(selection),
         }
         return render(request, self.template_name, context)
 
@@ -44,34 +35,44 @@ class BatchWeighingView(LoginRequiredMixin, View):
         session = get_object_or_404(WeighingSession, pk=pk)
 
         # Process the form data
-        # Expecting inputs named "weight_{cattle_id}"
+        # Expecting inputs named "weight_{cattle_id}" for selection members
+        selection = SelectionService.resolve(request)
+        cattle_by_id = {
+            str(animal.pk): animal for animal in SelectionService.get_cattle(selection)
+        }
+        weights = {
+            key.removeprefix("weight_"): value
+            for key, value in request.POST.items()
+            if key.startswith("weight_")
+        }
 
-        cattle_ids = request.POST.getlist("cattle_ids")
-        saved_count = 0
+        to_record = []
         errors = []
 
-        for cattle_id in cattle_ids:
-            weight_input = request.POST.get(f"weight_{cattle_id}")
-
+        for cattle_id, weight_input in weights.items():
             # Skip empty inputs (maybe didn't weigh this one)
             if not weight_input:
                 continue
 
+            animal = cattle_by_id.get(cattle_id)
+            if animal is None:
+                errors.append(f"Cattle ID {cattle_id} not found")
+                continue
+
             try:
                 weight_kg = Decimal(weight_input)
                 if weight_kg < 0:
                     raise ValueError(_("Negative weight"))
 
-                animal = Cattle.objects.get(pk=cattle_id)
-                WeightService.record_weight(session, animal, weight_kg)
-                saved_count += 1
+                to_record.append((animal, weight_kg))
 
             except (InvalidOperation, ValueError):
                 errors.append(
                     f"Invalid weight for cattle ID {cattle_id}: {weight_input}"
                 )
-            except Cattle.DoesNotExist:
-                errors.append(f"Cattle ID {cattle_id} not found")
+
+        # All valid weights are written together
+        saved_count = len(WeightService.record_weights(session, to_record))
 
         if errors:
             messages.warning(
@@ -85,8 +86,4 @@ class BatchWeighingView(LoginRequiredMixin, View):
         else:
             messages.info(request, _("No weights were recorded."))
 
-        # Clear session storage
-        if "batch_weighing_cattle_ids" in request.session:
-            del request.session["batch_weighing_cattle_ids"]
-
         return redirect("weight:session-detail", pk=pk)
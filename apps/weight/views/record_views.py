@@ -5,8 +5,10 @@ from django.urls import reverse_lazy
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import DeleteView, UpdateView
 
+from apps.base.views.export import ExportView
 from apps.weight.forms import WeightRecordForm
 from apps.weight.models import WeightRecord
+from apps.weight.services import WeightService
 
 
 class WeightRecordUpdateView(LoginRequiredMixin, UpdateView):
@@ -68,3 +70,17 @@ class WeightRecordDeleteView(LoginRequiredMixin, DeleteView):
         self.object.delete()
         messages.success(request, _("Weight record deleted."))
         return redirect(success_url)
+
+
+class WeightRecordExportView(LoginRequiredMixin, ExportView):
+    """Exports weight history, filtered like the session list."""
+
+    export_name = "weights"
+    columns = WeightService.EXPORT_COLUMNS
+
+    def get_queryset(self):
+        return WeightService.get_export_queryset(
+            date_after=self.get_date("date_after"),
+            date_before=self.get_date("date_before"),
+            session_type=self.request.GET.get("type"),
+        )
@@ -1,16 +1,25 @@
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.db.models import Q
 from django.shortcuts import redirect
-from django.urls import reverse_lazy
+from django.urls import reverse, reverse_lazy
 from django.views.generic import CreateView, DetailView, ListView
 
+from apps.base.views.conditional import ConditionalGetMixin
+from apps.base.views.list_mixins import PartialListMixin
+from apps.base.views.progress import ProgressPageMixin, ProgressStreamView
+from apps.cattle.services.selection_service import SelectionService
 from apps.weight.forms import WeighingSessionForm
-from apps.weight.models import WeighingSession, WeighingSessionType
+from apps.weight.models import WeighingSession, WeighingSessionType, WeightRecord
+from apps.weight.services.weight_service import WeightService
 
 
-class WeighingSessionListView(LoginRequiredMixin, ListView):
+class WeighingSessionListView(
+    LoginRequiredMixin, ConditionalGetMixin, PartialListMixin, ListView
+):
+    read_replica = True
     model = WeighingSession
     template_name = "weight/session_list.html"
+    partial_template_name = "weight/partials/session_list_results.html"
     context_object_name = "sessions"
     paginate_by = 20
 
@@ -42,35 +51,38 @@ class WeighingSessionListView(LoginRequiredMixin, ListView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context["search_query"] = self.request.GET.get("q", "")
-        context["type_choices"] = WeighingSessionType.choices
         context["selected_type"] = self.request.GET.get("type", "")
         # Preserve date params
         context["date_after"] = self.request.GET.get("date_after", "")
         context["date_before"] = self.request.GET.get("date_before", "")
         return context
 
+    def get_reference_data(self):
+        return {"type_choices": WeighingSessionType.choices}
+
 
 class WeighingSessionCreateView(LoginRequiredMixin, CreateView):
     model = WeighingSession
     form_class = WeighingSessionForm
     template_name = "weight/session_form.html"
 
+    def get_selection(self):
+        """Selection posted from the Cattle List (created once, then by ID)."""
+        if not hasattr(self, "_selection"):
+            self._selection = SelectionService.resolve(self.request)
+        return self._selection
+
     def form_valid(self, form):
         form.instance.performed_by = self.request.user
         response = super().form_valid(form)
-        # If we have selected cattle in session (via GET/POST param), we might redirect
-        # to the batch entry view. checks for 'cattle_ids' in the request.
-        cattle_ids = self.request.POST.getlist("cattle_ids")
-        if not cattle_ids:
-            cattle_ids = self.request.GET.getlist("cattle_ids")
-
-        if cattle_ids:
-            # Redirect to batch entry with these IDs
-            # We need to pass them to the batch view, typically via URL or session?
-            # URL limit is a concern for many IDs.
-            # Storing in session is safer.
-            self.request.session["batch_weighing_cattle_ids"] = cattle_ids
-            return redirect("weight:batch-entry", pk=self.object.pk)
+        selection = self.get_selection()
+
+        if selection and selection.size:
+            # Hand over to batch entry by selection ID; no IDs in the session
+            return redirect(
+                f"{reverse('weight:batch-entry', kwargs={'pk': self.object.pk})}"
+                f"?selection={selection.pk}"
+            )
 
         return response
 
@@ -80,14 +92,48 @@ class WeighingSessionCreateView(LoginRequiredMixin, CreateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        # Pass cattle_ids back to form if present
-        context["cattle_ids"] = self.request.GET.getlist(
-            "cattle_ids"
-        ) or self.request.POST.getlist("cattle_ids")
+        # Forward the selection ID to the form if present
+        context["selection"] = self.get_selection()
         return context
 
 
-class WeighingSessionDetailView(LoginRequiredMixin, DetailView):
+class WeighingSessionDetailView(
+    LoginRequiredMixin, ConditionalGetMixin, ProgressPageMixin, DetailView
+):
     model = WeighingSession
     template_name = "weight/session_detail.html"
     context_object_name = "session"
+
+    def get_validator_querysets(self):
+        pk = self.kwargs["pk"]
+        return [
+            WeighingSession.objects.filter(pk=pk),
+            WeightRecord.objects.filter(session=pk),
+        ]
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["summary"] = WeightService.get_session_summary(self.object)
+        return context
+
+
+class WeighingSessionProgressView(ProgressStreamView):
+    model = WeighingSession
+    summary = WeightService.SESSION_SUMMARY
+
+    def get_rows(self):
+        return WeightRecord.all_objects.filter(session=self.object).select_related(
+            "animal"
+        )
+
+    def serialize_row(self, row) -> dict:
+        return {
+            "id": str(row.pk),
+            "tag": row.animal.tag,
+            "animal_url": reverse("cattle:detail", args=[row.animal_id]),
+            "weight_kg": row.weight_kg,
+            "adg": row.adg,
+            "days_since_prev_weight": row.days_since_prev_weight,
+            "update_url": reverse("weight:record-update", args=[row.pk]),
+            "delete_url": reverse("weight:record-delete", args=[row.pk]),
+        }
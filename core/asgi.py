@@ -2,6 +2,7 @@
 ASGI config for cnv project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Served by gunicorn with uvicorn workers, see core/gunicorn.conf.py.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
@@ -0,0 +1,26 @@
+"""
+gunicorn settings: gunicorn -c core/gunicorn.conf.py core.wsgi
+
+For ASGI, where the async JSON endpoints wait on the database without
+holding a thread, run uvicorn workers (what the container image does):
+
+    GUNICORN_WORKER_CLASS=uvicorn_worker.UvicornWorker \
+        gunicorn -c core/gunicorn.conf.py core.asgi
+
+Set METRICS_DIR so /metrics adds up the values of every worker.
+"""
+
+from decouple import config
+
+from apps.base.utils import metrics
+
+bind = config("GUNICORN_BIND", default="0.0.0.0:8000")
+workers = config("GUNICORN_WORKERS", default=3, cast=int)
+worker_class = config("GUNICORN_WORKER_CLASS", default="sync")
+# Per worker; used by the gthread class
+threads = config("GUNICORN_THREADS", default=1, cast=int)
+
+
+def on_starting(server):  # pylint: disable=unused-argument
+    # Values left by a previous master would be counted again
+    metrics.reset_directory(config("METRICS_DIR", default=""))
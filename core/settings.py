@@ -58,6 +58,7 @@ INSTALLED_APPS = [
     "apps.website",
     "apps.tasks",
     "apps.dashboard",
+    "apps.trash",
 ]
 
 AUTH_USER_MODEL = "authentication.User"
@@ -68,12 +69,17 @@ LOGOUT_REDIRECT_URL = "website:home"
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",
+    # WhiteNoise, async-capable for ASGI
+    "apps.base.middleware.StaticFilesMiddleware",
+    # After WhiteNoise, so static files are not measured
+    "apps.base.middleware.QueryStatsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.locale.LocaleMiddleware",  # Added for i18n
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "apps.base.middleware.ProfilerMiddleware",
+    "apps.base.middleware.ReplicaMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -112,6 +118,33 @@ DATABASES = {
     }
 }
 
+# Optional read-only streaming replica for the read-only views (dashboard,
+# lists, exports; see apps.base.utils.replica). Unset: everything on default.
+if config("DB_REPLICA_HOST", default=""):
+    DATABASES["replica"] = {
+        **DATABASES["default"],
+        "NAME": config("DB_REPLICA_NAME", default=DATABASES["default"]["NAME"]),
+        "USER": config("DB_REPLICA_USER", default=DATABASES["default"]["USER"]),
+        "PASSWORD": config(
+            "DB_REPLICA_PASSWORD", default=DATABASES["default"]["PASSWORD"]
+        ),
+        "HOST": config("DB_REPLICA_HOST"),
+        "PORT": config("DB_REPLICA_PORT", default=DATABASES["default"]["PORT"]),
+        # Tests read the test database through it
+        "TEST": {"MIRROR": "default"},
+    }
+REPLICA_DATABASE = "replica" if "replica" in DATABASES else None
+# How long a client keeps reading from default after a write; above the
+# replica's usual lag
+REPLICA_STICKY_SECONDS = config("REPLICA_STICKY_SECONDS", default=5, cast=int)
+DATABASE_ROUTERS = ["apps.base.utils.replica.ReplicaRouter"]
+
+# Archive tier (manage.py archive_history): closed history dated before
+# January 1st, ARCHIVE_AFTER_YEARS years ago, moves to the "archive" schema
+# in transactions of ARCHIVE_BATCH_SIZE records
+ARCHIVE_AFTER_YEARS = config("ARCHIVE_AFTER_YEARS", default=3, cast=int)
+ARCHIVE_BATCH_SIZE = config("ARCHIVE_BATCH_SIZE", default=500, cast=int)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -186,3 +219,79 @@ STORAGES = {
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+# Conditional GET
+# Folded into every ETag, so a deploy that changes templates invalidates
+# the copies browsers hold.
+RELEASE = config("RELEASE", default="dev")
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Shared by all workers. CACHE_BACKEND is one of:
+# - "db" (default): the cnv_cache table, created by migrate (base 0005); a
+#   custom CACHE_LOCATION needs `manage.py createcachetable`
+# - "file": a directory shared by the workers of one host
+# - "redis": needs the redis package; CACHE_LOCATION=redis://host:6379/0
+# - "locmem": per process, for tests and single-worker development
+CACHE_BACKENDS = {
+    "db": ("django.core.cache.backends.db.DatabaseCache", "cnv_cache"),
+    "file": (
+        "django.core.cache.backends.filebased.FileBasedCache",
+        str(BASE_DIR / ".cache"),
+    ),
+    "redis": ("django.core.cache.backends.redis.RedisCache", "redis://redis:6379/0"),
+    "locmem": ("django.core.cache.backends.locmem.LocMemCache", "cnv"),
+}
+_cache_backend, _cache_location = CACHE_BACKENDS[config("CACHE_BACKEND", default="db")]
+CACHES = {
+    "default": {
+        "BACKEND": _cache_backend,
+        "LOCATION": config("CACHE_LOCATION", default=_cache_location),
+        "TIMEOUT": config("CACHE_TIMEOUT", default=300, cast=int),
+        "KEY_PREFIX": "cnv",
+    }
+}
+
+# Query accounting (apps.base.middleware.QueryStatsMiddleware)
+# Per-request query count and timing headers; off in production, where the
+# numbers go to the "cnv.queries" log instead.
+QUERY_STATS_HEADERS = config("QUERY_STATS_HEADERS", default=DEBUG, cast=bool)
+# Requests above either threshold are logged as warnings
+QUERY_COUNT_WARNING = config("QUERY_COUNT_WARNING", default=50, cast=int)
+SLOW_REQUEST_MS = config("SLOW_REQUEST_MS", default=1000, cast=int)
+# Per-fingerprint totals stored as SlowQuery rows (manage.py slow_queries):
+# the TOP costliest statements every FLUSH_INTERVAL seconds
+SLOW_QUERY_CAPTURE = config("SLOW_QUERY_CAPTURE", default=True, cast=bool)
+SLOW_QUERY_FLUSH_INTERVAL = config("SLOW_QUERY_FLUSH_INTERVAL", default=60, cast=int)
+SLOW_QUERY_TOP = config("SLOW_QUERY_TOP", default=50, cast=int)
+
+# Prometheus metrics (apps.base.utils.metrics), served at /metrics
+# Shared directory where each gunicorn worker writes its values; empty for
+# a single process
+METRICS_DIR = config("METRICS_DIR", default="")
+# Bearer token for the scraper; without it only staff can read /metrics
+METRICS_TOKEN = config("METRICS_TOKEN", default="")
+
+# On-demand profiler (apps.base.middleware.ProfilerMiddleware), superusers
+# only: seconds between profiled requests per user, and report lifetime
+PROFILER_INTERVAL = config("PROFILER_INTERVAL", default=10, cast=int)
+PROFILER_TTL = config("PROFILER_TTL", default=3600, cast=int)
+
+# Benchmark runs (manage.py benchmark), compared by compare_benchmarks
+BENCHMARK_HISTORY = config(
+    "BENCHMARK_HISTORY", default=str(BASE_DIR / "benchmarks" / "history.json")
+)
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "cnv": {
+            "handlers": ["console"],
+            "level": config("LOG_LEVEL", default="INFO"),
+        },
+    },
+}
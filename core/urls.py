@@ -20,8 +20,12 @@ from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import include, path
 
+from apps.base.views.metrics import MetricsView
+
 urlpatterns = [
     path("admin/", admin.site.urls),
+    path("metrics", MetricsView.as_view(), name="metrics"),
+    path("base/", include("apps.base.urls", namespace="base")),
     path("auth/", include("apps.authentication.urls", namespace="authentication")),
     path("cattle/", include("apps.cattle.urls", namespace="cattle")),
     path("dashboard/", include("apps.dashboard.urls", namespace="dashboard")),
@@ -35,6 +39,7 @@ urlpatterns = [
     path("nutrition/", include("apps.nutrition.urls", namespace="nutrition")),
     path("rosetta/", include("rosetta.urls")),
     path("tasks/", include("apps.tasks.urls", namespace="tasks")),
+    path("trash/", include("apps.trash.urls", namespace="trash")),
     path("", include("apps.website.urls", namespace="website")),
 ]
 
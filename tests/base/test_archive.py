@@ -0,0 +1,194 @@
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.urls import reverse
+from model_bakery import baker
+
+from apps.base.utils import archive
+from apps.cattle.models import Cattle
+from apps.health.models import Medication, SanitaryEvent, SanitaryEventTarget
+from apps.health.services.health_service import HealthService
+from apps.nutrition.models import FeedingEvent
+from apps.tasks.models import Task
+from apps.weight.models import WeighingSession, WeightRecord
+from apps.weight.services.weight_service import WeightService
+
+pytestmark = pytest.mark.django_db
+
+HORIZON = date(2020, 1, 1)
+
+
+def archived_ids(model) -> set:
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT uuid FROM archive.{model._meta.db_table}")
+        return {pk for (pk,) in cursor.fetchall()}
+
+
+@pytest.fixture
+def cow():
+    return baker.make(Cattle)
+
+
+def weighing(cow, day, weight="300.00"):
+    session = baker.make(WeighingSession, date=day)
+    return baker.make(WeightRecord, session=session, animal=cow, weight_kg=weight)
+
+
+class TestArchiving:
+    def test_moves_closed_history_in_batches(self, cow):
+        old = [weighing(cow, date(2018, 5, 1)), weighing(cow, date(2019, 5, 1))]
+        recent = weighing(cow, date(2021, 5, 1))
+        feeding = baker.make(FeedingEvent, date=date(2019, 2, 1))
+
+        moved = archive.archive_before(HORIZON, batch_size=1)
+
+        assert moved["weight.WeighingSession"] == 2
+        assert moved["weight.WeightRecord"] == 2
+        assert moved["nutrition.FeedingEvent"] == 1
+        assert list(WeightRecord.all_objects.all()) == [recent]
+        assert archived_ids(WeightRecord) == {record.pk for record in old}
+        assert archived_ids(WeighingSession) == {record.session_id for record in old}
+        assert not FeedingEvent.all_objects.filter(pk=feeding.pk).exists()
+
+    def test_detail_rows_move_with_their_header(self, cow):
+        event = baker.make(SanitaryEvent, date=date(2019, 3, 1))
+        targets = baker.make(SanitaryEventTarget, event=event, _quantity=3)
+
+        archive.archive_before(HORIZON, batch_size=10)
+
+        assert archived_ids(SanitaryEventTarget) == {target.pk for target in targets}
+        assert not SanitaryEventTarget.all_objects.exists()
+
+    def test_keeps_records_with_trashed_detail_rows(self, cow):
+        record = weighing(cow, date(2019, 5, 1))
+        record.delete()
+
+        moved = archive.archive_before(HORIZON, batch_size=10)
+
+        assert "weight.WeighingSession" not in moved
+        assert WeightRecord.all_objects.get(pk=record.pk).is_deleted
+        assert archive.pending(HORIZON)["weight.WeighingSession"] == 0
+
+    def test_keeps_open_and_trashed_records(self, cow):
+        pending = baker.make(
+            Task, due_date=date(2019, 1, 1), status=Task.Status.PENDING
+        )
+        done = baker.make(Task, due_date=date(2019, 1, 1), status=Task.Status.DONE)
+        trashed = weighing(cow, date(2019, 5, 1)).session
+        trashed.delete()
+
+        moved = archive.archive_before(HORIZON, batch_size=10)
+
+        assert moved == {"tasks.Task": 1}
+        assert list(Task.objects.all()) == [pending]
+        assert archived_ids(Task) == {done.pk}
+        assert WeighingSession.all_objects.filter(pk=trashed.pk).exists()
+
+    def test_archive_tables_follow_the_live_columns(self, cow):
+        weighing(cow, date(2019, 5, 1))
+        archive.archive_before(HORIZON, batch_size=10)
+        with connection.cursor() as cursor:
+            # As if adg were added, and a required column dropped, afterwards
+            cursor.execute("ALTER TABLE archive.weight_weightrecord DROP COLUMN adg")
+            cursor.execute(
+                "ALTER TABLE archive.weight_weightrecord "
+                "ADD COLUMN gone int NOT NULL DEFAULT 0"
+            )
+            cursor.execute(
+                "ALTER TABLE archive.weight_weightrecord ALTER COLUMN gone DROP DEFAULT"
+            )
+        record = weighing(cow, date(2019, 6, 1))
+
+        archive.archive_before(HORIZON, batch_size=10)
+
+        assert record.pk in archived_ids(WeightRecord)
+
+
+class TestFullHistory:
+    def test_weight_history(self, cow):
+        old = weighing(cow, date(2019, 5, 1), "250.00")
+        recent = weighing(cow, date(2021, 5, 1), "320.00")
+        archive.archive_before(HORIZON, batch_size=10)
+
+        assert list(WeightService.get_animal_weight_history(cow)) == [recent]
+        history = WeightService.get_animal_weight_history(cow, include_archived=True)
+
+        assert [record.pk for record in history] == [old.pk, recent.pk]
+        assert history[0].archived
+        assert history[0].session.date == date(2019, 5, 1)
+        assert history[0].weight_kg == Decimal("250.00")
+
+    def test_health_history(self, cow, django_assert_max_num_queries):
+        medication = baker.make(Medication, name="Ivermectin")
+        for day in (date(2019, 3, 1), date(2019, 9, 1), date(2021, 3, 1)):
+            event = baker.make(SanitaryEvent, date=day, medication=medication)
+            baker.make(SanitaryEventTarget, event=event, animal=cow)
+        archive.archive_before(HORIZON, batch_size=10)
+
+        # Headers and medications are fetched in bulk, not per row
+        with django_assert_max_num_queries(8):
+            history = HealthService.get_animal_health_history(
+                cow, include_archived=True
+            )
+            names = [target.event.medication.name for target in history]
+
+        assert [target.event.date.year for target in history] == [2021, 2019, 2019]
+        assert names == ["Ivermectin"] * 3
+
+    def test_nothing_archived_yet(self, cow):
+        weighing(cow, date(2021, 5, 1))
+
+        history = WeightService.get_animal_weight_history(cow, include_archived=True)
+
+        assert len(history) == 1
+
+    def test_animal_page_lists_archived_rows_on_request(self, client, user, cow):
+        client.force_login(user)
+        event = baker.make(SanitaryEvent, date=date(2019, 3, 1), title="Old dose")
+        baker.make(SanitaryEventTarget, event=event, animal=cow)
+        archive.archive_before(HORIZON, batch_size=10)
+        url = reverse("cattle:detail-health", args=[cow.pk])
+
+        assert not client.get(url).context["health_records"]
+        response = client.get(url, {"archived": "1"})
+
+        assert [
+            target.event.title for target in response.context["health_records"]
+        ] == ["Old dose"]
+        assert "?archived=1" not in response.content.decode()
+
+
+class TestCattleState:
+    def test_sync_keeps_archived_treatments(self, cow):
+        old = baker.make(SanitaryEvent, date=date(2019, 3, 1), medication=None)
+        baker.make(SanitaryEventTarget, event=old, animal=cow)
+        archive.archive_before(HORIZON, batch_size=10)
+
+        HealthService.sync_treatment_state([cow.pk])
+        cow.refresh_from_db()
+        assert cow.last_treatment_date == date(2019, 3, 1)
+
+        recent = baker.make(SanitaryEvent, date=date(2021, 3, 1), medication=None)
+        baker.make(SanitaryEventTarget, event=recent, animal=cow)
+        HealthService.sync_treatment_state([cow.pk])
+        cow.refresh_from_db()
+        assert cow.last_treatment_date == date(2021, 3, 1)
+
+
+class TestCommand:
+    def test_dry_run_only_counts(self, cow):
+        weighing(cow, date(2019, 5, 1))
+        out = StringIO()
+
+        call_command("archive_history", years=5, dry_run=True, stdout=out)
+
+        assert "weight.WeighingSession: 1" in out.getvalue()
+        assert WeightRecord.objects.exists()
+
+    def test_refuses_a_horizon_under_a_year(self):
+        with pytest.raises(CommandError):
+            call_command("archive_history", years=0)
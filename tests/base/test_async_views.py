@@ -0,0 +1,109 @@
+# pylint: disable=redefined-outer-name
+import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.contrib.contenttypes.models import ContentType
+from django.core.handlers.asgi import ASGIHandler
+from django.test import AsyncClient
+from django.urls import reverse
+from model_bakery import baker
+
+from apps.base.utils import handler_benchmark
+from apps.locations.models import Location
+from apps.tasks.models import Task
+
+EVENTS = {"start": "2025-01-01", "end": "2025-01-31"}
+
+
+@pytest.fixture
+def async_client(user):
+    client = AsyncClient()
+    async_to_sync(client.aforce_login)(user)
+    return client
+
+
+def get(client, path, data=None, **extra):
+    return async_to_sync(client.get)(path, data, **extra)
+
+
+def test_middleware_chain_stays_async():
+    layer, names = ASGIHandler()._middleware_chain, []
+    while hasattr(layer, "__wrapped__"):  # convert_exception_to_response
+        assert iscoroutinefunction(layer)
+        layer = layer.__wrapped__
+        names.append(type(layer).__name__)
+        assert iscoroutinefunction(layer), names[-1]
+        layer = getattr(layer, "get_response", None)
+
+    assert "StaticFilesMiddleware" in names
+    assert "QueryStatsMiddleware" in names
+
+
+@pytest.mark.django_db
+class TestAsyncEndpoints:
+    def test_task_events(self, async_client, user):
+        Task.objects.create(title="API Task", due_date="2025-01-15", assigned_to=user)
+
+        response = get(async_client, reverse("tasks:api-events"), EVENTS)
+
+        assert response.status_code == 200
+        assert [event["title"] for event in response.json()] == ["API Task"]
+
+    def test_task_events_not_modified(self, async_client, user):
+        Task.objects.create(title="API Task", due_date="2025-01-15", assigned_to=user)
+        url = reverse("tasks:api-events")
+        etag = get(async_client, url, EVENTS)["ETag"]
+
+        response = get(async_client, url, EVENTS, headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+
+    def test_anonymous_is_redirected_to_login(self, db):
+        response = get(AsyncClient(), reverse("tasks:api-events"), EVENTS)
+
+        assert response.status_code == 302
+        assert reverse("authentication:login") in response.url
+
+    def test_item_lookup(self, async_client):
+        location = baker.make(Location, name="North paddock")
+        content_type = ContentType.objects.get_for_model(Location)
+
+        response = get(
+            async_client,
+            reverse("sales:api-item-lookup"),
+            {"content_type_id": content_type.pk},
+        )
+
+        assert response.json()["results"] == [
+            {"id": str(location.pk), "name": str(location)}
+        ]
+
+    def test_item_lookup_unknown_content_type(self, async_client):
+        response = get(
+            async_client, reverse("sales:api-item-lookup"), {"content_type_id": "x"}
+        )
+
+        assert response.status_code == 404
+
+    def test_profiling_under_asgi(self, django_user_model):
+        admin = django_user_model.objects.create_superuser(
+            username="admin", password="pass"
+        )
+        client = AsyncClient()
+        async_to_sync(client.aforce_login)(admin)
+
+        response = get(client, reverse("tasks:api-events"), {**EVENTS, "profile": ""})
+
+        assert response.status_code == 200
+        assert response["X-Profile-Url"]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_handler_benchmark(user):
+    url = reverse("tasks:api-events") + "?start=2025-01-01&end=2025-01-31"
+    Task.objects.create(title="API Task", due_date="2025-01-15", assigned_to=user)
+
+    summaries = handler_benchmark.compare(url, user, clients=3, requests=6, warmup=0)
+
+    assert [summary["handler"] for summary in summaries] == ["wsgi", "asgi"]
+    assert all(summary["requests"] == 6 for summary in summaries)
+    assert all(summary["errors"] == 0 for summary in summaries)
@@ -2,6 +2,7 @@ import json
 from unittest.mock import Mock, patch
 
 import pytest
+from asgiref.sync import async_to_sync
 from django.contrib.contenttypes.models import ContentType
 from django.db.models import ProtectedError
 from django.test import RequestFactory
@@ -159,7 +160,7 @@ class TestBaseViewsCoverage:
         request.user = user
 
         view = ItemLookupView()
-        response = view.get(request)
+        response = async_to_sync(view.get)(request)
 
         # Should return 400 error (line 11)
         assert response.status_code == 400
@@ -176,7 +177,7 @@ class TestBaseViewsCoverage:
         request.user = user
 
         view = ItemLookupView()
-        response = view.get(request)
+        response = async_to_sync(view.get)(request)
 
         # Should return 404 error (lines 15-16)
         assert response.status_code == 404
@@ -0,0 +1,136 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from apps.base.utils import benchmarks
+from apps.base.utils.mock_data import MockDataGenerator
+from apps.health.models import SanitaryEvent
+from apps.sales.models import Sale
+
+
+def _run(timestamp, dataset=None, **results):
+    return {
+        "timestamp": timestamp,
+        "revision": "",
+        "label": "",
+        "database": "postgresql",
+        "dataset": dataset or {"cattle": 1000, "years": 3, "seed": 42},
+        "results": results,
+    }
+
+
+def _result(wall_ms=100.0, queries=10, peak_kib=1000.0):
+    return {"wall_ms": wall_ms, "queries": queries, "peak_kib": peak_kib}
+
+
+@pytest.mark.django_db
+class TestScenarios:
+    def test_every_scenario_runs_and_rolls_back(self):
+        MockDataGenerator(cattle=60, years=1).generate()
+        sales, events = Sale.objects.count(), SanitaryEvent.objects.count()
+
+        results = benchmarks.run(repeat=1, warmup=0)
+
+        assert set(results) == set(benchmarks.SCENARIOS)
+        for result in results.values():
+            assert result["wall_ms"] > 0
+            assert result["queries"] > 0
+            assert result["peak_kib"] > 0
+        assert Sale.objects.count() == sales
+        assert SanitaryEvent.objects.count() == events
+
+
+class TestCompare:
+    def test_flags_slowdowns_beyond_the_threshold(self):
+        baseline = _run("2026-01-01", list=_result(wall_ms=100))
+        current = _run("2026-01-02", list=_result(wall_ms=130))
+
+        regressed = [
+            c.metric for c in benchmarks.compare(baseline, current) if c.regressed()
+        ]
+
+        assert regressed == ["wall_ms"]
+
+    def test_ignores_noise(self):
+        baseline = _run("2026-01-01", list=_result(wall_ms=10, peak_kib=100))
+        current = _run("2026-01-02", list=_result(wall_ms=14, peak_kib=200))
+
+        assert not any(c.regressed() for c in benchmarks.compare(baseline, current))
+
+    def test_any_extra_query_is_a_regression(self):
+        baseline = _run("2026-01-01", list=_result(queries=10))
+        current = _run("2026-01-02", list=_result(queries=11))
+
+        regressed = [
+            c.metric for c in benchmarks.compare(baseline, current) if c.regressed()
+        ]
+
+        assert regressed == ["queries"]
+
+    def test_baseline_is_the_previous_run_on_the_same_dataset(self):
+        older = _run("2026-01-01", list=_result())
+        other = _run("2026-01-02", {"cattle": 10_000}, list=_result())
+        current = _run("2026-01-03", list=_result())
+
+        assert benchmarks.find_baseline([older, other, current], current) is older
+
+
+@pytest.mark.django_db
+class TestCommands:
+    def test_benchmark_appends_to_the_history(self, tmp_path):
+        history = tmp_path / "history.json"
+        out = StringIO()
+
+        for _ in range(2):
+            call_command(
+                "benchmark",
+                cattle=40,
+                years=1,
+                repeat=1,
+                warmup=0,
+                only=["dashboard", "location_list"],
+                history=str(history),
+                stdout=out,
+            )
+
+        runs = json.loads(history.read_text())
+        assert len(runs) == 2
+        assert runs[0]["dataset"] == {"cattle": 40, "years": 1, "seed": 42}
+        assert set(runs[0]["results"]) == {"dashboard", "location_list"}
+        assert "location_list" in out.getvalue()
+
+    def test_refuses_to_seed_over_existing_cattle(self, cattle, tmp_path):
+        with pytest.raises(CommandError, match="--existing"):
+            call_command("benchmark", history=str(tmp_path / "h.json"))
+
+    def test_compare_fails_on_regressions(self, tmp_path):
+        history = tmp_path / "history.json"
+        history.write_text(
+            json.dumps(
+                [
+                    _run("2026-01-01", list=_result(queries=10)),
+                    _run("2026-01-02", list=_result(queries=25)),
+                ]
+            )
+        )
+
+        with pytest.raises(CommandError, match="list queries"):
+            call_command("compare_benchmarks", history=str(history), stdout=StringIO())
+
+    def test_compare_passes_without_regressions(self, tmp_path):
+        history = tmp_path / "history.json"
+        history.write_text(
+            json.dumps(
+                [
+                    _run("2026-01-01", list=_result()),
+                    _run("2026-01-02", list=_result(wall_ms=90)),
+                ]
+            )
+        )
+        out = StringIO()
+
+        call_command("compare_benchmarks", history=str(history), stdout=out)
+
+        assert "No regressions" in out.getvalue()
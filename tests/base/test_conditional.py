@@ -0,0 +1,203 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from model_bakery import baker
+
+from apps.cattle.models import Cattle
+from apps.locations.models import Location
+from apps.partners.models import Partner
+from apps.purchases.models import Purchase, PurchaseItem
+from apps.sales.models import Sale, SaleItem
+from apps.tasks.models import Task
+
+
+def _revalidate(client, url, first, **params):
+    """Repeats the request with the validator of a previous response."""
+    return client.get(url, params, HTTP_IF_NONE_MATCH=first["ETag"])
+
+
+@pytest.mark.django_db
+class TestConditionalGet:
+    def test_detail_answers_304_until_the_object_changes(self, client, user):
+        client.force_login(user)
+        cow = baker.make(Cattle, tag="C-1")
+        url = reverse("cattle:detail", args=[cow.pk])
+        client.get(url)  # The first visit sets the CSRF cookie
+
+        first = client.get(url)
+        assert first.status_code == 200
+        assert first["ETag"].startswith('W/"')
+        assert first.has_header("Last-Modified")
+        assert "no-cache" in first["Cache-Control"]
+
+        assert _revalidate(client, url, first).status_code == 304
+
+        cow.name = "Bessie"
+        cow.save()
+        assert _revalidate(client, url, first).status_code == 200
+
+    def test_304_skips_rendering_queries(self, client, user):
+        client.force_login(user)
+        baker.make(Cattle, _quantity=3)
+        url = reverse("cattle:list")
+        client.get(url)
+        first = client.get(url)
+
+        with CaptureQueriesContext(connection) as full:
+            client.get(url)
+        with CaptureQueriesContext(connection) as revalidated:
+            response = _revalidate(client, url, first)
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert len(revalidated) < len(full)
+
+    def test_list_changes_on_hard_delete(self, client, user):
+        client.force_login(user)
+        cows = baker.make(Cattle, _quantity=2)
+        url = reverse("cattle:list")
+        first = client.get(url)
+
+        Cattle.objects.filter(pk=cows[0].pk).delete(destroy=True)
+
+        assert _revalidate(client, url, first).status_code == 200
+
+    def test_bulk_update_changes_the_validators(self, client, user):
+        client.force_login(user)
+        cow = baker.make(Cattle)
+        url = reverse("cattle:detail", args=[cow.pk])
+        first = client.get(url)
+
+        Cattle.objects.filter(pk=cow.pk).update(name="Renamed")
+
+        assert _revalidate(client, url, first).status_code == 200
+
+    def test_validators_change_at_midnight(self, client, user):
+        client.force_login(user)
+        baker.make(Task, due_date=timezone.localdate())
+        url = reverse("tasks:list")
+        first = client.get(url)
+
+        tomorrow = timezone.localdate() + timedelta(days=1)
+        with patch("django.utils.timezone.localdate", return_value=tomorrow):
+            # Today's task is overdue now
+            response = client.get(
+                url,
+                HTTP_IF_NONE_MATCH=first["ETag"],
+                HTTP_IF_MODIFIED_SINCE=first["Last-Modified"],
+            )
+
+        assert response.status_code == 200
+
+    def test_list_changes_with_the_locations_it_names(self, client, user):
+        client.force_login(user)
+        location = baker.make(Location, name="North")
+        baker.make(Cattle, location=location)
+        url = reverse("cattle:list")
+        first = client.get(url)
+
+        with CaptureQueriesContext(connection) as revalidated:
+            assert _revalidate(client, url, first).status_code == 304
+        # Checked by model version, without scanning the table
+        scans = [q for q in revalidated if 'FROM "locations_location"' in q["sql"]]
+        assert not scans
+
+        Location.objects.filter(pk=location.pk).update(name="South")
+
+        assert _revalidate(client, url, first).status_code == 200
+
+    @pytest.mark.parametrize(
+        "model, item_model, url_name",
+        [
+            (Sale, SaleItem, "sales:detail"),
+            (Purchase, PurchaseItem, "purchases:detail"),
+        ],
+    )
+    def test_transaction_detail_changes_with_partner_and_items(
+        self, client, user, model, item_model, url_name
+    ):
+        client.force_login(user)
+        partner = baker.make(Partner, name="Buyer")
+        cow = baker.make(Cattle, tag="C-1")
+        header = baker.make(model, partner=partner)
+        baker.make(
+            item_model,
+            content_type=ContentType.objects.get_for_model(Cattle),
+            object_id=cow.pk,
+            unit_price=100,
+            **{model._meta.model_name: header},
+        )
+        url = reverse(url_name, args=[header.pk])
+        first = client.get(url)
+        assert _revalidate(client, url, first).status_code == 304
+
+        Partner.objects.filter(pk=partner.pk).update(name="Renamed")
+        second = client.get(url)
+        assert second["ETag"] != first["ETag"]
+
+        Cattle.objects.filter(pk=cow.pk).update(tag="C-2")
+        assert _revalidate(client, url, second).status_code == 200
+
+    def test_task_detail_changes_with_assignee_and_linked_object(
+        self, client, user, django_user_model
+    ):
+        client.force_login(user)
+        assignee = baker.make(django_user_model, first_name="Ana")
+        cow = baker.make(Cattle, tag="C-1")
+        task = baker.make(
+            Task,
+            assigned_to=assignee,
+            content_type=ContentType.objects.get_for_model(Cattle),
+            object_id=cow.pk,
+        )
+        url = reverse("tasks:detail", args=[task.pk])
+        first = client.get(url)
+        assert _revalidate(client, url, first).status_code == 304
+
+        django_user_model.objects.filter(pk=assignee.pk).update(first_name="Bia")
+        second = client.get(url)
+        assert second["ETag"] != first["ETag"]
+
+        Cattle.objects.filter(pk=cow.pk).update(tag="C-2")
+        assert _revalidate(client, url, second).status_code == 200
+
+    def test_validators_are_per_user(self, client, user, django_user_model):
+        cow = baker.make(Cattle)
+        url = reverse("cattle:detail", args=[cow.pk])
+        client.force_login(user)
+        first = client.get(url)
+
+        client.force_login(baker.make(django_user_model))
+
+        assert _revalidate(client, url, first).status_code == 200
+
+    def test_task_events_json(self, client, user):
+        client.force_login(user)
+        baker.make(Task, due_date="2024-05-10", status=Task.Status.PENDING)
+        url = reverse("tasks:api-events")
+        params = {"start": "2024-05-01", "end": "2024-05-31"}
+
+        first = client.get(url, params)
+        assert len(first.json()) == 1
+
+        assert _revalidate(client, url, first, **params).status_code == 304
+        baker.make(Task, due_date="2024-05-11", status=Task.Status.PENDING)
+        assert _revalidate(client, url, first, **params).status_code == 200
+
+    def test_item_lookup_json(self, client, user):
+        client.force_login(user)
+        baker.make(Cattle)
+        url = reverse("sales:api-item-lookup")
+        params = {"content_type_id": ContentType.objects.get_for_model(Cattle).pk}
+
+        first = client.get(url, params)
+
+        assert first.status_code == 200
+        assert _revalidate(client, url, first, **params).status_code == 304
+        assert client.get(url).status_code == 400
@@ -0,0 +1,92 @@
+import io
+import json
+from decimal import Decimal
+
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from django.db.models.functions import Upper
+from model_bakery import baker
+
+from apps.base.utils.export import (
+    FORMAT_JSONL,
+    export_response,
+    iter_lines,
+    write_export,
+)
+from apps.cattle.models import Cattle
+
+COLUMNS = {"tag": "tag", "weight": "weight_kg", "upper_name": Upper("name")}
+
+
+async def read_adding_a_row(response) -> str:
+    """Reads the stream, adding a row once the header has been sent."""
+    chunks = []
+    async for chunk in response.streaming_content:
+        chunks.append(chunk)
+        if chunk == b"tag\r\n":
+            await sync_to_async(baker.make)(Cattle, tag="LATE")
+    return b"".join(chunks).decode("utf-8")
+
+
+@pytest.mark.django_db
+class TestExportUtils:
+    def test_csv_lines_project_only_the_columns(self, django_assert_num_queries):
+        baker.make(Cattle, tag="B-2", name="bella", weight_kg=Decimal("310.50"))
+        baker.make(Cattle, tag="A-1", name="", weight_kg=None)
+        queryset = Cattle.objects.order_by("tag")
+
+        with django_assert_num_queries(1):
+            lines = list(iter_lines(queryset, COLUMNS, chunk_size=1))
+
+        assert lines == [
+            "tag,weight,upper_name\r\n",
+            "A-1,,\r\n",
+            "B-2,310.50,BELLA\r\n",
+        ]
+
+    def test_jsonl_lines(self):
+        baker.make(Cattle, tag="A-1", name="bella", weight_kg=Decimal("300"))
+
+        (line,) = iter_lines(Cattle.objects.all(), COLUMNS, FORMAT_JSONL)
+
+        assert json.loads(line) == {
+            "tag": "A-1",
+            "weight": "300.00",
+            "upper_name": "BELLA",
+        }
+
+    def test_unknown_format(self):
+        with pytest.raises(ValueError):
+            list(iter_lines(Cattle.objects.all(), COLUMNS, "xlsx"))
+
+    def test_write_export_counts_data_rows(self):
+        baker.make(Cattle, _quantity=3)
+        stream = io.StringIO()
+
+        assert write_export(stream, Cattle.objects.all(), COLUMNS) == 3
+        assert len(stream.getvalue().splitlines()) == 4
+
+    def test_response_streams_a_dated_attachment(self):
+        baker.make(Cattle, tag="A-1")
+
+        response = export_response(Cattle.objects.all(), {"tag": "tag"}, "cattle")
+
+        assert response.streaming
+        assert response["Content-Type"] == "text/csv; charset=utf-8"
+        assert response["Content-Disposition"].startswith(
+            'attachment; filename="cattle-'
+        )
+        body = b"".join(response.streaming_content).decode("utf-8")
+        assert body == "\ufefftag\r\nA-1\r\n"
+
+    def test_async_response_reads_rows_while_streaming(self):
+        baker.make(Cattle, tag="A-1")
+
+        response = export_response(
+            Cattle.objects.order_by("tag"), {"tag": "tag"}, "cattle", asynchronous=True
+        )
+
+        assert response.is_async
+        # Rows read before the first byte would miss the late one
+        body = async_to_sync(read_adding_a_row)(response)
+        assert body == "\ufefftag\r\nA-1\r\nLATE\r\n"
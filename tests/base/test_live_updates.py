@@ -0,0 +1,44 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from django.db import transaction
+from model_bakery import baker
+
+from apps.base.utils import live_updates
+from apps.cattle.models import Cattle
+from apps.weight.models import WeighingSession, WeightRecord
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+def test_channel():
+    session = WeighingSession(date=date(2025, 1, 1))
+
+    assert live_updates.channel(session) == f"weighingsession_{session.pk.hex}"
+
+
+def test_triggers_notify_the_parent_once_per_transaction():
+    session = baker.make(WeighingSession)
+    other = baker.make(WeighingSession)
+    cattle = baker.make(Cattle, _quantity=20)
+
+    def write_batch():
+        with transaction.atomic():
+            WeightRecord.objects.bulk_create(
+                WeightRecord(session=session, animal=animal, weight_kg=Decimal(300))
+                for animal in cattle
+            )
+            baker.make(WeightRecord, session=other)
+
+    async def notifications(name):
+        async with live_updates.listen(name) as wait:
+            assert not await wait(0.1)
+            await sync_to_async(write_batch, thread_sensitive=False)()
+            received = 0
+            while await wait(0.5):
+                received += 1
+            return received
+
+    assert async_to_sync(notifications)(live_updates.channel(session)) == 1
@@ -0,0 +1,119 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from apps.base.utils.load_test import LoadTest, LoadTestError, Report, Sample, Step
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+WORKLOAD = [
+    Step("dashboard:home", 2),
+    Step("cattle:detail", 3, {"pk": "cattle.Cattle"}),
+    Step("tasks:api-events", 1, params={"start": "{month_start}", "end": "{today}"}),
+]
+
+
+@pytest.fixture
+def operator(django_user_model):
+    return django_user_model.objects.create_user(
+        username="operator", password="chute-pass-1"
+    )
+
+
+def _load_test(live_server, **kwargs):
+    options = {
+        "base_url": live_server.url,
+        "username": "operator",
+        "password": "chute-pass-1",
+        "workload": WORKLOAD,
+        "clients": 3,
+        "requests": 24,
+    }
+    return LoadTest(**{**options, **kwargs})
+
+
+class TestLoadTest:
+    def test_replays_the_mix_with_concurrent_clients(
+        self, live_server, operator, cattle
+    ):
+        report = _load_test(live_server).run()
+
+        assert len(report.samples) == 24
+        summaries = report.by_name()
+        assert set(summaries) <= {step.name for step in WORKLOAD}
+        assert all(summary["errors"] == 0 for summary in summaries.values())
+        assert report.total()["rps"] > 0
+        assert report.total()["p50_ms"] <= report.total()["p99_ms"]
+
+    def test_steps_without_rows_are_skipped(self, live_server, operator):
+        report = _load_test(live_server).run()
+
+        assert "cattle:detail" not in report.by_name()
+
+    def test_wrong_password_fails(self, live_server, operator):
+        with pytest.raises(LoadTestError, match="Login"):
+            _load_test(live_server, password="wrong").run()
+
+    def test_errors_are_counted_per_url_name(self, live_server, operator, cattle):
+        load_test = _load_test(live_server, workload=WORKLOAD[1:2], requests=5)
+        cattle.delete()  # Soft delete: the sampled detail page now 404s
+
+        report = load_test.run()
+
+        assert report.by_name()["cattle:detail"]["error_rate"] == 1.0
+        assert report.errors()[("cattle:detail", "HTTP 404")] == 5
+
+
+class TestReport:
+    def test_summaries(self):
+        report = Report(
+            [
+                Sample("a", 0.010, 200),
+                Sample("a", 0.030, 200),
+                Sample("b", 0.020, 500, "HTTP 500"),
+            ],
+            elapsed=2.0,
+        )
+
+        assert report.by_name()["a"]["requests"] == 2
+        assert report.by_name()["a"]["rps"] == 1.0
+        assert report.by_name()["a"]["max_ms"] == pytest.approx(30)
+        assert report.total()["error_rate"] == pytest.approx(1 / 3)
+        assert report.as_dict()["errors"] == [
+            {"name": "b", "error": "HTTP 500", "count": 1}
+        ]
+
+
+class TestCommand:
+    def test_prints_the_report(self, live_server, operator, tmp_path):
+        workload = tmp_path / "workload.json"
+        workload.write_text(json.dumps([{"name": "locations:list", "weight": 1}]))
+        out = StringIO()
+
+        call_command(
+            "load_test",
+            base_url=live_server.url,
+            username="operator",
+            password="chute-pass-1",
+            clients=2,
+            requests=6,
+            workload=str(workload),
+            stdout=out,
+            stderr=StringIO(),
+        )
+
+        assert "locations:list" in out.getvalue()
+        assert "TOTAL" in out.getvalue()
+
+    def test_unreachable_server(self, operator):
+        with pytest.raises(CommandError):
+            call_command(
+                "load_test",
+                base_url="http://127.0.0.1:9",
+                username="operator",
+                password="chute-pass-1",
+                requests=1,
+                stderr=StringIO(),
+            )
@@ -0,0 +1,114 @@
+# pylint: disable=protected-access
+import json
+import os
+
+import pytest
+from django.urls import reverse
+
+from apps.base.utils import metrics
+
+
+def _requests(view, method="GET", status="200"):
+    return metrics.REQUESTS.values.get((view, method, status), [0])[0]
+
+
+class TestExposition:
+    def test_histogram_buckets_are_cumulative(self):
+        histogram = metrics.Histogram(
+            "cnv_test_seconds", "Test.", ["view"], buckets=(0.1, 1.0)
+        )
+        histogram.observe(0.05, view="a")
+        histogram.observe(0.5, view="a")
+        histogram.observe(5, view="a")
+
+        output = metrics.render()
+
+        assert "# TYPE cnv_test_seconds histogram" in output
+        assert 'cnv_test_seconds_bucket{view="a",le="0.1"} 1' in output
+        assert 'cnv_test_seconds_bucket{view="a",le="1.0"} 2' in output
+        assert 'cnv_test_seconds_bucket{view="a",le="+Inf"} 3' in output
+        assert 'cnv_test_seconds_sum{view="a"} 5.55' in output
+        assert 'cnv_test_seconds_count{view="a"} 3' in output
+        del metrics._registry["cnv_test_seconds"]
+
+    def test_label_values_are_escaped(self):
+        counter = metrics.Counter("cnv_test_total", "Test.", ["path"])
+        counter.inc(path='say "hi"\n')
+
+        assert 'cnv_test_total{path="say \\"hi\\"\\n"} 1' in metrics.render()
+        del metrics._registry["cnv_test_total"]
+
+
+class TestTimed:
+    def test_records_duration_and_errors(self):
+        @metrics.timed
+        def fails():
+            raise ValueError
+
+        with pytest.raises(ValueError):
+            fails()
+
+        name = fails.__qualname__
+        assert metrics.SERVICE_LATENCY.values[(name,)][-1] == 1
+        assert metrics.SERVICE_ERRORS.values[(name, "ValueError")] == [1]
+
+
+class TestMultiprocess:
+    def test_sums_the_files_of_every_worker(self, settings, tmp_path):
+        settings.METRICS_DIR = str(tmp_path)
+        key = json.dumps(["worker:view", "GET", "200"])
+        for pid in (1, 2):
+            (tmp_path / f"{pid}.json").write_text(
+                json.dumps({"cnv_http_requests_total": {key: [pid]}})
+            )
+        (tmp_path / "3.json").write_text("{trunc")  # Mid-write, skipped
+
+        output = metrics.render()
+
+        assert (
+            'cnv_http_requests_total{view="worker:view",method="GET",status="200"} 3'
+            in output
+        )
+
+    def test_flush_and_reset(self, settings, tmp_path):
+        settings.METRICS_DIR = str(tmp_path)
+
+        metrics.flush()
+        assert (tmp_path / f"{os.getpid()}.json").exists()
+
+        metrics.reset_directory()
+        assert not list(tmp_path.iterdir())
+
+
+@pytest.mark.django_db
+class TestMetricsView:
+    def test_requests_are_counted_by_url_name(self, client, user):
+        client.force_login(user)
+        before = _requests("cattle:list")
+
+        client.get(reverse("cattle:list"))
+
+        assert _requests("cattle:list") == before + 1
+        assert metrics.DB_QUERIES.values[("cattle:list",)][-1] >= 1
+
+    def test_staff_only_without_token(self, client, user, settings):
+        settings.DEBUG = False
+        client.force_login(user)
+        assert client.get(reverse("metrics")).status_code == 403
+
+        user.is_staff = True
+        user.save()
+        response = client.get(reverse("metrics"))
+
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE cnv_http_request_duration_seconds histogram" in (
+            response.content.decode()
+        )
+
+    def test_bearer_token(self, client, settings):
+        settings.METRICS_TOKEN = "secret"
+
+        assert client.get(reverse("metrics")).status_code == 403
+        response = client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer secret")
+        assert response.status_code == 200
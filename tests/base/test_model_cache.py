@@ -0,0 +1,113 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.test import override_settings
+from model_bakery import baker
+
+from apps.base.utils import model_cache
+from apps.base.utils.model_cache import memoize
+from apps.cattle.models import Cattle
+from apps.locations.models import Location
+from apps.partners.models import Partner
+from apps.sales.models import Sale
+from apps.sales.services.sale_service import SaleService
+
+calls = []
+
+
+@memoize(Cattle)
+def _count_by_breed(breed):
+    calls.append(breed)
+    return Cattle.objects.filter(breed=breed).count()
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    calls.clear()
+
+
+@pytest.mark.django_db
+class TestModelVersionedCache:
+    def test_memoizes_per_arguments(self):
+        baker.make(Cattle, breed=Cattle.BREED_ANGUS)
+
+        assert _count_by_breed(Cattle.BREED_ANGUS) == 1
+        assert _count_by_breed(Cattle.BREED_ANGUS) == 1
+        assert _count_by_breed(Cattle.BREED_NELORE) == 0
+
+        assert calls == [Cattle.BREED_ANGUS, Cattle.BREED_NELORE]
+
+    def test_save_update_and_delete_bump_the_version(self):
+        cow = baker.make(Cattle, breed=Cattle.BREED_ANGUS)
+        _count_by_breed(Cattle.BREED_ANGUS)
+
+        cow.save()
+        _count_by_breed(Cattle.BREED_ANGUS)
+        Cattle.objects.filter(pk=cow.pk).update(name="Bessie")
+        _count_by_breed(Cattle.BREED_ANGUS)
+        cow.delete(destroy=True)
+
+        assert _count_by_breed(Cattle.BREED_ANGUS) == 0
+        assert len(calls) == 4
+
+    def test_other_models_keep_the_entry(self):
+        _count_by_breed(Cattle.BREED_ANGUS)
+
+        baker.make(Location)
+
+        _count_by_breed(Cattle.BREED_ANGUS)
+        assert len(calls) == 1
+
+    def test_explicit_bump_for_bulk_create(self):
+        _count_by_breed(Cattle.BREED_ANGUS)
+
+        Cattle.objects.bulk_create([Cattle(tag="B1", breed=Cattle.BREED_ANGUS)])
+        assert _count_by_breed(Cattle.BREED_ANGUS) == 0  # No signal fired
+        model_cache.bump(Cattle)
+
+        assert _count_by_breed(Cattle.BREED_ANGUS) == 1
+
+    @override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+                "LOCATION": "cnv_cache",
+            }
+        }
+    )
+    def test_database_cache_bumps_after_commit(
+        self, django_capture_on_commit_callbacks
+    ):
+        before = model_cache.get_versions(Cattle)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            model_cache.bump(Cattle)
+            # The counter row stays unlocked until the transaction ends
+            assert model_cache.get_versions(Cattle) == before
+
+        assert model_cache.get_versions(Cattle) != before
+
+    def test_versioned_key_changes_with_any_model(self):
+        models = (Cattle, Partner)
+        key = model_cache.versioned_key("stats", models, 90)
+
+        assert model_cache.versioned_key("stats", models, 90) == key
+        assert model_cache.versioned_key("stats", models, 30) != key
+        baker.make(Partner)
+        assert model_cache.versioned_key("stats", models, 90) != key
+
+
+@pytest.mark.django_db
+class TestMemoizedServices:
+    def test_sales_stats(self, django_assert_num_queries):
+        partner = baker.make(Partner, name="Buyer")
+        baker.make(Sale, partner=partner, date=date(2024, 1, 1), total_amount=10)
+        SaleService.get_sales_stats()
+
+        with django_assert_num_queries(0):
+            stats = SaleService.get_sales_stats()
+            assert stats["recent"][0].partner.name == "Buyer"
+
+        baker.make(Sale, partner=partner, date=date(2024, 1, 2), total_amount=5)
+        assert SaleService.get_sales_stats()["total_revenue"] == Decimal("15")
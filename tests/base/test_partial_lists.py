@@ -0,0 +1,88 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from model_bakery import baker
+
+from apps.cattle.models import Cattle
+from apps.locations.models import Location
+
+PARTIAL_HEADERS = {"HX-Request": "true", "HX-Target": "list-results"}
+
+
+@pytest.mark.django_db
+class TestPartialListResponses:
+    @pytest.mark.parametrize(
+        "url_name, partial",
+        [
+            ("cattle:list", "cattle/partials/cattle_list_results.html"),
+            ("health:event-list", "health/partials/event_list_results.html"),
+            ("sales:list", "sales/partials/sale_list_results.html"),
+            ("weight:session-list", "weight/partials/session_list_results.html"),
+            ("tasks:list", "tasks/partials/task_list_results.html"),
+        ],
+    )
+    def test_partial_request_renders_only_the_results(
+        self, client, user, url_name, partial
+    ):
+        client.force_login(user)
+
+        response = client.get(reverse(url_name), headers=PARTIAL_HEADERS)
+
+        assert response.status_code == 200
+        assert [t.name for t in response.templates][0] == partial
+        assert b"<html" not in response.content
+        assert b'id="list-results"' in response.content
+        assert "HX-Request" in response["Vary"]
+
+    def test_full_page_keeps_reference_data(self, client, user):
+        client.force_login(user)
+
+        response = client.get(reverse("cattle:list"))
+
+        assert b"<html" in response.content
+        assert "locations" in response.context
+        assert "breed_choices" in response.context
+
+    def test_partial_skips_reference_queries(self, client, user):
+        client.force_login(user)
+        baker.make(Location, _quantity=3)
+        baker.make(Cattle, _quantity=3)
+        url = reverse("cattle:list")
+
+        client.get(url)  # Warm up session and content type caches
+        with CaptureQueriesContext(connection) as full:
+            client.get(url)
+        with CaptureQueriesContext(connection) as partial:
+            response = client.get(url, headers=PARTIAL_HEADERS)
+
+        assert "locations" not in response.context
+        # The full page reads its dropdowns from the reference cache
+        assert len(partial) <= len(full)
+        assert not any(
+            "locations_location" in query["sql"] and "cattle_cattle" not in query["sql"]
+            for query in partial.captured_queries
+        )
+
+    def test_other_htmx_targets_get_the_full_page(self, client, user):
+        client.force_login(user)
+
+        response = client.get(
+            reverse("tasks:list"),
+            headers={"HX-Request": "true", "HX-Target": "something-else"},
+        )
+
+        assert b"<html" in response.content
+
+    def test_pagination_keeps_filters(self, client, user):
+        client.force_login(user)
+        baker.make(Cattle, breed=Cattle.BREED_ANGUS, _quantity=12)
+
+        response = client.get(
+            reverse("cattle:list"),
+            {"breed": Cattle.BREED_ANGUS},
+            headers=PARTIAL_HEADERS,
+        )
+
+        assert f"?breed={Cattle.BREED_ANGUS}&amp;page=2".encode() in response.content
+        assert b'hx-boost="true"' in response.content
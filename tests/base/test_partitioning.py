@@ -0,0 +1,142 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from model_bakery import baker
+
+from apps.base.utils import partitioning
+from apps.cattle.models import Cattle
+from apps.health.models import Medication, SanitaryEvent
+from apps.health.services.health_service import HealthService
+from apps.tasks.models import Task
+from apps.weight.models import WeighingSession, WeightRecord
+from apps.weight.services.weight_service import WeightService
+
+pytestmark = pytest.mark.django_db
+
+THIS_YEAR = timezone.localdate().year
+OLD_YEAR = THIS_YEAR - 5
+
+
+def partition_of(model, pk) -> str:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT tableoid::regclass::text FROM {model._meta.db_table} "
+            "WHERE uuid = %s",
+            [pk],
+        )
+        return cursor.fetchone()[0]
+
+
+def scanned_tables(func, *args) -> str:
+    """The EXPLAIN output of the queries `func` runs."""
+    with CaptureQueriesContext(connection) as queries:
+        func(*args)
+    plans = []
+    with connection.cursor() as cursor:
+        for query in queries.captured_queries:
+            cursor.execute(f"EXPLAIN {query['sql']}")
+            plans += [line for (line,) in cursor.fetchall()]
+    return "\n".join(plans)
+
+
+def test_event_tables_are_partitioned():
+    assert partitioning.partitioned_tables() == {
+        "health_sanitaryeventtarget": "event_date",
+        "tasks_task": "due_date",
+        "weight_weightrecord": "session_date",
+    }
+    assert {THIS_YEAR, THIS_YEAR + 1} <= set(
+        partitioning.partition_years("weight_weightrecord")
+    )
+
+
+class TestHeaderDates:
+    def test_rows_land_in_the_partition_of_their_header_year(self):
+        session = baker.make(WeighingSession, date=date(THIS_YEAR, 3, 1))
+        (record,) = WeightService.record_weights(
+            session, [(baker.make(Cattle), Decimal("300.00"))]
+        )
+
+        assert record.session_date == session.date
+        assert partition_of(WeightRecord, record.pk) == (
+            f"weight_weightrecord_y{THIS_YEAR}"
+        )
+
+    def test_years_without_a_partition_go_to_the_default_one(self):
+        task = baker.make(Task, due_date=date(OLD_YEAR, 1, 1))
+
+        assert partition_of(Task, task.pk) == "tasks_task_default"
+
+    def test_header_date_edits_reach_the_rows(self):
+        event = baker.make(SanitaryEvent, date=date(THIS_YEAR, 3, 1))
+        target = baker.make("health.SanitaryEventTarget", event=event)
+
+        event.date = date(OLD_YEAR, 3, 1)
+        event.save()
+        target.refresh_from_db()
+
+        assert target.event_date == event.date
+        assert partition_of(type(target), target.pk) == (
+            "health_sanitaryeventtarget_default"
+        )
+
+
+class TestMaintenance:
+    def test_creates_partitions_ahead(self):
+        call_command("partitions", ahead=3, stdout=StringIO())
+
+        assert {THIS_YEAR + 2, THIS_YEAR + 3} <= set(
+            partitioning.partition_years("tasks_task")
+        )
+
+    def test_new_partition_takes_its_rows_from_the_default_one(self):
+        task = baker.make(Task, due_date=date(OLD_YEAR, 6, 1))
+
+        partitioning.create_partition("tasks_task", "due_date", OLD_YEAR)
+
+        assert partition_of(Task, task.pk) == f"tasks_task_y{OLD_YEAR}"
+        assert Task.objects.filter(pk=task.pk).exists()
+
+
+class TestPruning:
+    """The date-bounded hot queries only scan the partitions they need."""
+
+    @pytest.fixture(autouse=True)
+    def old_partitions(self):
+        for table, column in partitioning.partitioned_tables().items():
+            partitioning.create_partition(table, column, OLD_YEAR)
+
+    def test_herd_adg_window(self):
+        plan = scanned_tables(WeightService.get_herd_adg_stats)
+
+        assert f"weight_weightrecord_y{THIS_YEAR}" in plan
+        assert f"weight_weightrecord_y{OLD_YEAR}" not in plan
+
+    def test_withdrawal_window(self):
+        medication = baker.make(Medication, withdrawal_days_meat=30)
+        cow = baker.make(Cattle, status=Cattle.STATUS_AVAILABLE)
+        HealthService.create_batch_event(
+            {"date": timezone.localdate(), "title": "Dose", "medication": medication},
+            [cow.pk],
+        )
+
+        plan = scanned_tables(HealthService.check_withdrawal_status, cow)
+
+        assert f"health_sanitaryeventtarget_y{THIS_YEAR}" in plan
+        assert f"health_sanitaryeventtarget_y{OLD_YEAR}" not in plan
+
+    def test_calendar_range(self):
+        start = date(THIS_YEAR, 1, 1)
+        plan = Task.objects.filter(
+            due_date__range=[start, start + timedelta(days=30)]
+        ).explain()
+
+        assert f"tasks_task_y{THIS_YEAR}" in plan
+        assert "tasks_task_default" not in plan
+        assert f"tasks_task_y{OLD_YEAR}" not in plan
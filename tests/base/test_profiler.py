@@ -0,0 +1,66 @@
+# pylint: disable=redefined-outer-name
+import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from model_bakery import baker
+
+from apps.base.utils import profiling
+from apps.locations.models import Location
+
+User = get_user_model()
+
+
+@pytest.fixture
+def admin_client(client, db):
+    admin = User.objects.create_superuser(username="admin", password="pass")
+    client.force_login(admin)
+    return client
+
+
+@pytest.mark.django_db
+class TestProfiler:
+    def test_profiles_a_request_on_demand(self, admin_client):
+        baker.make(Location, _quantity=3)
+
+        response = admin_client.get(reverse("locations:list") + "?profile")
+
+        report_url = response["X-Profile-Url"]
+        report = profiling.recent_reports()[0]
+        assert report_url == reverse("base:profiler-detail", args=[report["id"]])
+        assert report["view"] == "locations:list"
+        assert report["sql_count"] > 0
+        assert "cumulative" in report["functions"]
+        plans = [query["plan"] for query in report["queries"] if query["plan"]]
+        assert any("Buffers" in plan or "actual time" in plan for plan in plans)
+
+        page = admin_client.get(report_url)
+        assert page.status_code == 200
+        assert b"Slowest statements" in page.content
+
+    def test_throttled_per_user(self, admin_client):
+        url = reverse("locations:list") + "?profile"
+
+        admin_client.get(url)
+        response = admin_client.get(url)
+
+        assert "X-Profile-Url" not in response
+        assert len(profiling.recent_reports()) == 1
+
+    def test_cookie_toggle(self, admin_client):
+        response = admin_client.get(reverse("base:profiler-list") + "?profile=on")
+        assert response.cookies[profiling.PROFILE_COOKIE].value == "1"
+
+        response = admin_client.get(reverse("base:profiler-list") + "?profile=off")
+        assert response.cookies[profiling.PROFILE_COOKIE].value == ""
+
+    def test_ignored_for_regular_users(self, client, user):
+        client.force_login(user)
+
+        response = client.get(reverse("locations:list") + "?profile")
+
+        assert "X-Profile-Url" not in response
+        assert client.get(reverse("base:profiler-list")).status_code == 403
+
+    def test_only_select_statements_are_explained(self):
+        statement = {"alias": "default", "sql": "DELETE FROM x", "params": ()}
+        assert profiling.explain(statement) == ""
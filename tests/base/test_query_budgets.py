@@ -0,0 +1,138 @@
+"""
+Per-view query budgets on a realistic herd. Caches are cleared before each
+measured request, so the budgets cover a cold render.
+"""
+
+import logging
+from datetime import date
+
+import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.urls import reverse
+from model_bakery import baker
+
+from apps.base.utils import reference_data
+from apps.base.utils.query_stats import fingerprint
+from apps.cattle.models import Cattle
+from apps.cattle.services.selection_service import SelectionService
+from apps.locations.models import Location
+from apps.tasks.models import Task
+from apps.weight.models import WeighingSession, WeightRecord
+
+HERD_SIZE = 1_000
+
+
+@pytest.fixture
+def herd(db):
+    locations = baker.make(Location, capacity_head=200, area_hectares=50, _quantity=12)
+    Cattle.objects.bulk_create(
+        Cattle(
+            tag=f"H{i:04}",
+            sex=Cattle.SEX_FEMALE if i % 2 else Cattle.SEX_MALE,
+            location=locations[i % len(locations)],
+            current_weight=300 + i % 50,
+        )
+        for i in range(HERD_SIZE)
+    )
+    return locations
+
+
+@pytest.fixture
+def logged_client(client, user):
+    client.force_login(user)
+    client.get(reverse("dashboard:home"))  # Session and CSRF cookie
+    return client
+
+
+def _cold_get(client, url):
+    cache.clear()
+    reference_data.clear_local()
+    return client.get(url)
+
+
+@pytest.mark.django_db
+class TestQueryBudgets:
+    @pytest.mark.parametrize(
+        "url_name, budget",
+        [
+            ("dashboard:home", 20),
+            ("cattle:list", 8),
+            ("locations:list", 6),
+            ("reproduction:overview", 8),
+        ],
+    )
+    def test_pages(self, logged_client, herd, query_budget, url_name, budget):
+        with query_budget(budget):
+            response = _cold_get(logged_client, reverse(url_name))
+        assert response.status_code == 200
+
+    def test_location_detail(self, logged_client, herd, query_budget):
+        with query_budget(8):
+            _cold_get(logged_client, reverse("locations:detail", args=[herd[0].pk]))
+
+    def test_task_calendar_linked_objects(self, logged_client, herd, query_budget):
+        cattle_type = ContentType.objects.get_for_model(Cattle)
+        for animal in Cattle.objects.all()[:50]:
+            baker.make(
+                Task,
+                due_date=date(2024, 5, 10),
+                content_type=cattle_type,
+                object_id=animal.pk,
+                status=Task.Status.PENDING,
+            )
+        url = reverse("tasks:api-events") + "?start=2024-05-01&end=2024-05-31"
+
+        with query_budget(6):
+            response = _cold_get(logged_client, url)
+
+        assert len(response.json()) == 50
+
+    def test_batch_weighing(self, logged_client, user, herd, query_budget):
+        animals = list(Cattle.objects.all()[:100])
+        session = baker.make(WeighingSession, date=date(2024, 6, 1))
+        selection = SelectionService.create_selection(animals, user=user)
+        data = {
+            "selection": selection.pk,
+            **{f"weight_{animal.pk}": "310" for animal in animals},
+        }
+
+        with query_budget(15):
+            logged_client.post(reverse("weight:batch-entry", args=[session.pk]), data)
+
+        assert WeightRecord.objects.filter(session=session).count() == 100
+
+
+@pytest.mark.django_db
+class TestQueryStatsMiddleware:
+    def test_debug_headers(self, logged_client, settings):
+        settings.QUERY_STATS_HEADERS = True
+
+        response = logged_client.get(reverse("cattle:list"))
+
+        assert int(response["X-Query-Count"]) > 0
+        assert "X-Query-Duplicates" in response
+        assert response["Server-Timing"].startswith("db;dur=")
+
+    def test_no_headers_in_production(self, logged_client, settings):
+        settings.QUERY_STATS_HEADERS = False
+
+        response = logged_client.get(reverse("cattle:list"))
+
+        assert "X-Query-Count" not in response
+
+    def test_logs_a_warning_over_budget(self, logged_client, settings, caplog):
+        settings.QUERY_COUNT_WARNING = 0
+
+        with caplog.at_level(logging.INFO, logger="cnv.queries"):
+            logged_client.get(reverse("cattle:list"))
+
+        record = caplog.records[-1]
+        assert record.levelno == logging.WARNING
+        assert "GET /cattle/ 200" in record.getMessage()
+
+
+def test_fingerprint_collapses_parameter_lists():
+    assert fingerprint('SELECT 1 FROM "t" WHERE "id" IN (%s, %s)') == fingerprint(
+        'SELECT 1 FROM "t" WHERE "id" IN (%s,   %s, %s)'
+    )
@@ -0,0 +1,112 @@
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from model_bakery import baker
+
+from apps.base.utils import reference_data
+from apps.nutrition.forms import DietItemFormSet
+from apps.nutrition.models import Diet, FeedIngredient
+from apps.nutrition.services import IngredientService
+from apps.partners.models import Partner
+from apps.partners.services import PartnerService
+from apps.sales.forms import SaleForm
+
+
+def _ingredient_labels():
+    return [str(i) for i in IngredientService.get_ingredient_choices()]
+
+
+@pytest.mark.django_db
+class TestReferenceData:
+    def test_second_read_costs_no_queries(self, django_assert_num_queries):
+        baker.make(Partner, name="Acme")
+        PartnerService.get_partner_choices()
+
+        with django_assert_num_queries(0):
+            partners = PartnerService.get_partner_choices()
+
+        assert [p.name for p in partners] == ["Acme"]
+
+    def test_other_processes_read_the_shared_cache(self, django_assert_num_queries):
+        baker.make(Partner)
+        PartnerService.get_partner_choices()
+        reference_data.clear_local()
+
+        with django_assert_num_queries(0):
+            assert len(PartnerService.get_partner_choices()) == 1
+
+    def test_save_invalidates(self):
+        partner = baker.make(Partner, name="Old")
+        PartnerService.get_partner_choices()
+
+        partner.name = "New"
+        partner.save()
+
+        assert [p.name for p in PartnerService.get_partner_choices()] == ["New"]
+
+    def test_queryset_update_and_soft_delete_invalidate(self):
+        ingredient = baker.make(FeedIngredient, name="Corn", stock_quantity=10)
+        partner = baker.make(Partner)
+        PartnerService.get_partner_choices()
+        stale = _ingredient_labels()
+
+        FeedIngredient.objects.filter(pk=ingredient.pk).update(
+            stock_quantity=Decimal("4")
+        )
+        Partner.objects.filter(pk=partner.pk).delete()
+
+        assert _ingredient_labels() != stale
+        assert PartnerService.get_partner_choices() == []
+
+    def test_local_layer_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(reference_data, "LOCAL_MAX_ENTRIES", 1)
+        baker.make(Partner)
+        PartnerService.get_partner_choices()
+        _ingredient_labels()
+
+        assert len(reference_data._local) == 1
+
+
+@pytest.mark.django_db
+class TestCachedChoices:
+    def test_sale_form_renders_partners_without_queries(self):
+        partner = baker.make(Partner, name="Buyer")
+        SaleForm().as_p()  # Fills the cache
+
+        with CaptureQueriesContext(connection) as queries:
+            html = SaleForm(initial={"partner": partner}).as_p()
+
+        assert not [q for q in queries if "partners_partner" in q["sql"]]
+        assert f'<option value="{partner.pk}" selected>Buyer</option>' in html
+
+    def test_sale_form_still_validates_against_the_database(self):
+        partner = baker.make(Partner)
+        SaleForm().as_p()
+        Partner.all_objects.filter(pk=partner.pk).update(is_deleted=True)
+
+        form = SaleForm(data={"date": "2024-01-01", "partner": partner.pk})
+
+        assert "partner" in form.errors
+
+    def test_diet_formset_rows_share_one_lookup(self):
+        baker.make(FeedIngredient, _quantity=3)
+        diet = baker.make(Diet)
+        DietItemFormSet(instance=diet).as_p()
+
+        with CaptureQueriesContext(connection) as queries:
+            DietItemFormSet(instance=diet).as_p()
+
+        assert not [q for q in queries if "nutrition_feedingredient" in q["sql"]]
+
+    def test_list_filter_dropdown(self, client, user):
+        client.force_login(user)
+        customer = baker.make(Partner, is_customer=True)
+        supplier = baker.make(Partner, is_customer=False)
+
+        response = client.get(reverse("sales:list"))
+
+        assert customer in response.context["partners"]
+        assert supplier not in response.context["partners"]
@@ -0,0 +1,136 @@
+# pylint: disable=redefined-outer-name
+"""
+The replica stand-in (tests/conftest.py) is a second connection to the
+test database: it can't see rows written inside a test's transaction, so
+it behaves like a replica that hasn't caught up yet.
+"""
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.sessions.models import Session
+from django.test import AsyncClient
+from django.urls import reverse
+from django.utils.timezone import now
+from model_bakery import baker
+
+from apps.base.utils import replica
+from apps.cattle.models import Cattle
+from apps.locations.models import Location
+from apps.tasks.models import Task
+
+DATABASES = ["default", "replica"]
+LOCATION = {
+    "name": "New Pasture",
+    "type": "PASTURE",
+    "status": "ACTIVE",
+    "capacity_head": 50,
+    "area_hectares": "100.00",
+    "is_active": True,
+}
+
+
+@pytest.fixture
+def with_replica(settings):
+    settings.REPLICA_DATABASE = "replica"
+
+
+@pytest.fixture
+def auth_client(client, user):
+    client.force_login(user)
+    return client
+
+
+@pytest.mark.django_db(databases=DATABASES)
+class TestRouter:
+    def test_reads_follow_the_block(self, with_replica):
+        assert Cattle.objects.all().db == "default"
+        with replica.reads_from_replica():
+            assert Cattle.objects.all().db == "replica"
+            with replica.reads_from_primary():
+                assert Cattle.objects.all().db == "default"
+
+    def test_reads_after_a_write_stay_on_default(self, with_replica):
+        with replica.reads_from_replica():
+            baker.make(Location)
+
+            assert replica.wrote()
+            assert Cattle.objects.all().db == "default"
+
+    def test_sessions_stay_on_default(self, with_replica):
+        with replica.reads_from_replica():
+            assert Session.objects.all().db == "default"
+            Session.objects.create(session_key="x", session_data="", expire_date=now())
+
+            assert not replica.wrote()
+
+    def test_off_without_a_replica(self):
+        with replica.reads_from_replica():
+            assert Cattle.objects.all().db == "default"
+
+
+@pytest.mark.django_db(databases=DATABASES)
+class TestMiddleware:
+    def test_read_only_views_read_the_replica(self, with_replica, auth_client):
+        baker.make(Location)
+
+        response = auth_client.get(reverse("locations:list"))
+
+        # Not replicated yet
+        assert list(response.context["locations"]) == []
+
+    def test_other_views_read_default(self, with_replica, auth_client):
+        location = baker.make(Location)
+
+        response = auth_client.get(reverse("locations:detail", args=[location.pk]))
+
+        assert response.status_code == 200
+
+    def test_reads_your_writes_after_a_post(self, with_replica, auth_client):
+        response = auth_client.post(reverse("locations:create"), LOCATION)
+        assert replica.PIN_COOKIE in response.cookies
+
+        response = auth_client.get(reverse("locations:list"))
+
+        assert [loc.name for loc in response.context["locations"]] == ["New Pasture"]
+
+    def test_pin_expires(self, with_replica, auth_client, settings):
+        settings.REPLICA_STICKY_SECONDS = 0
+        auth_client.post(reverse("locations:create"), LOCATION)
+
+        response = auth_client.get(reverse("locations:list"))
+
+        assert list(response.context["locations"]) == []
+
+    def test_cached_aggregates_are_computed_on_default(self, with_replica, auth_client):
+        baker.make(Cattle, status=Cattle.STATUS_AVAILABLE)
+
+        response = auth_client.get(reverse("dashboard:home"))
+
+        assert response.context["cattle_stats"]["total"] == 1
+
+    def test_exports_read_the_replica(self, with_replica, auth_client):
+        baker.make(Cattle, tag="LAGGING")
+
+        response = auth_client.get(reverse("cattle:export"))
+
+        assert b"LAGGING" not in b"".join(response.streaming_content)
+
+    def test_async_views_read_the_replica(self, with_replica, user):
+        Task.objects.create(title="Lagging", due_date="2025-01-15", assigned_to=user)
+        client = AsyncClient()
+        async_to_sync(client.aforce_login)(user)
+
+        response = async_to_sync(client.get)(
+            reverse("tasks:api-events"), {"start": "2025-01-01", "end": "2025-01-31"}
+        )
+
+        assert response.json() == []
+
+
+@pytest.mark.django_db(databases=DATABASES, transaction=True)
+def test_replicated_rows_are_served(with_replica, auth_client):
+    baker.make(Location, name="Committed")
+
+    response = auth_client.get(reverse("locations:list"))
+
+    assert [loc.name for loc in response.context["locations"]] == ["Committed"]
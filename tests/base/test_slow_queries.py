@@ -0,0 +1,97 @@
+# pylint: disable=unused-argument
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from model_bakery import baker
+
+from apps.base.models import SlowQuery
+from apps.base.utils import slow_queries
+from apps.base.utils.query_stats import QueryRecorder
+from apps.cattle.models import Cattle
+
+
+@pytest.fixture(autouse=True)
+def clean_totals():
+    slow_queries.reset()
+    yield
+    slow_queries.reset()
+
+
+def test_percentile():
+    assert slow_queries.percentile([]) == 0.0
+    assert slow_queries.percentile(range(1, 101)) == 95
+    assert slow_queries.percentile([3.0]) == 3.0
+
+
+@pytest.mark.django_db
+class TestSlowQueryCapture:
+    def test_requests_are_grouped_by_view_and_fingerprint(self, client, user):
+        client.force_login(user)
+        baker.make(Cattle, _quantity=3)
+
+        client.get(reverse("cattle:list"))
+        client.get(reverse("cattle:list") + "?search=abc")
+        stored = slow_queries.flush()
+
+        assert stored > 0
+        rows = SlowQuery.objects.filter(view="cattle:list")
+        assert rows.exists()
+        assert all(row.calls >= 1 and row.p95_ms <= row.max_ms for row in rows)
+        assert any(row.calls >= 2 for row in rows)
+
+    def test_flush_merges_into_existing_rows(self):
+        with QueryRecorder() as recorder:
+            Cattle.objects.filter(tag__icontains="x").count()
+
+        for _ in range(2):
+            slow_queries.record("cattle:list", recorder)
+            slow_queries.flush()
+
+        row = SlowQuery.objects.get()
+        assert row.calls == 2
+        assert len(row.samples) == 2
+        assert row.example_params == ["%x%"]
+        assert row.total_ms == pytest.approx(recorder.duration * 2000)
+
+    def test_flushed_periodically_from_the_middleware(self, client, user, settings):
+        settings.SLOW_QUERY_FLUSH_INTERVAL = 0
+        client.force_login(user)
+
+        client.get(reverse("cattle:list"))
+
+        assert SlowQuery.objects.filter(view="cattle:list").exists()
+
+    def test_disabled(self, client, user, settings):
+        settings.SLOW_QUERY_CAPTURE = False
+        client.force_login(user)
+
+        client.get(reverse("cattle:list"))
+
+        assert slow_queries.flush() == 0
+
+
+@pytest.mark.django_db
+class TestSlowQueriesCommand:
+    def test_prints_ranked_fingerprints_with_plans(self, client, user):
+        client.force_login(user)
+        client.get(reverse("cattle:list") + "?search=abc")
+        slow_queries.flush()
+        out = StringIO()
+
+        call_command("slow_queries", "--view", "cattle:list", "--explain", stdout=out)
+
+        output = out.getvalue()
+        assert output.startswith("#1 cattle:list:")
+        assert "Example (" in output
+        assert "cost=" in output
+
+    def test_reset(self):
+        baker.make(SlowQuery, view="a", digest="x")
+        out = StringIO()
+
+        call_command("slow_queries", "--reset", stdout=out)
+
+        assert not SlowQuery.objects.exists()
+        assert "Deleted 1" in out.getvalue()
@@ -0,0 +1,37 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from model_bakery import baker
+
+from apps.cattle.models import Cattle
+
+
+@pytest.mark.django_db
+class TestExportCattle:
+    """Tests for the export_cattle management command."""
+
+    def test_writes_csv_to_stdout(self):
+        baker.make(Cattle, tag="A-1", sex=Cattle.SEX_FEMALE)
+        baker.make(Cattle, tag="B-1", sex=Cattle.SEX_MALE)
+        out, err = StringIO(), StringIO()
+
+        call_command(
+            "export_cattle", "--query", "sex=female&breed=", stdout=out, stderr=err
+        )
+
+        lines = out.getvalue().splitlines()
+        assert lines[0].startswith("tag,")
+        assert [line.split(",")[0] for line in lines[1:]] == ["A-1"]
+        assert "Exported 1 rows." in err.getvalue()
+
+    def test_writes_dated_file_into_directory(self, tmp_path):
+        baker.make(Cattle, _quantity=3)
+        out = StringIO()
+
+        call_command("export_cattle", "--format", "jsonl", "-o", tmp_path, stdout=out)
+
+        (path,) = tmp_path.iterdir()
+        assert path.name.startswith("cattle-") and path.suffix == ".jsonl"
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 3
+        assert "Exported 3 rows" in out.getvalue()
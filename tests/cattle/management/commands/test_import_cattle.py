@@ -0,0 +1,37 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from apps.cattle.models import Cattle
+
+
+@pytest.mark.django_db
+class TestImportCattle:
+    """Tests for the import_cattle management command."""
+
+    def test_imports_file_and_reports_errors(self, tmp_path):
+        path = tmp_path / "herd.csv"
+        path.write_text("tag,sex\nC-1,female\nC-2,unicorn\n", encoding="utf-8")
+        out, err = StringIO(), StringIO()
+
+        call_command("import_cattle", str(path), stdout=out, stderr=err)
+
+        assert list(Cattle.objects.values_list("tag", flat=True)) == ["C-1"]
+        assert "Imported 1 of 2 rows (1 errors)" in out.getvalue()
+        assert "Line 3: Invalid sex: unicorn" in err.getvalue()
+
+    def test_dry_run(self, tmp_path):
+        path = tmp_path / "herd.csv"
+        path.write_text("tag\nC-1\n", encoding="utf-8")
+        out = StringIO()
+
+        call_command("import_cattle", str(path), "--dry-run", stdout=out)
+
+        assert not Cattle.objects.exists()
+        assert "Validated 1 of 1 rows" in out.getvalue()
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(CommandError):
+            call_command("import_cattle", str(tmp_path / "missing.csv"))
@@ -0,0 +1,29 @@
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+from model_bakery import baker
+
+from apps.cattle.models import Cattle, Selection
+from apps.cattle.services.selection_service import SelectionService
+
+
+@pytest.mark.django_db
+class TestPurgeSelections:
+    """Tests for the purge_selections management command."""
+
+    def test_deletes_selections_older_than_days(self):
+        cow = baker.make(Cattle)
+        old = SelectionService.create_selection([cow])
+        recent = SelectionService.create_selection([cow])
+        Selection.objects.filter(pk=old.pk).update(
+            created_at=timezone.now() - timedelta(days=3)
+        )
+        out = StringIO()
+
+        call_command("purge_selections", "--days", "2", stdout=out)
+
+        assert list(Selection.objects.all()) == [recent]
+        assert "Deleted 1 stale selections." in out.getvalue()
@@ -0,0 +1,63 @@
+from datetime import date, timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+from model_bakery import baker
+
+from apps.cattle.models import Cattle
+from apps.health.models import Medication, SanitaryEvent, SanitaryEventTarget
+from apps.locations.models import Location, Movement
+from apps.reproduction.models import BreedingEvent, PregnancyCheck
+
+
+@pytest.mark.django_db
+class TestRebuildCattleState:
+    """Tests for the rebuild_cattle_state management command."""
+
+    def test_rebuilds_all_columns(self):
+        location = baker.make(Location)
+        cow = baker.make(
+            Cattle,
+            sex=Cattle.SEX_FEMALE,
+            reproduction_status=Cattle.REP_STATUS_PREGNANT,
+            location=location,
+        )
+        bystander = baker.make(Cattle, last_treatment_date=date(2020, 1, 1))
+
+        treated_on = timezone.localdate() - timedelta(days=1)
+        event = baker.make(
+            SanitaryEvent,
+            date=treated_on,
+            medication=baker.make(Medication, withdrawal_days_meat=7),
+        )
+        baker.make(SanitaryEventTarget, event=event, animal=cow)
+
+        breeding = baker.make(BreedingEvent, dam=cow, date=date(2024, 1, 1))
+        baker.make(
+            PregnancyCheck,
+            breeding_event=breeding,
+            result=PregnancyCheck.RESULT_POSITIVE,
+            expected_calving_date=date(2024, 10, 17),
+        )
+
+        moved_at = timezone.now() - timedelta(days=4)
+        movement = baker.make(Movement, destination=location, date=moved_at)
+        movement.animals.add(cow)
+
+        out = StringIO()
+        call_command("rebuild_cattle_state", batch_size=1, stdout=out)
+
+        cow.refresh_from_db()
+        assert cow.last_treatment_date == treated_on
+        assert cow.withdrawal_until == treated_on + timedelta(days=7)
+        assert cow.last_breeding_date == date(2024, 1, 1)
+        assert cow.expected_calving_date == date(2024, 10, 17)
+        assert cow.location_since == moved_at
+
+        # Stale values without a backing history are cleared
+        bystander.refresh_from_db()
+        assert bystander.last_treatment_date is None
+
+        assert "2 cattle" in out.getvalue()
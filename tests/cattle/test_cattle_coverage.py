@@ -52,10 +52,12 @@ class TestCattleCoverage:
         url = reverse("cattle:detail", kwargs={"pk": cattle.pk})
         response = client.get(url)
 
-        # Should render with health_events and weight_history in context (lines 33-36)
+        # The history tabs are fragments, loaded after the shell
         assert response.status_code == 200
-        assert "health_events" in response.context
-        assert "weight_history" in response.context
+        assert response.context["cattle"] == cattle
+        assert reverse("cattle:detail-timeline", args=[cattle.pk]) in (
+            response.content.decode()
+        )
 
     def test_cattle_create_view_context(self, client, django_user_model):
         """Test CattleCreateView get_context_data (lines 79-81)."""
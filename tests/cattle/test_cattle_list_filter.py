@@ -1,5 +1,8 @@
+from datetime import timedelta
+
 import pytest
 from django.urls import reverse
+from django.utils import timezone
 from model_bakery import baker
 
 from apps.cattle.models import Cattle
@@ -53,3 +56,27 @@ def test_cattle_list_location_filter(client, django_user_model):
     # Test context locations
     assert loc1 in response.context["locations"]
     assert loc2 in response.context["locations"]
+
+
+@pytest.mark.django_db
+def test_cattle_list_condition_filter_and_sort(client, django_user_model):
+    user = baker.make(django_user_model)
+    client.force_login(user)
+
+    today = timezone.localdate()
+    blocked = baker.make(
+        Cattle, tag="COW010", withdrawal_until=today + timedelta(days=5)
+    )
+    clear = baker.make(Cattle, tag="COW011")
+
+    url = reverse("cattle:list")
+
+    response = client.get(url, {"condition": "in_withdrawal"})
+    assert response.status_code == 200
+    assert list(response.context["cattle_list"]) == [blocked]
+    assert response.context["selected_condition"] == "in_withdrawal"
+    assert b"Withdrawal" in response.content
+
+    response = client.get(url, {"sort": "-withdrawal_until"})
+    assert list(response.context["cattle_list"]) == [blocked, clear]
+    assert response.context["selected_sort"] == "-withdrawal_until"
@@ -0,0 +1,108 @@
+import uuid
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.urls import reverse
+from model_bakery import baker
+
+from apps.cattle.models import Cattle
+from apps.health.models import SanitaryEvent, SanitaryEventTarget
+from apps.tasks.models import Task
+from apps.weight.models import WeighingSession, WeightRecord
+
+
+@pytest.fixture
+def cow(db):
+    return baker.make(Cattle, tag="COW", sex=Cattle.SEX_FEMALE)
+
+
+@pytest.mark.django_db
+class TestCattleDetailFragments:
+    def test_requires_login(self, client, cow):
+        response = client.get(reverse("cattle:detail-health", args=[cow.pk]))
+        assert response.status_code == 302
+
+    def test_unknown_animal_is_404(self, client, user):
+        client.force_login(user)
+        response = client.get(reverse("cattle:detail-weights", args=[uuid.uuid4()]))
+        assert response.status_code == 404
+
+    def test_timeline_pages_with_cursor(self, client, user, cow):
+        client.force_login(user)
+        for day in range(30):
+            event = baker.make(SanitaryEvent, date=date(2024, 1, 1) + timedelta(day))
+            SanitaryEventTarget.objects.create(event=event, animal=cow)
+        url = reverse("cattle:detail-timeline", args=[cow.pk])
+
+        response = client.get(url)
+
+        timeline = response.context["timeline"]
+        assert len(timeline["entries"]) == 25
+        assert f'hx-get="{url}?before={timeline["next_cursor"]}"' in (
+            response.content.decode()
+        )
+        older = client.get(url, {"before": timeline["next_cursor"]})
+        assert len(older.context["timeline"]["entries"]) == 5
+
+    def test_health_is_paginated(self, client, user, cow):
+        client.force_login(user)
+        for day in range(12):
+            event = baker.make(SanitaryEvent, date=date(2024, 1, 1) + timedelta(day))
+            SanitaryEventTarget.objects.create(event=event, animal=cow)
+        url = reverse("cattle:detail-health", args=[cow.pk])
+
+        response = client.get(url)
+
+        records = list(response.context["health_records"])
+        assert len(records) == 10
+        assert records[0].event.date == date(2024, 1, 12)
+        assert f'hx-get="{url}?page=2"' in response.content.decode()
+        assert len(client.get(url, {"page": 2}).context["health_records"]) == 2
+
+    def test_weights_chart_covers_all_records(self, client, user, cow):
+        client.force_login(user)
+        for day in range(12):
+            session = baker.make(
+                WeighingSession, date=date(2024, 1, 1) + timedelta(day)
+            )
+            baker.make(
+                WeightRecord, session=session, animal=cow, weight_kg=Decimal(300 + day)
+            )
+
+        response = client.get(reverse("cattle:detail-weights", args=[cow.pk]))
+
+        assert len(response.context["weight_records"]) == 10
+        series = response.context["weight_series"]
+        assert len(series) == 12
+        assert series[0] == {"x": "2024-01-01", "y": 300.0}
+
+    def test_tasks_lists_open_tasks_only(self, client, user, cow):
+        client.force_login(user)
+        cattle_type = ContentType.objects.get_for_model(Cattle)
+        task = baker.make(
+            Task,
+            content_type=cattle_type,
+            object_id=cow.pk,
+            status=Task.Status.PENDING,
+        )
+        baker.make(
+            Task, content_type=cattle_type, object_id=cow.pk, status=Task.Status.DONE
+        )
+
+        response = client.get(reverse("cattle:detail-tasks", args=[cow.pk]))
+
+        assert list(response.context["pending_tasks"]) == [task]
+
+    def test_revalidates_with_etag(self, client, user, cow):
+        client.force_login(user)
+        url = reverse("cattle:detail-timeline", args=[cow.pk])
+
+        response = client.get(url)
+
+        assert "no-cache" in response["Cache-Control"]
+        assert "private" in response["Cache-Control"]
+        assert response.has_header("ETag")
+        again = client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        assert again.status_code == 304
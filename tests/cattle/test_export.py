@@ -0,0 +1,88 @@
+import io
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from django.urls import reverse
+from model_bakery import baker
+
+from apps.cattle.models import Cattle
+from apps.cattle.services.import_service import CattleImportService
+from apps.locations.models import Location
+
+
+def _body(response):
+    return b"".join(response.streaming_content).decode("utf-8-sig")
+
+
+async def _async_export(user, **params):
+    client = AsyncClient()
+    await client.aforce_login(user)
+    response = await client.get(reverse("cattle:export"), params)
+    chunks = [chunk async for chunk in response.streaming_content]
+    return response, b"".join(chunks).decode("utf-8-sig")
+
+
+@pytest.mark.django_db
+class TestCattleExportView:
+    def test_requires_login(self, client):
+        response = client.get(reverse("cattle:export"))
+        assert response.status_code == 302
+
+    def test_exports_the_filtered_list(self, client, user):
+        client.force_login(user)
+        baker.make(Cattle, tag="COW", sex=Cattle.SEX_FEMALE)
+        baker.make(Cattle, tag="BULL", sex=Cattle.SEX_MALE)
+        baker.make(Cattle, tag="GONE", sex=Cattle.SEX_FEMALE, is_deleted=True)
+
+        response = client.get(
+            reverse("cattle:export"), {"sex": Cattle.SEX_FEMALE, "page": "2"}
+        )
+
+        assert response.status_code == 200
+        lines = _body(response).splitlines()
+        assert lines[0].startswith("tag,name,electronic_id,sex")
+        assert [line.split(",")[0] for line in lines[1:]] == ["COW"]
+
+    def test_jsonl_and_unknown_format(self, client, user):
+        client.force_login(user)
+        baker.make(Cattle, tag="COW")
+
+        response = client.get(reverse("cattle:export"), {"format": "jsonl"})
+        assert response["Content-Type"].startswith("application/x-ndjson")
+        assert '"tag": "COW"' in _body(response)
+
+        response = client.get(reverse("cattle:export"), {"format": "xml"})
+        assert response.status_code == 400
+
+    def test_streams_asynchronously_under_asgi(self, user):
+        baker.make(Cattle, tag="COW")
+
+        response, body = async_to_sync(_async_export)(user, format="jsonl")
+
+        assert response.is_async
+        assert '"tag": "COW"' in body
+
+    def test_export_can_be_reimported(self, client, user):
+        client.force_login(user)
+        location = baker.make(Location, name="North")
+        dam = baker.make(Cattle, tag="A-DAM", sex=Cattle.SEX_FEMALE, location=location)
+        baker.make(
+            Cattle,
+            tag="B-CALF",
+            sex=Cattle.SEX_MALE,
+            dam=dam,
+            sire_external_id="AI-7",
+            location=location,
+        )
+        # Sorted by tag, so the dam is imported before her calf
+        exported = _body(client.get(reverse("cattle:export")))
+        Cattle.objects.all().delete(destroy=True)
+
+        result = CattleImportService.import_csv(io.StringIO(exported))
+
+        assert result["error_count"] == 0
+        calf = Cattle.objects.get(tag="B-CALF")
+        assert calf.dam.tag == "A-DAM"
+        assert calf.sire_external_id == "AI-7"
+        assert calf.location == location
@@ -0,0 +1,153 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from django.http import QueryDict
+from django.urls import reverse
+from django.utils import timezone
+from model_bakery import baker
+
+from apps.cattle.models import Cattle
+from apps.cattle.services.cattle_service import CattleService
+from apps.cattle.services.herd_query import HerdQuery, _month_start
+from apps.health.models import Medication, SanitaryEvent, SanitaryEventTarget
+from apps.locations.models import Location, LocationType
+from apps.reproduction.models import Calving
+from apps.weight.models import WeighingSession, WeightRecord
+
+
+def _months_old(months):
+    """A birth date that Cattle.age reports as exactly `months` months."""
+    return _month_start(timezone.localdate(), months)
+
+
+class TestHerdQuerySerialization:
+    def test_round_trips_through_querystring(self):
+        query = HerdQuery(
+            sex=Cattle.SEX_FEMALE,
+            breed=[Cattle.BREED_ANGUS, Cattle.BREED_NELORE],
+            adg_max="0.5",
+            in_withdrawal=False,
+            not_treated_days=60,
+        )
+
+        restored = HerdQuery.from_params(QueryDict(query.to_querystring()))
+
+        assert restored.criteria == query.criteria
+        assert restored.criteria["adg_max"] == Decimal("0.5")
+        assert restored.criteria["in_withdrawal"] is False
+
+    def test_from_params_skips_invalid_values(self):
+        query = HerdQuery.from_params(
+            QueryDict("sex=unicorn&age_min_months=abc&location=nope&q=A1&page=2")
+        )
+
+        assert query.criteria == {"q": "A1"}
+
+    def test_where_rejects_unknown_filters(self):
+        with pytest.raises(ValueError):
+            HerdQuery().where(colour="red")
+
+    def test_empty_value_removes_criterion(self):
+        query = HerdQuery(sex=Cattle.SEX_MALE).where(sex="")
+
+        assert not query
+
+
+@pytest.mark.django_db
+class TestHerdQueryFilters:
+    def test_example_cohort_in_one_query(self, django_assert_num_queries):
+        today = timezone.localdate()
+        feedlot = baker.make(Location, type=LocationType.FEEDLOT)
+        pasture = baker.make(Location, type=LocationType.PASTURE)
+        session = baker.make(WeighingSession, date=today - timedelta(days=10))
+
+        def make(tag, adg="0.3", **kwargs):
+            fields = {
+                "sex": Cattle.SEX_FEMALE,
+                "birth_date": _months_old(24),
+                "location": feedlot,
+                **kwargs,
+            }
+            animal = baker.make(Cattle, tag=tag, **fields)
+            baker.make(WeightRecord, session=session, animal=animal, adg=Decimal(adg))
+            return animal
+
+        match = make("MATCH")
+        make("MALE", sex=Cattle.SEX_MALE)
+        make("YOUNG", birth_date=_months_old(12))
+        make("OLD", birth_date=_months_old(31))
+        make("FAST", adg="0.9")
+        make("TREATED", last_treatment_date=today - timedelta(days=5))
+        make("PASTURE", location=pasture)
+
+        query = HerdQuery(
+            sex=Cattle.SEX_FEMALE,
+            age_min_months=18,
+            age_max_months=30,
+            adg_max="0.5",
+            not_treated_days=60,
+            location_type=LocationType.FEEDLOT,
+        )
+
+        with django_assert_num_queries(1):
+            result = list(query.apply())
+
+        assert result == [match]
+
+    def test_age_bounds_match_cattle_age(self):
+        edge = baker.make(Cattle, birth_date=_months_old(18))
+        younger = baker.make(Cattle, birth_date=_months_old(17))
+
+        result = list(HerdQuery(age_min_months=18, age_max_months=18).apply())
+
+        assert edge.age == "1y 6m"
+        assert result == [edge]
+        assert younger not in result
+
+    def test_adg_window_ignores_old_weighings(self):
+        cow = baker.make(Cattle)
+        old = baker.make(
+            WeighingSession, date=timezone.localdate() - timedelta(days=200)
+        )
+        baker.make(WeightRecord, session=old, animal=cow, adg=Decimal("0.1"))
+
+        assert not HerdQuery(adg_max="0.5").apply().exists()
+        assert HerdQuery(adg_max="0.5", adg_days=365).apply().exists()
+
+    def test_related_history_filters(self):
+        medication = baker.make(Medication)
+        treated = baker.make(Cattle)
+        event = baker.make(SanitaryEvent, medication=medication, date=date.today())
+        baker.make(SanitaryEventTarget, event=event, animal=treated)
+
+        dam = baker.make(Cattle, sex=Cattle.SEX_FEMALE)
+        baker.make(Calving, dam=dam)
+
+        assert list(HerdQuery(treated_with=str(medication.pk)).apply()) == [treated]
+        assert list(HerdQuery(has_calved=True).apply()) == [dam]
+        assert dam not in HerdQuery(has_calved=False).apply()
+
+    def test_composes_with_list_filters(self):
+        angus = baker.make(Cattle, breed=Cattle.BREED_ANGUS, sex=Cattle.SEX_MALE)
+        baker.make(Cattle, breed=Cattle.BREED_ANGUS, sex=Cattle.SEX_FEMALE)
+        baker.make(Cattle, breed=Cattle.BREED_NELORE, sex=Cattle.SEX_MALE)
+
+        qs = CattleService.get_all_cattle(
+            breed=Cattle.BREED_ANGUS, criteria=HerdQuery(sex=Cattle.SEX_MALE)
+        )
+
+        assert list(qs) == [angus]
+
+
+@pytest.mark.django_db
+def test_cattle_list_uses_herd_query(client, user):
+    client.force_login(user)
+    bull = baker.make(Cattle, tag="BULL1", sex=Cattle.SEX_MALE)
+    baker.make(Cattle, tag="COW1", sex=Cattle.SEX_FEMALE)
+
+    response = client.get(reverse("cattle:list"), {"sex": "male", "page": "1"})
+
+    assert list(response.context["cattle_list"]) == [bull]
+    assert response.context["saved_search_query"] == "sex=male"
+    assert response.context["advanced_filters_active"]
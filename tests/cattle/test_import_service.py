@@ -0,0 +1,194 @@
+import io
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import DataError, IntegrityError
+from django.urls import reverse
+from model_bakery import baker
+
+from apps.cattle.models import Cattle
+from apps.cattle.services.import_service import CattleImportService
+from apps.locations.models import Location
+
+
+def _csv(*lines):
+    return io.StringIO("\n".join(lines) + "\n")
+
+
+@pytest.mark.django_db
+class TestCattleImportService:
+    def test_imports_rows_with_labels_and_codes(self):
+        location = baker.make(Location, name="North Pasture")
+
+        result = CattleImportService.import_csv(
+            _csv(
+                "Tag,Name,Sex,Breed,Birth_Date,Weight_kg,Location",
+                'A-1,Bessie,Female,nelore,2022-03-01,"412,5",north pasture',
+                "A-2,,male,Angus,15/04/2023,,",
+            )
+        )
+
+        assert result == {"rows": 2, "created": 2, "error_count": 0, "errors": []}
+        cow = Cattle.objects.get(tag="A-1")
+        assert cow.sex == Cattle.SEX_FEMALE
+        assert cow.breed == Cattle.BREED_NELORE
+        assert cow.birth_date == date(2022, 3, 1)
+        assert cow.weight_kg == Decimal("412.5")
+        assert cow.current_weight == Decimal("412.5")
+        assert cow.location == location
+        assert cow.location_since is not None
+        bull = Cattle.objects.get(tag="A-2")
+        assert bull.breed == Cattle.BREED_ANGUS
+        assert bull.status == Cattle.STATUS_AVAILABLE
+
+    def test_reports_row_errors_without_aborting(self):
+        baker.make(Cattle, tag="TAKEN")
+
+        result = CattleImportService.import_csv(
+            _csv(
+                "tag,sex,birth_date,location",
+                "OK-1,female,,",
+                ",female,,",
+                "TAKEN,female,,",
+                "OK-1,male,,",
+                "BAD-SEX,cow,,",
+                "BAD-DATE,female,yesterday,",
+                "BAD-LOC,female,,Nowhere",
+                "OK-2,male,,",
+            )
+        )
+
+        assert result["rows"] == 8
+        assert result["created"] == 2
+        assert [line for line, _message in result["errors"]] == [3, 4, 5, 6, 7, 8]
+        assert set(Cattle.objects.values_list("tag", flat=True)) == {
+            "TAKEN",
+            "OK-1",
+            "OK-2",
+        }
+
+    def test_resolves_parents_by_tag_electronic_id_and_file_order(self):
+        sire = baker.make(Cattle, tag="BULL", sex=Cattle.SEX_MALE)
+        dam = baker.make(
+            Cattle, tag="COW", electronic_id="982000123", sex=Cattle.SEX_FEMALE
+        )
+
+        result = CattleImportService.import_csv(
+            _csv(
+                "tag,sex,sire,dam",
+                "CALF-1,female,BULL,982000123",
+                "CALF-2,male,AI-STRAW-7,CALF-1",
+                "CALF-3,male,COW,",
+            ),
+            chunk_size=2,
+        )
+
+        assert result["created"] == 2
+        assert result["errors"][0][0] == 4
+        calf = Cattle.objects.get(tag="CALF-1")
+        assert calf.sire == sire
+        assert calf.dam == dam
+        second = Cattle.objects.get(tag="CALF-2")
+        assert second.sire is None
+        assert second.sire_external_id == "AI-STRAW-7"
+        assert second.dam == calf  # Imported in an earlier chunk
+
+    def test_dry_run_validates_without_saving(self):
+        result = CattleImportService.import_csv(
+            _csv("tag", "D-1", "D-1", "D-2"), dry_run=True
+        )
+
+        assert result["created"] == 2
+        assert result["error_count"] == 1
+        assert not Cattle.objects.exists()
+
+    def test_falls_back_to_row_inserts_on_conflict(self):
+        with patch.object(
+            CattleImportService, "_copy", side_effect=IntegrityError("race")
+        ):
+            result = CattleImportService.import_csv(_csv("tag", "R-1", "R-2"))
+
+        assert result["created"] == 2
+        assert Cattle.objects.count() == 2
+
+    def test_reports_values_the_columns_cannot_hold(self):
+        result = CattleImportService.import_csv(
+            _csv(
+                "tag,name,electronic_id,weight_kg",
+                f"LONG-NAME,{'x' * 101},,",
+                f"LONG-EID,,{'9' * 101},",
+                "HEAVY,,,1000000",
+                "NAN,,,nan",
+                "INF,,,inf",
+                "OK,,,999999.99",
+            )
+        )
+
+        assert [line for line, _message in result["errors"]] == [2, 3, 4, 5, 6]
+        assert list(Cattle.objects.values_list("tag", flat=True)) == ["OK"]
+
+    def test_falls_back_to_row_inserts_on_data_errors(self):
+        with (
+            patch.object(
+                CattleImportService, "_copy", side_effect=DataError("overflow")
+            ),
+            patch.object(
+                Cattle,
+                "save",
+                autospec=True,
+                side_effect=[None, DataError("value too long")],
+            ),
+        ):
+            result = CattleImportService.import_csv(_csv("tag", "R-1", "R-2"))
+
+        assert result["created"] == 1
+        assert result["errors"] == [(3, "value too long")]
+
+    def test_missing_tag_column(self):
+        result = CattleImportService.import_csv(_csv("name,sex", "Bessie,female"))
+
+        assert result["created"] == 0
+        assert result["error_count"] == 1
+
+
+@pytest.mark.django_db
+class TestCattleImportView:
+    def test_requires_login(self, client):
+        response = client.get(reverse("cattle:import"))
+        assert response.status_code == 302
+
+    def test_upload_imports_and_shows_errors(self, client, user):
+        client.force_login(user)
+        upload = SimpleUploadedFile(
+            "herd.csv", b"\xef\xbb\xbftag,sex\nU-1,female\n,male\n", "text/csv"
+        )
+
+        response = client.post(reverse("cattle:import"), {"file": upload})
+
+        assert response.status_code == 200
+        assert response.context["result"]["created"] == 1
+        assert response.context["errors"][0][0] == 3
+        assert Cattle.objects.filter(tag="U-1").exists()
+
+    def test_upload_dry_run(self, client, user):
+        client.force_login(user)
+        upload = SimpleUploadedFile("herd.csv", b"tag\nU-1\n", "text/csv")
+
+        response = client.post(
+            reverse("cattle:import"), {"file": upload, "dry_run": "on"}
+        )
+
+        assert response.context["result"]["created"] == 1
+        assert not Cattle.objects.exists()
+
+    def test_upload_rejects_non_utf8(self, client, user):
+        client.force_login(user)
+        upload = SimpleUploadedFile("herd.csv", b"tag\n\xff\xfe\n", "text/csv")
+
+        response = client.post(reverse("cattle:import"), {"file": upload})
+
+        assert response.status_code == 200
+        assert response.context["form"].errors["file"]
@@ -0,0 +1,188 @@
+import uuid
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.test import RequestFactory
+from django.utils import timezone
+from model_bakery import baker
+
+from apps.cattle.models import Cattle, Selection, SelectionMember
+from apps.cattle.services.herd_query import HerdQuery
+from apps.cattle.services.selection_service import SelectionService
+from apps.trash.services import TrashService
+
+
+def _members(selection):
+    return set(selection.members.values_list("animal_id", flat=True))
+
+
+@pytest.mark.django_db
+class TestSelectionCreation:
+    def test_create_from_ids_drops_unknown_and_deleted(self):
+        cow = baker.make(Cattle)
+        gone = baker.make(Cattle, is_deleted=True)
+
+        selection = SelectionService.create_selection(
+            [str(cow.pk), str(gone.pk), str(uuid.uuid4()), "not-a-uuid"]
+        )
+
+        assert _members(selection) == {cow.pk}
+        assert selection.size == 1
+
+    def test_create_from_comma_joined_ids_and_duplicates(self):
+        c1, c2 = baker.make(Cattle, _quantity=2)
+
+        selection = SelectionService.create_selection([f"{c1.pk},{c2.pk}", c1.pk])
+
+        assert _members(selection) == {c1.pk, c2.pk}
+        assert selection.size == 2
+
+    def test_create_from_herd_query(self):
+        cow = baker.make(Cattle, sex=Cattle.SEX_FEMALE)
+        baker.make(Cattle, sex=Cattle.SEX_MALE)
+
+        selection = SelectionService.create_selection(
+            HerdQuery(sex=Cattle.SEX_FEMALE).apply(), name="Cows"
+        )
+
+        assert _members(selection) == {cow.pk}
+        assert selection.name == "Cows"
+
+    def test_get_cattle_excludes_deleted_members(self):
+        c1, c2 = baker.make(Cattle, _quantity=2)
+        selection = SelectionService.create_selection([c1, c2])
+        c2.delete()
+
+        assert list(SelectionService.get_cattle(selection)) == [c1]
+
+    def test_add_and_remove(self):
+        c1, c2 = baker.make(Cattle, _quantity=2)
+        selection = SelectionService.create_selection([c1])
+
+        assert SelectionService.add(selection, [c1, c2]) == 1
+        assert selection.size == 2
+
+        assert SelectionService.remove(selection, [c1.pk]) == 1
+        assert _members(selection) == {c2.pk}
+        assert selection.size == 1
+
+
+@pytest.mark.django_db
+class TestSelectionSetOperations:
+    @pytest.fixture
+    def herd(self):
+        c1, c2, c3 = baker.make(Cattle, _quantity=3)
+        first = SelectionService.create_selection([c1, c2])
+        second = SelectionService.create_selection([c2, c3])
+        return c1, c2, c3, first, second
+
+    def test_union(self, herd):
+        c1, c2, c3, first, second = herd
+
+        result = SelectionService.union(first, second)
+
+        assert _members(result) == {c1.pk, c2.pk, c3.pk}
+        assert result.size == 3
+
+    def test_difference(self, herd):
+        c1, _c2, _c3, first, second = herd
+
+        result = SelectionService.difference(first, second)
+
+        assert _members(result) == {c1.pk}
+
+    def test_intersection(self, herd):
+        _c1, c2, _c3, first, second = herd
+
+        result = SelectionService.intersection(first, second)
+
+        assert _members(result) == {c2.pk}
+
+    def test_operands_are_untouched(self, herd):
+        c1, c2, _c3, first, second = herd
+
+        SelectionService.difference(first, second)
+
+        assert _members(first) == {c1.pk, c2.pk}
+
+
+@pytest.mark.django_db
+class TestSelectionResolve:
+    def test_resolves_selection_param(self, user):
+        selection = SelectionService.create_selection([baker.make(Cattle)], user=user)
+        request = RequestFactory().post("/", {"selection": str(selection.pk)})
+        request.user = user
+
+        assert SelectionService.resolve(request) == selection
+
+    def test_ignores_other_users_selections(self, user, django_user_model):
+        other = baker.make(django_user_model)
+        selection = SelectionService.create_selection([baker.make(Cattle)], user=other)
+        request = RequestFactory().get("/", {"selection": str(selection.pk)})
+        request.user = user
+
+        assert SelectionService.resolve(request) is None
+
+    def test_get_with_cattle_ids_creates_nothing(self, user):
+        cow = baker.make(Cattle)
+        request = RequestFactory().get("/", {"cattle_ids": [str(cow.pk)]})
+        request.user = user
+
+        assert SelectionService.resolve(request) is None
+        assert not Selection.objects.exists()
+
+    def test_creates_selection_from_cattle_ids(self, user):
+        cow = baker.make(Cattle)
+        request = RequestFactory().post("/", {"cattle_ids": [str(cow.pk)]})
+        request.user = user
+
+        selection = SelectionService.resolve(request)
+
+        assert _members(selection) == {cow.pk}
+        assert selection.created_by == user
+
+    def test_anonymous_and_empty_requests(self):
+        request = RequestFactory().get("/", {"selection": "garbage"})
+        request.user = AnonymousUser()
+        assert SelectionService.resolve(request) is None
+
+        request = RequestFactory().get("/")
+        request.user = AnonymousUser()
+        assert SelectionService.resolve(request) is None
+        assert not Selection.objects.exists()
+
+
+@pytest.mark.django_db
+class TestSelectionLifecycle:
+    def test_membership_does_not_block_cattle_deletion(self):
+        cow = baker.make(Cattle)
+        SelectionService.create_selection([cow])
+
+        cow.delete()
+
+        assert Cattle.all_objects.get(pk=cow.pk).is_deleted
+
+    def test_purging_cattle_removes_membership(self):
+        cow = baker.make(Cattle, is_deleted=True)
+        selection = SelectionService.create_selection(Cattle.all_objects.all())
+
+        assert TrashService.bulk_purge({"cattle": [cow.pk]})["purged"] == 1
+        assert not SelectionMember.objects.filter(selection=selection).exists()
+
+    def test_purge_stale_keeps_named_and_recent(self):
+        cow = baker.make(Cattle)
+        stale = SelectionService.create_selection([cow])
+        named = SelectionService.create_selection([cow], name="Keep")
+        recent = SelectionService.create_selection([cow])
+        Selection.objects.filter(pk__in=[stale.pk, named.pk]).update(
+            created_at=timezone.now() - timedelta(days=30)
+        )
+
+        assert SelectionService.purge_stale() == 1
+
+        assert set(Selection.objects.values_list("pk", flat=True)) == {
+            named.pk,
+            recent.pk,
+        }
+        assert not SelectionMember.objects.filter(selection_id=stale.pk).exists()
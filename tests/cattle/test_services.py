@@ -1,4 +1,8 @@
+from datetime import timedelta
+
 import pytest
+from django.utils import timezone
+from model_bakery import baker
 
 from apps.cattle.models import Cattle
 from apps.cattle.services.cattle_service import CattleService
@@ -115,3 +119,97 @@ class TestCattleService:
         assert breakdown["Other"] == 1
         # Fallback for unknown should be title cased code
         assert breakdown["Unknown_Breed"] == 1
+
+    def test_herd_summary_single_query(self, django_assert_num_queries):
+        Cattle.objects.create(
+            tag="F1",
+            sex=Cattle.SEX_FEMALE,
+            reproduction_status=Cattle.REP_STATUS_PREGNANT,
+            weight_kg=100,
+        )
+        Cattle.objects.create(
+            tag="F2",
+            sex=Cattle.SEX_FEMALE,
+            reproduction_status=Cattle.REP_STATUS_OPEN,
+            status=Cattle.STATUS_SOLD,
+            weight_kg=100,
+        )
+        Cattle.objects.create(tag="M1", sex=Cattle.SEX_MALE, weight_kg=100)
+
+        with django_assert_num_queries(1):
+            summary = CattleService.get_herd_summary()
+
+        assert summary["total"] == 2
+        assert summary["status_breakdown"] == {
+            Cattle.STATUS_AVAILABLE: 2,
+            Cattle.STATUS_SOLD: 1,
+        }
+        assert summary["sex_breakdown"] == {
+            Cattle.SEX_MALE: 1,
+            Cattle.SEX_FEMALE: 1,
+        }
+        assert summary["total_females"] == 1
+        assert summary["reproduction_breakdown"][Cattle.REP_STATUS_PREGNANT] == 1
+        assert summary["reproduction_breakdown"][Cattle.REP_STATUS_OPEN] == 0
+
+    def test_herd_summary_is_cached_and_invalidated(self, django_assert_num_queries):
+        cow = Cattle.objects.create(tag="C1", weight_kg=100)
+        assert CattleService.get_herd_summary()["total"] == 1
+
+        with django_assert_num_queries(0):
+            CattleService.get_herd_summary()
+
+        cow.status = Cattle.STATUS_SOLD
+        cow.save()
+        assert CattleService.get_herd_summary()["total"] == 0
+
+        Cattle.objects.create(tag="C2", weight_kg=100)
+        assert CattleService.get_herd_summary()["total"] == 1
+
+    def test_get_all_cattle_condition_filters(self):
+        today = timezone.localdate()
+        in_withdrawal = baker.make(
+            Cattle, tag="W1", withdrawal_until=today + timedelta(days=3)
+        )
+        cleared = baker.make(Cattle, tag="W2", withdrawal_until=today)
+        due = baker.make(
+            Cattle,
+            tag="P1",
+            reproduction_status=Cattle.REP_STATUS_PREGNANT,
+            expected_calving_date=today + timedelta(days=10),
+        )
+        baker.make(
+            Cattle,
+            tag="P2",
+            reproduction_status=Cattle.REP_STATUS_PREGNANT,
+            expected_calving_date=today + timedelta(days=90),
+        )
+
+        qs = CattleService.get_all_cattle(
+            condition=CattleService.CONDITION_IN_WITHDRAWAL
+        )
+        assert list(qs) == [in_withdrawal]
+
+        qs = CattleService.get_all_cattle(
+            condition=CattleService.CONDITION_CALVING_SOON
+        )
+        assert list(qs) == [due]
+
+        qs = CattleService.get_all_cattle(condition="bogus")
+        assert cleared in qs
+        assert qs.count() == 4
+
+    def test_get_all_cattle_ordering_puts_nulls_last(self):
+        today = timezone.localdate()
+        late = baker.make(Cattle, tag="A", expected_calving_date=today)
+        none = baker.make(Cattle, tag="B", expected_calving_date=None)
+        soon = baker.make(
+            Cattle, tag="C", expected_calving_date=today - timedelta(days=1)
+        )
+
+        qs = CattleService.get_all_cattle(ordering="expected_calving_date")
+        assert list(qs) == [soon, late, none]
+
+        # Unknown sort keys fall back to tag order
+        qs = CattleService.get_all_cattle(ordering="notes")
+        assert list(qs) == [late, none, soon]
@@ -0,0 +1,176 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.urls import reverse
+from django.utils import timezone
+from model_bakery import baker
+
+from apps.cattle.models import Cattle
+from apps.cattle.services.timeline_service import TimelineService
+from apps.health.models import SanitaryEvent, SanitaryEventTarget
+from apps.locations.models import Location, Movement, MovementReason
+from apps.purchases.models import Purchase, PurchaseItem
+from apps.reproduction.models import BreedingEvent, Calving, PregnancyCheck
+from apps.sales.models import Sale, SaleItem
+from apps.weight.models import WeighingSession, WeightRecord
+
+
+@pytest.fixture
+def cow_history(db):
+    cow = baker.make(Cattle, tag="COW", sex=Cattle.SEX_FEMALE)
+    bull = baker.make(Cattle, tag="BULL", sex=Cattle.SEX_MALE)
+    calf = baker.make(Cattle, tag="CALF", sex=Cattle.SEX_MALE)
+    pasture = baker.make(Location, name="North")
+    partner = baker.make("partners.Partner", name="Auction")
+
+    purchase = baker.make(Purchase, date=date(2020, 1, 5), partner=partner)
+    PurchaseItem.objects.create(
+        purchase=purchase, content_object=cow, quantity=1, unit_price=Decimal("1")
+    )
+    movement = baker.make(
+        Movement,
+        date=timezone.make_aware(datetime(2020, 1, 6, 10)),
+        destination=pasture,
+        reason=MovementReason.ROTATION,
+    )
+    movement.animals.add(cow)
+    session = baker.make(WeighingSession, date=date(2020, 2, 1))
+    baker.make(
+        WeightRecord,
+        session=session,
+        animal=cow,
+        weight_kg=Decimal("410.50"),
+        adg=Decimal("0.750"),
+    )
+    breeding = baker.make(
+        BreedingEvent,
+        dam=cow,
+        sire=bull,
+        date=date(2020, 3, 1),
+        breeding_method=BreedingEvent.METHOD_AI,
+    )
+    baker.make(
+        PregnancyCheck,
+        breeding_event=breeding,
+        date=date(2020, 4, 15),
+        result=PregnancyCheck.RESULT_POSITIVE,
+        expected_calving_date=date(2020, 12, 5),
+    )
+    baker.make(Calving, dam=cow, calf=calf, date=date(2020, 12, 6))
+    event = baker.make(
+        SanitaryEvent, date=date(2021, 1, 10), title="Vaccination", medication=None
+    )
+    baker.make(SanitaryEventTarget, event=event, animal=cow)
+    sale = baker.make(Sale, date=date(2022, 6, 1), partner=partner)
+    SaleItem.objects.create(
+        sale=sale, content_object=cow, quantity=1, unit_price=Decimal("1")
+    )
+
+    # Other animals and deleted records stay out
+    gone = baker.make(SanitaryEvent, date=date(2021, 2, 1), is_deleted=True)
+    baker.make(SanitaryEventTarget, event=gone, animal=cow)
+    baker.make(WeightRecord, animal=bull)
+    return cow
+
+
+def _kinds(page):
+    return [entry["kind"] for entry in page["entries"]]
+
+
+@pytest.mark.django_db
+class TestTimelineService:
+    def test_merges_all_event_kinds_newest_first(
+        self, cow_history, django_assert_num_queries
+    ):
+        ContentType.objects.get_for_model(Cattle)  # Warm the content type cache
+
+        with django_assert_num_queries(1):
+            page = TimelineService.get_timeline(cow_history)
+
+        assert _kinds(page) == [
+            "sale",
+            "health",
+            "calving",
+            "pregnancy_check",
+            "breeding",
+            "weight",
+            "movement",
+            "purchase",
+        ]
+        assert page["next_cursor"] is None
+        summaries = {entry["kind"]: entry["summary"] for entry in page["entries"]}
+        assert summaries["weight"] == "Weighed 410.50 kg (ADG 0.750 kg/day)"
+        assert summaries["breeding"] == "Artificial Insemination: BULL"
+        assert summaries["calving"] == "Calved CALF (Easy/Unassisted)"
+        assert summaries["movement"] == "Moved to North (Rotation)"
+        assert summaries["sale"] == "Sale: Auction"
+        assert page["entries"][-2]["date"] == date(2020, 1, 6)
+
+    def test_links_entries_to_their_records(self, cow_history):
+        entries = {
+            entry["kind"]: entry
+            for entry in TimelineService.get_timeline(cow_history)["entries"]
+        }
+
+        calf = Cattle.objects.get(tag="CALF")
+        assert entries["calving"]["url"] == reverse("cattle:detail", args=[calf.pk])
+        assert entries["breeding"]["url"] is None
+
+    def test_calf_and_sire_see_the_event_from_their_side(self, cow_history):
+        calf_page = TimelineService.get_timeline(Cattle.objects.get(tag="CALF"))
+        bull_page = TimelineService.get_timeline(Cattle.objects.get(tag="BULL"))
+
+        assert [e["summary"] for e in calf_page["entries"]] == ["Born to COW"]
+        assert "Artificial Insemination: COW" in [
+            e["summary"] for e in bull_page["entries"]
+        ]
+
+    def test_keyset_pages_cover_the_history_once(self, cow_history):
+        seen = []
+        cursor = None
+        while True:
+            page = TimelineService.get_timeline(cow_history, cursor=cursor, limit=3)
+            seen.extend(_kinds(page))
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        assert seen == _kinds(TimelineService.get_timeline(cow_history))
+
+    def test_same_day_entries_are_split_by_key(self):
+        cow = baker.make(Cattle)
+        for _ in range(3):
+            event = baker.make(SanitaryEvent, date=date(2024, 1, 1))
+            baker.make(SanitaryEventTarget, event=event, animal=cow)
+
+        first = TimelineService.get_timeline(cow, limit=2)
+        second = TimelineService.get_timeline(cow, cursor=first["next_cursor"])
+
+        keys = [e["key"] for e in first["entries"] + second["entries"]]
+        assert len(set(keys)) == 3
+
+    def test_invalid_cursor_starts_over(self, cow_history):
+        page = TimelineService.get_timeline(cow_history, cursor="yesterday_x")
+
+        assert len(page["entries"]) == 8
+
+
+@pytest.mark.django_db
+class TestCattleDetailTimeline:
+    def test_timeline_fragment_paginates(self, client, user, cow_history):
+        client.force_login(user)
+        url = reverse("cattle:detail-timeline", args=[cow_history.pk])
+
+        first = client.get(url)
+        cursor = TimelineService.encode_cursor(first.context["timeline"]["entries"][3])
+        older = client.get(url, {"before": cursor})
+
+        assert b"Moved to North" in first.content
+        assert _kinds(older.context["timeline"]) == [
+            "breeding",
+            "weight",
+            "movement",
+            "purchase",
+        ]
@@ -1,14 +1,56 @@
 # pylint: disable=unused-argument
+from contextlib import contextmanager
+
 import pytest
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.test import Client
+from django.core.cache import cache
+from django.test import Client, override_settings
 from model_bakery import baker
 
+from apps.base.utils import reference_data
+from apps.base.utils.query_stats import QueryRecorder
 from apps.cattle.models.cattle import Cattle
 
 User = get_user_model()
 
 
+@pytest.fixture(autouse=True, scope="session")
+def local_cache():
+    """Tests run against a per-process cache instead of the shared backend."""
+    with override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "KEY_PREFIX": "cnv",
+            }
+        }
+    ):
+        yield
+
+
+@pytest.fixture(scope="session")
+def django_db_modify_db_settings(django_db_modify_db_settings_parallel_suffix):
+    """
+    A second alias on the test database stands in for the read replica.
+    Routing to it stays off (REPLICA_DATABASE) unless a test turns it on.
+    """
+    default = settings.DATABASES["default"]
+    settings.DATABASES.setdefault(
+        "replica", {**default, "TEST": {**default["TEST"], "MIRROR": "default"}}
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Cached aggregates must not leak between tests."""
+    cache.clear()
+    reference_data.clear_local()
+    yield
+    cache.clear()
+    reference_data.clear_local()
+
+
 @pytest.fixture
 def client():
     return Client()
@@ -28,3 +70,24 @@ def cattle():
 @pytest.fixture
 def bull():
     return baker.make(Cattle, sex=Cattle.SEX_MALE)
+
+
+@pytest.fixture
+def query_budget(db):
+    """
+    Fails the test when the block runs more than `limit` queries, listing
+    the repeated statements (usually an N+1):
+
+        with query_budget(15):
+            client.get(url)
+    """
+
+    @contextmanager
+    def budget(limit: int):
+        with QueryRecorder() as recorder:
+            yield recorder
+        assert (
+            recorder.count <= limit
+        ), f"Query budget of {limit} exceeded: {recorder.report()}"
+
+    return budget
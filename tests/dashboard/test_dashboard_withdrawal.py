@@ -13,6 +13,7 @@ from apps.health.models import (
     SanitaryEvent,
     SanitaryEventTarget,
 )
+from apps.health.services import HealthService
 
 
 @pytest.mark.django_db
@@ -66,6 +67,8 @@ class TestDashboardWithdrawalKPI:
             SanitaryEvent, date=timezone.localdate(), medication=med1, performed_by=user
         )
         baker.make(SanitaryEventTarget, event=event4, animal=cow4)
+        # Targets made directly skip the state sync of the service
+        HealthService.sync_treatment_state([cow1.pk, cow2.pk, cow4.pk])
 
         # Request Dashboard
         response = client.get(reverse("dashboard:home"))
@@ -0,0 +1,51 @@
+import asyncio
+import json
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from django.test import AsyncClient
+from django.urls import reverse
+from django.utils import timezone
+from model_bakery import baker
+
+from apps.cattle.models import Cattle
+from apps.health.services import HealthService
+
+
+@pytest.mark.django_db(transaction=True)
+def test_event_progress_streams_removed_targets(django_user_model):
+    user = django_user_model.objects.create_user(username="vet", password="pw")
+    cattle = baker.make(Cattle, _quantity=3)
+    event = HealthService.create_batch_event(
+        {"date": date.today(), "title": "Vaccination", "total_cost": Decimal("30")},
+        [animal.pk for animal in cattle],
+    )
+    removed = event.targets.first()
+    since = timezone.now()
+
+    async def scenario():
+        client = AsyncClient()
+        await client.aforce_login(user)
+        response = await client.get(
+            reverse("health:event-progress", args=[event.pk]),
+            {"since": since.isoformat()},
+        )
+        events = aiter(response.streaming_content)
+        first = await asyncio.wait_for(anext(events), timeout=10)
+        await sync_to_async(removed.delete, thread_sensitive=False)()
+        second = await asyncio.wait_for(anext(events), timeout=10)
+        await events.aclose()
+        return [
+            json.loads(chunk.decode().split("data: ")[1]) for chunk in (first, second)
+        ]
+
+    first, second = async_to_sync(scenario)()
+
+    # Targets written just before `since` are read again, in case they
+    # committed after it
+    assert len(first["rows"]) == 3 and first["removed"] == []
+    assert first["count"] == 3
+    assert second["removed"] == [str(removed.pk)]
+    assert len(second["rows"]) == 2 and second["count"] == 2
@@ -6,7 +6,8 @@ from django.urls import reverse
 from model_bakery import baker
 
 from apps.cattle.models import Cattle
-from apps.health.models import Medication, SanitaryEvent
+from apps.cattle.services.selection_service import SelectionService
+from apps.health.models import Medication, SanitaryEvent, SanitaryEventTarget
 from apps.health.models.health import MedicationType
 
 
@@ -33,8 +34,10 @@ class TestSanitaryEventViewsCoverage:
         response = client.post(url, {"cattle_ids": cattle_ids})
 
         assert response.status_code == 200
-        assert "cattle_ids" in response.context
+        assert response.context["selection"].size == 2
         assert len(response.context["selected_cattle"]) == 2
+        # Re-renders carry only the selection ID
+        assert b'name="cattle_ids"' not in response.content
 
     def test_create_view_post_no_cattle(self, client, django_user_model):
         """Test POST with no cattle_ids redirects."""
@@ -91,7 +94,7 @@ class TestSanitaryEventViewsCoverage:
         response = client.post(url, data)
         assert response.status_code == 200
         assert response.context["form"].errors
-        assert "cattle_ids" in response.context  # Context preserved
+        assert response.context["selection"].size == 1  # Selection preserved
 
     def test_create_view_exception_handling(self, client, django_user_model):
         """Test exception handling during creation service call."""
@@ -119,6 +122,33 @@ class TestSanitaryEventViewsCoverage:
             messages = list(get_messages(response.wsgi_request))
             assert str(messages[0]) == "Service Fail"
 
+    def test_create_view_saves_from_selection(self, client, django_user_model):
+        """The save POST references the selection instead of re-posting IDs."""
+        user = baker.make(django_user_model)
+        client.force_login(user)
+        cattle = baker.make(Cattle, _quantity=3)
+        selection = SelectionService.create_selection(cattle[:2], user=user)
+        med = baker.make(Medication)
+
+        response = client.post(
+            reverse("health:event-create"),
+            {
+                "selection": str(selection.pk),
+                "action": "save_event",
+                "date": "2024-01-01",
+                "title": "From Selection",
+                "medication": med.pk,
+                "total_cost": "100.00",
+            },
+        )
+
+        assert response.status_code == 302
+        event = SanitaryEvent.objects.get(title="From Selection")
+        assert set(event.targets.values_list("animal_id", flat=True)) == {
+            cattle[0].pk,
+            cattle[1].pk,
+        }
+
     def test_list_view_filters(self, client, django_user_model):
         """Test list view filters."""
         user = baker.make(django_user_model)
@@ -155,7 +185,7 @@ class TestSanitaryEventViewsCoverage:
         assert ev2 in response.context["events"]
 
     def test_detail_view_context(self, client, django_user_model):
-        """Test detail view context includes targets."""
+        """Test detail view context includes the target count."""
         user = baker.make(django_user_model)
         client.force_login(user)
         event = baker.make(SanitaryEvent, performed_by=user)
@@ -163,7 +193,28 @@ class TestSanitaryEventViewsCoverage:
         url = reverse("health:event-detail", kwargs={"pk": event.pk})
         response = client.get(url)
         assert response.status_code == 200
-        assert "targets" in response.context
+        assert response.context["target_count"] == 0
+
+    def test_targets_fragment_is_paginated(self, client, django_user_model):
+        user = baker.make(django_user_model)
+        client.force_login(user)
+        event = baker.make(SanitaryEvent, performed_by=user)
+        for index in range(12):
+            baker.make(
+                SanitaryEventTarget,
+                event=event,
+                animal=baker.make(Cattle, tag=f"T-{index:02d}"),
+            )
+
+        url = reverse("health:event-targets", kwargs={"pk": event.pk})
+        response = client.get(url)
+
+        assert response.status_code == 200
+        assert [t.animal.tag for t in response.context["targets"]][:2] == [
+            "T-00",
+            "T-01",
+        ]
+        assert len(client.get(url, {"page": 2}).context["targets"]) == 2
 
     def test_update_view_context(self, client, django_user_model):
         """Test update view context includes targets."""
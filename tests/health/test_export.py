@@ -0,0 +1,78 @@
+# pylint: disable=unused-argument
+from datetime import date
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from model_bakery import baker
+
+from apps.cattle.models import Cattle
+from apps.health.models import Medication, SanitaryEvent, SanitaryEventTarget
+from apps.health.models.health import MedicationType
+from apps.health.services import HealthService
+
+
+@pytest.fixture
+def treatments(db):
+    cow = baker.make(Cattle, tag="COW")
+    vaccine = baker.make(
+        Medication, name="Aftosa", medication_type=MedicationType.VACCINE
+    )
+    dewormer = baker.make(
+        Medication, name="Ivomec", medication_type=MedicationType.VERMIFUGE
+    )
+    for day, medication, deleted in (
+        (date(2024, 5, 1), dewormer, False),
+        (date(2024, 4, 1), vaccine, False),
+        (date(2024, 4, 15), vaccine, True),
+    ):
+        event = baker.make(
+            SanitaryEvent,
+            date=day,
+            title=medication.name,
+            medication=medication,
+            is_deleted=deleted,
+        )
+        baker.make(SanitaryEventTarget, event=event, animal=cow)
+    return cow
+
+
+def _titles(queryset):
+    return list(queryset.values_list("event__title", flat=True))
+
+
+@pytest.mark.django_db
+class TestHealthExport:
+    def test_queryset_skips_deleted_events_and_filters(self, treatments):
+        assert _titles(HealthService.get_export_queryset()) == ["Aftosa", "Ivomec"]
+        assert _titles(
+            HealthService.get_export_queryset(date_before=date(2024, 4, 30))
+        ) == ["Aftosa"]
+        assert _titles(
+            HealthService.get_export_queryset(medication_type=MedicationType.VERMIFUGE)
+        ) == ["Ivomec"]
+
+    def test_view(self, client, user, treatments):
+        client.force_login(user)
+
+        response = client.get(
+            reverse("health:event-export"), {"medication_type": "None"}
+        )
+
+        lines = b"".join(response.streaming_content).decode("utf-8-sig").splitlines()
+        assert lines[0].startswith("date,event,medication,medication_type,tag")
+        assert [line.split(",")[1] for line in lines[1:]] == ["Aftosa", "Ivomec"]
+
+    def test_command(self, treatments):
+        out = StringIO()
+
+        call_command(
+            "export_health",
+            "--medication-type",
+            MedicationType.VACCINE,
+            stdout=out,
+            stderr=StringIO(),
+        )
+
+        assert out.getvalue().splitlines()[1].startswith("2024-04-01,Aftosa,Aftosa")
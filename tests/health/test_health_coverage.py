@@ -47,7 +47,7 @@ class TestHealthCoverage:
         assert list(history)  # Force evaluation
 
     def test_get_active_withdrawal_count_with_duplicate_animal(self):
-        """Test withdrawal count with duplicate animal (line 142 continue)."""
+        """An animal treated twice is counted once."""
         med = baker.make(Medication, withdrawal_days_meat=20)
         cattle = baker.make(Cattle, status=Cattle.STATUS_AVAILABLE)
 
@@ -60,8 +60,8 @@ class TestHealthCoverage:
 
         baker.make(SanitaryEventTarget, animal=cattle, event=event1)
         baker.make(SanitaryEventTarget, animal=cattle, event=event2)
+        HealthService.sync_treatment_state([cattle.pk])
 
-        # Get count - should be 1 (same animal, line 142 continue should be hit)
         count = HealthService.get_active_withdrawal_count()
 
         assert count == 1  # Only counts unique animals
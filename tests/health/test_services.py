@@ -86,3 +86,65 @@ class TestHealthServiceWithdrawal:
 
         is_blocked, _ = HealthService.check_withdrawal_status(cow)
         assert is_blocked is False
+
+
+@pytest.mark.django_db
+class TestHealthServiceStateCache:
+    def test_create_batch_event_updates_cattle_state(self):
+        med = baker.make(Medication, withdrawal_days_meat=20)
+        cow = baker.make(Cattle)
+        today = timezone.localdate()
+
+        HealthService.create_batch_event(
+            {"date": today, "title": "Dose", "medication": med, "total_cost": 0},
+            [cow.pk],
+        )
+
+        cow.refresh_from_db()
+        assert cow.last_treatment_date == today
+        assert cow.withdrawal_until == today + timedelta(days=20)
+        assert cow.in_withdrawal is True
+
+    def test_older_event_does_not_move_dates_back(self):
+        med = baker.make(Medication, withdrawal_days_meat=5)
+        today = timezone.localdate()
+        cow = baker.make(
+            Cattle,
+            last_treatment_date=today,
+            withdrawal_until=today + timedelta(days=30),
+        )
+
+        HealthService.create_batch_event(
+            {
+                "date": today - timedelta(days=10),
+                "title": "Late entry",
+                "medication": med,
+                "total_cost": 0,
+            },
+            [cow.pk],
+        )
+
+        cow.refresh_from_db()
+        assert cow.last_treatment_date == today
+        assert cow.withdrawal_until == today + timedelta(days=30)
+
+    def test_sync_treatment_state_ignores_deleted_events(self):
+        med = baker.make(Medication, withdrawal_days_meat=10)
+        cow = baker.make(Cattle)
+        old_date = timezone.localdate() - timedelta(days=40)
+        new_date = timezone.localdate() - timedelta(days=2)
+        old_event = baker.make(SanitaryEvent, date=old_date, medication=None)
+        new_event = baker.make(SanitaryEvent, date=new_date, medication=med)
+        baker.make(SanitaryEventTarget, event=old_event, animal=cow)
+        baker.make(SanitaryEventTarget, event=new_event, animal=cow)
+
+        HealthService.sync_treatment_state([cow.pk])
+        cow.refresh_from_db()
+        assert cow.last_treatment_date == new_date
+        assert cow.withdrawal_until == new_date + timedelta(days=10)
+
+        new_event.delete()
+        HealthService.sync_treatment_state([cow.pk])
+        cow.refresh_from_db()
+        assert cow.last_treatment_date == old_date
+        assert cow.withdrawal_until is None
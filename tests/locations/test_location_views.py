@@ -2,12 +2,14 @@
 from unittest.mock import patch
 
 import pytest
+from django.contrib.auth import get_user
 from django.db.models import ProtectedError
 from django.urls import reverse
 from model_bakery import baker
 
 from apps.cattle.models import Cattle
-from apps.locations.models import Location, LocationStatus, LocationType
+from apps.cattle.services.selection_service import SelectionService
+from apps.locations.models import Location, LocationStatus, LocationType, Movement
 from apps.locations.services import LocationService
 from tests.test_utils import verify_protected_error_response
 
@@ -134,9 +136,30 @@ class TestLocationCrudViews:
         response = auth_client.get(url)
         assert response.status_code == 200
         assert response.context["location"] == loc
-        assert c1 in response.context["cattle_list"]
         assert "stats" in response.context
 
+        response = auth_client.get(
+            reverse("locations:detail-inventory", kwargs={"pk": loc.pk})
+        )
+        assert c1 in response.context["cattle_list"]
+
+    def test_movements_fragment(self, auth_client):
+        loc, other = baker.make(Location, _quantity=2)
+        herd = baker.make(Cattle, _quantity=3)
+        incoming = baker.make(Movement, origin=other, destination=loc)
+        incoming.animals.set(herd)
+        outgoing = baker.make(Movement, origin=loc, destination=other)
+        outgoing.animals.set(herd[:1])
+        baker.make(Movement, origin=other, destination=other)
+
+        response = auth_client.get(
+            reverse("locations:detail-movements", kwargs={"pk": loc.pk})
+        )
+
+        assert response.status_code == 200
+        counts = {m.pk: m.animal_count for m in response.context["movements"]}
+        assert counts == {incoming.pk: 3, outgoing.pk: 1}
+
 
 @pytest.mark.django_db
 class TestLocationListLogic:
@@ -214,8 +237,13 @@ class TestMovementViews:
         response = auth_client.post(url, {"cattle_ids": [c1.pk, c2.pk]})
         assert response.status_code == 200
         assert "locations/movement_form.html" in [t.name for t in response.templates]
-        # Form should be initialized with cattle IDs
-        assert str(c1.pk) in response.context["form"]["cattle_ids"].value()
+        # Form should be initialized with the selection holding the cattle
+        selection = response.context["selection"]
+        assert response.context["form"]["selection"].value() == str(selection.pk)
+        assert set(selection.members.values_list("animal_id", flat=True)) == {
+            c1.pk,
+            c2.pk,
+        }
 
     def test_movement_create_submit(self, auth_client):
         c1 = baker.make(Cattle)
@@ -253,11 +281,35 @@ class TestMovementViews:
         response = auth_client.post(url, {"cattle_ids": [f"{c1.pk}"]})
         # Should render form
         assert response.status_code == 200
-        assert str(c1.pk) in response.context["form"]["cattle_ids"].value()
+        assert list(response.context["cattle_list"]) == [c1]
 
         # Test comma separated
         c2 = baker.make(Cattle)
         response = auth_client.post(url, {"cattle_ids": [f"{c1.pk},{c2.pk}"]})
-        content = response.context["form"]["cattle_ids"].value()
-        assert str(c1.pk) in content
-        assert str(c2.pk) in content
+        assert set(response.context["cattle_list"]) == {c1, c2}
+
+    def test_movement_submit_with_selection(self, auth_client):
+        c1, c2 = baker.make(Cattle, _quantity=2)
+        dest = baker.make(
+            Location,
+            status=LocationStatus.ACTIVE,
+            area_hectares=10,
+            capacity_head=100,
+        )
+        selection = SelectionService.create_selection([c1], user=get_user(auth_client))
+
+        response = auth_client.post(
+            reverse("locations:move"),
+            {
+                "selection": str(selection.pk),
+                "destination": dest.pk,
+                "date": "2024-01-01",
+                "reason": "ROTATION",
+            },
+        )
+
+        assert response.status_code == 302
+        c1.refresh_from_db()
+        c2.refresh_from_db()
+        assert c1.location == dest
+        assert c2.location is None
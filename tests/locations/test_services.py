@@ -1,10 +1,14 @@
 # pylint: disable=unused-argument
+from datetime import timedelta
 from decimal import Decimal
 
 import pytest
 from django.core.exceptions import ValidationError
+from django.utils import timezone
 from model_bakery import baker
 
+from apps.cattle.models import Cattle
+from apps.cattle.services.cattle_service import CattleService
 from apps.locations.models import Location, LocationStatus
 from apps.locations.services import LocationService, MovementService
 
@@ -143,3 +147,88 @@ class TestLocationServices:
 
         assert movement.pk is not None
         assert movement.destination == location_b
+
+    def test_move_cattle_sets_location_since(self, location_b, cattle_list, user):
+        """Moving records the arrival time on each animal."""
+        move_date = timezone.now() - timedelta(days=3)
+
+        MovementService.move_cattle(
+            cattle_list=cattle_list,
+            destination=location_b,
+            performed_by=user,
+            reason="ROTATION",
+            move_date=move_date,
+        )
+
+        for c in cattle_list:
+            c.refresh_from_db()
+            assert c.location_since == move_date
+            assert c.days_at_location == 3
+
+    def test_sync_location_state(self, location, location_b, cattle_list, user):
+        """Rebuild uses the latest movement into the current location."""
+        first = timezone.now() - timedelta(days=10)
+        second = timezone.now() - timedelta(days=2)
+        MovementService.move_cattle(
+            cattle_list=cattle_list,
+            destination=location,
+            performed_by=user,
+            reason="ROTATION",
+            move_date=first,
+        )
+        movement = MovementService.move_cattle(
+            cattle_list=cattle_list,
+            destination=location_b,
+            performed_by=user,
+            reason="ROTATION",
+            move_date=second,
+        )
+        Cattle.objects.filter(pk__in=[c.pk for c in cattle_list]).update(
+            location_since=None
+        )
+
+        MovementService.sync_location_state()
+        for c in cattle_list:
+            c.refresh_from_db()
+            assert c.location_since == second
+
+        # Animal put back by hand: no movement into its current location
+        movement.delete()
+        MovementService.sync_location_state()
+        for c in cattle_list:
+            c.refresh_from_db()
+            assert c.location_since is None
+
+    def test_form_edit_of_location_resyncs_location_since(
+        self, location, location_b, cattle_list, user
+    ):
+        """Editing the location by hand takes the arrival date from movements."""
+        first = timezone.now() - timedelta(days=10)
+        second = timezone.now() - timedelta(days=2)
+        cow = cattle_list[0]
+        MovementService.move_cattle(
+            cattle_list=[cow],
+            destination=location,
+            performed_by=user,
+            reason="ROTATION",
+            move_date=first,
+        )
+        MovementService.move_cattle(
+            cattle_list=[cow],
+            destination=location_b,
+            performed_by=user,
+            reason="ROTATION",
+            move_date=second,
+        )
+        cow.refresh_from_db()
+
+        CattleService.update_cattle(cow, {"location": location})
+        cow.refresh_from_db()
+        assert cow.location == location
+        assert cow.location_since == first
+
+        # Other edits leave the arrival date alone
+        Cattle.objects.filter(pk=cow.pk).update(location_since=second)
+        CattleService.update_cattle(cow, {"location": location, "name": "Daisy"})
+        cow.refresh_from_db()
+        assert cow.location_since == second
@@ -0,0 +1,62 @@
+# pylint: disable=unused-argument, redefined-outer-name
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from model_bakery import baker
+
+from apps.locations.models.location import Location
+from apps.nutrition.models import Diet, FeedingEvent
+from apps.nutrition.services import FeedingService
+
+
+@pytest.fixture
+def feedings(db):
+    pen = baker.make(Location, name="Pen 1")
+    pasture = baker.make(Location, name="Pasture")
+    diet = baker.make(Diet, name="Finishing")
+    baker.make(
+        FeedingEvent,
+        date=date(2024, 2, 1),
+        location=pen,
+        diet=diet,
+        amount_kg=Decimal("500"),
+    )
+    baker.make(FeedingEvent, date=date(2024, 1, 1), location=pasture, diet=diet)
+    baker.make(FeedingEvent, location=pen, diet=diet, is_deleted=True)
+    return pen
+
+
+@pytest.mark.django_db
+class TestFeedingExport:
+    def test_queryset_skips_deleted_and_filters(self, feedings):
+        assert list(
+            FeedingService.get_export_queryset().values_list("date", flat=True)
+        ) == [date(2024, 1, 1), date(2024, 2, 1)]
+        assert FeedingService.get_export_queryset(
+            location_id=feedings.pk
+        ).get().date == date(2024, 2, 1)
+
+    def test_view(self, client, user, feedings):
+        client.force_login(user)
+
+        response = client.get(
+            reverse("nutrition:event-export"),
+            {"location": "not-a-uuid", "date_after": "2024-01-15"},
+        )
+
+        lines = b"".join(response.streaming_content).decode("utf-8-sig").splitlines()
+        assert lines == [
+            "date,location,diet,amount_kg,cost_total,performed_by",
+            "2024-02-01,Pen 1,Finishing,500.00,0.00,",
+        ]
+
+    def test_command(self, feedings, tmp_path):
+        path = tmp_path / "feeding.csv"
+
+        call_command("export_feeding", "-o", str(path), stdout=StringIO())
+
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 3
@@ -9,6 +9,7 @@ from django.urls import reverse
 from model_bakery import baker
 
 from apps.cattle.models import Cattle
+from apps.cattle.services.selection_service import SelectionService
 from apps.reproduction.models import BreedingEvent, ReproductiveSeason
 from tests.test_utils import verify_redirect_with_message
 
@@ -371,3 +372,68 @@ class TestBreedingTrashViews:
             "reproduction:breeding_permanent_delete", kwargs={"pk": fake_uuid}
         )
         verify_redirect_with_message(client, url, "not found", method="get")
+
+
+@pytest.mark.django_db
+class TestBreedingBatchCreateView:
+    """Tests for recording breeding for a selection of cattle."""
+
+    def test_initial_post_from_cattle_list(self, client, user):
+        client.force_login(user)
+        cows = baker.make(Cattle, sex=Cattle.SEX_FEMALE, _quantity=2)
+
+        response = client.post(
+            reverse("reproduction:breeding_batch_add"),
+            {"cattle_ids": [str(c.pk) for c in cows]},
+        )
+
+        assert response.status_code == 200
+        assert response.context["selection"].size == 2
+        assert not BreedingEvent.objects.exists()
+
+    def test_save_with_selection(self, client, user):
+        client.force_login(user)
+        cow = baker.make(
+            Cattle, sex=Cattle.SEX_FEMALE, reproduction_status=Cattle.REP_STATUS_OPEN
+        )
+        steer = baker.make(Cattle, sex=Cattle.SEX_MALE)
+        selection = SelectionService.create_selection([cow, steer], user=user)
+
+        response = client.post(
+            reverse("reproduction:breeding_batch_add"),
+            {
+                "selection": str(selection.pk),
+                "action": "save_breeding",
+                "date": "2024-01-01",
+                "breeding_method": BreedingEvent.METHOD_AI,
+                "sire_name": "AI Straw",
+            },
+        )
+
+        assert response.status_code == 302
+        assert list(BreedingEvent.objects.values_list("dam_id", flat=True)) == [cow.pk]
+        messages = [str(m) for m in get_messages(response.wsgi_request)]
+        assert any("1 animals were skipped" in m for m in messages)
+
+    def test_invalid_form_keeps_selection(self, client, user):
+        client.force_login(user)
+        selection = SelectionService.create_selection(
+            [baker.make(Cattle, sex=Cattle.SEX_FEMALE)], user=user
+        )
+
+        response = client.post(
+            reverse("reproduction:breeding_batch_add"),
+            {"selection": str(selection.pk), "action": "save_breeding"},
+        )
+
+        assert response.status_code == 200
+        assert response.context["form"].errors
+        assert response.context["selection"] == selection
+
+    def test_no_selection_redirects(self, client, user):
+        client.force_login(user)
+
+        response = client.post(reverse("reproduction:breeding_batch_add"), {})
+
+        assert response.status_code == 302
+        assert response.url == reverse("cattle:list")
@@ -26,6 +26,30 @@ class TestReproductionService:
         assert event.dam == cow
         assert cow.reproduction_status == Cattle.REP_STATUS_BRED
 
+    def test_record_batch_breeding_skips_ineligible(self):
+        """Only Open or Lactating females of the batch are bred."""
+        open_cow = baker.make(
+            Cattle, sex=Cattle.SEX_FEMALE, reproduction_status=Cattle.REP_STATUS_OPEN
+        )
+        pregnant = baker.make(
+            Cattle,
+            sex=Cattle.SEX_FEMALE,
+            reproduction_status=Cattle.REP_STATUS_PREGNANT,
+        )
+        bull = baker.make(Cattle, sex=Cattle.SEX_MALE)
+
+        events, skipped = ReproductionService.record_batch_breeding(
+            dams=[open_cow, pregnant, bull],
+            date=date(2024, 1, 1),
+            method=BreedingEvent.METHOD_IATF,
+            sire_name="AI Straw",
+        )
+
+        assert [event.dam for event in events] == [open_cow]
+        assert skipped == 2
+        pregnant.refresh_from_db()
+        assert pregnant.reproduction_status == Cattle.REP_STATUS_PREGNANT
+
     def test_record_diagnosis_positive(self):
         """Test positive diagnosis updates status to PREGNANT and calculates due date."""
         cow = baker.make(
@@ -102,3 +126,63 @@ class TestReproductionService:
             ReproductionService.record_breeding(
                 dam=bull, date=date(2024, 1, 1), method=BreedingEvent.METHOD_NATURAL
             )
+
+    def test_breeding_cycle_updates_cattle_state(self):
+        """Breeding, diagnosis and birth keep the dam's cached dates current."""
+        cow = baker.make(Cattle, sex=Cattle.SEX_FEMALE)
+        breeding_date = date(2024, 1, 1)
+
+        event = ReproductionService.record_breeding(
+            dam=cow, date=breeding_date, method=BreedingEvent.METHOD_AI
+        )
+        cow.refresh_from_db()
+        assert cow.last_breeding_date == breeding_date
+        assert cow.expected_calving_date is None
+
+        ReproductionService.record_diagnosis(
+            breeding_event=event,
+            date=date(2024, 2, 1),
+            result=PregnancyCheck.RESULT_POSITIVE,
+        )
+        cow.refresh_from_db()
+        assert cow.expected_calving_date == breeding_date + timedelta(days=290)
+
+        ReproductionService.register_birth(
+            dam=cow,
+            date=date(2024, 10, 15),
+            breeding_event=event,
+            calf_data={"tag": "CALF-S1", "sex": Cattle.SEX_MALE},
+        )
+        cow.refresh_from_db()
+        assert cow.expected_calving_date is None
+        assert cow.last_breeding_date == breeding_date
+
+    def test_sync_breeding_state(self):
+        """Rebuild derives the cached dates from the active history."""
+        cow = baker.make(
+            Cattle,
+            sex=Cattle.SEX_FEMALE,
+            reproduction_status=Cattle.REP_STATUS_PREGNANT,
+        )
+        first = baker.make(BreedingEvent, dam=cow, date=date(2024, 1, 1))
+        second = baker.make(BreedingEvent, dam=cow, date=date(2024, 3, 1))
+        check = baker.make(
+            PregnancyCheck,
+            breeding_event=second,
+            date=date(2024, 4, 1),
+            result=PregnancyCheck.RESULT_POSITIVE,
+            expected_calving_date=date(2024, 12, 15),
+        )
+
+        ReproductionService.sync_breeding_state([cow.pk])
+        cow.refresh_from_db()
+        assert cow.last_breeding_date == date(2024, 3, 1)
+        assert cow.expected_calving_date == date(2024, 12, 15)
+
+        ReproductionService.hard_delete_pregnancy_check(str(check.pk))
+        cow.refresh_from_db()
+        assert cow.expected_calving_date is None
+
+        ReproductionService.hard_delete_breeding_event(str(second.pk))
+        cow.refresh_from_db()
+        assert cow.last_breeding_date == first.date
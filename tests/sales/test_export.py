@@ -0,0 +1,90 @@
+# pylint: disable=unused-argument
+from datetime import date
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from model_bakery import baker
+
+from apps.base.utils.money import Money
+from apps.cattle.models import Cattle
+from apps.locations.models import Location
+from apps.sales.models import Sale, SaleItem
+from apps.sales.services.sale_service import SaleService
+
+
+@pytest.fixture
+def transactions(db):
+    partner = baker.make("partners.Partner", name="Frigorifico")
+    sale = baker.make(Sale, partner=partner, date=date(2024, 6, 1))
+    SaleItem.objects.create(
+        sale=sale,
+        content_object=baker.make(Cattle, tag="STEER"),
+        quantity=1,
+        unit_price=Money("3000.00"),
+    )
+    purchase = baker.make(
+        Sale, partner=partner, date=date(2024, 5, 1), type=Sale.TYPE_PURCHASE
+    )
+    SaleItem.objects.create(
+        sale=purchase,
+        content_object=baker.make(Location, name="Back Pasture"),
+        quantity=1,
+        unit_price=Money("50000.00"),
+    )
+    gone = baker.make(Sale, partner=partner, is_deleted=True)
+    SaleItem.objects.create(
+        sale=gone,
+        content_object=baker.make(Cattle),
+        quantity=1,
+        unit_price=Money("1.00"),
+    )
+    return sale
+
+
+@pytest.mark.django_db
+class TestSaleExport:
+    def test_queryset_skips_deleted_transactions_and_filters(self, transactions):
+        assert SaleService.get_export_queryset().count() == 2
+        assert (
+            SaleService.get_export_queryset(sale_type=Sale.TYPE_SALE).get().sale
+            == transactions
+        )
+        assert not SaleService.get_export_queryset(date_after=date(2024, 7, 1)).exists()
+
+    def test_view_names_items_without_loading_them(self, client, user, transactions):
+        client.force_login(user)
+
+        response = client.get(reverse("sales:export"))
+        lines = b"".join(response.streaming_content).decode("utf-8-sig").splitlines()
+
+        assert lines[0].split(",")[:6] == [
+            "transaction",
+            "date",
+            "type",
+            "partner",
+            "item_type",
+            "item",
+        ]
+        rows = [line.split(",") for line in lines[1:]]
+        assert [(row[1], row[4], row[5]) for row in rows] == [
+            ("2024-05-01", "location", "Back Pasture"),
+            ("2024-06-01", "cattle", "STEER"),
+        ]
+
+    def test_command(self, transactions):
+        out = StringIO()
+
+        call_command(
+            "export_sales",
+            "--format",
+            "jsonl",
+            "--date-after",
+            "2024-06-01",
+            stdout=out,
+            stderr=StringIO(),
+        )
+
+        assert '"item": "STEER"' in out.getvalue()
+        assert out.getvalue().count("\n") == 1
@@ -0,0 +1,248 @@
+import uuid
+from datetime import date, timedelta
+
+import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.utils import timezone
+from model_bakery import baker
+
+from apps.cattle.models import Cattle
+from apps.health.models import Medication, SanitaryEvent, SanitaryEventTarget
+from apps.locations.models import Location
+from apps.partners.models import Partner
+from apps.reproduction.models import BreedingEvent, PregnancyCheck
+from apps.sales.models import Sale, SaleItem
+from apps.tasks.models import Task
+from apps.trash.services import TrashService
+
+
+def _age(obj, minutes):
+    """Backdates modified_at without going through auto_now."""
+    type(obj).all_objects.filter(pk=obj.pk).update(
+        modified_at=timezone.now() - timedelta(minutes=minutes)
+    )
+
+
+@pytest.mark.django_db
+class TestTrashServicePagination:
+    def test_get_page_merges_models_newest_first(self):
+        cow = baker.make(Cattle, tag="T-1", is_deleted=True)
+        task = baker.make(Task, title="Old Task", is_deleted=True)
+        partner = baker.make(Partner, name="Acme", is_deleted=True)
+        baker.make(Cattle, tag="ALIVE")  # Not in trash
+        _age(cow, 1)
+        _age(task, 3)
+        _age(partner, 2)
+
+        page = TrashService.get_page()
+
+        assert [(i["kind"], i["label"]) for i in page["items"]] == [
+            ("cattle", "T-1"),
+            ("partner", "Acme"),
+            ("task", "Old Task"),
+        ]
+        assert page["next_cursor"] is None
+
+    def test_keyset_cursor_walks_all_pages(self):
+        for i in range(5):
+            cow = baker.make(Cattle, tag=f"C{i}", is_deleted=True)
+            _age(cow, i)
+        for i in range(3):
+            task = baker.make(Task, title=f"T{i}", is_deleted=True)
+            _age(task, 10 + i)
+
+        seen = []
+        cursor = None
+        while True:
+            page = TrashService.get_page(cursor=cursor, page_size=3)
+            seen.extend(item["uuid"] for item in page["items"])
+            cursor = page["next_cursor"]
+            if not cursor:
+                break
+
+        assert len(seen) == 8
+        assert len(set(seen)) == 8
+
+    def test_get_page_filters_kinds(self):
+        baker.make(Cattle, is_deleted=True)
+        baker.make(Task, is_deleted=True)
+
+        page = TrashService.get_page(kinds=["task", "unknown"])
+
+        assert [item["kind"] for item in page["items"]] == ["task"]
+
+    def test_invalid_cursor_raises(self):
+        with pytest.raises(ValueError):
+            TrashService.get_page(cursor="not-a-cursor")
+
+    def test_cursor_with_malformed_pk_raises(self):
+        cursor = TrashService.encode_cursor(timezone.now(), "1 OR 1=1")
+
+        with pytest.raises(ValueError):
+            TrashService.get_page(cursor=cursor)
+
+
+@pytest.mark.django_db
+class TestTrashServiceBulkActions:
+    def test_group_selection(self):
+        first, second, third, fourth = (str(uuid.uuid4()) for _ in range(4))
+        grouped = TrashService.group_selection(
+            [
+                f"cattle:{first}",
+                f"cattle:{second}",
+                f"task:{third}",
+                f"bogus:{fourth}",
+                "cattle:",
+                "task:not-a-uuid",
+            ]
+        )
+        assert grouped == {"cattle": [first, second], "task": [third]}
+
+    def test_bulk_restore_skips_tag_conflicts(self):
+        free = baker.make(Cattle, tag="FREE", is_deleted=True)
+        clash = baker.make(Cattle, tag="TAKEN", is_deleted=True)
+        baker.make(Cattle, tag="TAKEN")
+        task = baker.make(Task, is_deleted=True)
+
+        result = TrashService.bulk_restore(
+            {"cattle": [free.pk, clash.pk], "task": [task.pk]}
+        )
+
+        assert result == {"restored": 2, "skipped": 1}
+        assert Cattle.objects.filter(pk=free.pk).exists()
+        assert not Cattle.objects.filter(pk=clash.pk).exists()
+        assert Task.objects.filter(pk=task.pk).exists()
+
+    def test_bulk_restore_duplicate_tags_in_selection(self):
+        first = baker.make(Cattle, tag="DUP", is_deleted=True)
+        second = baker.make(Cattle, tag="DUP", is_deleted=True)
+
+        result = TrashService.bulk_restore({"cattle": [first.pk, second.pk]})
+
+        assert result == {"restored": 1, "skipped": 1}
+        assert Cattle.objects.filter(tag="DUP").count() == 1
+
+    def test_bulk_purge_respects_references(self):
+        sold = baker.make(Cattle, is_deleted=True)
+        loose = baker.make(Cattle, is_deleted=True)
+        sale = baker.make(Sale)
+        baker.make(
+            SaleItem,
+            sale=sale,
+            content_type=ContentType.objects.get_for_model(Cattle),
+            object_id=sold.pk,
+            unit_price=10,
+        )
+
+        result = TrashService.bulk_purge({"cattle": [sold.pk, loose.pk]})
+
+        assert result == {
+            "purged": 1,
+            "skipped": 1,
+            "blocked": [f"Cattle: {sold.tag}"],
+        }
+        assert Cattle.all_objects.filter(pk=sold.pk).exists()
+        assert not Cattle.all_objects.filter(pk=loose.pk).exists()
+
+    def test_bulk_purge_blocks_on_active_reverse_relations(self):
+        location = baker.make(Location, is_deleted=True)
+        baker.make(Cattle, location=location)
+
+        result = TrashService.bulk_purge({"location": [location.pk]})
+
+        assert result == {
+            "purged": 0,
+            "skipped": 1,
+            "blocked": [f"Location: {location.name}"],
+        }
+        assert Location.all_objects.filter(pk=location.pk).exists()
+
+    def test_bulk_purge_ignores_active_objects(self):
+        active = baker.make(Task)
+
+        result = TrashService.bulk_purge({"task": [active.pk]})
+
+        assert result == {"purged": 0, "skipped": 1, "blocked": []}
+        assert Task.objects.filter(pk=active.pk).exists()
+
+    def test_bulk_purge_keeps_only_the_protected_rows(self):
+        # A trashed event still protects its medication
+        used = baker.make(Medication, name="Used", is_deleted=True)
+        unused = baker.make(Medication, name="Unused", is_deleted=True)
+        baker.make(SanitaryEvent, medication=used, is_deleted=True)
+
+        result = TrashService.bulk_purge({"medication": [used.pk, unused.pk]})
+
+        assert result == {
+            "purged": 1,
+            "skipped": 1,
+            "blocked": ["Medication: Used"],
+        }
+        assert Medication.all_objects.filter(pk=used.pk).exists()
+        assert not Medication.all_objects.filter(pk=unused.pk).exists()
+
+
+@pytest.mark.django_db
+class TestTrashServiceCattleState:
+    """Restoring or purging history recomputes the animals' cached state."""
+
+    def test_sanitary_event(self):
+        cow = baker.make(Cattle)
+        medication = baker.make(Medication, withdrawal_days_meat=10)
+        treated_on = timezone.localdate() - timedelta(days=2)
+        event = baker.make(
+            SanitaryEvent, date=treated_on, medication=medication, is_deleted=True
+        )
+        baker.make(SanitaryEventTarget, event=event, animal=cow)
+
+        TrashService.bulk_restore({"sanitary_event": [event.pk]})
+        cow.refresh_from_db()
+        assert cow.last_treatment_date == treated_on
+        assert cow.withdrawal_until == treated_on + timedelta(days=10)
+
+        SanitaryEvent.objects.filter(pk=event.pk).update(is_deleted=True)
+        TrashService.bulk_purge({"sanitary_event": [event.pk]})
+        cow.refresh_from_db()
+        assert cow.last_treatment_date is None
+        assert cow.withdrawal_until is None
+
+    def test_breeding(self):
+        cow = baker.make(Cattle, sex=Cattle.SEX_FEMALE)
+        baker.make(BreedingEvent, dam=cow, date=date(2024, 1, 1))
+        later = baker.make(
+            BreedingEvent, dam=cow, date=date(2024, 3, 1), is_deleted=True
+        )
+
+        TrashService.bulk_restore({"breeding": [later.pk]})
+        cow.refresh_from_db()
+        assert cow.last_breeding_date == date(2024, 3, 1)
+
+        BreedingEvent.objects.filter(pk=later.pk).update(is_deleted=True)
+        TrashService.bulk_purge({"breeding": [later.pk]})
+        cow.refresh_from_db()
+        assert cow.last_breeding_date == date(2024, 1, 1)
+
+    def test_diagnosis(self):
+        cow = baker.make(
+            Cattle,
+            sex=Cattle.SEX_FEMALE,
+            reproduction_status=Cattle.REP_STATUS_PREGNANT,
+        )
+        breeding = baker.make(BreedingEvent, dam=cow, date=date(2024, 1, 1))
+        check = baker.make(
+            PregnancyCheck,
+            breeding_event=breeding,
+            date=date(2024, 2, 1),
+            result=PregnancyCheck.RESULT_POSITIVE,
+            expected_calving_date=date(2024, 10, 18),
+            is_deleted=True,
+        )
+
+        TrashService.bulk_restore({"diagnosis": [check.pk]})
+        cow.refresh_from_db()
+        assert cow.expected_calving_date == date(2024, 10, 18)
+
+        PregnancyCheck.objects.filter(pk=check.pk).update(is_deleted=True)
+        TrashService.bulk_purge({"diagnosis": [check.pk]})
+        cow.refresh_from_db()
+        assert cow.expected_calving_date is None
@@ -0,0 +1,158 @@
+import pytest
+from django.contrib.messages import get_messages
+from django.urls import reverse
+from django.utils import timezone
+from model_bakery import baker
+
+from apps.cattle.models import Cattle
+from apps.health.models import Medication, SanitaryEvent
+from apps.tasks.models import Task
+from apps.trash.services import TrashService
+
+
+@pytest.mark.django_db
+class TestTrashViews:
+    def test_list_requires_login(self, client):
+        response = client.get(reverse("trash:list"))
+        assert response.status_code == 302
+
+    def test_list_shows_deleted_items(self, client, user):
+        client.force_login(user)
+        baker.make(Cattle, tag="GONE-1", is_deleted=True)
+        baker.make(Task, title="Gone Task", is_deleted=True)
+        baker.make(Cattle, tag="STILL-HERE")
+
+        response = client.get(reverse("trash:list"))
+
+        assert response.status_code == 200
+        labels = [item["label"] for item in response.context["items"]]
+        assert "GONE-1" in labels
+        assert "Gone Task" in labels
+        assert "STILL-HERE" not in labels
+
+    def test_list_paginates_with_cursor(self, client, user):
+        client.force_login(user)
+        baker.make(Task, is_deleted=True, _quantity=30)
+
+        response = client.get(reverse("trash:list"))
+        assert len(response.context["items"]) == 25
+        cursor = response.context["next_cursor"]
+        assert cursor
+
+        response = client.get(reverse("trash:list"), {"after": cursor})
+        assert len(response.context["items"]) == 5
+        assert response.context["next_cursor"] is None
+
+    def test_list_with_bad_cursor_falls_back_to_first_page(self, client, user):
+        client.force_login(user)
+        baker.make(Task, is_deleted=True)
+
+        response = client.get(reverse("trash:list"), {"after": "garbage"})
+
+        assert response.status_code == 200
+        assert len(response.context["items"]) == 1
+        assert response.context["is_first_page"]
+
+    def test_list_filters_by_kind(self, client, user):
+        client.force_login(user)
+        baker.make(Cattle, is_deleted=True)
+        baker.make(Task, is_deleted=True)
+
+        response = client.get(reverse("trash:list"), {"kind": "cattle"})
+
+        assert [i["kind"] for i in response.context["items"]] == ["cattle"]
+
+    def test_bulk_restore(self, client, user):
+        client.force_login(user)
+        cow = baker.make(Cattle, is_deleted=True)
+        task = baker.make(Task, is_deleted=True)
+
+        response = client.post(
+            reverse("trash:bulk-action"),
+            {"action": "restore", "items": [f"cattle:{cow.pk}", f"task:{task.pk}"]},
+        )
+
+        assert response.status_code == 302
+        assert Cattle.objects.filter(pk=cow.pk).exists()
+        assert Task.objects.filter(pk=task.pk).exists()
+
+    def test_bulk_purge(self, client, user):
+        client.force_login(user)
+        task = baker.make(Task, is_deleted=True)
+
+        response = client.post(
+            reverse("trash:bulk-action"),
+            {"action": "purge", "items": [f"task:{task.pk}"]},
+        )
+
+        assert response.status_code == 302
+        assert not Task.all_objects.filter(pk=task.pk).exists()
+
+    def test_bulk_action_reports_skipped(self, client, user):
+        client.force_login(user)
+        baker.make(Cattle, tag="X1")
+        clash = baker.make(Cattle, tag="X1", is_deleted=True)
+
+        response = client.post(
+            reverse("trash:bulk-action"),
+            {"action": "restore", "items": [f"cattle:{clash.pk}"]},
+        )
+
+        messages = [str(m) for m in get_messages(response.wsgi_request)]
+        assert any("skipped" in m for m in messages)
+
+    def test_bulk_purge_reports_blocked_items(self, client, user):
+        client.force_login(user)
+        medication = baker.make(Medication, name="Ivermectin", is_deleted=True)
+        baker.make(SanitaryEvent, medication=medication, is_deleted=True)
+
+        response = client.post(
+            reverse("trash:bulk-action"),
+            {"action": "purge", "items": [f"medication:{medication.pk}"]},
+        )
+
+        messages = [str(m) for m in get_messages(response.wsgi_request)]
+        assert any("Medication: Ivermectin" in m for m in messages)
+
+    def test_list_with_tampered_cursor_pk(self, client, user):
+        client.force_login(user)
+        baker.make(Task, is_deleted=True)
+        cursor = TrashService.encode_cursor(timezone.now(), "not-a-uuid")
+
+        response = client.get(reverse("trash:list"), {"after": cursor})
+
+        assert response.status_code == 200
+        assert response.context["is_first_page"]
+
+    def test_bulk_action_with_malformed_token(self, client, user):
+        client.force_login(user)
+
+        response = client.post(
+            reverse("trash:bulk-action"),
+            {"action": "purge", "items": ["task:not-a-uuid"]},
+        )
+
+        assert response.status_code == 302
+        messages = [str(m) for m in get_messages(response.wsgi_request)]
+        assert any("No items selected" in m for m in messages)
+
+    def test_bulk_action_without_selection(self, client, user):
+        client.force_login(user)
+
+        response = client.post(reverse("trash:bulk-action"), {"action": "restore"})
+
+        messages = [str(m) for m in get_messages(response.wsgi_request)]
+        assert any("No items selected" in m for m in messages)
+
+    def test_bulk_action_invalid_action(self, client, user):
+        client.force_login(user)
+        task = baker.make(Task, is_deleted=True)
+
+        response = client.post(
+            reverse("trash:bulk-action"),
+            {"action": "explode", "items": [f"task:{task.pk}"]},
+        )
+
+        messages = [str(m) for m in get_messages(response.wsgi_request)]
+        assert any("Invalid action" in m for m in messages)
+        assert Task.all_objects.filter(pk=task.pk, is_deleted=True).exists()
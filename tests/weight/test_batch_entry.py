@@ -2,6 +2,7 @@
 import pytest
 from django.urls import reverse
 
+from apps.cattle.models import Selection
 from apps.weight.models import WeighingSession
 
 
@@ -30,10 +31,12 @@ def test_create_session_redirects_to_batch_entry(client, user_login, cattle):
     assert response.status_code == 302
 
     session = WeighingSession.objects.get(name="Batch Test Session")
+    selection = Selection.objects.get()
     expected_url = reverse("weight:batch-entry", kwargs={"pk": session.pk})
 
-    # Assert redirect location matches expected URL
-    assert response.url == expected_url
+    # Assert redirect location matches expected URL, carrying only the selection ID
+    assert response.url == f"{expected_url}?selection={selection.pk}"
+    assert list(selection.members.values_list("animal_id", flat=True)) == [cattle.pk]
 
 
 @pytest.mark.django_db
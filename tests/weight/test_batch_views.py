@@ -7,6 +7,7 @@ from django.urls import reverse
 from model_bakery import baker
 
 from apps.cattle.models import Cattle
+from apps.cattle.services.selection_service import SelectionService
 from apps.weight.models import WeighingSession, WeightRecord
 
 
@@ -14,39 +15,39 @@ from apps.weight.models import WeighingSession, WeightRecord
 class TestBatchWeighingView:
     """Tests for BatchWeighingView - batch weight entry functionality."""
 
-    def test_get_batch_view_with_session_storage(self, client, user):
-        """Test GET request retrieves cattle from session storage."""
+    def test_get_batch_view_with_selection(self, client, user):
+        """Test GET request retrieves cattle from the selection ID."""
         client.force_login(user)
         session = baker.make(WeighingSession)
         cow1 = baker.make(Cattle, tag="COW001")
         cow2 = baker.make(Cattle, tag="COW002")
+        outsider = baker.make(Cattle, tag="COW003")
+        selection = SelectionService.create_selection([cow1, cow2], user=user)
 
-        # Set session storage
-        s = client.session
-        s["batch_weighing_cattle_ids"] = [str(cow1.pk), str(cow2.pk)]
-        s.save()
-
-        response = client.get(reverse("weight:batch-entry", kwargs={"pk": session.pk}))
+        response = client.get(
+            reverse("weight:batch-entry", kwargs={"pk": session.pk}),
+            {"selection": str(selection.pk)},
+        )
 
         assert response.status_code == 200
         assert cow1 in response.context["cattle_list"]
         assert cow2 in response.context["cattle_list"]
+        assert outsider not in response.context["cattle_list"]
+        assert b'name="cattle_ids"' not in response.content
 
-    def test_get_batch_view_with_query_params(self, client, user):
-        """Test GET request retrieves cattle from query parameters."""
+    def test_get_batch_view_unknown_selection_redirects(self, client, user):
+        """Test GET request with a stale selection ID redirects with warning."""
         client.force_login(user)
         session = baker.make(WeighingSession)
-        cow1 = baker.make(Cattle, tag="COW001")
-        cow2 = baker.make(Cattle, tag="COW002")
 
         response = client.get(
-            reverse("weight:batch-entry", kwargs={"pk": session.pk})
-            + f"?ids={cow1.pk},{cow2.pk}"
+            reverse("weight:batch-entry", kwargs={"pk": session.pk}),
+            {"selection": str(uuid.uuid4())},
         )
 
-        assert response.status_code == 200
-        assert cow1 in response.context["cattle_list"]
-        assert cow2 in response.context["cattle_list"]
+        assert response.status_code == 302
+        messages = list(get_messages(response.wsgi_request))
+        assert any("no cattle selected" in str(m).lower() for m in messages)
 
     def test_get_batch_view_no_cattle_redirects(self, client, user):
         """Test GET request without cattle IDs redirects with warning."""
@@ -187,20 +188,18 @@ class TestBatchWeighingView:
         messages = list(get_messages(response.wsgi_request))
         assert any("no weights were recorded" in str(m).lower() for m in messages)
 
-    def test_post_clears_session_storage(self, client, user):
-        """Test that session storage is cleared after POST."""
+    def test_post_with_selection(self, client, user):
+        """Test POST reads the animals from the selection, not posted IDs."""
         client.force_login(user)
         session = baker.make(WeighingSession)
         cow1 = baker.make(Cattle, tag="COW001")
-
-        # Set session storage
-        s = client.session
-        s["batch_weighing_cattle_ids"] = [str(cow1.pk)]
-        s.save()
+        outsider = baker.make(Cattle, tag="COW002")
+        selection = SelectionService.create_selection([cow1], user=user)
 
         data = {
-            "cattle_ids": [str(cow1.pk)],
+            "selection": str(selection.pk),
             f"weight_{cow1.pk}": "450.5",
+            f"weight_{outsider.pk}": "300",
         }
 
         response = client.post(
@@ -208,4 +207,9 @@ class TestBatchWeighingView:
         )
 
         assert response.status_code == 302
-        assert "batch_weighing_cattle_ids" not in client.session
+        assert WeightRecord.objects.filter(session=session, animal=cow1).exists()
+        assert not WeightRecord.objects.filter(
+            session=session, animal=outsider
+        ).exists()
+        messages = list(get_messages(response.wsgi_request))
+        assert any("error" in str(m).lower() for m in messages)
@@ -0,0 +1,79 @@
+# pylint: disable=unused-argument
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from model_bakery import baker
+
+from apps.cattle.models import Cattle
+from apps.weight.models import WeighingSession, WeighingSessionType, WeightRecord
+from apps.weight.services import WeightService
+
+
+@pytest.fixture
+def history(db):
+    cow = baker.make(Cattle, tag="COW")
+    early = baker.make(WeighingSession, date=date(2024, 1, 10), name="January")
+    late = baker.make(
+        WeighingSession,
+        date=date(2024, 3, 10),
+        name="March",
+        session_type=WeighingSessionType.SALE,
+    )
+    gone = baker.make(WeighingSession, date=date(2024, 2, 10), is_deleted=True)
+    for session, weight in ((late, "350"), (early, "300"), (gone, "320")):
+        baker.make(WeightRecord, session=session, animal=cow, weight_kg=Decimal(weight))
+    return cow
+
+
+def _dates(queryset):
+    return list(queryset.values_list("session__date", flat=True))
+
+
+@pytest.mark.django_db
+class TestWeightExport:
+    def test_queryset_skips_deleted_sessions_and_filters(self, history):
+        assert _dates(WeightService.get_export_queryset()) == [
+            date(2024, 1, 10),
+            date(2024, 3, 10),
+        ]
+        assert _dates(
+            WeightService.get_export_queryset(date_after=date(2024, 2, 1))
+        ) == [date(2024, 3, 10)]
+        assert _dates(
+            WeightService.get_export_queryset(session_type=WeighingSessionType.ROUTINE)
+        ) == [date(2024, 1, 10)]
+
+    def test_view(self, client, user, history):
+        client.force_login(user)
+
+        response = client.get(
+            reverse("weight:record-export"), {"date_before": "2024-02-01"}
+        )
+
+        lines = b"".join(response.streaming_content).decode("utf-8-sig").splitlines()
+        assert (
+            lines[0]
+            == "date,session,session_type,tag,weight_kg,adg,days_since_prev_weight"
+        )
+        assert lines[1].startswith("2024-01-10,January,ROUTINE,COW,300.00")
+        assert len(lines) == 2
+
+    def test_command(self, history):
+        out = StringIO()
+
+        call_command(
+            "export_weights",
+            "--format",
+            "jsonl",
+            "--type",
+            "SALE",
+            stdout=out,
+            stderr=StringIO(),
+        )
+
+        assert out.getvalue().count("\n") == 1
+        assert '"weight_kg": "350.00"' in out.getvalue()
@@ -4,6 +4,7 @@ import pytest
 from django.urls import reverse
 from model_bakery import baker
 
+from apps.cattle.models import Cattle
 from apps.weight.models import WeighingSession, WeighingSessionType
 
 
@@ -54,14 +55,19 @@ class TestWeighingSessionListView:
 @pytest.mark.django_db
 class TestWeighingSessionCreateView:
     def test_context_cattle_ids(self, client, user):
-        """Test that cattle_ids in GET are passed to context."""
+        """Test that cattle_ids posted from the list are stored as a selection."""
         client.force_login(user)
         url = reverse("weight:session-create")
+        cow1, cow2 = baker.make(Cattle, _quantity=2)
 
-        response = client.get(url, {"cattle_ids": ["uuid-1", "uuid-2"]})
+        response = client.post(url, {"cattle_ids": [cow1.pk, cow2.pk, "uuid-3"]})
         assert response.status_code == 200
-        assert "uuid-1" in response.context["cattle_ids"]
-        assert "uuid-2" in response.context["cattle_ids"]
+        selection = response.context["selection"]
+        assert set(selection.members.values_list("animal_id", flat=True)) == {
+            cow1.pk,
+            cow2.pk,
+        }
+        assert f'name="selection" value="{selection.pk}"' in response.content.decode()
 
     def test_create_without_cattle_ids(self, client, user):
         """Test creating session without cattle redirects to detail."""
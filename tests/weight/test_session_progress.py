@@ -0,0 +1,182 @@
+# pylint: disable=unused-argument, redefined-outer-name
+import asyncio
+import json
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from django.test import AsyncClient, Client
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.cattle.models import Cattle
+from apps.weight.models import WeightRecord
+from apps.weight.services.weight_service import WeightService
+from apps.weight.views import WeighingSessionProgressView
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+def parse(chunk) -> dict:
+    lines = dict(
+        line.split(": ", 1) for line in chunk.decode().splitlines() if ": " in line
+    )
+    return {"id": lines["id"], **json.loads(lines["data"])}
+
+
+async def open_stream(user, session, **params):
+    client = AsyncClient()
+    await client.aforce_login(user)
+    response = await client.get(
+        reverse("weight:session-progress", args=[session.pk]), params
+    )
+    return response, aiter(response.streaming_content)
+
+
+async def next_event(events):
+    return await asyncio.wait_for(anext(events), timeout=10)
+
+
+@pytest.fixture(autouse=True)
+def short_keepalive(monkeypatch):
+    monkeypatch.setattr(WeighingSessionProgressView, "keepalive", 1)
+
+
+def test_pushes_records_as_they_are_written(
+    user, cattle, weight_record_factory, weighing_session_factory
+):
+    earlier = weighing_session_factory(date=date(2022, 12, 1))
+    weight_record_factory(session=earlier, weight_kg=Decimal("150.00"))
+    session = weighing_session_factory()
+    since = timezone.now()
+    calf = Cattle.objects.create(tag="CALF", birth_date=date(2022, 6, 1))
+
+    async def scenario():
+        response, events = await open_stream(user, session, since=since.isoformat())
+        assert response["Content-Type"] == "text/event-stream"
+        snapshot = parse(await next_event(events))
+
+        # Written by another connection, as the chute's batch entry would
+        await sync_to_async(WeightService.record_weights, thread_sensitive=False)(
+            session, [(cattle, Decimal("180.00")), (calf, Decimal("120.00"))]
+        )
+        progress = parse(await next_event(events))
+        await events.aclose()
+        return snapshot, progress
+
+    snapshot, progress = async_to_sync(scenario)()
+
+    assert snapshot["rows"] == [] and snapshot["count"] == 0
+    # One batch, one event
+    assert {row["tag"] for row in progress["rows"]} == {"TEST_COW", "CALF"}
+    assert progress["count"] == 2
+    assert Decimal(progress["avg_weight"]) == Decimal("150.0")
+    assert Decimal(progress["avg_adg"]) == Decimal("0.968")  # 30 kg in 31 days
+    assert progress["id"] > snapshot["id"]
+
+
+def test_resumes_from_last_event_id(user, cattle, weight_record_factory):
+    record = weight_record_factory()
+    cursor = record.modified_at
+    WeightRecord.objects.filter(pk=record.pk).delete()
+
+    async def scenario():
+        client = AsyncClient()
+        await client.aforce_login(user)
+        response = await client.get(
+            reverse("weight:session-progress", args=[record.session_id]),
+            headers={"Last-Event-ID": cursor.isoformat()},
+        )
+        events = aiter(response.streaming_content)
+        event = parse(await next_event(events))
+        await events.aclose()
+        return event
+
+    event = async_to_sync(scenario)()
+
+    assert event["removed"] == [str(record.pk)]
+    assert event["count"] == 0
+
+
+def test_rereads_rows_committed_behind_the_cursor(user, weight_record_factory):
+    # Stamped before a cursor the client already holds, committed after it
+    record = weight_record_factory()
+    cursor = record.modified_at + timedelta(seconds=5)
+
+    async def scenario():
+        _response, events = await open_stream(
+            user, record.session, since=cursor.isoformat()
+        )
+        event = parse(await next_event(events))
+        await events.aclose()
+        return event
+
+    event = async_to_sync(scenario)()
+
+    assert [row["id"] for row in event["rows"]] == [str(record.pk)]
+    # The cursor never moves back
+    assert event["id"] == cursor.isoformat()
+
+
+def test_keepalive_while_idle(user, weighing_session_factory):
+    session = weighing_session_factory()
+
+    async def scenario():
+        _response, events = await open_stream(user, session)
+        await next_event(events)
+        chunk = await next_event(events)
+        await events.aclose()
+        return chunk
+
+    assert async_to_sync(scenario)() == b": keepalive\n\n"
+
+
+def test_requires_login(weighing_session_factory):
+    session = weighing_session_factory()
+
+    response = async_to_sync(AsyncClient().get)(
+        reverse("weight:session-progress", args=[session.pk])
+    )
+
+    assert response.status_code == 302
+
+
+def test_detail_page_shows_the_summary(client, user_login, weight_record_factory):
+    record = weight_record_factory()
+
+    response = client.get(reverse("weight:session-detail", args=[record.session_id]))
+
+    assert response.context["summary"]["count"] == 1
+    # Under WSGI the page doesn't open the stream
+    assert response.context["live_progress"] is False
+    assert reverse("weight:session-progress", args=[record.session_id]) not in (
+        response.content.decode()
+    )
+
+
+def test_detail_page_opens_the_stream_under_asgi(user, weight_record_factory):
+    record = weight_record_factory()
+
+    async def scenario():
+        client = AsyncClient()
+        await client.aforce_login(user)
+        return await client.get(
+            reverse("weight:session-detail", args=[record.session_id])
+        )
+
+    response = async_to_sync(scenario)()
+
+    assert reverse("weight:session-progress", args=[record.session_id]) in (
+        response.content.decode()
+    )
+
+
+def test_stream_is_not_served_under_wsgi(user, weighing_session_factory):
+    session = weighing_session_factory()
+    client = Client()
+    client.force_login(user)
+
+    response = client.get(reverse("weight:session-progress", args=[session.pk]))
+
+    assert response.status_code == 404
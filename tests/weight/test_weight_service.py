@@ -92,6 +92,22 @@ class TestWeightService:
         assert cattle.current_weight == Decimal("230.00")
         assert cattle.last_weighing_date == session_2.date
 
+    def test_record_weights_batch(self, cattle, session_1, session_2):
+        """Batch recording matches record_weight and corrects re-weighings."""
+        calf = Cattle.objects.create(tag="TEST002", birth_date=date(2023, 1, 1))
+        WeightService.record_weight(session_1, cattle, Decimal("200.00"))
+        WeightService.record_weight(session_2, calf, Decimal("90.00"))
+
+        records = WeightService.record_weights(
+            session_2, [(cattle, Decimal("230.00")), (calf, Decimal("95.00"))]
+        )
+
+        assert [r.adg for r in records] == [Decimal("1.000"), None]
+        assert session_2.records.count() == 2
+        calf.refresh_from_db()
+        assert calf.current_weight == Decimal("95.00")
+        assert records[1].weight_kg == Decimal("95.00")
+
     def test_get_herd_adg_stats(self, cattle, session_1, session_2):
         """Test herd stats calculation."""
         # Setup: cattle with 1.0 ADG in last 90 days
@@ -131,6 +147,27 @@ class TestWeightService:
         # Average of 1.0 and 2.0 is 1.5
         assert stats["avg_adg"] == Decimal("1.500")
 
+    def test_get_herd_adg_stats_sees_new_weighings(self, cattle):
+        cattle_2 = Cattle.objects.create(tag="TEST002", birth_date=date(2023, 1, 1))
+        today = timezone.now().date()
+        session_recent_1 = WeighingSession.objects.create(
+            date=today - timedelta(days=30), name="R1", session_type="ROUTINE"
+        )
+        session_recent_2 = WeighingSession.objects.create(
+            date=today, name="R2", session_type="ROUTINE"
+        )
+        WeightService.record_weights(
+            session_recent_1,
+            [(cattle, Decimal("200.00")), (cattle_2, Decimal("200.00"))],
+        )
+        WeightService.record_weight(session_recent_2, cattle, Decimal("230.00"))
+        assert WeightService.get_herd_adg_stats()["avg_adg"] == Decimal("1.000")
+
+        # A fresh record, written with bulk_create
+        WeightService.record_weight(session_recent_2, cattle_2, Decimal("260.00"))
+
+        assert WeightService.get_herd_adg_stats()["avg_adg"] == Decimal("1.500")
+
     def test_get_animal_weight_history(self, cattle, session_1, session_2):
         """Test retrieving weight history ordered by date."""
         # Create records out of order